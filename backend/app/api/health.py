@@ -24,6 +24,14 @@ def health_check():
     }
 
 
+@router.get("/health/audio-cache")
+def health_check_audio_cache():
+    """Lesson audio cache size, hit rate and eviction counters for this worker."""
+    from app.lesson.audio_cache import audio_renderer
+
+    return audio_renderer.stats()
+
+
 @router.get("/health/db")
 async def health_check_db(db: AsyncSession = Depends(get_db)):
     """Detailed database health check."""
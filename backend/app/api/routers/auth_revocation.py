@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_session
 from app.db.user_models import RevokedToken, User
 from app.security.auth import decode_token, get_current_user
+from app.security.auth_cache import revocations
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 bearer_scheme = HTTPBearer(auto_error=False)
@@ -60,6 +61,7 @@ async def logout(
     )
     session.add(revoked)
     await session.commit()
+    revocations.add(token_data.jti, token_data.exp)
 
     return LogoutResponse(
         message="Successfully logged out",
@@ -141,6 +143,7 @@ async def revoke_specific_token(
     )
     session.add(revoked)
     await session.commit()
+    revocations.add(token_data.jti, token_data.exp)
 
     return LogoutResponse(
         message="Token successfully revoked",
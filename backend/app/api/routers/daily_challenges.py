@@ -13,6 +13,7 @@ from app.db.session import get_session
 from app.db.social_models import ChallengeStreak, DailyChallenge, DoubleOrNothing, WeeklyChallenge
 from app.db.user_models import User, UserProgress
 from app.security.auth import get_current_user
+from app.services.leaderboards import get_leaderboard_service, load_board_users
 
 logger = logging.getLogger(__name__)
 
@@ -248,6 +249,23 @@ async def get_challenge_leaderboard(
     1. Current streak (primary)
     2. Total challenges completed (secondary)
     """
+    # Served from the Redis board when it is available
+    leaderboards = get_leaderboard_service()
+    page = await leaderboards.challenge_page(current_user.id, limit) if leaderboards is not None else None
+    if page is not None:
+        usernames = await load_board_users(session, [user_id for user_id, _ in page.entries])
+        return ChallengeLeaderboardResponse(
+            entries=[
+                ChallengeLeaderboardEntry(
+                    user_id=user_id, username=usernames[user_id][0], rank=rank, **details
+                )
+                for rank, ((user_id, _), details) in enumerate(zip(page.entries, page.details), start=1)
+                if user_id in usernames
+            ],
+            user_rank=page.rank,
+            total_users=page.total,
+        )
+
     # Build leaderboard query
     query = (
         select(
@@ -10,9 +10,10 @@ Provides REST endpoints for:
 
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Response, status
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy import Integer, and_, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -24,11 +25,17 @@ from app.db.user_models import (
     LearningEvent,
     User,
     UserAchievement,
+    UserDailyXP,
     UserProfile,
     UserProgress,
     UserQuest,
 )
 from app.security.auth import get_current_user
+from app.services.achievement_rarity import rarity_snapshot
+from app.services.daily_xp import record_daily_xp
+from app.services.event_sink import emit_learning_event
+from app.services.leaderboards import get_leaderboard_service, load_board_users, period_start, xp_board
+from app.services.progress_snapshot import progress_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -266,26 +273,8 @@ async def _get_weekly_activity(db: AsyncSession, user_id: int, days: int = 7) ->
 # ---------------------------------------------------------------------
 
 
-@router.get("/users/{user_id}/progress", response_model=UserProgressResponse)
-async def get_user_progress(
-    user_id: str = Path(..., pattern=r"^\d+$", description="User ID (numeric string)"),
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
-):
-    """Get user progress and gamification stats.
-
-    Returns:
-    - XP, level, streaks
-    - Activity stats (lessons, words, time)
-    - Per-language XP breakdown
-    - Unlocked achievements
-    - Weekly activity chart data
-    """
-    try:
-        target_user_id = int(user_id)
-    except ValueError as exc:  # pragma: no cover - defensive guard
-        raise HTTPException(status_code=404, detail="User not found") from exc
-
+async def _load_viewable_user(session: AsyncSession, current_user: User, target_user_id: int) -> User:
+    """Load another user whose progress ``current_user`` wants to see, enforcing profile visibility."""
     # Resolve target user + profile visibility settings
     result = await session.execute(
         select(User, UserProfile.profile_visibility)
@@ -303,7 +292,7 @@ async def get_user_progress(
 
     visibility = (row[1] or "friends").lower()
 
-    if target_user.id != current_user.id and not current_user.is_superuser:
+    if not current_user.is_superuser:
         if visibility == "private":
             raise HTTPException(status_code=403, detail="This profile is private")
 
@@ -319,6 +308,56 @@ async def get_user_progress(
             if friend_result.first() is None:
                 raise HTTPException(status_code=403, detail="Only friends can view this profile")
 
+    return target_user
+
+
+@router.get(
+    "/users/{user_id}/progress",
+    response_model=UserProgressResponse,
+    responses={304: {"description": "Progress unchanged (If-None-Match)"}},
+)
+async def get_user_progress(
+    user_id: str = Path(..., pattern=r"^\d+$", description="User ID (numeric string)"),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    """Get user progress and gamification stats.
+
+    Returns:
+    - XP, level, streaks
+    - Activity stats (lessons, words, time)
+    - Per-language XP breakdown
+    - Unlocked achievements
+    - Weekly activity chart data
+
+    The body comes from the user's progress snapshot (see app.services.progress_snapshot)
+    with its ETag; a matching If-None-Match gets a 304. Your own progress is a single
+    cache read; other users' profiles still check visibility first.
+    """
+    try:
+        target_user_id = int(user_id)
+    except ValueError as exc:  # pragma: no cover - defensive guard
+        raise HTTPException(status_code=404, detail="User not found") from exc
+
+    if target_user_id == current_user.id:
+        target_user = current_user
+    else:
+        target_user = await _load_viewable_user(session, current_user, target_user_id)
+
+    async def build() -> dict:
+        overview = await _build_user_progress(session, target_user)
+        return overview.model_dump(mode="json")
+
+    snapshot = await progress_snapshot(target_user.id, "gamification", build)
+    headers = {"ETag": snapshot.etag, "Cache-Control": "private, no-cache"}
+    if snapshot.matches(if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return JSONResponse(content=snapshot.body, headers=headers)
+
+
+async def _build_user_progress(session: AsyncSession, target_user: User) -> UserProgressResponse:
+    """Assemble the progress overview for ``target_user`` from the database."""
     progress = await _get_or_create_progress(session, target_user)
 
     # Get weekly activity
@@ -349,7 +388,7 @@ async def get_user_progress(
     )
 
     return UserProgressResponse(
-        user_id=user_id,
+        user_id=str(target_user.id),
         total_xp=progress.xp_total,
         level=level,
         current_streak=progress.streak_days,
@@ -382,7 +421,7 @@ async def get_achievements(
 
     # Define all available achievements
     all_achievements = _get_all_achievement_definitions()
-    rarity_map = await _compute_rarity_percentages(session)
+    rarity_map = (await rarity_snapshot(session)).percentages()
 
     responses = []
     for achievement in all_achievements:
@@ -494,70 +533,99 @@ async def get_leaderboard(
 
     Args:
         scope: global, friends, or language
-        period: daily, weekly, monthly, or all_time
+        period: daily, weekly, monthly (the current UTC day, ISO week or month), or all_time
         language_code: Required if scope=language
         limit: Max number of entries to return
 
     Returns leaderboard with rankings and current user's rank.
     """
-    # Build query based on period
-    cutoff_date = None
-    if period == "daily":
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=1)
-    elif period == "weekly":
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=7)
-    elif period == "monthly":
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=30)
-
-    # Base query
-    period_totals = None
-    if cutoff_date:
-        # For time-period leaderboards, aggregate XP from learning events within the window
-        period_totals = (
-            select(
-                LearningEvent.user_id.label("user_id"),
-                func.coalesce(
-                    func.sum(func.cast(LearningEvent.data["xp_earned"].astext, Integer)),
-                    0,
-                ).label("xp"),
+    if scope == "language" and not language_code:
+        raise HTTPException(status_code=400, detail="language_code is required for scope=language")
+    board_language = language_code if scope == "language" else None
+
+    friend_ids: Optional[List[int]] = None
+    if scope == "friends":
+        friends_result = await session.execute(
+            select(Friendship.friend_id).where(
+                Friendship.user_id == current_user.id,
+                Friendship.status == "accepted",
             )
-            .join(User, User.id == LearningEvent.user_id)
-            .where(
-                and_(
-                    User.is_active,
-                    LearningEvent.event_type == "lesson_completed",
-                    LearningEvent.event_timestamp >= cutoff_date,
+        )
+        friend_ids = [row[0] for row in friends_result.all()] + [current_user.id]
+
+    # Served from the Redis boards when they are available
+    leaderboards = get_leaderboard_service()
+    if leaderboards is not None:
+        board = xp_board(period, board_language)
+        if friend_ids is None:
+            page = await leaderboards.page(board, current_user.id, limit)
+        else:
+            page = await leaderboards.members_page(board, friend_ids, current_user.id, limit)
+        if page is not None:
+            users = await load_board_users(session, [user_id for user_id, _ in page.entries])
+            entries = []
+            for rank, (user_id, xp) in enumerate(page.entries, start=1):
+                if user_id not in users:
+                    continue  # deleted since the board was written
+                username, level = users[user_id]
+                entries.append(
+                    LeaderboardEntryResponse(
+                        user_id=str(user_id),
+                        username=username,
+                        rank=rank,
+                        xp=xp,
+                        level=level if level is not None else _calculate_level_from_xp(xp),
+                        language_code=language_code,
+                        is_current_user=user_id == current_user.id,
+                    )
                 )
+            return LeaderboardResponse(
+                scope=scope,
+                period=period,
+                entries=entries,
+                current_user_rank=page.rank,
+                total_users=max(page.total, page.rank),
             )
-            .group_by(LearningEvent.user_id)
-        ).subquery()
 
-        stmt = (
-            select(
-                period_totals.c.user_id,
-                User.username,
-                period_totals.c.xp.label("xp"),
-                UserProgress.level,
-            )
-            .join(User, User.id == period_totals.c.user_id)
-            .join(UserProgress, UserProgress.user_id == period_totals.c.user_id, isouter=True)
-            .order_by(desc(period_totals.c.xp))
-            .limit(limit)
-        )
+    # Per-user XP totals for the board
+    if period != "all_time" or board_language:
+        # Period and language boards sum the daily XP rollup over the current day/week/month
+        filters = [User.is_active]
+        if period != "all_time":
+            filters.append(UserDailyXP.day >= period_start(period).date())
+        if board_language:
+            filters.append(UserDailyXP.language_code == board_language)
+        if friend_ids is not None:
+            filters.append(UserDailyXP.user_id.in_(friend_ids))
+        totals = (
+            select(UserDailyXP.user_id.label("user_id"), func.sum(UserDailyXP.xp).label("xp"))
+            .join(User, User.id == UserDailyXP.user_id)
+            .where(and_(*filters))
+            .group_by(UserDailyXP.user_id)
+        ).subquery()
     else:
         # All-time leaderboard from UserProgress
-        stmt = (
-            select(
-                User.id.label("user_id"),
-                User.username,
-                UserProgress.xp_total.label("xp"),
-                UserProgress.level,
-            )
-            .join(UserProgress, UserProgress.user_id == User.id)
-            .where(User.is_active)
-            .order_by(desc(UserProgress.xp_total))
-            .limit(limit)
+        filters = [User.is_active]
+        if friend_ids is not None:
+            filters.append(UserProgress.user_id.in_(friend_ids))
+        totals = (
+            select(UserProgress.user_id.label("user_id"), UserProgress.xp_total.label("xp"))
+            .join(User, User.id == UserProgress.user_id)
+            .where(and_(*filters))
+        ).subquery()
+
+    stmt = (
+        select(
+            totals.c.user_id,
+            User.username,
+            totals.c.xp,
+            UserProgress.level,
         )
+        .join(User, User.id == totals.c.user_id)
+        .join(UserProgress, UserProgress.user_id == totals.c.user_id, isouter=True)
+        .order_by(desc(totals.c.xp))
+        .limit(limit)
+    )
 
     result = await session.execute(stmt)
     rows = result.all()
@@ -571,7 +639,7 @@ async def get_leaderboard(
         if is_current:
             current_user_rank = rank
 
-        level = row.level if hasattr(row, "level") else _calculate_level_from_xp(row.xp)
+        level = row.level if row.level is not None else _calculate_level_from_xp(row.xp)
 
         entries.append(
             LeaderboardEntryResponse(
@@ -585,58 +653,21 @@ async def get_leaderboard(
             )
         )
 
-    if cutoff_date:
-        total_users_result = await session.execute(select(func.count()).select_from(period_totals))
-        total_users = total_users_result.scalar_one_or_none() or 0
-    else:
-        total_users_result = await session.execute(
-            select(func.count())
-            .select_from(UserProgress)
-            .join(User, User.id == UserProgress.user_id)
-            .where(User.is_active)
-        )
-        total_users = total_users_result.scalar_one_or_none() or 0
+    total_users_result = await session.execute(select(func.count()).select_from(totals))
+    total_users = total_users_result.scalar_one_or_none() or 0
 
     # If current user not in top N, find their rank
     if current_user_rank == -1:
-        if cutoff_date:
-            current_xp_result = await session.execute(
-                select(
-                    func.coalesce(
-                        func.sum(func.cast(LearningEvent.data["xp_earned"].astext, Integer)),
-                        0,
-                    )
-                ).where(
-                    and_(
-                        LearningEvent.user_id == current_user.id,
-                        LearningEvent.event_type == "lesson_completed",
-                        LearningEvent.event_timestamp >= cutoff_date,
-                    )
-                )
-            )
-            current_xp = current_xp_result.scalar_one_or_none() or 0
-
-            higher_count_result = await session.execute(
-                select(func.count()).select_from(period_totals).where(period_totals.c.xp > current_xp)
-            )
-            higher_count = higher_count_result.scalar_one_or_none() or 0
-            current_user_rank = int(higher_count) + 1 if total_users else 1
-        else:
-            current_xp_result = await session.execute(
-                select(UserProgress.xp_total)
-                .join(User, User.id == UserProgress.user_id)
-                .where(UserProgress.user_id == current_user.id, User.is_active)
-            )
-            current_xp = current_xp_result.scalar_one_or_none() or 0
+        current_xp_result = await session.execute(
+            select(totals.c.xp).where(totals.c.user_id == current_user.id)
+        )
+        current_xp = current_xp_result.scalar_one_or_none() or 0
 
-            higher_count_result = await session.execute(
-                select(func.count())
-                .select_from(UserProgress)
-                .join(User, User.id == UserProgress.user_id)
-                .where(User.is_active, UserProgress.xp_total > current_xp)
-            )
-            higher_count = higher_count_result.scalar_one_or_none() or 0
-            current_user_rank = int(higher_count) + 1
+        higher_count_result = await session.execute(
+            select(func.count()).select_from(totals).where(totals.c.xp > current_xp)
+        )
+        higher_count = higher_count_result.scalar_one_or_none() or 0
+        current_user_rank = int(higher_count) + 1
 
     total_users = max(total_users, current_user_rank if current_user_rank > 0 else 0)
 
@@ -718,7 +749,8 @@ async def complete_lesson(
             "accuracy": request.accuracy,
         },
     )
-    session.add(event)
+    emit_learning_event(session, event)
+    await record_daily_xp(session, current_user.id, request.xp_earned, request.language_code, now)
 
     # Update quest progress
     await _update_quest_progress(session, current_user.id, "lesson_completed", 1)
@@ -809,43 +841,6 @@ def _tier_to_rarity(tier: int) -> str:
     }.get(tier, "common")
 
 
-async def _compute_rarity_percentages(session: AsyncSession) -> Dict[str, float]:
-    total_users = await session.scalar(select(func.count(User.id)).where(User.is_active))
-    if not total_users or total_users <= 0:
-        return {}
-
-    result = await session.execute(
-        select(
-            UserAchievement.achievement_type,
-            UserAchievement.achievement_id,
-            func.count(UserAchievement.id),
-        ).group_by(UserAchievement.achievement_type, UserAchievement.achievement_id)
-    )
-    data: Dict[str, float] = {}
-    for achievement_type, achievement_id, count in result:
-        key = f"{achievement_type}:{achievement_id}"
-        data[key] = (count / total_users) * 100.0
-    return data
-
-
-async def _compute_rarity_for(
-    session: AsyncSession, achievement_type: str, achievement_id: str
-) -> float | None:
-    total_users = await session.scalar(select(func.count(User.id)).where(User.is_active))
-    if not total_users or total_users <= 0:
-        return None
-    unlocked = await session.scalar(
-        select(func.count(UserAchievement.id)).where(
-            and_(
-                UserAchievement.achievement_type == achievement_type,
-                UserAchievement.achievement_id == achievement_id,
-            )
-        )
-    )
-    unlocked = unlocked or 0
-    return (unlocked / total_users) * 100.0
-
-
 async def _create_daily_quests(db: AsyncSession, user: User) -> List[UserQuest]:
     """Create daily quests for a user."""
     now = datetime.now(timezone.utc)
@@ -989,7 +984,7 @@ async def update_user_progress(
     await session.refresh(progress)
 
     # Return full progress response
-    return await get_user_progress(user_id, current_user, session)
+    return await _build_user_progress(session, current_user)
 
 
 @router.get("/users/{user_id}/achievements", response_model=List[AchievementResponse])
@@ -1013,7 +1008,7 @@ async def get_user_achievements_only(
     # Get all achievement definitions
     all_achievements = _get_all_achievement_definitions()
     achievement_map = {a["key"]: a for a in all_achievements}
-    rarity_map = await _compute_rarity_percentages(session)
+    rarity_map = (await rarity_snapshot(session)).percentages()
 
     # Return only unlocked achievements with full details
     responses = []
@@ -1094,7 +1089,7 @@ async def unlock_achievement(
         if not achievement_def:
             raise HTTPException(status_code=404, detail="Achievement definition not found")
 
-        rarity_percent = await _compute_rarity_for(session, achievement_type, achievement_key)
+        rarity_percent = (await rarity_snapshot(session)).percent(f"{achievement_type}:{achievement_key}")
 
         return AchievementResponse(
             id=achievement_def["id"],
@@ -1142,7 +1137,7 @@ async def unlock_achievement(
     await session.commit()
     await session.refresh(user_achievement)
 
-    rarity_percent = await _compute_rarity_for(session, achievement_type, achievement_key)
+    rarity_percent = (await rarity_snapshot(session)).percent(f"{achievement_type}:{achievement_key}")
 
     # Send achievement notification email (async, don't block response)
     try:
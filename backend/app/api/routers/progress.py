@@ -2,21 +2,23 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Path, Query, Response, status
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas.user_schemas import (
+    ProgressBatchRequest,
     ProgressUpdateRequest,
     UserAchievementResponse,
     UserProgressResponse,
     UserSkillResponse,
     UserTextStatsResponse,
 )
-from app.db.seed_achievements import check_and_unlock_achievements
+from app.db.seed_achievements import check_and_unlock_achievements, record_language_lesson
 from app.db.session import get_session
 from app.db.user_models import (
     LearningEvent,
@@ -27,6 +29,9 @@ from app.db.user_models import (
     UserTextStats,
 )
 from app.security.auth import get_current_user
+from app.services.daily_xp import record_daily_xp
+from app.services.event_sink import emit_learning_event
+from app.services.progress_snapshot import progress_snapshot
 
 router = APIRouter(prefix="/progress", tags=["progress"])
 
@@ -62,12 +67,34 @@ class ReadingProgressUpdateRequest(BaseModel):
 # ---------------------------------------------------------------------
 
 
-@router.get("/me", response_model=UserProgressResponse)
+@router.get(
+    "/me",
+    response_model=UserProgressResponse,
+    responses={304: {"description": "Progress unchanged (If-None-Match)"}},
+)
 async def get_user_progress(
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
-) -> UserProgressResponse:
-    """Get the current user's overall progress and gamification metrics."""
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    """Get the current user's overall progress and gamification metrics.
+
+    Served from the user's progress snapshot with its ETag; a matching
+    If-None-Match gets a 304.
+    """
+
+    async def build() -> dict:
+        return (await _build_user_progress(session, current_user)).model_dump(mode="json")
+
+    snapshot = await progress_snapshot(current_user.id, "progress", build)
+    headers = {"ETag": snapshot.etag, "Cache-Control": "private, no-cache"}
+    if snapshot.matches(if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return JSONResponse(content=snapshot.body, headers=headers)
+
+
+async def _build_user_progress(session: AsyncSession, current_user: User) -> UserProgressResponse:
+    """Load (or create) the user's progress row and compute the level fields."""
     result = await session.execute(select(UserProgress).where(UserProgress.user_id == current_user.id))
     progress = result.scalar_one_or_none()
 
@@ -128,32 +155,16 @@ async def get_user_progress(
     )
 
 
-@router.post("/me/update", response_model=UserProgressResponse)
-async def update_user_progress(
-    update: ProgressUpdateRequest,
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
-) -> UserProgressResponse:
-    """Update user progress after completing a lesson or activity.
-
-    This endpoint:
-    1. Adds XP to the user's total
-    2. Updates streak tracking
-    3. Logs a learning event
-    4. Recalculates level
-
-    Uses row-level locking (SELECT FOR UPDATE) to prevent race conditions
-    when multiple concurrent requests update the same user's progress.
-    """
-    # Use SELECT FOR UPDATE to lock the row and prevent race conditions
+async def _lock_progress(session: AsyncSession, user_id: int) -> UserProgress:
+    """Load the user's progress row with SELECT FOR UPDATE, creating it if missing."""
     result = await session.execute(
-        select(UserProgress).where(UserProgress.user_id == current_user.id).with_for_update()
+        select(UserProgress).where(UserProgress.user_id == user_id).with_for_update()
     )
     progress = result.scalar_one_or_none()
 
     if not progress:
         progress = UserProgress(
-            user_id=current_user.id,
+            user_id=user_id,
             xp_total=0,
             level=0,
             streak_days=0,
@@ -168,7 +179,11 @@ async def update_user_progress(
         )
         session.add(progress)
         await session.flush()
+    return progress
 
+
+def _apply_lesson(progress: UserProgress, update: ProgressUpdateRequest, now: datetime) -> tuple[int, int]:
+    """Apply one lesson completed at ``now`` to ``progress``; returns ``(old_level, new_level)``."""
     old_level = UserProgressResponse.calculate_level(progress.xp_total)
 
     # Update XP and award coins (1 coin per 10 XP)
@@ -177,7 +192,6 @@ async def update_user_progress(
     progress.coins += coins_earned
 
     # Update streak logic
-    now = datetime.now(timezone.utc)
     today = datetime(now.year, now.month, now.day, tzinfo=timezone.utc)
 
     if progress.last_streak_update:
@@ -226,12 +240,33 @@ async def update_user_progress(
     # Calculate new level
     new_level = UserProgressResponse.calculate_level(progress.xp_total)
     progress.level = new_level
+    return old_level, new_level
 
-    # Log learning event (include language and completion time for achievement tracking)
-    now = datetime.now(timezone.utc)
-    event = LearningEvent(
-        user_id=current_user.id,
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def _lesson_time(occurred_at: datetime | None, previous: datetime | None, now: datetime) -> datetime:
+    """When a queued lesson counts as done: its device time, kept in order and never in the future."""
+    at = _as_utc(occurred_at) if occurred_at else now
+    if previous is not None:
+        at = max(at, previous)
+    return min(at, now)
+
+
+def _completion_seconds(update: ProgressUpdateRequest) -> int | None:
+    return update.time_spent_minutes * 60 if update.time_spent_minutes else None
+
+
+def _lesson_event(
+    user_id: int, update: ProgressUpdateRequest, old_level: int, new_level: int, at: datetime
+) -> LearningEvent:
+    # Include language and completion time for achievement tracking
+    return LearningEvent(
+        user_id=user_id,
         event_type="lesson_complete",
+        event_timestamp=at,
         data={
             "lesson_id": update.lesson_id,
             "xp_gained": update.xp_gained,
@@ -239,26 +274,31 @@ async def update_user_progress(
             "old_level": old_level,
             "new_level": new_level,
             "level_up": new_level > old_level,
-            "language": getattr(update, "language", None),  # Language code (grc, lat, etc.)
-            "completion_time_seconds": update.time_spent_minutes * 60 if update.time_spent_minutes else None,
+            "language": update.language,  # Language code (grc, lat, etc.)
+            "completion_time_seconds": _completion_seconds(update),
         },
     )
-    session.add(event)
 
-    # Check for achievement unlocks BEFORE committing
-    # (so achievements are added to the same transaction)
+
+async def _finish_progress_update(
+    session: AsyncSession,
+    current_user: User,
+    progress: UserProgress,
+    progress_data: dict,
+) -> UserProgressResponse:
+    """Check achievements against the updated progress, commit, and build the response."""
     progress_data = {
         "total_lessons": progress.total_lessons,
         "perfect_lessons": progress.perfect_lessons,
         "streak_days": progress.streak_days,
         "xp_total": progress.xp_total,
-        "level": new_level,
+        "level": progress.level,
         "coins": progress.coins,
-        "language": getattr(update, "language", None),
-        "completion_time_seconds": update.time_spent_minutes * 60 if update.time_spent_minutes else None,
-        "lesson_timestamp": now,
+        **progress_data,
     }
 
+    # Check for achievement unlocks BEFORE committing
+    # (so achievements are added to the same transaction)
     newly_unlocked: list[UserAchievement] = []
     try:
         newly_unlocked = await check_and_unlock_achievements(session, current_user.id, progress_data)
@@ -270,12 +310,12 @@ async def update_user_progress(
 
         traceback.print_exc()
 
-    # Commit everything: progress update, learning event, AND newly unlocked achievements
+    # Commit everything: progress update, learning events, AND newly unlocked achievements
     await session.commit()
     await session.refresh(progress)
 
     # Get updated progress and add newly unlocked achievements
-    progress_response = await get_user_progress(current_user, session)
+    progress_response = await _build_user_progress(session, current_user)
 
     # Populate newly unlocked achievements if any
     if newly_unlocked:
@@ -286,6 +326,102 @@ async def update_user_progress(
     return progress_response
 
 
+@router.post("/me/update", response_model=UserProgressResponse)
+async def update_user_progress(
+    update: ProgressUpdateRequest,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> UserProgressResponse:
+    """Update user progress after completing a lesson or activity.
+
+    This endpoint:
+    1. Adds XP to the user's total
+    2. Updates streak tracking
+    3. Logs a learning event
+    4. Recalculates level
+
+    Uses row-level locking (SELECT FOR UPDATE) to prevent race conditions
+    when multiple concurrent requests update the same user's progress.
+    """
+    progress = await _lock_progress(session, current_user.id)
+    now = datetime.now(timezone.utc)
+    old_level, new_level = _apply_lesson(progress, update, now)
+
+    # Per-language lesson counters for achievements (seeded from past events on first use,
+    # so this runs before the current lesson's event is added)
+    language_lessons = await record_language_lesson(session, progress, update.language)
+
+    emit_learning_event(session, _lesson_event(current_user.id, update, old_level, new_level, now))
+    await record_daily_xp(session, current_user.id, update.xp_gained, update.language, now)
+
+    return await _finish_progress_update(
+        session,
+        current_user,
+        progress,
+        {
+            "language": update.language,
+            "language_lessons": language_lessons,
+            "completion_time_seconds": _completion_seconds(update),
+            "lesson_timestamp": now,
+        },
+    )
+
+
+@router.post("/me/update/batch", response_model=UserProgressResponse)
+async def update_user_progress_batch(
+    batch: ProgressBatchRequest,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> UserProgressResponse:
+    """Apply lesson completions queued by an offline client, in order.
+
+    The whole batch runs in one transaction under a single progress row lock:
+    streak and level transitions are computed in memory event by event, the
+    learning events go to the event sink together, the daily XP rollup gets one upsert
+    per day and language, and achievements are checked once at the end.
+
+    ``occurred_at`` places each lesson on the day it was done. It is clamped so
+    events never go back before the previous lesson or forward past now.
+    """
+    progress = await _lock_progress(session, current_user.id)
+    now = datetime.now(timezone.utc)
+    at = _as_utc(progress.last_lesson_at) if progress.last_lesson_at else None
+
+    # (UTC day, language) -> (first lesson time, xp, lessons): one rollup upsert per group
+    daily_xp: dict[tuple[date, str | None], tuple[datetime, int, int]] = {}
+    language_lessons: dict[str, int] = {}
+    completion_times: list[int] = []
+    lesson_times: list[datetime] = []
+    for update in batch.events:
+        at = _lesson_time(update.occurred_at, at, now)
+        lesson_times.append(at)
+        old_level, new_level = _apply_lesson(progress, update, at)
+        language_lessons = await record_language_lesson(session, progress, update.language)
+        emit_learning_event(session, _lesson_event(current_user.id, update, old_level, new_level, at))
+
+        day_at, xp, lessons = daily_xp.get((at.date(), update.language), (at, 0, 0))
+        daily_xp[(at.date(), update.language)] = (day_at, xp + update.xp_gained, lessons + 1)
+        if update.time_spent_minutes:
+            completion_times.append(_completion_seconds(update))
+
+    for (_, language), (day_at, xp, lessons) in daily_xp.items():
+        await record_daily_xp(session, current_user.id, xp, language, day_at, lessons=lessons)
+
+    last = batch.events[-1]
+    return await _finish_progress_update(
+        session,
+        current_user,
+        progress,
+        {
+            "language": last.language,
+            "language_lessons": language_lessons,
+            "completion_time_seconds": min(completion_times) if completion_times else None,
+            "lesson_timestamp": at,
+            "lesson_timestamps": lesson_times,
+        },
+    )
+
+
 @router.get("/me/skills", response_model=list[UserSkillResponse])
 async def get_user_skills(
     current_user: User = Depends(get_current_user),
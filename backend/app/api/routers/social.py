@@ -17,6 +17,7 @@ from app.db.social_models import (
 )
 from app.db.user_models import User, UserProfile, UserProgress
 from app.security.auth import get_current_user
+from app.services.leaderboards import get_leaderboard_service, load_board_users, xp_board
 
 router = APIRouter(prefix="/social", tags=["Social"])
 
@@ -166,6 +167,35 @@ async def get_leaderboard(
         else:
             effective_board_type = "local"
 
+    # Served from the Redis boards when they are available
+    leaderboards = get_leaderboard_service()
+    if leaderboards is not None:
+        if effective_board_type == "friends":
+            page = await leaderboards.members_page(xp_board("all_time"), friend_ids, current_user.id, limit)
+        else:
+            board = xp_board("all_time", region=user_region if effective_board_type == "local" else None)
+            page = await leaderboards.page(board, current_user.id, limit)
+        if page is not None:
+            board_users = await load_board_users(session, [user_id for user_id, _ in page.entries])
+            users = [
+                LeaderboardUserResponse(
+                    rank=rank,
+                    user_id=user_id,
+                    username=board_users[user_id][0],
+                    xp=xp,
+                    level=board_users[user_id][1] or 1,
+                    is_current_user=user_id == current_user.id,
+                )
+                for rank, (user_id, xp) in enumerate(page.entries, start=1)
+                if user_id in board_users
+            ]
+            return LeaderboardResponse(
+                board_type=board_type,
+                users=users,
+                current_user_rank=page.rank,
+                total_users=page.total,
+            )
+
     # Build query
     if effective_board_type == "global":
         # Get top users by XP
@@ -5,7 +5,7 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
-from sqlalchemy import and_, case, func, select
+from sqlalchemy import and_, case, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_session
@@ -69,6 +69,33 @@ class SRSReviewResponse(BaseModel):
     days_until_next_review: int
 
 
+class SRSSessionReview(BaseModel):
+    """One review inside a review batch."""
+
+    card_id: int = Field(..., gt=0, description="SRS card ID must be positive")
+    quality: int = Field(..., ge=1, le=4, description="Review quality: 1=Again, 2=Hard, 3=Good, 4=Easy")
+
+
+class SRSReviewBatchRequest(BaseModel):
+    """Reviews from a study session, in the order they were answered."""
+
+    reviews: List[SRSSessionReview] = Field(..., min_length=1, max_length=200)
+
+
+class SRSReviewBatchResponse(BaseModel):
+    """Per-review results plus the XP granted for the whole batch."""
+
+    results: List[SRSReviewResponse]
+    xp_earned: int
+
+
+class SRSSessionResponse(BaseModel):
+    """A batch of due cards preloaded for a study session."""
+
+    cards: List[SRSCardResponse]
+    due_total: int  # all due cards matching the filter, including ones beyond this batch
+
+
 class SRSStats(BaseModel):
     """Overall SRS statistics."""
 
@@ -133,23 +160,7 @@ async def create_srs_card(
     await session.commit()
     await session.refresh(card)
 
-    return SRSCardResponse(
-        id=card.id,
-        card_type=card.card_type,
-        content_id=card.content_id,
-        state=card.state,
-        due_at=card.due_at,
-        stability=card.stability,
-        difficulty=card.difficulty,
-        elapsed_days=card.elapsed_days,
-        scheduled_days=card.scheduled_days,
-        reps=card.reps,
-        lapses=card.lapses,
-        p_recall=card.p_recall,
-        last_review_at=card.last_review_at,
-        created_at=card.created_at,
-        updated_at=card.updated_at,
-    )
+    return _card_response(card)
 
 
 @router.get("/cards/due", response_model=List[SRSCardResponse])
@@ -163,54 +174,14 @@ async def get_due_cards(
 
     Returns cards in optimal order: new → learning → review → relearning.
     """
-    now = datetime.now(timezone.utc)
-
-    # Build query for due cards
-    query = select(UserSRSCard).where(
-        and_(
-            UserSRSCard.user_id == current_user.id,
-            UserSRSCard.due_at <= now,
-        )
-    )
-
-    if card_type:
-        query = query.where(UserSRSCard.card_type == card_type)
+    query = _due_cards_query(current_user.id, card_type, datetime.now(timezone.utc))
 
-    # Order by state priority (new first, then learning, then relearning, then review)
-    query = query.order_by(
-        case(
-            (UserSRSCard.state == "new", 1),
-            (UserSRSCard.state == "learning", 2),
-            (UserSRSCard.state == "relearning", 3),
-            (UserSRSCard.state == "review", 4),
-            else_=5,
-        ),
-        UserSRSCard.due_at,  # Then by due date
-    ).limit(limit)
+    query = query.order_by(*_DUE_ORDER).limit(limit)
 
     result = await session.execute(query)
     cards = result.scalars().all()
 
-    return [
-        SRSCardResponse(
-            id=c.id,
-            card_type=c.card_type,
-            content_id=c.content_id,
-            state=c.state,
-            due_at=c.due_at,
-            stability=c.stability,
-            difficulty=c.difficulty,
-            elapsed_days=c.elapsed_days,
-            scheduled_days=c.scheduled_days,
-            reps=c.reps,
-            lapses=c.lapses,
-            p_recall=c.p_recall,
-            last_review_at=c.last_review_at,
-            created_at=c.created_at,
-            updated_at=c.updated_at,
-        )
-        for c in cards
-    ]
+    return [_card_response(c) for c in cards]
 
 
 @router.post("/cards/{card_id}/review", response_model=SRSReviewResponse)
@@ -243,58 +214,101 @@ async def review_srs_card(
         raise HTTPException(status_code=404, detail="Card not found")
 
     now = datetime.now(timezone.utc)
+    values = _review_card(_card_state(card), review.quality, now)
+    for key in _REVIEW_FIELDS:
+        setattr(card, key, values[key])
 
-    # Calculate time since last review
-    if card.last_review_at:
-        elapsed_days = (now - card.last_review_at).days
-    else:
-        elapsed_days = 0
+    # Grant XP for completing review, in the same transaction as the card update
+    progress_query = select(UserProgress).where(UserProgress.user_id == current_user.id)
+    progress_result = await session.execute(progress_query)
+    progress = progress_result.scalar_one_or_none()
 
-    # Apply FSRS algorithm
-    new_stability, new_difficulty, new_state, scheduled_days = _calculate_fsrs_schedule(
-        quality=review.quality,
-        current_stability=card.stability,
-        current_difficulty=card.difficulty,
-        current_state=card.state,
-        elapsed_days=elapsed_days,
+    if progress:
+        progress.xp_total += _REVIEW_XP.get(review.quality, 10)
+
+    await session.commit()
+
+    return _review_response(values)
+
+
+# ---------------------------------------------------------------------
+# Review Sessions
+# ---------------------------------------------------------------------
+
+
+@router.get("/session", response_model=SRSSessionResponse)
+async def start_review_session(
+    card_type: Optional[str] = Query(default=None, description="Filter by card type: lemma, grammar, morph"),
+    size: int = Query(default=50, ge=1, le=200, description="Cards to preload for the session"),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    """Preload a batch of due cards for a study session.
+
+    One query returns the batch (in the same order as ``/cards/due``) and the total
+    number of due cards. Answers go to ``POST /srs/session/reviews`` in batches.
+    """
+    query = _due_cards_query(current_user.id, card_type, datetime.now(timezone.utc))
+    query = query.add_columns(func.count().over()).order_by(*_DUE_ORDER).limit(size)
+
+    result = await session.execute(query)
+    rows = result.all()
+
+    return SRSSessionResponse(
+        cards=[_card_response(card) for card, _ in rows],
+        due_total=rows[0][1] if rows else 0,
     )
 
-    # Update card
-    card.stability = new_stability
-    card.difficulty = new_difficulty
-    card.state = new_state
-    card.elapsed_days = elapsed_days
-    card.scheduled_days = scheduled_days
-    card.reps += 1
-    card.last_review_at = now
-    card.due_at = now + timedelta(days=scheduled_days)
 
-    # Track lapses (failures)
-    if review.quality == 1:
-        card.lapses += 1
+@router.post("/session/reviews", response_model=SRSReviewBatchResponse)
+async def submit_review_batch(
+    batch: SRSReviewBatchRequest,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    """Apply a batch of reviews from a study session.
 
-    await session.commit()
+    The reviewed cards are locked and loaded with one query, FSRS schedules are
+    computed in memory in answer order (a card answered twice sees its first
+    result), and the batch is written with one bulk UPDATE plus one XP increment,
+    all in a single transaction.
+    """
+    card_ids = {review.card_id for review in batch.reviews}
+    result = await session.execute(
+        select(*_STATE_COLUMNS)
+        .where(UserSRSCard.user_id == current_user.id, UserSRSCard.id.in_(card_ids))
+        .with_for_update()
+    )
+    states = {row.id: dict(row._mapping) for row in result.all()}
 
-    # Grant XP for completing review
-    progress_query = select(UserProgress).where(UserProgress.user_id == current_user.id)
-    progress_result = await session.execute(progress_query)
-    progress = progress_result.scalar_one_or_none()
+    missing = card_ids - states.keys()
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Cards not found: {sorted(missing)}")
+
+    now = datetime.now(timezone.utc)
+    results = []
+    xp_earned = 0
+    for review in batch.reviews:
+        values = _review_card(states[review.card_id], review.quality, now)
+        states[review.card_id].update(values)
+        results.append(_review_response(values))
+        xp_earned += _REVIEW_XP.get(review.quality, 10)
+
+    await session.execute(
+        update(UserSRSCard),
+        [{key: state[key] for key in ("id", *_REVIEW_FIELDS)} for state in states.values()],
+    )
 
+    progress_result = await session.execute(
+        select(UserProgress).where(UserProgress.user_id == current_user.id).with_for_update()
+    )
+    progress = progress_result.scalar_one_or_none()
     if progress:
-        # Grant 5-15 XP based on quality
-        xp_rewards = {1: 5, 2: 8, 3: 12, 4: 15}
-        xp_earned = xp_rewards.get(review.quality, 10)
         progress.xp_total += xp_earned
-        await session.commit()
 
-    return SRSReviewResponse(
-        card_id=card.id,
-        next_due_at=card.due_at,
-        new_stability=new_stability,
-        new_difficulty=new_difficulty,
-        new_state=new_state,
-        days_until_next_review=scheduled_days,
-    )
+    await session.commit()
+
+    return SRSReviewBatchResponse(results=results, xp_earned=xp_earned if progress else 0)
 
 
 @router.get("/stats", response_model=SRSStats)
@@ -366,6 +380,124 @@ async def delete_srs_card(
     return {"message": "Card deleted successfully", "card_id": card_id}
 
 
+# ---------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------
+
+# XP per review by quality
+_REVIEW_XP = {1: 5, 2: 8, 3: 12, 4: 15}
+
+# State priority (new first, then learning, then relearning, then review), then due date
+_DUE_ORDER = (
+    case(
+        (UserSRSCard.state == "new", 1),
+        (UserSRSCard.state == "learning", 2),
+        (UserSRSCard.state == "relearning", 3),
+        (UserSRSCard.state == "review", 4),
+        else_=5,
+    ),
+    UserSRSCard.due_at,
+)
+
+# Columns a review reads, and the ones it writes
+_STATE_COLUMNS = (
+    UserSRSCard.id,
+    UserSRSCard.stability,
+    UserSRSCard.difficulty,
+    UserSRSCard.state,
+    UserSRSCard.reps,
+    UserSRSCard.lapses,
+    UserSRSCard.last_review_at,
+)
+_REVIEW_FIELDS = (
+    "stability",
+    "difficulty",
+    "state",
+    "elapsed_days",
+    "scheduled_days",
+    "reps",
+    "lapses",
+    "last_review_at",
+    "due_at",
+)
+
+
+def _due_cards_query(user_id: int, card_type: Optional[str], now: datetime):
+    query = select(UserSRSCard).where(
+        and_(
+            UserSRSCard.user_id == user_id,
+            UserSRSCard.due_at <= now,
+        )
+    )
+    if card_type:
+        query = query.where(UserSRSCard.card_type == card_type)
+    return query
+
+
+def _card_response(card: UserSRSCard) -> SRSCardResponse:
+    return SRSCardResponse(
+        id=card.id,
+        card_type=card.card_type,
+        content_id=card.content_id,
+        state=card.state,
+        due_at=card.due_at,
+        stability=card.stability,
+        difficulty=card.difficulty,
+        elapsed_days=card.elapsed_days,
+        scheduled_days=card.scheduled_days,
+        reps=card.reps,
+        lapses=card.lapses,
+        p_recall=card.p_recall,
+        last_review_at=card.last_review_at,
+        created_at=card.created_at,
+        updated_at=card.updated_at,
+    )
+
+
+def _card_state(card: UserSRSCard) -> dict:
+    return {column.key: getattr(card, column.key) for column in _STATE_COLUMNS}
+
+
+def _review_card(state: dict, quality: int, now: datetime) -> dict:
+    """New scheduling values for a card in ``state`` (see ``_STATE_COLUMNS``) reviewed at ``now``."""
+    # Calculate time since last review
+    elapsed_days = (now - state["last_review_at"]).days if state["last_review_at"] else 0
+
+    # Apply FSRS algorithm
+    new_stability, new_difficulty, new_state, scheduled_days = _calculate_fsrs_schedule(
+        quality=quality,
+        current_stability=state["stability"],
+        current_difficulty=state["difficulty"],
+        current_state=state["state"],
+        elapsed_days=elapsed_days,
+    )
+
+    return {
+        "id": state["id"],
+        "stability": new_stability,
+        "difficulty": new_difficulty,
+        "state": new_state,
+        "elapsed_days": elapsed_days,
+        "scheduled_days": scheduled_days,
+        "reps": state["reps"] + 1,
+        # Track lapses (failures)
+        "lapses": state["lapses"] + (1 if quality == 1 else 0),
+        "last_review_at": now,
+        "due_at": now + timedelta(days=scheduled_days),
+    }
+
+
+def _review_response(values: dict) -> SRSReviewResponse:
+    return SRSReviewResponse(
+        card_id=values["id"],
+        next_due_at=values["due_at"],
+        new_stability=values["stability"],
+        new_difficulty=values["difficulty"],
+        new_state=values["state"],
+        days_until_next_review=values["scheduled_days"],
+    )
+
+
 # ---------------------------------------------------------------------
 # FSRS Algorithm Implementation
 # ---------------------------------------------------------------------
@@ -292,6 +292,20 @@ class ProgressUpdateRequest(BaseModel):
     language: str | None = Field(None, description="Language code (grc, lat, hbo, san, etc.)")
 
 
+class ProgressBatchEvent(ProgressUpdateRequest):
+    """One queued lesson completion in a batch progress update."""
+
+    occurred_at: datetime | None = Field(
+        None, description="When the lesson was completed on the device (defaults to upload time)"
+    )
+
+
+class ProgressBatchRequest(BaseModel):
+    """Lesson completions queued by an offline client, oldest first."""
+
+    events: list[ProgressBatchEvent] = Field(..., min_length=1, max_length=100)
+
+
 class UserSkillResponse(BaseModel):
     """Response containing skill data for a specific topic."""
 
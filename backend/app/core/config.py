@@ -17,6 +17,8 @@ class Settings(BaseSettings):
     # Redis URL - optional but recommended for rate limiting
     # (falls back to allowing all requests if unavailable)
     REDIS_URL: str | None = Field(default=None)
+    # Optional YAML override for rate-limit policies (reloaded when the file changes)
+    RATE_LIMIT_POLICY_FILE: str | None = Field(default=None)
 
     @field_validator("DATABASE_URL", mode="before")
     @classmethod
@@ -62,10 +64,24 @@ class Settings(BaseSettings):
     LESSONS_OPENAI_DEFAULT_MODEL: str = Field(default="gpt-5-nano-2025-08-07")
     LESSONS_ANTHROPIC_DEFAULT_MODEL: str = Field(default="claude-sonnet-4-5-20250929")
     LESSONS_GOOGLE_DEFAULT_MODEL: str = Field(default="gemini-2.5-flash")
+    # Lesson context cache (canonical lines and text-range summaries)
+    LESSON_CONTEXT_CACHE_TTL_SECONDS: int = Field(default=600)
+    LESSON_CONTEXT_CACHE_MAX_ENTRIES: int = Field(default=512)
+    # Empty results (language without a canon, timed-out query) are retried after this long
+    LESSON_CONTEXT_CACHE_EMPTY_TTL_SECONDS: int = Field(default=30)
     TTS_ENABLED: bool = Field(default=True)
     TTS_LICENSE_GUARD: bool = Field(default=True)
+    TTS_LICENSE_MAP_TTL_SECONDS: int = Field(default=3600)
     TTS_DEFAULT_MODEL: str = Field(default="tts-1")  # OpenAI TTS: tts-1 or tts-1-hd
     TTS_GOOGLE_DEFAULT_MODEL: str = Field(default="gemini-2.5-flash-tts")  # Gemini TTS
+    # Concurrent lesson-audio syntheses allowed per TTS provider
+    TTS_RENDER_CONCURRENCY: int = Field(default=4)
+    # Recently synthesized /tts/speak clips kept for Range and If-None-Match follow-ups
+    TTS_CLIP_CACHE_MAX_BYTES: int = Field(default=64 * 1024 * 1024)
+    # Lesson audio cache eviction (least recently used first, then by age)
+    AUDIO_CACHE_MAX_BYTES: int = Field(default=2 * 1024 * 1024 * 1024)
+    AUDIO_CACHE_MAX_AGE_DAYS: int = Field(default=90)
+    AUDIO_CACHE_EVICT_INTERVAL_SECONDS: int = Field(default=600)
 
     # Health check models (for testing vendor API connectivity) - October 2025
     HEALTH_OPENAI_MODEL: str = Field(default="gpt-5-mini-2025-08-07")
@@ -89,6 +105,39 @@ class Settings(BaseSettings):
     DEMO_DAILY_REQUEST_LIMIT: int = Field(default=30)  # requests per day
     DEMO_WEEKLY_REQUEST_LIMIT: int = Field(default=150)  # requests per week
     DEMO_ENABLED: bool = Field(default=True)  # Master switch for demo keys
+    # How often Redis demo counters are copied into demo_api_usage (only used with REDIS_URL)
+    DEMO_USAGE_FLUSH_INTERVAL_SECONDS: int = Field(default=60)
+
+    # How often the Redis leaderboards are rebuilt from Postgres (only used with REDIS_URL)
+    LEADERBOARD_REBUILD_INTERVAL_SECONDS: int = Field(default=900)
+
+    # How often achievement rarity is recomputed from Postgres, and how long a worker serves its
+    # copy before reloading the shared one from Redis (see app.services.achievement_rarity)
+    ACHIEVEMENT_RARITY_REFRESH_SECONDS: int = Field(default=3600)
+    ACHIEVEMENT_RARITY_CACHE_TTL_SECONDS: float = Field(default=60.0)
+
+    # Write-behind learning_event sink (see app.services.event_sink): rows are COPYed in batches of
+    # EVENT_SINK_BATCH_SIZE or every EVENT_SINK_FLUSH_INTERVAL_MS, and drained at shutdown
+    EVENT_SINK_ENABLED: bool = Field(default=True)
+    EVENT_SINK_BATCH_SIZE: int = Field(default=500)
+    EVENT_SINK_FLUSH_INTERVAL_MS: int = Field(default=250)
+    EVENT_SINK_MAX_QUEUE: int = Field(default=10000)
+    EVENT_SINK_DRAIN_TIMEOUT_SECONDS: float = Field(default=10.0)
+    # A worker whose journal heartbeat is older than EVENT_SINK_RECOVERY_AGE_SECONDS has crashed; its
+    # Redis journal is replayed by the check every EVENT_SINK_RECOVERY_INTERVAL_SECONDS (only with REDIS_URL)
+    EVENT_SINK_RECOVERY_AGE_SECONDS: int = Field(default=300)
+    EVENT_SINK_RECOVERY_INTERVAL_SECONDS: int = Field(default=60)
+
+    # learning_event is partitioned by month (see app.services.event_partitions): partitions are created
+    # this many months ahead, and with a retention set, months older than that are rolled up into
+    # learning_event_monthly and dropped (None keeps every event)
+    LEARNING_EVENT_PARTITIONS_AHEAD: int = Field(default=3)
+    LEARNING_EVENT_RETENTION_MONTHS: int | None = Field(default=None, ge=1)
+
+    # Cached home-screen progress bodies (see app.services.progress_snapshot): kept in Redis with
+    # REDIS_URL, otherwise in-process for up to PROGRESS_SNAPSHOT_LOCAL_MAX_USERS users
+    PROGRESS_SNAPSHOT_TTL_SECONDS: int = Field(default=900)
+    PROGRESS_SNAPSHOT_LOCAL_MAX_USERS: int = Field(default=10000)
 
     # Echo Fallback Control (allows app to work without API keys)
     ECHO_FALLBACK_ENABLED: bool = Field(default=True)
@@ -99,6 +148,9 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=60 * 24 * 7)  # 7 days
     REFRESH_TOKEN_EXPIRE_MINUTES: int = Field(default=60 * 24 * 30)  # 30 days
     ENCRYPTION_KEY: str | None = Field(default=None)  # For encrypting user API keys (BYOK)
+    # How stale another worker's view of revoked tokens / user rows may be (see app.security.auth_cache)
+    AUTH_REVOCATION_SYNC_SECONDS: float = Field(default=5.0)
+    AUTH_USER_CACHE_TTL_SECONDS: float = Field(default=30.0)
 
     # Error Tracking & Monitoring
     SENTRY_DSN: str | None = Field(default=None)  # Sentry DSN for error tracking in production
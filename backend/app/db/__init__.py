@@ -21,9 +21,11 @@ from .social_models import (
 )
 from .user_models import (
     LearningEvent,
+    LearningEventMonthly,
     User,
     UserAchievement,
     UserAPIConfig,
+    UserDailyXP,
     UserPreferences,
     UserProfile,
     UserProgress,
@@ -55,6 +57,8 @@ __all__ = [
     "UserTextStats",
     "UserSRSCard",
     "LearningEvent",
+    "LearningEventMonthly",
+    "UserDailyXP",
     "UserQuest",
     # Social models
     "Friendship",
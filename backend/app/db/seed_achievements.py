@@ -9,12 +9,16 @@ Usage:
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.user_models import UserAchievement
+from app.db.user_models import UserAchievement, UserProgress
 
 
 @dataclass
@@ -645,6 +649,162 @@ async def seed_achievement_templates(session: AsyncSession) -> None:
         print(f"  - [{achievement.tier}★] {achievement.title}: {achievement.description}")
 
 
+# ---------------------------------------------------------------------
+# Criteria index
+# ---------------------------------------------------------------------
+
+# unlock_criteria keys that require "metric >= threshold", mapped to the metric name
+_AT_LEAST_CRITERIA = {
+    "lessons_completed": "total_lessons",
+    "streak_days": "streak_days",
+    "xp_total": "xp_total",
+    "level": "level",
+    "perfect_lessons": "perfect_lessons",
+    "coins": "coins",
+    "languages_count": "languages_count",
+}
+_MAJOR_HOLIDAYS = {(12, 25), (1, 1), (7, 4), (11, 11)}  # Christmas, New Year, July 4, Veterans
+
+LANGUAGE_LESSONS_STAT = "language_lessons"  # UserProgress.stats key: {language: lessons completed}
+
+
+def _criteria_requirements(criteria: dict) -> list[tuple[str, Any]]:
+    """``(metric, threshold)`` pairs an achievement's criteria depend on."""
+    requirements = [(metric, criteria[key]) for key, metric in _AT_LEAST_CRITERIA.items() if key in criteria]
+    if "language" in criteria:
+        requirements.append((f"language_lessons:{criteria['language']}", criteria.get("lessons", 1)))
+    if "completion_time_seconds" in criteria:
+        requirements.append(("completion_time_seconds", criteria["completion_time_seconds"]))
+    if "special" in criteria:
+        requirements.append((f"special:{criteria['special']}", True))
+    return requirements
+
+
+@dataclass(frozen=True)
+class _MetricIndex:
+    """Achievements depending on one metric, sorted by threshold."""
+
+    thresholds: tuple[Any, ...]
+    achievements: tuple[AchievementDefinition, ...]
+    at_most: bool = False  # completion time: lower values satisfy more thresholds
+
+    def reachable(self, value: Any) -> tuple[AchievementDefinition, ...]:
+        """Achievements whose threshold for this metric ``value`` satisfies."""
+        if value is None or value is False:
+            return ()
+        if value is True:
+            return self.achievements
+        if self.at_most:
+            return self.achievements[bisect_left(self.thresholds, value) :]
+        return self.achievements[: bisect_right(self.thresholds, value)]
+
+
+def _build_criteria_index(achievements: list[AchievementDefinition]) -> dict[str, _MetricIndex]:
+    by_metric: dict[str, list[tuple[Any, AchievementDefinition]]] = defaultdict(list)
+    for achievement in achievements:
+        for metric, threshold in _criteria_requirements(achievement.unlock_criteria or {}):
+            by_metric[metric].append((threshold, achievement))
+    index = {}
+    for metric, entries in by_metric.items():
+        entries.sort(key=lambda entry: entry[0])
+        index[metric] = _MetricIndex(
+            thresholds=tuple(threshold for threshold, _ in entries),
+            achievements=tuple(achievement for _, achievement in entries),
+            at_most=metric == "completion_time_seconds",
+        )
+    return index
+
+
+CRITERIA_INDEX: dict[str, _MetricIndex] = _build_criteria_index(ACHIEVEMENTS)
+
+
+def _special_metrics(timestamp: datetime | str | None) -> dict[str, bool]:
+    """Which time-based ``special`` criteria a lesson completed at ``timestamp`` satisfies."""
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if not isinstance(timestamp, datetime):
+        return {}
+    return {
+        "special:early_morning": timestamp.hour < 7,  # Before 7 AM
+        "special:late_night": timestamp.hour >= 23,  # After 11 PM
+        "special:weekend": timestamp.weekday() in (5, 6),  # Saturday or Sunday
+        # Major holidays (simplified)
+        "special:holiday": (timestamp.month, timestamp.day) in _MAJOR_HOLIDAYS,
+    }
+
+
+def _meets_criteria(achievement: AchievementDefinition, metrics: dict[str, Any]) -> bool:
+    """ALL criteria of ``achievement`` must be met."""
+    for metric, threshold in _criteria_requirements(achievement.unlock_criteria or {}):
+        value = metrics.get(metric)
+        if metric.startswith("language_lessons:"):
+            value = value or 0
+        if value is None:
+            return False
+        if metric == "completion_time_seconds":
+            if value > threshold:
+                return False
+        elif metric.startswith("special:"):
+            if not value:
+                return False
+        elif value < threshold:
+            return False
+    return True
+
+
+async def _count_language_lessons(session: AsyncSession, user_id: int) -> dict[str, int]:
+    """Lessons per language from the user's ``lesson_complete`` events (used to seed the counters).
+
+    Events in partitions retired by retention are counted from their monthly rollup.
+    """
+    from app.db.user_models import LearningEvent, LearningEventMonthly
+
+    language = LearningEvent.data["language"].astext
+    recent = (
+        select(language, func.count())
+        .where(
+            LearningEvent.user_id == user_id,
+            LearningEvent.event_type == "lesson_complete",
+            language.is_not(None),
+        )
+        .group_by(language)
+    )
+    retired = (
+        select(LearningEventMonthly.language_code, func.sum(LearningEventMonthly.events))
+        .where(
+            LearningEventMonthly.user_id == user_id,
+            LearningEventMonthly.event_type == "lesson_complete",
+            LearningEventMonthly.language_code != "",
+        )
+        .group_by(LearningEventMonthly.language_code)
+    )
+    result = await session.execute(recent.union_all(retired))
+    counts: dict[str, int] = defaultdict(int)
+    for lang, count in result.all():
+        counts[lang] += int(count)
+    return dict(counts)
+
+
+async def record_language_lesson(
+    session: AsyncSession, progress: UserProgress, language: str | None
+) -> dict[str, int]:
+    """Count one completed lesson in ``progress.stats`` and return lessons per language.
+
+    The first call for a user seeds the counters from their past lesson events, so
+    call this before the current lesson's event is added to the session.
+    """
+    counts = (progress.stats or {}).get(LANGUAGE_LESSONS_STAT)
+    if counts is None:
+        counts = await _count_language_lessons(session, progress.user_id)
+    counts = dict(counts)
+    if language:
+        counts[language] = counts.get(language, 0) + 1
+    if progress.stats is None:
+        progress.stats = {}
+    progress.stats[LANGUAGE_LESSONS_STAT] = counts
+    return counts
+
+
 async def check_and_unlock_achievements(
     session: AsyncSession,
     user_id: int,
@@ -664,156 +824,73 @@ async def check_and_unlock_achievements(
             - level: Current level
             - coins: Current coin balance
             - language: (Optional) Current lesson language code
+            - language_lessons: (Optional) Lessons per language, from
+              ``record_language_lesson``; counted from learning events if missing.
+              Every language's count is checked, not just ``language``'s
             - completion_time_seconds: (Optional) Last lesson completion time
             - lesson_timestamp: (Optional) Timestamp of lesson completion
+            - lesson_timestamps: (Optional) Completion times of every lesson in
+              the update (a batch); used instead of ``lesson_timestamp``
+
+    Only achievements indexed under a metric of this update, with a threshold the
+    current value reaches, are evaluated.
 
     Returns:
         List of newly unlocked achievements
     """
-    # Get already unlocked achievements
-    result = await session.execute(select(UserAchievement).where(UserAchievement.user_id == user_id))
-    unlocked = {f"{a.achievement_type}/{a.achievement_id}" for a in result.scalars().all()}
-
-    # Get language-specific lesson counts and unique languages from learning events
-    from app.db.user_models import LearningEvent
-
-    # Count lessons per language
-    language_counts = {}
-    unique_languages = set()
-    try:
-        events_result = await session.execute(
-            select(LearningEvent.data).where(
-                LearningEvent.user_id == user_id,
-                LearningEvent.event_type == "lesson_complete",
-            )
+    language_lessons = progress_data.get("language_lessons")
+    if language_lessons is None:
+        language_lessons = await _count_language_lessons(session, user_id)
+
+    metrics: dict[str, Any] = {metric: progress_data.get(metric, 0) for metric in _AT_LEAST_CRITERIA.values()}
+    metrics["languages_count"] = len(language_lessons)
+    metrics["completion_time_seconds"] = progress_data.get("completion_time_seconds")
+    for timestamp in progress_data.get("lesson_timestamps") or [progress_data.get("lesson_timestamp")]:
+        for metric, value in _special_metrics(timestamp).items():
+            metrics[metric] = metrics.get(metric, False) or value
+    for language, lessons in language_lessons.items():
+        metrics[f"language_lessons:{language}"] = lessons
+
+    candidates: dict[tuple[str, str], AchievementDefinition] = {}
+    for metric, value in metrics.items():
+        index = CRITERIA_INDEX.get(metric)
+        if index is None:
+            continue
+        for achievement in index.reachable(value):
+            candidates[(achievement.achievement_type, achievement.achievement_id)] = achievement
+    if not candidates:
+        return []
+
+    # Get already unlocked achievements among the candidates
+    result = await session.execute(
+        select(UserAchievement.achievement_type, UserAchievement.achievement_id).where(
+            UserAchievement.user_id == user_id,
+            UserAchievement.achievement_id.in_([achievement_id for _, achievement_id in candidates]),
         )
-        for (event_data,) in events_result:
-            if event_data and "language" in event_data:
-                lang = event_data["language"]
-                language_counts[lang] = language_counts.get(lang, 0) + 1
-                unique_languages.add(lang)
-    except Exception as e:
-        print(f"[WARNING] Could not fetch language-specific data: {e}")
+    )
+    unlocked = {tuple(row) for row in result.all()}
 
     newly_unlocked: list[UserAchievement] = []
 
-    for achievement in ACHIEVEMENTS:
-        key = f"{achievement.achievement_type}/{achievement.achievement_id}"
-        if key in unlocked:
-            continue
-
-        # Check unlock criteria - ALL criteria must be met if present
-        criteria = achievement.unlock_criteria or {}
-        if not criteria:
+    for key, achievement in candidates.items():
+        if key in unlocked or not _meets_criteria(achievement, metrics):
             continue
 
-        # Check each criterion - only unlock if ALL present criteria are met
-        should_unlock = True
-
-        if "lessons_completed" in criteria:
-            if progress_data.get("total_lessons", 0) < criteria["lessons_completed"]:
-                should_unlock = False
-
-        if "streak_days" in criteria and should_unlock:
-            if progress_data.get("streak_days", 0) < criteria["streak_days"]:
-                should_unlock = False
-
-        if "xp_total" in criteria and should_unlock:
-            if progress_data.get("xp_total", 0) < criteria["xp_total"]:
-                should_unlock = False
-
-        if "level" in criteria and should_unlock:
-            if progress_data.get("level", 0) < criteria["level"]:
-                should_unlock = False
-
-        if "perfect_lessons" in criteria and should_unlock:
-            if progress_data.get("perfect_lessons", 0) < criteria["perfect_lessons"]:
-                should_unlock = False
-
-        if "coins" in criteria and should_unlock:
-            if progress_data.get("coins", 0) < criteria["coins"]:
-                should_unlock = False
-
-        # Language-specific achievements (e.g., "Complete 10 Greek lessons")
-        if "language" in criteria and should_unlock:
-            required_lang = criteria["language"]
-            required_lessons = criteria.get("lessons", 1)
-            actual_lessons = language_counts.get(required_lang, 0)
-            if actual_lessons < required_lessons:
-                should_unlock = False
-
-        # Polyglot achievements (practice multiple languages)
-        if "languages_count" in criteria and should_unlock:
-            required_count = criteria["languages_count"]
-            if len(unique_languages) < required_count:
-                should_unlock = False
-
-        # Completion time achievements (speed-based)
-        if "completion_time_seconds" in criteria and should_unlock:
-            max_time = criteria["completion_time_seconds"]
-            actual_time = progress_data.get("completion_time_seconds")
-            if actual_time is None or actual_time > max_time:
-                should_unlock = False
-
-        # Special time-based achievements (early bird, night owl, weekend, etc.)
-        if "special" in criteria and should_unlock:
-            special_type = criteria["special"]
-            timestamp = progress_data.get("lesson_timestamp")
-
-            if timestamp is None:
-                should_unlock = False
-            else:
-                from datetime import datetime
-
-                if isinstance(timestamp, str):
-                    timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                elif not isinstance(timestamp, datetime):
-                    should_unlock = False
-                else:
-                    hour = timestamp.hour
-                    weekday = timestamp.weekday()  # Monday=0, Sunday=6
-
-                    if special_type == "early_morning":
-                        # Before 7 AM
-                        if hour >= 7:
-                            should_unlock = False
-                    elif special_type == "late_night":
-                        # After 11 PM
-                        if hour < 23:
-                            should_unlock = False
-                    elif special_type == "weekend":
-                        # Saturday (5) or Sunday (6)
-                        if weekday not in (5, 6):
-                            should_unlock = False
-                    elif special_type == "holiday":
-                        # Check for major holidays (simplified - just December 25 and January 1)
-                        month = timestamp.month
-                        day = timestamp.day
-                        major_holidays = [
-                            (12, 25),
-                            (1, 1),
-                            (7, 4),
-                            (11, 11),
-                        ]  # Christmas, New Year, July 4, Veterans
-                        if (month, day) not in major_holidays:
-                            should_unlock = False
-
-        if should_unlock:
-            new_achievement = UserAchievement(
-                user_id=user_id,
-                achievement_type=achievement.achievement_type,
-                achievement_id=achievement.achievement_id,
-                meta={
-                    "title": achievement.title,
-                    "description": achievement.description,
-                    "icon": achievement.icon,
-                    "tier": achievement.tier,
-                    "xp_reward": achievement.xp_reward,
-                    "coin_reward": achievement.coin_reward,
-                },
-            )
-            session.add(new_achievement)
-            newly_unlocked.append(new_achievement)
+        new_achievement = UserAchievement(
+            user_id=user_id,
+            achievement_type=achievement.achievement_type,
+            achievement_id=achievement.achievement_id,
+            meta={
+                "title": achievement.title,
+                "description": achievement.description,
+                "icon": achievement.icon,
+                "tier": achievement.tier,
+                "xp_reward": achievement.xp_reward,
+                "coin_reward": achievement.coin_reward,
+            },
+        )
+        session.add(new_achievement)
+        newly_unlocked.append(new_achievement)
 
     return newly_unlocked
 
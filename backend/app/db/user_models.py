@@ -6,11 +6,12 @@ Follows the design from docs/gamification_ideas.md for comprehensive progress tr
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 
 from sqlalchemy import (
     Boolean,
+    Date,
     DateTime,
     Float,
     ForeignKey,
@@ -597,6 +598,49 @@ class LearningEvent(Base):
         return f"<LearningEvent user_id={self.user_id} type={self.event_type}>"
 
 
+class UserDailyXP(Base):
+    """Per-user, per-day, per-language XP rollup of completed lessons.
+
+    Written alongside the lesson events so period leaderboards sum a few typed
+    rows per user instead of parsing ``learning_event.data`` for every event.
+    Lessons without a language are stored under ``language_code=""``.
+    """
+
+    __tablename__ = "user_daily_xp"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)  # UTC calendar day
+    language_code: Mapped[str] = mapped_column(String(20), primary_key=True, default="")
+    xp: Mapped[int] = mapped_column(Integer, default=0)
+    lessons: Mapped[int] = mapped_column(Integer, default=0)
+
+    __table_args__ = (Index("ix_user_daily_xp_day", "day", "user_id"),)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<UserDailyXP user_id={self.user_id} day={self.day} xp={self.xp}>"
+
+
+class LearningEventMonthly(Base):
+    """Monthly aggregate of ``learning_event`` partitions removed by the retention policy.
+
+    One row per user, UTC month, event type and language; ``xp`` is the lesson XP
+    of those events (0 for other event types). Events without a language are
+    stored under ``language_code=""``.
+    """
+
+    __tablename__ = "learning_event_monthly"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
+    month: Mapped[date] = mapped_column(Date, primary_key=True)  # first day of the UTC month
+    event_type: Mapped[str] = mapped_column(String(50), primary_key=True)
+    language_code: Mapped[str] = mapped_column(String(20), primary_key=True, default="")
+    events: Mapped[int] = mapped_column(Integer, default=0)
+    xp: Mapped[int] = mapped_column(Integer, default=0)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<LearningEventMonthly user_id={self.user_id} month={self.month} type={self.event_type}>"
+
+
 # ---------------------------------------------------------------------
 # Quests & Challenges
 # ---------------------------------------------------------------------
@@ -763,6 +807,8 @@ __all__ = [
     "UserTextStats",
     "UserSRSCard",
     "LearningEvent",
+    "UserDailyXP",
+    "LearningEventMonthly",
     "UserQuest",
     "DemoAPIUsage",
 ]
@@ -9,6 +9,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.util import text_with_json
 from app.ingestion.normalize import accent_fold, nfc
 from app.ingestion.sources.perseus import iter_lines_book1, iter_tokens, read_tei
+from app.lesson.context_cache import invalidate_lesson_context
+from app.tts.license_guard import invalidate_license_map
 
 ILIAD_AUTHOR = "Homer"
 ILIAD_TITLE = "Iliad"
@@ -216,6 +218,8 @@ async def ingest_iliad_sample(
                 idx += 1
 
     await db.commit()
+    invalidate_lesson_context("grc-cls")
+    invalidate_license_map()
 
     end_total = (
         await db.execute(
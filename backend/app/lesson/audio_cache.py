@@ -2,23 +2,62 @@
 
 Generates and caches TTS audio for lesson tasks. Uses deterministic hashing
 to avoid re-generating the same audio content multiple times.
+
+Rendering goes through :class:`AudioRenderService`, which keeps an in-memory
+index of the files already on disk (built with a single directory scan off the
+event loop and checked against the disk on each hit), collapses concurrent
+requests for the same cache key into one synthesis, bounds in-flight syntheses
+per TTS provider, and writes files atomically from a worker thread.
+
+Files are sharded by the first two hex characters of their cache key
+(``audio_cache/ab/ab12....wav``, served at ``/audio/ab/ab12....wav``). A
+``manifest.json`` in the cache root records the last time each key was handed
+out and its language; :meth:`AudioRenderService.run_maintenance` rescans the
+shards, evicts expired and least recently used files until the directory fits
+``AUDIO_CACHE_MAX_BYTES``, and rewrites the manifest. Access times only reflect
+lookups made through this service, not repeat downloads of an already issued URL.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import json
 import logging
+import os
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import Dict, Iterable
 
-if TYPE_CHECKING:
-    pass
+from app.core.config import settings
 
 _LOGGER = logging.getLogger("app.lesson.audio_cache")
 
 # Cache directory for generated audio files
 _CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "audio_cache"
 
+_AUDIO_EXTENSIONS = ("wav", "mp3", "audio")
+_MANIFEST_NAME = "manifest.json"
+_SHARD_CHARS = 2
+# Evict down to this fraction of the size cap so every cycle does not trim a single file
+_EVICT_LOW_WATER = 0.9
+
+
+@dataclass(slots=True)
+class _AudioEntry:
+    name: str  # path relative to the cache root, e.g. "ab/ab12cd34ef567890.wav"
+    size: int
+    last_access: float
+    language: str | None = None
+
+
+@dataclass(slots=True)
+class _MaintenanceResult:
+    entries: Dict[str, _AudioEntry]
+    evicted: set[str]
+    evicted_bytes: int
+
 
 def _ensure_cache_dir() -> Path:
     """Ensure audio cache directory exists"""
@@ -32,11 +71,381 @@ def _audio_cache_key(text: str, language: str, provider: str) -> str:
     return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
 
 
+def _audio_extension(mime: str) -> str:
+    return "wav" if "wav" in mime else "mp3" if "mp3" in mime else "audio"
+
+
+def _shard_name(cache_key: str, extension: str) -> str:
+    return f"{cache_key[:_SHARD_CHARS]}/{cache_key}.{extension}"
+
+
 def _get_cached_audio_path(cache_key: str, mime: str) -> Path:
     """Get path for cached audio file"""
-    extension = "wav" if "wav" in mime else "mp3" if "mp3" in mime else "audio"
     cache_dir = _ensure_cache_dir()
-    return cache_dir / f"{cache_key}.{extension}"
+    return cache_dir / _shard_name(cache_key, _audio_extension(mime))
+
+
+def _split_audio_name(file_name: str) -> tuple[str, str] | None:
+    stem, _, ext = file_name.partition(".")
+    if ext not in _AUDIO_EXTENSIONS or not stem:
+        return None
+    return stem, ext
+
+
+def _scan_cache_dir(cache_dir: Path) -> Dict[str, _AudioEntry]:
+    """Index every cached audio file by cache key (blocking).
+
+    Files left in the flat pre-sharding layout are moved into their shard. Files
+    that disappear mid-scan (another worker evicting or moving them) are skipped.
+    Access times default to the file's mtime until merged with the manifest.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    index: Dict[str, _AudioEntry] = {}
+    with os.scandir(cache_dir) as entries:
+        top_level = list(entries)
+    for entry in top_level:
+        if entry.is_dir(follow_symlinks=False):
+            with os.scandir(entry.path) as shard:
+                for item in shard:
+                    parsed = _split_audio_name(item.name)
+                    if parsed is None or not item.is_file(follow_symlinks=False):
+                        continue
+                    try:
+                        stat = item.stat()
+                    except FileNotFoundError:
+                        continue  # evicted by another worker mid-scan
+                    index.setdefault(
+                        parsed[0], _AudioEntry(f"{entry.name}/{item.name}", stat.st_size, stat.st_mtime)
+                    )
+            continue
+        parsed = _split_audio_name(entry.name)
+        if parsed is None or not entry.is_file(follow_symlinks=False):
+            continue
+        name = _shard_name(*parsed)
+        target = cache_dir / name
+        target.parent.mkdir(exist_ok=True)
+        try:
+            os.replace(entry.path, target)
+            stat = target.stat()
+        except FileNotFoundError:
+            continue  # another worker migrated or evicted it first
+        index.setdefault(parsed[0], _AudioEntry(name, stat.st_size, stat.st_mtime))
+    return index
+
+
+def _read_manifest(cache_dir: Path) -> Dict[str, list]:
+    try:
+        with open(cache_dir / _MANIFEST_NAME, encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        _LOGGER.warning("Ignoring unreadable audio cache manifest: %s", exc)
+        return {}
+    entries = payload.get("entries") if isinstance(payload, dict) else None
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write_manifest(cache_dir: Path, entries: Dict[str, _AudioEntry]) -> None:
+    payload = {
+        "version": 1,
+        "total_bytes": sum(entry.size for entry in entries.values()),
+        "entries": {
+            key: [entry.name, entry.size, round(entry.last_access, 3), entry.language]
+            for key, entry in entries.items()
+        },
+    }
+    tmp_path = cache_dir / f".{_MANIFEST_NAME}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, separators=(",", ":"))
+    os.replace(tmp_path, cache_dir / _MANIFEST_NAME)
+
+
+def _merge_access(index: Dict[str, _AudioEntry], records: Dict[str, list]) -> None:
+    """Fold manifest/in-memory access times and languages into a fresh scan."""
+    for key, record in records.items():
+        entry = index.get(key)
+        if entry is None or not isinstance(record, list) or len(record) < 4:
+            continue
+        if isinstance(record[2], (int, float)) and record[2] > entry.last_access:
+            entry.last_access = float(record[2])
+        if entry.language is None and isinstance(record[3], str):
+            entry.language = record[3]
+
+
+def _load_index(cache_dir: Path) -> Dict[str, _AudioEntry]:
+    index = _scan_cache_dir(cache_dir)
+    _merge_access(index, _read_manifest(cache_dir))
+    return index
+
+
+def _maintain_cache_dir(
+    cache_dir: Path,
+    known: Dict[str, list],
+    *,
+    max_bytes: int,
+    max_age_seconds: float,
+    now: float,
+) -> _MaintenanceResult:
+    """Rescan, evict expired then least recently used files, and rewrite the manifest (blocking)."""
+    index = _scan_cache_dir(cache_dir)
+    _merge_access(index, _read_manifest(cache_dir))
+    _merge_access(index, known)
+
+    evicted: set[str] = set()
+    evicted_bytes = 0
+    total = sum(entry.size for entry in index.values())
+    target = int(max_bytes * _EVICT_LOW_WATER) if total > max_bytes else max_bytes
+    for key, entry in sorted(index.items(), key=lambda item: item[1].last_access):
+        if now - entry.last_access <= max_age_seconds and total <= target:
+            break
+        try:
+            os.unlink(cache_dir / entry.name)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            _LOGGER.warning("Could not evict cached audio %s: %s", entry.name, exc)
+            continue
+        evicted.add(key)
+        evicted_bytes += entry.size
+        total -= entry.size
+
+    for key in evicted:
+        index.pop(key, None)
+    _write_manifest(cache_dir, index)
+    return _MaintenanceResult(entries=index, evicted=evicted, evicted_bytes=evicted_bytes)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a temp file so readers never see partial audio (blocking)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+class AudioRenderService:
+    """Content-addressed, single-flight TTS renderer backed by the audio cache directory."""
+
+    def __init__(
+        self,
+        *,
+        cache_dir: Path,
+        max_concurrency: int,
+        max_bytes: int = settings.AUDIO_CACHE_MAX_BYTES,
+        max_age_seconds: float = settings.AUDIO_CACHE_MAX_AGE_DAYS * 86400,
+    ) -> None:
+        self._cache_dir = cache_dir
+        self._max_concurrency = max(1, max_concurrency)
+        self._max_bytes = max_bytes
+        self._max_age_seconds = max_age_seconds
+        self._index: Dict[str, _AudioEntry] | None = None
+        self._index_lock: asyncio.Lock | None = None
+        self._inflight: Dict[str, asyncio.Task[str | None]] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.hits = 0
+        self.misses = 0
+        self.renders = 0
+        self.coalesced = 0
+        self.evicted = 0
+        self.evicted_bytes = 0
+
+    async def _ensure_index(self) -> Dict[str, _AudioEntry]:
+        if self._index is not None:
+            return self._index
+        if self._index_lock is None:
+            self._index_lock = asyncio.Lock()
+        async with self._index_lock:
+            if self._index is None:
+                self._index = await asyncio.to_thread(_load_index, self._cache_dir)
+                _LOGGER.debug("Indexed %d cached audio files in %s", len(self._index), self._cache_dir)
+        return self._index
+
+    def _semaphore(self, provider: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(provider)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphores[provider] = semaphore
+        return semaphore
+
+    async def get_url(
+        self,
+        *,
+        text: str,
+        language: str,
+        provider: str = "echo",
+        token: str | None = None,
+    ) -> str | None:
+        """Return the ``/audio/...`` URL for ``text``, rendering it at most once per cache key."""
+        cache_key = _audio_cache_key(text, language, provider)
+        try:
+            index = await self._ensure_index()
+        except Exception as exc:
+            _LOGGER.warning("Failed to index cached audio in %s: %s", self._cache_dir, exc)
+            return None
+        entry = index.get(cache_key)
+        if entry is not None:
+            if await asyncio.to_thread(os.path.exists, self._cache_dir / entry.name):
+                self.hits += 1
+                entry.last_access = time.time()
+                if entry.language is None:
+                    entry.language = language
+                return f"/audio/{entry.name}"
+            # Evicted or cleared by another worker since this one indexed it
+            if index.get(cache_key) is entry:
+                del index[cache_key]
+
+        task = self._inflight.get(cache_key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.create_task(self._render(cache_key, text, language, provider, token))
+            self._inflight[cache_key] = task
+        else:
+            self.coalesced += 1
+        # Shield so a cancelled lesson request does not abort a render other requests await.
+        return await asyncio.shield(task)
+
+    async def render_many(
+        self,
+        texts: Iterable[str],
+        *,
+        language: str,
+        provider: str = "echo",
+        token: str | None = None,
+    ) -> list[str | None]:
+        """Render a batch of texts concurrently; results are aligned with ``texts``."""
+        ordered = list(texts)
+        unique = list(dict.fromkeys(ordered))
+        urls = await asyncio.gather(
+            *(self.get_url(text=text, language=language, provider=provider, token=token) for text in unique)
+        )
+        by_text = dict(zip(unique, urls))
+        return [by_text[text] for text in ordered]
+
+    async def _render(
+        self, cache_key: str, text: str, language: str, provider: str, token: str | None
+    ) -> str | None:
+        from app.tts.models import TTSSpeakRequest
+        from app.tts.service import synthesize
+
+        try:
+            async with self._semaphore(provider):
+                request = TTSSpeakRequest(
+                    text=text,
+                    provider=provider,
+                    format="wav",  # Use WAV for compatibility
+                )
+                result, actual_provider, note = await synthesize(request, token)
+
+            name = _shard_name(cache_key, _audio_extension(result.mime))
+            await asyncio.to_thread(_write_atomic, self._cache_dir / name, result.audio)
+            index = await self._ensure_index()
+            index[cache_key] = _AudioEntry(name, len(result.audio), time.time(), language)
+            self.renders += 1
+
+            _LOGGER.info(
+                "Generated and cached audio: text_len=%d language=%s provider=%s cache_key=%s",
+                len(text),
+                language,
+                actual_provider,
+                cache_key,
+            )
+            return f"/audio/{name}"
+        except Exception as exc:
+            _LOGGER.warning(
+                "Failed to generate audio for text='%s' language=%s: %s",
+                text[:50],
+                language,
+                exc,
+            )
+            return None
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    async def run_maintenance(self) -> dict[str, int]:
+        """Evict expired/least recently used files down to the size cap and persist the manifest.
+
+        The rescan also picks up files written or evicted by other workers.
+        """
+        index = await self._ensure_index()
+        started = time.time()
+        known = {
+            key: [entry.name, entry.size, entry.last_access, entry.language] for key, entry in index.items()
+        }
+        result = await asyncio.to_thread(
+            _maintain_cache_dir,
+            self._cache_dir,
+            known,
+            max_bytes=self._max_bytes,
+            max_age_seconds=self._max_age_seconds,
+            now=started,
+        )
+        # Keep entries rendered or touched while the scan ran in the worker thread.
+        current = self._index or {}
+        for key, entry in current.items():
+            if key in result.evicted:
+                continue
+            scanned = result.entries.get(key)
+            if scanned is None:
+                if entry.last_access >= started:
+                    result.entries[key] = entry
+            elif entry.last_access > scanned.last_access:
+                scanned.last_access = entry.last_access
+        self._index = result.entries
+        self.evicted += len(result.evicted)
+        self.evicted_bytes += result.evicted_bytes
+        if result.evicted:
+            _LOGGER.info(
+                "Evicted %d cached audio files (%d bytes); %d files remain",
+                len(result.evicted),
+                result.evicted_bytes,
+                len(result.entries),
+            )
+        return self.stats()
+
+    async def clear(self, language: str | None = None) -> int:
+        """Delete cached audio for ``language`` (or everything); returns the count removed."""
+        index = await self._ensure_index()
+        if language is None:
+            keys = list(index)
+        else:
+            keys = [key for key, entry in index.items() if entry.language == language]
+        removed = {key: index.pop(key) for key in keys}
+
+        def _delete() -> None:
+            for entry in removed.values():
+                try:
+                    os.unlink(self._cache_dir / entry.name)
+                except FileNotFoundError:
+                    pass
+            _write_manifest(self._cache_dir, index)
+
+        await asyncio.to_thread(_delete)
+        return len(removed)
+
+    def reset_index(self) -> None:
+        """Forget the in-memory file index; the next lookup rescans the directory."""
+        self._index = None
+
+    def stats(self) -> dict[str, int]:
+        index = self._index or {}
+        lookups = self.hits + self.misses
+        return {
+            "files": len(index),
+            "total_bytes": sum(entry.size for entry in index.values()),
+            "max_bytes": self._max_bytes,
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate_pct": round(100 * self.hits / lookups) if lookups else 0,
+            "renders": self.renders,
+            "coalesced": self.coalesced,
+            "evicted": self.evicted,
+            "evicted_bytes": self.evicted_bytes,
+        }
+
+
+audio_renderer = AudioRenderService(cache_dir=_CACHE_DIR, max_concurrency=settings.TTS_RENDER_CONCURRENCY)
 
 
 async def get_or_generate_audio_url(
@@ -57,63 +466,49 @@ async def get_or_generate_audio_url(
     Returns:
         URL path to audio file, or None if generation fails
     """
-    from app.tts.models import TTSSpeakRequest
-    from app.tts.service import synthesize
+    return await audio_renderer.get_url(text=text, language=language, provider=provider, token=token)
 
-    cache_key = _audio_cache_key(text, language, provider)
 
-    # Check for cached file
-    # Try multiple extensions since we don't know the mime type yet
-    for ext in ["wav", "mp3", "audio"]:
-        cached_path = _ensure_cache_dir() / f"{cache_key}.{ext}"
-        if cached_path.exists():
-            # Return relative URL path
-            return f"/audio/{cache_key}.{ext}"
-
-    # Generate new audio
-    try:
-        request = TTSSpeakRequest(
-            text=text,
-            provider=provider,
-            format="wav",  # Use WAV for compatibility
-        )
-        result, actual_provider, note = await synthesize(request, token)
-
-        # Save to cache
-        cache_path = _get_cached_audio_path(cache_key, result.mime)
-        cache_path.write_bytes(result.audio)
-
-        _LOGGER.info(
-            "Generated and cached audio: text_len=%d language=%s provider=%s cache_key=%s",
-            len(text),
-            language,
-            actual_provider,
-            cache_key,
-        )
+async def render_audio_urls(
+    texts: Iterable[str],
+    *,
+    language: str,
+    provider: str = "echo",
+    token: str | None = None,
+) -> list[str | None]:
+    """Batch variant of :func:`get_or_generate_audio_url`; one URL (or None) per input text.
 
-        # Return relative URL path
-        return f"/audio/{cache_path.name}"
+    Texts citing a license-restricted source get None, checked in one pass against the
+    cached license map.
+    """
+    ordered = list(texts)
+    if settings.TTS_LICENSE_GUARD and ordered:
+        from app.tts.license_guard import evaluate_tts_requests
 
-    except Exception as exc:
-        _LOGGER.warning(
-            "Failed to generate audio for text='%s' language=%s: %s",
-            text[:50],
-            language,
-            exc,
+        violations = await evaluate_tts_requests(ordered)
+        allowed = [text for text, violation in zip(ordered, violations) if violation is None]
+        urls = iter(
+            await audio_renderer.render_many(allowed, language=language, provider=provider, token=token)
         )
-        return None
+        return [None if violation else next(urls) for violation in violations]
+    return await audio_renderer.render_many(ordered, language=language, provider=provider, token=token)
 
 
 def clear_audio_cache() -> int:
-    """Clear all cached audio files. Returns count of files deleted."""
+    """Clear all cached audio files. Returns count of files deleted.
+
+    Use ``await audio_renderer.clear(language)`` to drop a single language.
+    """
+    audio_renderer.reset_index()
     if not _CACHE_DIR.exists():
         return 0
 
     count = 0
-    for audio_file in _CACHE_DIR.glob("*"):
+    for audio_file in _CACHE_DIR.rglob("*"):
         if audio_file.is_file():
+            if audio_file.name != _MANIFEST_NAME:
+                count += 1
             audio_file.unlink()
-            count += 1
 
     _LOGGER.info("Cleared %d cached audio files", count)
     return count
@@ -0,0 +1,103 @@
+"""In-process cache for database-backed lesson context.
+
+Canonical lines depend only on the language and text-range summaries only on
+(language, ref window), so both are memoized here with a TTL. Empty results
+(no canon for the language, a load that timed out) are kept for a shorter TTL so
+they are retried without every lesson paying for the lookup. Ingestion jobs
+call :func:`invalidate_lesson_context` after writing segments so fresh corpus
+data is picked up without waiting for expiry.
+"""
+
+from __future__ import annotations
+
+import logging
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+from app.core.config import settings
+
+_LOGGER = logging.getLogger("app.lesson.context_cache")
+
+T = TypeVar("T")
+
+
+class LessonContextCache:
+    """TTL cache keyed by tuples whose second element is the language code."""
+
+    def __init__(self, *, ttl_seconds: float, max_size: int, empty_ttl_seconds: float | None = None) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._empty_ttl_seconds = ttl_seconds if empty_ttl_seconds is None else empty_ttl_seconds
+        self._max_size = max_size
+        # key -> (stored at, ttl, value)
+        self._entries: Dict[Hashable, tuple[float, float, Any]] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        timestamp, ttl, value = entry
+        age = monotonic() - timestamp
+        if age > ttl:
+            self._entries.pop(key, None)
+            _LOGGER.debug("Evicted stale lesson context for key=%s (age=%.2fs)", key, age)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        ttl = self._ttl_seconds if value else self._empty_ttl_seconds
+        self._entries[key] = (monotonic(), ttl, value)
+        if len(self._entries) > self._max_size:
+            oldest_key = min(self._entries.items(), key=lambda item: item[1][0])[0]
+            self._entries.pop(oldest_key, None)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value for ``key`` or await ``loader`` and store its result.
+
+        Empty results are stored for the shorter empty TTL, so a timed-out or
+        not-yet-ingested corpus is retried soon without a lookup on every
+        request. A load that overlaps with an invalidation is returned to the
+        caller but not cached.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        generation = self._generation
+        value = await loader()
+        if generation == self._generation:
+            self.set(key, value)
+        return value
+
+    def invalidate(self, language: str | None = None) -> int:
+        """Drop cached context for ``language`` (or everything) and return the count removed."""
+        self._generation += 1
+        if language is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+
+        stale = [key for key in self._entries if isinstance(key, tuple) and key[1:2] == (language,)]
+        for key in stale:
+            self._entries.pop(key, None)
+        return len(stale)
+
+    def stats(self) -> dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+context_cache = LessonContextCache(
+    ttl_seconds=settings.LESSON_CONTEXT_CACHE_TTL_SECONDS,
+    max_size=settings.LESSON_CONTEXT_CACHE_MAX_ENTRIES,
+    empty_ttl_seconds=settings.LESSON_CONTEXT_CACHE_EMPTY_TTL_SECONDS,
+)
+
+
+def invalidate_lesson_context(language: str | None = None) -> None:
+    """Invalidate cached canonical lines and text-range summaries after ingestion."""
+    removed = context_cache.invalidate(language)
+    _LOGGER.info("Invalidated %d cached lesson context entries (language=%s)", removed, language or "*")
@@ -5,7 +5,10 @@ for AI-powered lesson generation, dynamically pulling from the comprehensive
 language configuration system.
 """
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=256)
 def get_system_prompt(language: str = "grc-cls") -> str:
     """Get language-specific system prompt for lesson generation.
 
@@ -36,6 +39,7 @@ def get_system_prompt(language: str = "grc-cls") -> str:
     )
 
 
+@lru_cache(maxsize=256)
 def get_pedagogy_core(language: str = "grc-cls") -> str:
     """Get language-specific pedagogy instructions.
 
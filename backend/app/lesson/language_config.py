@@ -11,6 +11,7 @@ and historically authentic scripts as researched and specified.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Literal
 
 
@@ -1799,9 +1800,13 @@ LANGUAGES: dict[str, LanguageConfig] = {
 }
 
 
+@lru_cache(maxsize=256)
 def get_language_config(language_code: str) -> LanguageConfig:
     """Get configuration for a language, with fallback to default.
 
+    Results are memoized so unknown codes reuse a single fallback config instead
+    of building a new one per call.
+
     Args:
         language_code: ISO 639-3 code (e.g., 'grc', 'lat')
 
@@ -1820,6 +1825,7 @@ def get_language_config(language_code: str) -> LanguageConfig:
     )
 
 
+@lru_cache(maxsize=256)
 def get_script_guidelines(language_code: str) -> str:
     """Get script guidelines for AI prompts.
 
@@ -7,7 +7,9 @@ to reason about student level, learning objectives, and pedagogical best practic
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Sequence
+from functools import lru_cache
+from string import Formatter
+from typing import TYPE_CHECKING, Iterable, Sequence
 
 if TYPE_CHECKING:
     from app.lesson.providers.base import CanonicalLine, DailyLine, GrammarPattern, VocabularyItem
@@ -15,6 +17,7 @@ if TYPE_CHECKING:
 from app.lesson.language_config import get_script_guidelines
 
 
+@lru_cache(maxsize=256)
 def get_system_prompt(language: str = "grc") -> str:
     """Get system prompt with language-specific script guidelines.
 
@@ -182,6 +185,33 @@ Generate ONE translation exercise now based on the seed examples.
 )
 
 
+_FORMATTER = Formatter()
+
+
+@lru_cache(maxsize=1024)
+def _bind_static(template: str, **static_fields: str) -> str:
+    """Pre-render the static fields of ``template`` (profile, language).
+
+    The result is still a format string: literal braces stay escaped and the
+    remaining per-request fields (context, seed examples, vocabulary, ...) are
+    kept as placeholders, so each request only interpolates its dynamic context.
+    """
+    parts: list[str] = []
+    for literal, field_name, format_spec, conversion in _FORMATTER.parse(template):
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field_name is None:
+            continue
+        if field_name in static_fields:
+            value = _FORMATTER.format_field(
+                _FORMATTER.convert_field(static_fields[field_name], conversion), format_spec or ""
+            )
+            parts.append(value.replace("{", "{{").replace("}", "}}"))
+        else:
+            suffix = (f"!{conversion}" if conversion else "") + (f":{format_spec}" if format_spec else "")
+            parts.append(f"{{{field_name}{suffix}}}")
+    return "".join(parts)
+
+
 def format_daily_examples(daily_lines: list[DailyLine], language: str = "grc", limit: int = 5) -> str:
     """Format daily lines as seed examples for prompts."""
     examples = []
@@ -225,6 +255,7 @@ def format_text_samples(samples: Sequence[str], limit: int = 5) -> str:
     return "\n".join(preview) if preview else "(No text samples available)"
 
 
+@lru_cache(maxsize=512)
 def build_alphabet_prompt(profile: str, language: str = "grc") -> str:
     """Build alphabet exercise prompt."""
     return ALPHABET_PROMPT.format(profile=profile, language=language)
@@ -238,11 +269,9 @@ def build_match_prompt(
 ) -> str:
     """Build match exercise prompt with curriculum examples."""
     seed_examples = format_daily_examples(daily_lines, language=language, limit=5)
-    return MATCH_PROMPT.format(
-        profile=profile,
+    return _bind_static(MATCH_PROMPT, profile=profile, language=language).format(
         context=context,
         seed_examples=seed_examples,
-        language=language,
     )
 
 
@@ -253,8 +282,7 @@ def build_cloze_prompt(
     canonical_text: str,
 ) -> str:
     """Build cloze exercise prompt from canonical text."""
-    return CLOZE_PROMPT.format(
-        profile=profile,
+    return _bind_static(CLOZE_PROMPT, profile=profile).format(
         source_kind=source_kind,
         ref=ref,
         canonical_text=canonical_text,
@@ -269,8 +297,7 @@ def build_translate_prompt(
 ) -> str:
     """Build translation exercise prompt with curriculum examples."""
     seed_examples = format_daily_examples(daily_lines, language=language, limit=3)
-    return TRANSLATE_PROMPT.format(
-        profile=profile,
+    return _bind_static(TRANSLATE_PROMPT, profile=profile).format(
         context=context,
         seed_examples=seed_examples,
     )
@@ -738,8 +765,7 @@ def build_grammar_prompt(
     text_samples: Sequence[str],
 ) -> str:
     """Build grammar judgment prompt."""
-    return GRAMMAR_PROMPT.format(
-        profile=profile,
+    return _bind_static(GRAMMAR_PROMPT, profile=profile).format(
         grammar_patterns=format_grammar_patterns(grammar_patterns),
         text_samples=format_text_samples(text_samples),
     )
@@ -751,8 +777,7 @@ def build_listening_prompt(
     language: str = "grc",
 ) -> str:
     """Build listening comprehension prompt."""
-    return LISTENING_PROMPT.format(
-        profile=profile,
+    return _bind_static(LISTENING_PROMPT, profile=profile).format(
         daily_examples=format_daily_examples(list(daily_lines), language=language, limit=5),
     )
 
@@ -764,8 +789,7 @@ def build_speaking_prompt(
     language: str = "grc",
 ) -> str:
     """Build speaking exercise prompt."""
-    return SPEAKING_PROMPT.format(
-        profile=profile,
+    return _bind_static(SPEAKING_PROMPT, profile=profile).format(
         register=register,
         daily_examples=format_daily_examples(list(daily_lines), language=language, limit=5),
     )
@@ -776,8 +800,7 @@ def build_wordbank_prompt(
     text_samples: Sequence[str],
 ) -> str:
     """Build word bank prompt."""
-    return WORDBANK_PROMPT.format(
-        profile=profile,
+    return _bind_static(WORDBANK_PROMPT, profile=profile).format(
         text_samples=format_text_samples(text_samples),
     )
 
@@ -787,8 +810,7 @@ def build_truefalse_prompt(
     grammar_patterns: Sequence["GrammarPattern"],
 ) -> str:
     """Build true/false prompt."""
-    return TRUEFALSE_PROMPT.format(
-        profile=profile,
+    return _bind_static(TRUEFALSE_PROMPT, profile=profile).format(
         grammar_patterns=format_grammar_patterns(grammar_patterns),
     )
 
@@ -798,8 +820,7 @@ def build_multiplechoice_prompt(
     text_samples: Sequence[str],
 ) -> str:
     """Build multiple choice prompt."""
-    return MULTIPLE_CHOICE_PROMPT.format(
-        profile=profile,
+    return _bind_static(MULTIPLE_CHOICE_PROMPT, profile=profile).format(
         text_samples=format_text_samples(text_samples),
     )
 
@@ -811,8 +832,7 @@ def build_dialogue_prompt(
     language: str = "grc",
 ) -> str:
     """Build dialogue completion prompt."""
-    return DIALOGUE_PROMPT.format(
-        profile=profile,
+    return _bind_static(DIALOGUE_PROMPT, profile=profile).format(
         register=register,
         daily_examples=format_daily_examples(list(daily_lines), language=language, limit=5),
     )
@@ -823,8 +843,7 @@ def build_conjugation_prompt(
     vocabulary: Sequence["VocabularyItem"],
 ) -> str:
     """Build conjugation drill prompt."""
-    return CONJUGATION_PROMPT.format(
-        profile=profile,
+    return _bind_static(CONJUGATION_PROMPT, profile=profile).format(
         vocabulary=format_vocabulary_items(vocabulary),
     )
 
@@ -834,8 +853,7 @@ def build_declension_prompt(
     vocabulary: Sequence["VocabularyItem"],
 ) -> str:
     """Build declension drill prompt."""
-    return DECLENSION_PROMPT.format(
-        profile=profile,
+    return _bind_static(DECLENSION_PROMPT, profile=profile).format(
         vocabulary=format_vocabulary_items(vocabulary),
     )
 
@@ -845,8 +863,7 @@ def build_synonym_prompt(
     vocabulary: Sequence["VocabularyItem"],
 ) -> str:
     """Build synonym/antonym prompt."""
-    return SYNONYM_PROMPT.format(
-        profile=profile,
+    return _bind_static(SYNONYM_PROMPT, profile=profile).format(
         vocabulary=format_vocabulary_items(vocabulary),
     )
 
@@ -856,8 +873,7 @@ def build_contextmatch_prompt(
     text_samples: Sequence[str],
 ) -> str:
     """Build context match prompt."""
-    return CONTEXTMATCH_PROMPT.format(
-        profile=profile,
+    return _bind_static(CONTEXTMATCH_PROMPT, profile=profile).format(
         text_samples=format_text_samples(text_samples),
     )
 
@@ -867,8 +883,7 @@ def build_reorder_prompt(
     text_samples: Sequence[str],
 ) -> str:
     """Build reorder prompt."""
-    return REORDER_PROMPT.format(
-        profile=profile,
+    return _bind_static(REORDER_PROMPT, profile=profile).format(
         text_samples=format_text_samples(text_samples),
     )
 
@@ -879,8 +894,7 @@ def build_dictation_prompt(
     language: str = "grc",
 ) -> str:
     """Build dictation prompt."""
-    return DICTATION_PROMPT.format(
-        profile=profile,
+    return _bind_static(DICTATION_PROMPT, profile=profile).format(
         daily_examples=format_daily_examples(list(daily_lines), language=language, limit=5),
     )
 
@@ -890,8 +904,7 @@ def build_etymology_prompt(
     vocabulary: Sequence["VocabularyItem"],
 ) -> str:
     """Build etymology prompt."""
-    return ETYMOLOGY_PROMPT.format(
-        profile=profile,
+    return _bind_static(ETYMOLOGY_PROMPT, profile=profile).format(
         vocabulary=format_vocabulary_items(vocabulary),
     )
 
@@ -903,9 +916,57 @@ def build_comprehension_prompt(
     canonical_text: str,
 ) -> str:
     """Build reading comprehension prompt from canonical text."""
-    return COMPREHENSION_PROMPT.format(
-        profile=profile,
+    return _bind_static(COMPREHENSION_PROMPT, profile=profile).format(
         source_kind=source_kind,
         ref=ref,
         canonical_text=canonical_text,
     )
+
+
+EXERCISE_PROMPTS: dict[str, str] = {
+    "alphabet": ALPHABET_PROMPT,
+    "match": MATCH_PROMPT,
+    "cloze": CLOZE_PROMPT,
+    "translate": TRANSLATE_PROMPT,
+    "grammar": GRAMMAR_PROMPT,
+    "listening": LISTENING_PROMPT,
+    "speaking": SPEAKING_PROMPT,
+    "wordbank": WORDBANK_PROMPT,
+    "truefalse": TRUEFALSE_PROMPT,
+    "multiplechoice": MULTIPLE_CHOICE_PROMPT,
+    "dialogue": DIALOGUE_PROMPT,
+    "conjugation": CONJUGATION_PROMPT,
+    "declension": DECLENSION_PROMPT,
+    "synonym": SYNONYM_PROMPT,
+    "contextmatch": CONTEXTMATCH_PROMPT,
+    "reorder": REORDER_PROMPT,
+    "dictation": DICTATION_PROMPT,
+    "etymology": ETYMOLOGY_PROMPT,
+    "comprehension": COMPREHENSION_PROMPT,
+}
+
+
+def warm_prompt_cache(
+    languages: Iterable[str], profiles: Sequence[str] = ("beginner", "intermediate")
+) -> int:
+    """Pre-render system prompts and static template parts for every (language, profile, exercise).
+
+    Called once at startup so the first lesson request per language does not pay
+    for building script guidelines and binding templates. Returns the number of
+    languages warmed.
+    """
+    from app.lesson.lang_config import get_system_prompt as get_provider_system_prompt
+
+    warmed = 0
+    for language in languages:
+        get_system_prompt(language)
+        get_provider_system_prompt(language)
+        for profile in profiles:
+            build_alphabet_prompt(profile, language)
+            _bind_static(MATCH_PROMPT, profile=profile, language=language)
+        warmed += 1
+    for profile in profiles:
+        for exercise_type, template in EXERCISE_PROMPTS.items():
+            if exercise_type not in ("alphabet", "match"):
+                _bind_static(template, profile=profile)
+    return warmed
@@ -396,7 +396,15 @@ class AnthropicLessonProvider(LessonProvider):
             "model": model_name,
             "max_tokens": 4096,
             "temperature": 0.7,
-            "system": system_prompt,
+            # The system prompt depends only on the language, so mark it as a
+            # cacheable prefix; repeated lessons for a language reuse it.
+            "system": [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
             "messages": [
                 {
                     "role": "user",
@@ -514,6 +514,8 @@ class OpenAILessonProvider(LessonProvider):
         # Build input as array of messages with proper content structure
         # Based on working examples from OpenAI Responses API documentation (October 2025)
         # ⚠️ CRITICAL FIX: role must be "developer" (not "system") and content must be string (not array)
+        # The developer message comes first and is identical for every lesson in a
+        # language, so OpenAI's automatic prefix caching can reuse it.
         input_messages = [
             {"role": "developer", "content": system_prompt},
             {"role": "user", "content": user_message},
@@ -17,6 +17,8 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from app.lesson.language_config import LanguageConfig, get_language_config
@@ -25,6 +27,142 @@ if TYPE_CHECKING:
     from app.api.schemas.script_preferences import ScriptDisplayMode
 
 
+# Greek monotonic uppercase letters with tonos/dialytika, mapped to their
+# unaccented forms before decomposition.
+_GREEK_MONOTONIC_MAP = {
+    "\u0386": "\u0391",  # Ά → Α (Alpha with tonos)
+    "\u0388": "\u0395",  # Έ → Ε (Epsilon with tonos)
+    "\u0389": "\u0397",  # Ή → Η (Eta with tonos)
+    "\u038a": "\u0399",  # Ί → Ι (Iota with tonos)
+    "\u038c": "\u039f",  # Ό → Ο (Omicron with tonos)
+    "\u038e": "\u03a5",  # Ύ → Υ (Upsilon with tonos)
+    "\u038f": "\u03a9",  # Ώ → Ω (Omega with tonos)
+    "\u03aa": "\u0399",  # Ϊ → Ι (Iota with dialytika)
+    "\u03ab": "\u03a5",  # Ϋ → Υ (Upsilon with dialytika)
+}
+
+_V_FOR_U_TABLE = str.maketrans({"U": "V", "u": "v"})
+_SCRIPTIO_CONTINUA_RE = re.compile(r"[ \t]+")
+_SPACES_RE = re.compile(r" +")
+
+
+class _TranslationTable(dict):
+    """``str.translate`` table that fuses character normalization and accent stripping.
+
+    Entries are computed on first sight of a code point, so the table only ever
+    holds characters that actually occur in lesson text. Stripping maps a
+    character to its NFD decomposition minus nonspacing marks (category Mn);
+    the NFC pass in :meth:`translate_text` then restores canonical order and
+    composition, giving the same result as decomposing the whole string.
+    """
+
+    def __init__(self, normalize_chars: dict[str, str], strip_accents: bool) -> None:
+        super().__init__()
+        self._normalize_chars = normalize_chars
+        self._strip_accents = strip_accents
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        mapped = self._normalize_chars.get(char, char)
+        if self._strip_accents:
+            decomposed = unicodedata.normalize(
+                "NFD", "".join(_GREEK_MONOTONIC_MAP.get(part, part) for part in mapped)
+            )
+            mapped = "".join(part for part in decomposed if unicodedata.category(part) != "Mn")
+        self[codepoint] = mapped
+        return mapped
+
+    def translate_text(self, text: str) -> str:
+        """Translate ``text`` and, when stripping accents, recompose it to NFC."""
+        translated = text.translate(self)
+        if self._strip_accents:
+            return unicodedata.normalize("NFC", translated)
+        return translated
+
+
+_ACCENT_STRIP_TABLE = _TranslationTable({}, strip_accents=True)
+
+
+@dataclass(frozen=True)
+class CompiledScriptTransform:
+    """Script rules for one language, precompiled into a single translate pass.
+
+    Steps run in the order the rules are defined: character normalization and
+    accent stripping (fused), case, legacy V-for-U, then word separation.
+    """
+
+    replacements: tuple[tuple[str, str], ...]
+    """Ordered replacements that cannot be expressed as a translate table"""
+
+    table: _TranslationTable | None
+    """Fused per-character normalization and accent stripping (None if neither applies)"""
+
+    case: str
+    v_for_u: bool
+    scriptio_continua: bool
+    word_separator: str | None
+
+    def __call__(self, text: str) -> str:
+        if not text:
+            return text
+
+        result = text
+        for old_char, new_char in self.replacements:
+            result = result.replace(old_char, new_char)
+
+        if self.table is not None:
+            result = self.table.translate_text(result)
+
+        if self.case == "upper":
+            result = result.upper()
+        elif self.case == "lower":
+            result = result.lower()
+
+        if self.v_for_u:
+            result = result.translate(_V_FOR_U_TABLE)
+
+        if self.scriptio_continua:
+            result = _SCRIPTIO_CONTINUA_RE.sub("", result)
+
+        if self.word_separator:
+            result = _SPACES_RE.sub(self.word_separator, result.strip())
+
+        return result
+
+
+def _compile_script_transform(config: LanguageConfig) -> CompiledScriptTransform:
+    script = config.script
+    normalize_chars = script.normalize_chars or {}
+    # Single-character mappings whose outputs never feed another mapping can be
+    # applied simultaneously by str.translate; anything else keeps ordered replace.
+    translatable = all(len(old_char) == 1 for old_char in normalize_chars) and not any(
+        old_char in new_char for old_char in normalize_chars for new_char in normalize_chars.values()
+    )
+    replacements: tuple[tuple[str, str], ...] = ()
+    if not translatable:
+        replacements = tuple(normalize_chars.items())
+        normalize_chars = {}
+
+    table = None
+    if normalize_chars or not script.has_accents:
+        table = _TranslationTable(dict(normalize_chars), strip_accents=not script.has_accents)
+
+    return CompiledScriptTransform(
+        replacements=replacements,
+        table=table,
+        case=script.case,
+        v_for_u=script.char_v_for_u and not script.normalize_chars,
+        scriptio_continua=script.scriptio_continua_default and script.word_separator is None,
+        word_separator=script.word_separator,
+    )
+
+
+@lru_cache(maxsize=256)
+def compile_script_transform(language_code: str) -> CompiledScriptTransform:
+    """Return the cached compiled script transform for a language code."""
+    return _compile_script_transform(get_language_config(language_code))
+
+
 def apply_script_transform(text: str, language_code: str) -> str:
     """Transform text according to language-specific script rules.
 
@@ -35,8 +173,7 @@ def apply_script_transform(text: str, language_code: str) -> str:
     Returns:
         Transformed text following authentic script conventions
     """
-    config = get_language_config(language_code)
-    return apply_script_transform_with_config(text, config)
+    return compile_script_transform(language_code)(text)
 
 
 def apply_script_transform_with_config(text: str, config: LanguageConfig) -> str:
@@ -49,41 +186,9 @@ def apply_script_transform_with_config(text: str, config: LanguageConfig) -> str
     Returns:
         Transformed text following authentic script conventions
     """
-    if not text:
-        return text
-
-    result = text
-
-    # Apply character normalizations (e.g., J→I, U→V for Latin)
-    if config.script.normalize_chars:
-        for old_char, new_char in config.script.normalize_chars.items():
-            result = result.replace(old_char, new_char)
-
-    # Strip accents/diacritics if not wanted for this language
-    if not config.script.has_accents:
-        result = _remove_accents(result)
-
-    # Apply case transformation
-    if config.script.case == "upper":
-        result = result.upper()
-    elif config.script.case == "lower":
-        result = result.lower()
-    # "mixed" case leaves text as-is
-
-    # Legacy support: Apply V for U transformation (Latin)
-    # Note: Modern approach uses normalize_chars instead
-    if config.script.char_v_for_u and not config.script.normalize_chars:
-        result = result.replace("U", "V").replace("u", "v")
-
-    # Apply scriptio continua if default for this language
-    if config.script.scriptio_continua_default and config.script.word_separator is None:
-        result = apply_scriptio_continua(result)
-
-    # Apply word separator if configured
-    if config.script.word_separator:
-        result = _apply_word_separator(result, config.script.word_separator)
-
-    return result
+    if get_language_config(config.code) is config:
+        return compile_script_transform(config.code)(text)
+    return _compile_script_transform(config)(text)
 
 
 def _remove_accents(text: str) -> str:
@@ -99,33 +204,83 @@ def _remove_accents(text: str) -> str:
     Returns:
         Text with all diacritical marks removed
     """
-    # Greek monotonic uppercase letters with tonos/dialytika that don't decompose
-    # Map them to their unaccented forms
-    greek_monotonic_map = {
-        "\u0386": "\u0391",  # Ά → Α (Alpha with tonos)
-        "\u0388": "\u0395",  # Έ → Ε (Epsilon with tonos)
-        "\u0389": "\u0397",  # Ή → Η (Eta with tonos)
-        "\u038a": "\u0399",  # Ί → Ι (Iota with tonos)
-        "\u038c": "\u039f",  # Ό → Ο (Omicron with tonos)
-        "\u038e": "\u03a5",  # Ύ → Υ (Upsilon with tonos)
-        "\u038f": "\u03a9",  # Ώ → Ω (Omega with tonos)
-        "\u03aa": "\u0399",  # Ϊ → Ι (Iota with dialytika)
-        "\u03ab": "\u03a5",  # Ϋ → Υ (Upsilon with dialytika)
-    }
-
-    # Apply Greek monotonic replacements first
-    result = text
-    for accented, unaccented in greek_monotonic_map.items():
-        result = result.replace(accented, unaccented)
-
-    # Normalize to NFD (decomposed form) where accents are separate combining characters
-    nfd = unicodedata.normalize("NFD", result)
-
-    # Filter out combining characters (category Mn = Mark, Nonspacing)
-    without_accents = "".join(char for char in nfd if unicodedata.category(char) != "Mn")
-
-    # Normalize back to NFC (composed form)
-    return unicodedata.normalize("NFC", without_accents)
+    return _ACCENT_STRIP_TABLE.translate_text(text)
+
+
+# Map lowercase iota subscript vowels to vowel + I
+_IOTA_SUBSCRIPT_LOWER = {
+    "ᾀ": "αι",  # alpha with psili and iota subscript
+    "ᾁ": "αι",  # alpha with dasia and iota subscript
+    "ᾂ": "αι",  # alpha with psili, varia, and iota subscript
+    "ᾃ": "αι",  # alpha with dasia, varia, and iota subscript
+    "ᾄ": "αι",  # alpha with psili, oxia, and iota subscript
+    "ᾅ": "αι",  # alpha with dasia, oxia, and iota subscript
+    "ᾆ": "αι",  # alpha with psili, perispomeni, and iota subscript
+    "ᾇ": "αι",  # alpha with dasia, perispomeni, and iota subscript
+    "ᾰ": "α",  # alpha with vrachy (no iota but sometimes confused)
+    "ᾱ": "α",  # alpha with macron (no iota)
+    "ᾳ": "αι",  # alpha with iota subscript (MOST COMMON)
+    "ᾴ": "αι",  # alpha with oxia and iota subscript
+    "ᾶ": "α",  # alpha with perispomeni (no iota)
+    "ᾷ": "αι",  # alpha with perispomeni and iota subscript
+    "ᾐ": "ηι",  # eta with psili and iota subscript
+    "ᾑ": "ηι",  # eta with dasia and iota subscript
+    "ᾒ": "ηι",  # eta with psili, varia, and iota subscript
+    "ᾓ": "ηι",  # eta with dasia, varia, and iota subscript
+    "ᾔ": "ηι",  # eta with psili, oxia, and iota subscript
+    "ᾕ": "ηι",  # eta with dasia, oxia, and iota subscript
+    "ᾖ": "ηι",  # eta with psili, perispomeni, and iota subscript
+    "ᾗ": "ηι",  # eta with dasia, perispomeni, and iota subscript
+    "ῃ": "ηι",  # eta with iota subscript (MOST COMMON)
+    "ῄ": "ηι",  # eta with oxia and iota subscript
+    "ῆ": "η",  # eta with perispomeni (no iota)
+    "ῇ": "ηι",  # eta with perispomeni and iota subscript
+    "ᾠ": "ωι",  # omega with psili and iota subscript
+    "ᾡ": "ωι",  # omega with dasia and iota subscript
+    "ᾢ": "ωι",  # omega with psili, varia, and iota subscript
+    "ᾣ": "ωι",  # omega with dasia, varia, and iota subscript
+    "ᾤ": "ωι",  # omega with psili, oxia, and iota subscript
+    "ᾥ": "ωι",  # omega with dasia, oxia, and iota subscript
+    "ᾦ": "ωι",  # omega with psili, perispomeni, and iota subscript
+    "ᾧ": "ωι",  # omega with dasia, perispomeni, and iota subscript
+    "ῳ": "ωι",  # omega with iota subscript (MOST COMMON)
+    "ῴ": "ωι",  # omega with oxia and iota subscript
+    "ῶ": "ω",  # omega with perispomeni (no iota)
+    "ῷ": "ωι",  # omega with perispomeni and iota subscript
+}
+
+# Map uppercase iota subscript vowels to vowel + Ι
+_IOTA_SUBSCRIPT_UPPER = {
+    "ᾈ": "ΑΙ",  # alpha with psili and prosgegrammeni
+    "ᾉ": "ΑΙ",  # alpha with dasia and prosgegrammeni
+    "ᾊ": "ΑΙ",  # alpha with psili, varia, and prosgegrammeni
+    "ᾋ": "ΑΙ",  # alpha with dasia, varia, and prosgegrammeni
+    "ᾌ": "ΑΙ",  # alpha with psili, oxia, and prosgegrammeni
+    "ᾍ": "ΑΙ",  # alpha with dasia, oxia, and prosgegrammeni
+    "ᾎ": "ΑΙ",  # alpha with psili, perispomeni, and prosgegrammeni
+    "ᾏ": "ΑΙ",  # alpha with dasia, perispomeni, and prosgegrammeni
+    "ᾼ": "ΑΙ",  # alpha with prosgegrammeni (MOST COMMON)
+    "ᾘ": "ΗΙ",  # eta with psili and prosgegrammeni
+    "ᾙ": "ΗΙ",  # eta with dasia and prosgegrammeni
+    "ᾚ": "ΗΙ",  # eta with psili, varia, and prosgegrammeni
+    "ᾛ": "ΗΙ",  # eta with dasia, varia, and prosgegrammeni
+    "ᾜ": "ΗΙ",  # eta with psili, oxia, and prosgegrammeni
+    "ᾝ": "ΗΙ",  # eta with dasia, oxia, and prosgegrammeni
+    "ᾞ": "ΗΙ",  # eta with psili, perispomeni, and prosgegrammeni
+    "ᾟ": "ΗΙ",  # eta with dasia, perispomeni, and prosgegrammeni
+    "ῌ": "ΗΙ",  # eta with prosgegrammeni (MOST COMMON)
+    "ᾨ": "ΩΙ",  # omega with psili and prosgegrammeni
+    "ᾩ": "ΩΙ",  # omega with dasia and prosgegrammeni
+    "ᾪ": "ΩΙ",  # omega with psili, varia, and prosgegrammeni
+    "ᾫ": "ΩΙ",  # omega with dasia, varia, and prosgegrammeni
+    "ᾬ": "ΩΙ",  # omega with psili, oxia, and prosgegrammeni
+    "ᾭ": "ΩΙ",  # omega with dasia, oxia, and prosgegrammeni
+    "ᾮ": "ΩΙ",  # omega with psili, perispomeni, and prosgegrammeni
+    "ᾯ": "ΩΙ",  # omega with dasia, perispomeni, and prosgegrammeni
+    "ῼ": "ΩΙ",  # omega with prosgegrammeni (MOST COMMON)
+}
+
+_IOTA_ADSCRIPT_TABLE = str.maketrans({**_IOTA_SUBSCRIPT_LOWER, **_IOTA_SUBSCRIPT_UPPER})
 
 
 def convert_iota_subscript_to_adscript(text: str) -> str:
@@ -146,86 +301,7 @@ def convert_iota_subscript_to_adscript(text: str) -> str:
         >>> convert_iota_subscript_to_adscript("τῷ λόγῳ")
         'ΤΩΙ ΛΟΓΩΙ'
     """
-    # Map lowercase iota subscript vowels to vowel + I
-    lowercase_map = {
-        "ᾀ": "αι",  # alpha with psili and iota subscript
-        "ᾁ": "αι",  # alpha with dasia and iota subscript
-        "ᾂ": "αι",  # alpha with psili, varia, and iota subscript
-        "ᾃ": "αι",  # alpha with dasia, varia, and iota subscript
-        "ᾄ": "αι",  # alpha with psili, oxia, and iota subscript
-        "ᾅ": "αι",  # alpha with dasia, oxia, and iota subscript
-        "ᾆ": "αι",  # alpha with psili, perispomeni, and iota subscript
-        "ᾇ": "αι",  # alpha with dasia, perispomeni, and iota subscript
-        "ᾰ": "α",  # alpha with vrachy (no iota but sometimes confused)
-        "ᾱ": "α",  # alpha with macron (no iota)
-        "ᾳ": "αι",  # alpha with iota subscript (MOST COMMON)
-        "ᾴ": "αι",  # alpha with oxia and iota subscript
-        "ᾶ": "α",  # alpha with perispomeni (no iota)
-        "ᾷ": "αι",  # alpha with perispomeni and iota subscript
-        "ᾐ": "ηι",  # eta with psili and iota subscript
-        "ᾑ": "ηι",  # eta with dasia and iota subscript
-        "ᾒ": "ηι",  # eta with psili, varia, and iota subscript
-        "ᾓ": "ηι",  # eta with dasia, varia, and iota subscript
-        "ᾔ": "ηι",  # eta with psili, oxia, and iota subscript
-        "ᾕ": "ηι",  # eta with dasia, oxia, and iota subscript
-        "ᾖ": "ηι",  # eta with psili, perispomeni, and iota subscript
-        "ᾗ": "ηι",  # eta with dasia, perispomeni, and iota subscript
-        "ῃ": "ηι",  # eta with iota subscript (MOST COMMON)
-        "ῄ": "ηι",  # eta with oxia and iota subscript
-        "ῆ": "η",  # eta with perispomeni (no iota)
-        "ῇ": "ηι",  # eta with perispomeni and iota subscript
-        "ᾠ": "ωι",  # omega with psili and iota subscript
-        "ᾡ": "ωι",  # omega with dasia and iota subscript
-        "ᾢ": "ωι",  # omega with psili, varia, and iota subscript
-        "ᾣ": "ωι",  # omega with dasia, varia, and iota subscript
-        "ᾤ": "ωι",  # omega with psili, oxia, and iota subscript
-        "ᾥ": "ωι",  # omega with dasia, oxia, and iota subscript
-        "ᾦ": "ωι",  # omega with psili, perispomeni, and iota subscript
-        "ᾧ": "ωι",  # omega with dasia, perispomeni, and iota subscript
-        "ῳ": "ωι",  # omega with iota subscript (MOST COMMON)
-        "ῴ": "ωι",  # omega with oxia and iota subscript
-        "ῶ": "ω",  # omega with perispomeni (no iota)
-        "ῷ": "ωι",  # omega with perispomeni and iota subscript
-    }
-
-    # Map uppercase iota subscript vowels to vowel + Ι
-    uppercase_map = {
-        "ᾈ": "ΑΙ",  # alpha with psili and prosgegrammeni
-        "ᾉ": "ΑΙ",  # alpha with dasia and prosgegrammeni
-        "ᾊ": "ΑΙ",  # alpha with psili, varia, and prosgegrammeni
-        "ᾋ": "ΑΙ",  # alpha with dasia, varia, and prosgegrammeni
-        "ᾌ": "ΑΙ",  # alpha with psili, oxia, and prosgegrammeni
-        "ᾍ": "ΑΙ",  # alpha with dasia, oxia, and prosgegrammeni
-        "ᾎ": "ΑΙ",  # alpha with psili, perispomeni, and prosgegrammeni
-        "ᾏ": "ΑΙ",  # alpha with dasia, perispomeni, and prosgegrammeni
-        "ᾼ": "ΑΙ",  # alpha with prosgegrammeni (MOST COMMON)
-        "ᾘ": "ΗΙ",  # eta with psili and prosgegrammeni
-        "ᾙ": "ΗΙ",  # eta with dasia and prosgegrammeni
-        "ᾚ": "ΗΙ",  # eta with psili, varia, and prosgegrammeni
-        "ᾛ": "ΗΙ",  # eta with dasia, varia, and prosgegrammeni
-        "ᾜ": "ΗΙ",  # eta with psili, oxia, and prosgegrammeni
-        "ᾝ": "ΗΙ",  # eta with dasia, oxia, and prosgegrammeni
-        "ᾞ": "ΗΙ",  # eta with psili, perispomeni, and prosgegrammeni
-        "ᾟ": "ΗΙ",  # eta with dasia, perispomeni, and prosgegrammeni
-        "ῌ": "ΗΙ",  # eta with prosgegrammeni (MOST COMMON)
-        "ᾨ": "ΩΙ",  # omega with psili and prosgegrammeni
-        "ᾩ": "ΩΙ",  # omega with dasia and prosgegrammeni
-        "ᾪ": "ΩΙ",  # omega with psili, varia, and prosgegrammeni
-        "ᾫ": "ΩΙ",  # omega with dasia, varia, and prosgegrammeni
-        "ᾬ": "ΩΙ",  # omega with psili, oxia, and prosgegrammeni
-        "ᾭ": "ΩΙ",  # omega with dasia, oxia, and prosgegrammeni
-        "ᾮ": "ΩΙ",  # omega with psili, perispomeni, and prosgegrammeni
-        "ᾯ": "ΩΙ",  # omega with dasia, perispomeni, and prosgegrammeni
-        "ῼ": "ΩΙ",  # omega with prosgegrammeni (MOST COMMON)
-    }
-
-    result = text
-    for subscript, adscript in lowercase_map.items():
-        result = result.replace(subscript, adscript)
-    for subscript, adscript in uppercase_map.items():
-        result = result.replace(subscript, adscript)
-
-    return result
+    return text.translate(_IOTA_ADSCRIPT_TABLE)
 
 
 def apply_scriptio_continua(text: str) -> str:
@@ -247,7 +323,7 @@ def apply_scriptio_continua(text: str) -> str:
         'ARMAVIRVMQVECANO'
     """
     # Remove all spaces but preserve line breaks
-    return re.sub(r"[ \t]+", "", text)
+    return _SCRIPTIO_CONTINUA_RE.sub("", text)
 
 
 def apply_interpunct(text: str) -> str:
@@ -270,7 +346,7 @@ def apply_interpunct(text: str) -> str:
         'ΜΗΝΙΝ·ΑΕΙΔΕ·ΘΕΑ'
     """
     # Replace spaces with interpunct (U+00B7 MIDDLE DOT)
-    return re.sub(r" +", "·", text.strip())
+    return _SPACES_RE.sub("·", text.strip())
 
 
 def _apply_word_separator(text: str, separator: str) -> str:
@@ -283,7 +359,48 @@ def _apply_word_separator(text: str, separator: str) -> str:
     Returns:
         Text with spaces replaced by separator
     """
-    return re.sub(r" +", separator, text.strip())
+    return _SPACES_RE.sub(separator, text.strip())
+
+
+# Unicode combining overline: U+035E
+_OVERLINE = "\u035e"
+
+# Nomina sacra mappings (full word → abbreviated form)
+# Format: each letter gets an overline, e.g., ΘΣ → Θ͞Σ͞
+_NOMINA_SACRA = {
+    # Most common (15 standard nomina sacra)
+    "ΘΕΟΣ": f"Θ{_OVERLINE}Σ{_OVERLINE}",  # God
+    "ΘΕΟΥ": f"Θ{_OVERLINE}Υ{_OVERLINE}",  # of God (genitive)
+    "ΘΕΩΝ": f"Θ{_OVERLINE}Ν{_OVERLINE}",  # of gods (genitive plural)
+    "ΚΥΡΙΟΣ": f"Κ{_OVERLINE}Σ{_OVERLINE}",  # Lord
+    "ΚΥΡΙΟΥ": f"Κ{_OVERLINE}Υ{_OVERLINE}",  # of Lord (genitive)
+    "ΚΥΡΙΩΝ": f"Κ{_OVERLINE}Ν{_OVERLINE}",  # of lords (genitive plural)
+    "ΙΗΣΟΥΣ": f"Ι{_OVERLINE}Σ{_OVERLINE}",  # Jesus
+    "ΙΗΣΟΥ": f"Ι{_OVERLINE}Υ{_OVERLINE}",  # of Jesus (genitive)
+    "ΧΡΙΣΤΟΣ": f"Χ{_OVERLINE}Σ{_OVERLINE}",  # Christ
+    "ΧΡΙΣΤΟΥ": f"Χ{_OVERLINE}Υ{_OVERLINE}",  # of Christ (genitive)
+    "ΠΝΕΥΜΑ": f"Π{_OVERLINE}Ν{_OVERLINE}Α{_OVERLINE}",  # Spirit
+    "ΠΝΕΥΜΑΤΟΣ": f"Π{_OVERLINE}Ν{_OVERLINE}Σ{_OVERLINE}",  # of Spirit (genitive)
+    "ΥΙΟΣ": f"Υ{_OVERLINE}Σ{_OVERLINE}",  # Son
+    "ΥΙΟΥ": f"Υ{_OVERLINE}Υ{_OVERLINE}",  # of Son (genitive)
+    "ΠΑΤΗΡ": f"Π{_OVERLINE}Η{_OVERLINE}Ρ{_OVERLINE}",  # Father
+    "ΠΑΤΡΟΣ": f"Π{_OVERLINE}Ρ{_OVERLINE}Σ{_OVERLINE}",  # of Father (genitive)
+    "ΜΗΤΗΡ": f"Μ{_OVERLINE}Η{_OVERLINE}Ρ{_OVERLINE}",  # Mother
+    "ΜΗΤΡΟΣ": f"Μ{_OVERLINE}Ρ{_OVERLINE}Σ{_OVERLINE}",  # of Mother (genitive)
+    "ΑΝΘΡΩΠΟΣ": f"Α{_OVERLINE}Ν{_OVERLINE}Ο{_OVERLINE}Σ{_OVERLINE}",  # man/human
+    "ΑΝΘΡΩΠΟΥ": f"Α{_OVERLINE}Ν{_OVERLINE}Ο{_OVERLINE}Υ{_OVERLINE}",  # of man (genitive)
+    "ΟΥΡΑΝΟΣ": f"Ο{_OVERLINE}Υ{_OVERLINE}Ν{_OVERLINE}Σ{_OVERLINE}",  # heaven
+    "ΟΥΡΑΝΟΥ": f"Ο{_OVERLINE}Υ{_OVERLINE}Ν{_OVERLINE}Υ{_OVERLINE}",  # of heaven (genitive)
+    "ΙΣΡΑΗΛ": f"Ι{_OVERLINE}Η{_OVERLINE}Λ{_OVERLINE}",  # Israel
+    "ΔΑΥΙΔ": f"Δ{_OVERLINE}Α{_OVERLINE}Δ{_OVERLINE}",  # David
+    "ΙΕΡΟΥΣΑΛΗΜ": f"Ι{_OVERLINE}Λ{_OVERLINE}Η{_OVERLINE}Μ{_OVERLINE}",  # Jerusalem
+    "ΣΤΑΥΡΟΣ": f"Σ{_OVERLINE}Τ{_OVERLINE}Σ{_OVERLINE}",  # cross
+}
+
+# Longest words first so that an alternation tries them before shorter prefixes.
+_NOMINA_SACRA_RE = re.compile(
+    "|".join(rf"\b{full_word}\b" for full_word in sorted(_NOMINA_SACRA, key=len, reverse=True))
+)
 
 
 def apply_nomina_sacra(text: str, language_code: str = "grc-koi") -> str:
@@ -322,48 +439,28 @@ def apply_nomina_sacra(text: str, language_code: str = "grc-koi") -> str:
     if language_code != "grc-koi":
         return text  # Only apply to Koine Greek
 
-    # Unicode combining overline: U+035E
-    OVERLINE = "\u035e"
-
-    # Nomina sacra mappings (full word → abbreviated form)
-    # Format: each letter gets an overline, e.g., ΘΣ → Θ͞Σ͞
-    nomina_sacra = {
-        # Most common (15 standard nomina sacra)
-        "ΘΕΟΣ": f"Θ{OVERLINE}Σ{OVERLINE}",  # God
-        "ΘΕΟΥ": f"Θ{OVERLINE}Υ{OVERLINE}",  # of God (genitive)
-        "ΘΕΩΝ": f"Θ{OVERLINE}Ν{OVERLINE}",  # of gods (genitive plural)
-        "ΚΥΡΙΟΣ": f"Κ{OVERLINE}Σ{OVERLINE}",  # Lord
-        "ΚΥΡΙΟΥ": f"Κ{OVERLINE}Υ{OVERLINE}",  # of Lord (genitive)
-        "ΚΥΡΙΩΝ": f"Κ{OVERLINE}Ν{OVERLINE}",  # of lords (genitive plural)
-        "ΙΗΣΟΥΣ": f"Ι{OVERLINE}Σ{OVERLINE}",  # Jesus
-        "ΙΗΣΟΥ": f"Ι{OVERLINE}Υ{OVERLINE}",  # of Jesus (genitive)
-        "ΧΡΙΣΤΟΣ": f"Χ{OVERLINE}Σ{OVERLINE}",  # Christ
-        "ΧΡΙΣΤΟΥ": f"Χ{OVERLINE}Υ{OVERLINE}",  # of Christ (genitive)
-        "ΠΝΕΥΜΑ": f"Π{OVERLINE}Ν{OVERLINE}Α{OVERLINE}",  # Spirit
-        "ΠΝΕΥΜΑΤΟΣ": f"Π{OVERLINE}Ν{OVERLINE}Σ{OVERLINE}",  # of Spirit (genitive)
-        "ΥΙΟΣ": f"Υ{OVERLINE}Σ{OVERLINE}",  # Son
-        "ΥΙΟΥ": f"Υ{OVERLINE}Υ{OVERLINE}",  # of Son (genitive)
-        "ΠΑΤΗΡ": f"Π{OVERLINE}Η{OVERLINE}Ρ{OVERLINE}",  # Father
-        "ΠΑΤΡΟΣ": f"Π{OVERLINE}Ρ{OVERLINE}Σ{OVERLINE}",  # of Father (genitive)
-        "ΜΗΤΗΡ": f"Μ{OVERLINE}Η{OVERLINE}Ρ{OVERLINE}",  # Mother
-        "ΜΗΤΡΟΣ": f"Μ{OVERLINE}Ρ{OVERLINE}Σ{OVERLINE}",  # of Mother (genitive)
-        "ΑΝΘΡΩΠΟΣ": f"Α{OVERLINE}Ν{OVERLINE}Ο{OVERLINE}Σ{OVERLINE}",  # man/human
-        "ΑΝΘΡΩΠΟΥ": f"Α{OVERLINE}Ν{OVERLINE}Ο{OVERLINE}Υ{OVERLINE}",  # of man (genitive)
-        "ΟΥΡΑΝΟΣ": f"Ο{OVERLINE}Υ{OVERLINE}Ν{OVERLINE}Σ{OVERLINE}",  # heaven
-        "ΟΥΡΑΝΟΥ": f"Ο{OVERLINE}Υ{OVERLINE}Ν{OVERLINE}Υ{OVERLINE}",  # of heaven (genitive)
-        "ΙΣΡΑΗΛ": f"Ι{OVERLINE}Η{OVERLINE}Λ{OVERLINE}",  # Israel
-        "ΔΑΥΙΔ": f"Δ{OVERLINE}Α{OVERLINE}Δ{OVERLINE}",  # David
-        "ΙΕΡΟΥΣΑΛΗΜ": f"Ι{OVERLINE}Λ{OVERLINE}Η{OVERLINE}Μ{OVERLINE}",  # Jerusalem
-        "ΣΤΑΥΡΟΣ": f"Σ{OVERLINE}Τ{OVERLINE}Σ{OVERLINE}",  # cross
-    }
+    return _NOMINA_SACRA_RE.sub(lambda match: _NOMINA_SACRA[match.group(0)], text)
 
-    result = text
-    # Sort by length (longest first) to avoid partial replacements
-    for full_word, abbreviated in sorted(nomina_sacra.items(), key=lambda x: -len(x[0])):
-        # Use word boundary matching to avoid replacing parts of words
-        result = re.sub(rf"\b{full_word}\b", abbreviated, result)
 
-    return result
+# Remove modern punctuation marks
+_MODERN_PUNCTUATION = {
+    "?": "",  # Question mark (not ancient)
+    "!": "",  # Exclamation mark (not ancient)
+    ",": " ",  # Comma (replace with space)
+    ";": " ",  # Semicolon (especially not ancient Greek - this is modern question mark!)
+    ":": " ",  # Colon (not ancient)
+    ".": " ",  # Period (not ancient in this form)
+    '"': "",  # Quotation marks
+    "'": "",  # Apostrophe (except in Greek elision)
+    "—": " ",  # Em dash
+    "–": " ",  # En dash
+    "(": "",  # Parentheses
+    ")": "",
+    "[": "",  # Brackets
+    "]": "",
+}
+
+_MODERN_PUNCTUATION_TABLE = str.maketrans(_MODERN_PUNCTUATION)
 
 
 def remove_modern_punctuation(text: str, language_code: str) -> str:
@@ -387,32 +484,10 @@ def remove_modern_punctuation(text: str, language_code: str) -> str:
         >>> remove_modern_punctuation("SALVE, AMICE.", "lat")
         'SALVE AMICE'
     """
-    # Remove modern punctuation marks
-    modern_punctuation = {
-        "?": "",  # Question mark (not ancient)
-        "!": "",  # Exclamation mark (not ancient)
-        ",": " ",  # Comma (replace with space)
-        ";": " ",  # Semicolon (especially not ancient Greek - this is modern question mark!)
-        ":": " ",  # Colon (not ancient)
-        ".": " ",  # Period (not ancient in this form)
-        '"': "",  # Quotation marks
-        "'": "",  # Apostrophe (except in Greek elision)
-        "—": " ",  # Em dash
-        "–": " ",  # En dash
-        "(": "",  # Parentheses
-        ")": "",
-        "[": "",  # Brackets
-        "]": "",
-    }
-
-    result = text
-    for punct, replacement in modern_punctuation.items():
-        result = result.replace(punct, replacement)
+    result = text.translate(_MODERN_PUNCTUATION_TABLE)
 
     # Clean up multiple spaces
-    result = re.sub(r" +", " ", result).strip()
-
-    return result
+    return _SPACES_RE.sub(" ", result).strip()
 
 
 def get_alphabet_for_language(language_code: str) -> list[str]:
@@ -23,14 +23,9 @@ def load_daily_seeds(language: str) -> list[dict]:
 
 def load_canonical_refs(language: str) -> list[str]:
     """Load canonical refs (text fetched from LDS at runtime)."""
-    seed_file = Path(__file__).parent / "seed" / f"canonical_{language}.yaml"
-    if not seed_file.exists():
-        return []
-
-    with open(seed_file, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    from app.lesson.seed_store import load_canonical_refs as load_compiled_canonical_refs
 
-    return [item["ref"] for item in data.get(f"canonical_{language}", [])]
+    return load_compiled_canonical_refs(language)
 
 
 @lru_cache(maxsize=4)
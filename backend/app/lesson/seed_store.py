@@ -0,0 +1,347 @@
+"""Compiled, memory-mapped store for lesson seed YAML.
+
+The ``daily_*``, ``colloquial_*`` and ``canonical_*`` files in ``lesson/seed`` are
+compiled at build time (``python -m app.lesson.seed_store``) into a single binary
+artifact. Worker processes ``mmap`` it read-only, so the pages are shared through
+the OS page cache. A line is decoded only when it is sampled, which removes
+cold-start YAML parsing and per-request list copies.
+
+Layout (little endian)::
+
+    b"PRVSEED1" | u32 directory length | JSON directory
+    | daily records (6 x u32: text off/len, en off/len, first variant, variant count)
+    | variant records (2 x u32: off/len) | ref records (2 x u32: off/len) | UTF-8 string blob
+
+Region offsets in the directory are relative to the end of the directory, and
+string offsets inside records are relative to the string blob. The directory stores a
+fingerprint of the source YAML; a missing or stale artifact falls back to
+parsing YAML directly, so development checkouts keep working without a build step.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import mmap
+import struct
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator, Sequence, overload
+
+from app.lesson.providers.base import DailyLine
+
+_LOGGER = logging.getLogger("app.lesson.seed_store")
+
+SEED_DIR = Path(__file__).resolve().parent / "seed"
+SEED_STORE_PATH = SEED_DIR / "seed_store.bin"
+
+_MAGIC = b"PRVSEED1"
+_HEADER = struct.Struct("<8sI")
+_DAILY_RECORD = struct.Struct("<6I")
+_SPAN_RECORD = struct.Struct("<2I")
+_SEED_PREFIXES = ("daily_", "colloquial_", "canonical_")
+
+
+def _normalize(value: Any) -> str:
+    # Handle booleans that YAML parsed from keywords like "on"→True, "yes"→True, "no"→False
+    if isinstance(value, bool):
+        return "on" if value else "off"
+    return unicodedata.normalize("NFC", (value or "").strip())
+
+
+def seed_source_files(seed_dir: Path = SEED_DIR) -> list[Path]:
+    return sorted(path for path in seed_dir.glob("*.yaml") if path.name.startswith(_SEED_PREFIXES))
+
+
+def seed_fingerprint(seed_dir: Path = SEED_DIR) -> str:
+    """Content hash of every seed YAML file, used to detect a stale artifact."""
+    digest = hashlib.sha256()
+    for path in seed_source_files(seed_dir):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _read_yaml_entries(path: Path) -> list[Any]:
+    try:
+        import yaml
+    except ImportError as exc:  # pragma: no cover - installation issue
+        raise RuntimeError("PyYAML is required to load lesson seed data") from exc
+
+    key = path.stem
+    yaml_data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    data = yaml_data.get(key, [])
+    if not data and "-" in key:
+        data = yaml_data.get(key.split("-", 1)[0], [])
+    return data or []
+
+
+def normalize_daily_entries(data: Sequence[Any]) -> list[tuple[str, str, tuple[str, ...]]]:
+    """NFC-normalize and de-duplicate raw daily seed entries into (text, en, variants)."""
+    lines: list[tuple[str, str, tuple[str, ...]]] = []
+    seen: set[str] = set()
+    for entry in data:
+        text = _normalize(entry.get("text", ""))
+        # Defensive: handle booleans that YAML parsed from "yes"→True, "no"→False
+        en_raw = entry.get("en")
+        if en_raw is None:
+            en = ""
+        elif isinstance(en_raw, bool):
+            # Convert bool back to lowercase yes/no for consistency
+            en = "yes" if en_raw else "no"
+        else:
+            en = str(en_raw).strip()
+        if not text or not en or text in seen:
+            continue
+        variants = entry.get("variants") or []
+        normalized_variants: list[str] = []
+        for variant in variants:
+            norm_variant = _normalize(variant)
+            if norm_variant and norm_variant not in normalized_variants:
+                normalized_variants.append(norm_variant)
+        if not normalized_variants:
+            normalized_variants.append(text)
+        lines.append((text, en, tuple(normalized_variants)))
+        seen.add(text)
+    return lines
+
+
+def _canonical_refs(data: Sequence[Any]) -> list[str]:
+    return [str(item["ref"]) for item in data if isinstance(item, dict) and "ref" in item]
+
+
+def build_seed_store(seed_dir: Path = SEED_DIR, output: Path = SEED_STORE_PATH) -> dict[str, Any]:
+    """Compile every seed YAML file in ``seed_dir`` into the binary artifact at ``output``."""
+    blob = bytearray()
+    offsets: dict[str, int] = {}
+
+    def _span(value: str) -> tuple[int, int]:
+        offset = offsets.get(value)
+        encoded = value.encode("utf-8")
+        if offset is None:
+            offset = len(blob)
+            offsets[value] = offset
+            blob.extend(encoded)
+        return offset, len(encoded)
+
+    daily_records = bytearray()
+    variant_records = bytearray()
+    ref_records = bytearray()
+    sections: dict[str, dict[str, Any]] = {}
+    daily_count = variant_count = ref_count = 0
+
+    for path in seed_source_files(seed_dir):
+        data = _read_yaml_entries(path)
+        if path.name.startswith("canonical_"):
+            refs = _canonical_refs(data)
+            sections[path.stem] = {"kind": "canonical", "start": ref_count, "count": len(refs)}
+            for ref in refs:
+                ref_records.extend(_SPAN_RECORD.pack(*_span(ref)))
+            ref_count += len(refs)
+            continue
+
+        lines = normalize_daily_entries(data)
+        sections[path.stem] = {"kind": "daily", "start": daily_count, "count": len(lines)}
+        for text, en, variants in lines:
+            daily_records.extend(_DAILY_RECORD.pack(*_span(text), *_span(en), variant_count, len(variants)))
+            for variant in variants:
+                variant_records.extend(_SPAN_RECORD.pack(*_span(variant)))
+            variant_count += len(variants)
+        daily_count += len(lines)
+
+    # Region offsets are relative to the end of the directory.
+    directory = {
+        "fingerprint": seed_fingerprint(seed_dir),
+        "sections": sections,
+        "daily_offset": 0,
+        "variant_offset": len(daily_records),
+        "ref_offset": len(daily_records) + len(variant_records),
+        "strings_offset": len(daily_records) + len(variant_records) + len(ref_records),
+    }
+    encoded_directory = json.dumps(directory).encode("utf-8")
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_suffix(output.suffix + ".tmp")
+    with open(tmp_path, "wb") as handle:
+        handle.write(_HEADER.pack(_MAGIC, len(encoded_directory)))
+        handle.write(encoded_directory)
+        handle.write(daily_records)
+        handle.write(variant_records)
+        handle.write(ref_records)
+        handle.write(blob)
+    tmp_path.replace(output)
+    return {"sections": len(sections), "daily_lines": daily_count, "refs": ref_count, "bytes": len(blob)}
+
+
+class SeedLines(Sequence[DailyLine]):
+    """Read-only view over one daily/colloquial section; lines decode on access."""
+
+    __slots__ = ("_store", "_start", "_count", "_language")
+
+    def __init__(self, store: SeedStore, start: int, count: int, language: str) -> None:
+        self._store = store
+        self._start = start
+        self._count = count
+        self._language = language
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> DailyLine: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[DailyLine, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> DailyLine | tuple[DailyLine, ...]:
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(self._count)))
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("seed line index out of range")
+        return self._store._daily_line(self._start + index, self._language)
+
+    def __iter__(self) -> Iterator[DailyLine]:
+        for index in range(self._count):
+            yield self._store._daily_line(self._start + index, self._language)
+
+
+class SeedStore:
+    """Memory-mapped view of a compiled seed artifact."""
+
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as handle:
+            self._mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, directory_length = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a compiled seed store")
+        base = _HEADER.size + directory_length
+        directory = json.loads(bytes(self._mm[_HEADER.size : base]))
+        self.fingerprint: str = directory["fingerprint"]
+        self.sections: dict[str, dict[str, Any]] = directory["sections"]
+        self._daily_offset: int = base + directory["daily_offset"]
+        self._variant_offset: int = base + directory["variant_offset"]
+        self._ref_offset: int = base + directory["ref_offset"]
+        self._strings_offset: int = base + directory["strings_offset"]
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_offset + offset
+        return self._mm[start : start + length].decode("utf-8")
+
+    def _daily_line(self, index: int, language: str) -> DailyLine:
+        text_off, text_len, en_off, en_len, variant_start, variant_count = _DAILY_RECORD.unpack_from(
+            self._mm, self._daily_offset + index * _DAILY_RECORD.size
+        )
+        variants = tuple(
+            self._string(*_SPAN_RECORD.unpack_from(self._mm, self._variant_offset + i * _SPAN_RECORD.size))
+            for i in range(variant_start, variant_start + variant_count)
+        )
+        return DailyLine(
+            text=self._string(text_off, text_len),
+            en=self._string(en_off, en_len),
+            language=language,
+            variants=variants,
+        )
+
+    def daily_lines(self, section: str, language: str) -> SeedLines:
+        meta = self.sections[section]
+        return SeedLines(self, meta["start"], meta["count"], language)
+
+    def canonical_refs(self, section: str) -> list[str]:
+        meta = self.sections[section]
+        return [
+            self._string(*_SPAN_RECORD.unpack_from(self._mm, self._ref_offset + i * _SPAN_RECORD.size))
+            for i in range(meta["start"], meta["start"] + meta["count"])
+        ]
+
+
+@lru_cache(maxsize=1)
+def get_seed_store() -> SeedStore | None:
+    """Open the compiled artifact once per process, or return None to fall back to YAML."""
+    if not SEED_STORE_PATH.exists():
+        _LOGGER.info("Compiled seed store not found at %s; parsing seed YAML on demand", SEED_STORE_PATH)
+        return None
+    try:
+        store = SeedStore(SEED_STORE_PATH)
+    except (OSError, ValueError, KeyError) as exc:
+        _LOGGER.warning("Failed to open compiled seed store %s: %s", SEED_STORE_PATH, exc)
+        return None
+    if store.fingerprint != seed_fingerprint():
+        _LOGGER.warning("Compiled seed store %s is stale; parsing seed YAML on demand", SEED_STORE_PATH)
+        return None
+    return store
+
+
+def _daily_section_candidates(language: str, register: str) -> list[str]:
+    prefix = "colloquial" if register == "colloquial" else "daily"
+    base_language = language.split("-", 1)[0]
+    candidates = [f"{prefix}_{language}"]
+    if "-" in language:
+        candidates.append(f"{prefix}_{base_language}")
+    if register == "colloquial":
+        candidates.append(f"daily_{language}")
+        if "-" in language:
+            candidates.append(f"daily_{base_language}")
+    return candidates
+
+
+@lru_cache(maxsize=256)
+def _yaml_daily_lines(section: str, language: str) -> tuple[DailyLine, ...]:
+    lines = normalize_daily_entries(_read_yaml_entries(SEED_DIR / f"{section}.yaml"))
+    return tuple(
+        DailyLine(text=text, en=en, language=language, variants=variants) for text, en, variants in lines
+    )
+
+
+def load_daily_lines(language: str, register: str = "literary") -> Sequence[DailyLine]:
+    """Return the daily (or colloquial) seed lines for ``language`` without copying them."""
+    candidates = _daily_section_candidates(language, register)
+    store = get_seed_store()
+    for section in candidates:
+        if store is not None:
+            if section in store.sections:
+                return store.daily_lines(section, language)
+        elif (SEED_DIR / f"{section}.yaml").exists():
+            return _yaml_daily_lines(section, language)
+
+    _LOGGER.warning(
+        "Lesson seed file missing at %s for language '%s' (register=%s)",
+        SEED_DIR / f"{candidates[0]}.yaml",
+        language,
+        register,
+    )
+    return tuple()
+
+
+def load_canonical_refs(language: str) -> list[str]:
+    """Return canonical refs for ``language`` from the compiled store or its YAML file."""
+    section = f"canonical_{language}"
+    store = get_seed_store()
+    if store is not None:
+        return store.canonical_refs(section) if section in store.sections else []
+    path = SEED_DIR / f"{section}.yaml"
+    if not path.exists():
+        return []
+    return _canonical_refs(_read_yaml_entries(path))
+
+
+def main() -> None:  # pragma: no cover - build entry point
+    parser = argparse.ArgumentParser(description="Compile lesson seed YAML into a memory-mappable store")
+    parser.add_argument("--seed-dir", type=Path, default=SEED_DIR)
+    parser.add_argument("--output", type=Path, default=SEED_STORE_PATH)
+    args = parser.parse_args()
+    stats = build_seed_store(args.seed_dir, args.output)
+    print(
+        f"Wrote {args.output} ({stats['sections']} sections, {stats['daily_lines']} lines, "
+        f"{stats['refs']} refs, {stats['bytes']} string bytes)"
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -4,8 +4,8 @@ import hashlib
 import logging
 import random
 import unicodedata
-from functools import lru_cache
-from pathlib import Path
+from dataclasses import replace
+from typing import Sequence
 
 from fastapi import HTTPException
 from sqlalchemy import text
@@ -13,6 +13,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings
+from app.lesson.context_cache import context_cache
 from app.lesson.models import LessonGenerateRequest, LessonResponse
 from app.lesson.providers import (
     PROVIDERS,
@@ -30,8 +31,7 @@ from app.lesson.providers.anthropic import AnthropicLessonProvider
 from app.lesson.providers.echo import EchoLessonProvider
 from app.lesson.providers.google import GoogleLessonProvider
 from app.lesson.providers.openai import OpenAILessonProvider
-
-_SEED_DIR = Path(__file__).resolve().parent / "seed"
+from app.lesson.seed_store import load_daily_lines
 
 # Register core providers
 if "echo" not in PROVIDERS:
@@ -243,7 +243,7 @@ async def _build_context(
     canonical_lines: tuple[CanonicalLine, ...] = tuple()
     if request.k_canon > 0 and "canon" in request.sources:
         try:
-            canonical_lines = await _fetch_canonical_lines(
+            canonical_lines = await _cached_canonical_lines(
                 session=session,
                 language=request.language,
                 limit=request.k_canon,
@@ -275,7 +275,7 @@ async def _build_context(
     text_range_data = None
     if request.text_range:
         try:
-            text_range_data = await _extract_text_range_data(
+            text_range_data = await _cached_text_range_data(
                 session=session,
                 language=request.language,
                 ref_start=request.text_range.ref_start,
@@ -328,7 +328,7 @@ def _daily_sample_size(request: LessonGenerateRequest) -> int:
 
 
 def _select_daily_lines(*, language: str, seed: int, sample_size: int, register: str = "literary"):
-    lines = list(_load_daily_seed(language=language, register=register))
+    lines = _load_daily_seed(language=language, register=register)
     if not lines or sample_size <= 0:
         return tuple()
     if sample_size >= len(lines):
@@ -338,84 +338,51 @@ def _select_daily_lines(*, language: str, seed: int, sample_size: int, register:
     return tuple(lines[idx] for idx in indices)
 
 
-@lru_cache(maxsize=16)
-def _load_daily_seed(language: str = "grc", register: str = "literary"):
-    try:
-        import yaml
-    except ImportError as exc:  # pragma: no cover - installation issue
-        raise RuntimeError("PyYAML is required to load lesson seed data") from exc
+def _load_daily_seed(language: str = "grc", register: str = "literary") -> Sequence[DailyLine]:
+    """Seed lines for (language, register), served from the compiled store when built."""
+    return load_daily_lines(language, register)
 
-    prefix = "colloquial" if register == "colloquial" else "daily"
-    base_language = language.split("-", 1)[0]
 
-    search_candidates: list[tuple[str, str]] = [
-        (f"{prefix}_{language}.yaml", f"{prefix}_{language}"),
-    ]
+_MAX_CANONICAL_LINES = 10
 
-    if "-" in language:
-        search_candidates.append((f"{prefix}_{base_language}.yaml", f"{prefix}_{base_language}"))
-
-    if register == "colloquial":
-        search_candidates.append((f"daily_{language}.yaml", f"daily_{language}"))
-        if "-" in language:
-            search_candidates.append((f"daily_{base_language}.yaml", f"daily_{base_language}"))
-
-    seed_path = None
-    yaml_key = None
-    for filename, candidate_key in search_candidates:
-        candidate_path = _SEED_DIR / filename
-        if candidate_path.exists():
-            seed_path = candidate_path
-            yaml_key = candidate_key
-            break
 
-    if seed_path is None or yaml_key is None:  # pragma: no cover - misconfiguration
-        _LOGGER.warning(
-            "Lesson seed file missing at %s for language '%s' (register=%s)",
-            _SEED_DIR / search_candidates[0][0],
-            language,
-            register,
-        )
+async def _cached_canonical_lines(*, session: AsyncSession, language: str, limit: int):
+    """Return up to ``limit`` canonical lines, memoized per language.
+
+    The cache always holds the maximum window so every ``k_canon`` is served by slicing.
+    """
+    limit = max(0, min(limit, _MAX_CANONICAL_LINES))
+    if limit == 0:
         return tuple()
+    lines = await context_cache.get_or_load(
+        ("canon", language),
+        lambda: _fetch_canonical_lines(session=session, language=language, limit=_MAX_CANONICAL_LINES),
+    )
+    return lines[:limit]
 
-    yaml_data = yaml.safe_load(seed_path.read_text(encoding="utf-8")) or {}
-    data = yaml_data.get(yaml_key, [])
-    if not data and "-" in yaml_key:
-        fallback_key = yaml_key.split("-", 1)[0]
-        data = yaml_data.get(fallback_key, [])
-    lines = []
-    seen: set[str] = set()
-    for entry in data:
-        text = _normalize(entry.get("text", ""))
-        # Defensive: handle booleans that YAML parsed from "yes"→True, "no"→False
-        en_raw = entry.get("en")
-        if en_raw is None:
-            en = ""
-        elif isinstance(en_raw, bool):
-            # Convert bool back to lowercase yes/no for consistency
-            en = "yes" if en_raw else "no"
-        else:
-            en = str(en_raw).strip()
-        if not text or not en or text in seen:
-            continue
-        variants = entry.get("variants") or []
-        normalized_variants = []
-        for variant in variants:
-            norm_variant = _normalize(variant)
-            if norm_variant and norm_variant not in normalized_variants:
-                normalized_variants.append(norm_variant)
-        if not normalized_variants:
-            normalized_variants.append(text)
-        lines.append(
-            DailyLine(
-                text=text,
-                en=en,
-                language=language,
-                variants=tuple(normalized_variants),
-            )
-        )
-        seen.add(text)
-    return tuple(lines)
+
+async def _cached_text_range_data(
+    *,
+    session: AsyncSession,
+    language: str,
+    ref_start: str,
+    ref_end: str,
+) -> TextRangeData:
+    """Return text-range vocabulary and grammar summaries, memoized per segment window."""
+    key = ("range", language, _parse_ref(ref_start), _parse_ref(ref_end))
+    data = await context_cache.get_or_load(
+        key,
+        lambda: _extract_text_range_data(
+            session=session,
+            language=language,
+            ref_start=ref_start,
+            ref_end=ref_end,
+        ),
+    )
+    if data.ref_start == ref_start and data.ref_end == ref_end:
+        return data
+    # Same window requested with a different ref spelling (e.g. "Il.1.20" vs "1.20")
+    return replace(data, ref_start=ref_start, ref_end=ref_end)
 
 
 _CANONICAL_SQL = text(
@@ -512,31 +479,49 @@ def _normalize(value: str) -> str:
     return unicodedata.normalize("NFC", (value or "").strip())
 
 
-async def _extract_text_range_data(
-    *,
-    session: AsyncSession,
-    language: str,
-    ref_start: str,
-    ref_end: str,
-) -> TextRangeData:
-    """Extract vocabulary and grammar patterns from a text range"""
-
-    # Parse ref format (e.g., "Il.1.20" -> "1.20")
-    def parse_ref(ref: str) -> str:
-        parts = ref.split(".")
-        if len(parts) == 3 and parts[0].lower() in ("il", "iliad"):
-            return f"{parts[1]}.{parts[2]}"
-        elif len(parts) == 2:
-            return ref
+def _parse_ref(ref: str) -> str:
+    """Parse ref format (e.g., "Il.1.20" -> "1.20")."""
+    parts = ref.split(".")
+    if len(parts) == 3 and parts[0].lower() in ("il", "iliad"):
+        return f"{parts[1]}.{parts[2]}"
+    elif len(parts) == 2:
         return ref
+    return ref
+
+
+_TEXT_RANGE_MAX_SEGMENTS = 500
+_TEXT_RANGE_VOCAB_LIMIT = 30
+_TEXT_RANGE_MAX_EXAMPLES = 5
 
-    start_ref = parse_ref(ref_start)
-    end_ref = parse_ref(ref_end)
+_GRAMMAR_PATTERN_DESCRIPTIONS = {
+    "aorist_passive": "Aorist passive (verbs expressing completed action in passive voice)",
+    "genitive_noun": "Genitive case nouns (possession, origin, or partitive)",
+    "subjunctive": "Subjunctive mood (expressing possibility, purpose, or condition)",
+}
 
-    # Fetch text segments in range
-    query = text(
-        """
-        SELECT ts.ref, ts.text_nfc, ts.id
+_TEXT_RANGE_SAMPLES_SQL = text(
+    """
+    SELECT ts.text_nfc
+    FROM text_segment AS ts
+    JOIN text_work AS tw ON tw.id = ts.work_id
+    JOIN language AS lang ON lang.id = tw.language_id
+    WHERE lang.code = :language
+      AND ts.ref >= :start_ref
+      AND ts.ref <= :end_ref
+    ORDER BY ts.ref
+    LIMIT :sample_limit
+    """
+)
+
+# Characters str.strip() removes (all of them are below U+3001); btrim() alone only strips spaces.
+_WHITESPACE = "".join(ch for ch in map(chr, range(0x3001)) if ch.isspace())
+
+# Aggregates lemma frequency (distinct surface forms) and msd-derived grammar patterns in one pass.
+# Surface forms keep first-occurrence order so results match reading order of the range.
+_TEXT_RANGE_AGGREGATE_SQL = text(
+    """
+    WITH seg AS (
+        SELECT ts.id
         FROM text_segment AS ts
         JOIN text_work AS tw ON tw.id = ts.work_id
         JOIN language AS lang ON lang.id = tw.language_id
@@ -544,16 +529,89 @@ async def _extract_text_range_data(
           AND ts.ref >= :start_ref
           AND ts.ref <= :end_ref
         ORDER BY ts.ref
-        LIMIT 50
-        """
+        LIMIT :max_segments
+    ),
+    tok AS (
+        SELECT
+            normalize(btrim(t.lemma, :whitespace), NFC) AS lemma,
+            normalize(btrim(t.surface_nfc, :whitespace), NFC) AS surface,
+            CASE
+                WHEN t.msd ->> 'tense' = 'aorist' AND t.msd ->> 'voice' = 'passive' THEN 'aorist_passive'
+                WHEN t.msd ->> 'case' = 'genitive' AND t.msd ->> 'pos' = 'noun' THEN 'genitive_noun'
+                WHEN t.msd ->> 'mood' = 'subjunctive' THEN 'subjunctive'
+            END AS pattern,
+            row_number() OVER (ORDER BY t.segment_id, t.idx) AS pos
+        FROM token AS t
+        JOIN seg ON seg.id = t.segment_id
+        WHERE t.lemma IS NOT NULL
+    ),
+    forms AS (
+        SELECT lemma, surface, min(pos) AS first_pos
+        FROM tok
+        WHERE lemma <> '' AND surface <> ''
+        GROUP BY lemma, surface
+    ),
+    pattern_forms AS (
+        SELECT pattern, surface, min(pos) AS first_pos
+        FROM tok
+        WHERE pattern IS NOT NULL AND lemma <> '' AND surface <> ''
+        GROUP BY pattern, surface
+    ),
+    vocab AS (
+        SELECT
+            'lemma' AS kind,
+            lemma AS key,
+            count(*) AS frequency,
+            min(first_pos) AS first_pos,
+            (array_agg(surface ORDER BY first_pos))[1:(:max_examples)] AS examples
+        FROM forms
+        GROUP BY lemma
+        ORDER BY frequency DESC, first_pos
+        LIMIT :vocab_limit
+    ),
+    patterns AS (
+        SELECT
+            'pattern' AS kind,
+            pattern AS key,
+            count(*) AS frequency,
+            min(first_pos) AS first_pos,
+            (array_agg(surface ORDER BY first_pos))[1:(:max_examples)] AS examples
+        FROM pattern_forms
+        GROUP BY pattern
+        HAVING count(*) >= 2
+    ),
+    combined AS (
+        SELECT kind, key, frequency, first_pos, examples FROM vocab
+        UNION ALL
+        SELECT kind, key, frequency, first_pos, examples FROM patterns
     )
-    result = await session.execute(
-        query,
-        {"language": language, "start_ref": start_ref, "end_ref": end_ref},
+    SELECT kind, key, frequency, examples
+    FROM combined
+    ORDER BY kind, CASE WHEN kind = 'lemma' THEN frequency END DESC, first_pos
+    """
+)
+
+
+async def _extract_text_range_data(
+    *,
+    session: AsyncSession,
+    language: str,
+    ref_start: str,
+    ref_end: str,
+) -> TextRangeData:
+    """Extract vocabulary and grammar patterns from a text range"""
+
+    start_ref = _parse_ref(ref_start)
+    end_ref = _parse_ref(ref_end)
+    params = {"language": language, "start_ref": start_ref, "end_ref": end_ref}
+
+    sample_result = await session.execute(
+        _TEXT_RANGE_SAMPLES_SQL,
+        {**params, "sample_limit": _TEXT_RANGE_MAX_EXAMPLES},
     )
-    segments = result.all()
+    sample_rows = sample_result.all()
 
-    if not segments:
+    if not sample_rows:
         return TextRangeData(
             ref_start=ref_start,
             ref_end=ref_end,
@@ -562,87 +620,37 @@ async def _extract_text_range_data(
             text_samples=tuple(),
         )
 
-    segment_ids = [seg.id for seg in segments]
-    text_samples = [_normalize(seg.text_nfc) for seg in segments if seg.text_nfc][:5]
-
-    # Fetch tokens for these segments
-    token_query = text(
-        """
-        SELECT t.lemma, t.surface_nfc, t.msd
-        FROM token AS t
-        WHERE t.segment_id = ANY(:segment_ids)
-          AND t.lemma IS NOT NULL
-        ORDER BY t.segment_id, t.idx
-        """
+    text_samples = [_normalize(row.text_nfc) for row in sample_rows if row.text_nfc]
+
+    aggregate_result = await session.execute(
+        _TEXT_RANGE_AGGREGATE_SQL,
+        {
+            **params,
+            "max_segments": _TEXT_RANGE_MAX_SEGMENTS,
+            "vocab_limit": _TEXT_RANGE_VOCAB_LIMIT,
+            "max_examples": _TEXT_RANGE_MAX_EXAMPLES,
+            "whitespace": _WHITESPACE,
+        },
     )
-    token_result = await session.execute(
-        token_query,
-        {"segment_ids": segment_ids},
-    )
-    tokens = token_result.all()
-
-    # Count lemma frequencies
-    lemma_freq: dict[str, list[str]] = {}
-    msd_patterns: dict[str, list[str]] = {}
 
-    for token in tokens:
-        lemma = _normalize(token.lemma or "")
-        surface = _normalize(token.surface_nfc or "")
-        if not lemma or not surface:
-            continue
-
-        if lemma not in lemma_freq:
-            lemma_freq[lemma] = []
-        if surface not in lemma_freq[lemma]:
-            lemma_freq[lemma].append(surface)
-
-        # Extract grammar patterns from msd
-        if token.msd and isinstance(token.msd, dict):
-            msd_dict = token.msd
-            # Identify notable patterns
-            if msd_dict.get("tense") == "aorist" and msd_dict.get("voice") == "passive":
-                pattern_key = "aorist_passive"
-                if pattern_key not in msd_patterns:
-                    msd_patterns[pattern_key] = []
-                if surface not in msd_patterns[pattern_key]:
-                    msd_patterns[pattern_key].append(surface)
-            elif msd_dict.get("case") == "genitive" and msd_dict.get("pos") == "noun":
-                pattern_key = "genitive_noun"
-                if pattern_key not in msd_patterns:
-                    msd_patterns[pattern_key] = []
-                if surface not in msd_patterns[pattern_key]:
-                    msd_patterns[pattern_key].append(surface)
-            elif msd_dict.get("mood") == "subjunctive":
-                pattern_key = "subjunctive"
-                if pattern_key not in msd_patterns:
-                    msd_patterns[pattern_key] = []
-                if surface not in msd_patterns[pattern_key]:
-                    msd_patterns[pattern_key].append(surface)
-
-    # Build vocabulary items (top 30 by frequency)
-    vocab_items = [
-        VocabularyItem(
-            lemma=lemma,
-            surface_forms=tuple(surfaces[:5]),  # Limit surface forms
-            frequency=len(surfaces),
-        )
-        for lemma, surfaces in sorted(lemma_freq.items(), key=lambda x: len(x[1]), reverse=True)[:30]
-    ]
-
-    # Build grammar patterns
-    grammar_patterns_list = []
-    pattern_descriptions = {
-        "aorist_passive": "Aorist passive (verbs expressing completed action in passive voice)",
-        "genitive_noun": "Genitive case nouns (possession, origin, or partitive)",
-        "subjunctive": "Subjunctive mood (expressing possibility, purpose, or condition)",
-    }
-    for pattern_key, examples in msd_patterns.items():
-        if len(examples) >= 2:  # Only include patterns with multiple examples
+    vocab_items: list[VocabularyItem] = []
+    grammar_patterns_list: list[GrammarPattern] = []
+    for row in aggregate_result.all():
+        examples = tuple(row.examples or ())
+        if row.kind == "lemma":
+            vocab_items.append(
+                VocabularyItem(
+                    lemma=row.key,
+                    surface_forms=examples,
+                    frequency=int(row.frequency),
+                )
+            )
+        else:
             grammar_patterns_list.append(
                 GrammarPattern(
-                    pattern=pattern_key,
-                    description=pattern_descriptions.get(pattern_key, pattern_key),
-                    examples=tuple(examples[:5]),
+                    pattern=row.key,
+                    description=_GRAMMAR_PATTERN_DESCRIPTIONS.get(row.key, row.key),
+                    examples=examples,
                 )
             )
 
@@ -54,10 +54,11 @@ from app.db.init_db import initialize_database
 from app.db.session import SessionLocal
 from app.lesson.router import router as lesson_router
 from app.lesson.vocabulary_router import router as vocabulary_router
-from app.middleware.csrf import csrf_middleware
-from app.middleware.rate_limit import rate_limit_middleware
-from app.middleware.security_headers import security_headers_middleware
-from app.security.middleware import redact_api_keys_middleware
+from app.middleware.csrf import csrf_stage
+from app.middleware.pipeline import RequestPipelineMiddleware, ResponseHook
+from app.middleware.rate_limit import rate_limit_stage
+from app.middleware.security_headers import security_headers_stage
+from app.security.middleware import redact_api_keys_stage
 from app.tasks import task_runner
 from app.tts import router as tts_router
 
@@ -125,6 +126,16 @@ async def lifespan(app: FastAPI):
 
     startup_logger.info("Echo fallback enabled: %s", settings.ECHO_FALLBACK_ENABLED)
 
+    # Pre-render per-language system prompts and static lesson prompt templates
+    try:
+        from app.lesson.language_config import LANGUAGES
+        from app.lesson.prompts import warm_prompt_cache
+
+        warmed = warm_prompt_cache(LANGUAGES)
+        startup_logger.info("Prompt templates warmed for %d languages", warmed)
+    except Exception as exc:
+        startup_logger.warning("Prompt template warm-up failed: %s", exc)
+
     # Initialize database (wrapped in try/except to prevent startup crashes)
     try:
         async with SessionLocal() as db:
@@ -137,6 +148,21 @@ async def lifespan(app: FastAPI):
             exc_info=True,
         )
 
+    # Build the TTS license map so /tts/speak never queries licenses per request
+    if settings.TTS_ENABLED and settings.TTS_LICENSE_GUARD and not is_testing:
+        try:
+            from app.tts.license_guard import license_map
+
+            await license_map.labels()
+        except Exception as exc:
+            startup_logger.warning("TTS license map warm-up failed: %s", exc)
+
+    # Start the write-behind learning event flusher before anything can log events
+    if not is_testing:
+        from app.services.event_sink import start_event_sink
+
+        start_event_sink()
+
     # Start scheduled tasks only outside of test mode
     if not is_testing:
         startup_logger.info("Starting scheduled tasks...")
@@ -168,6 +194,21 @@ async def lifespan(app: FastAPI):
         startup_logger.info("Stopping scheduled tasks...")
         await task_runner.stop()
 
+        try:
+            from app.services.demo_usage import flush_demo_usage
+
+            await flush_demo_usage()
+        except Exception as exc:
+            startup_logger.error(f"Final demo usage flush failed: {exc}")
+
+        # Requests have finished by now; write every learning event they committed
+        try:
+            from app.services.event_sink import stop_event_sink
+
+            await stop_event_sink()
+        except Exception as exc:
+            startup_logger.error(f"Learning event drain failed: {exc}")
+
         startup_logger.info("Stopping email scheduler...")
         try:
             from app.jobs.scheduler import email_scheduler
@@ -183,10 +224,6 @@ async def lifespan(app: FastAPI):
 # Initialize the FastAPI app
 app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan, docs_url=None, redoc_url=None)
 
-# Add rate limiting middleware
-app.middleware("http")(rate_limit_middleware)
-app.middleware("http")(security_headers_middleware)
-
 if _SERVE_FLUTTER_WEB:
     if _FLUTTER_WEB_ROOT.exists():
         app.mount("/app", StaticFiles(directory=str(_FLUTTER_WEB_ROOT), html=True), name="flutter-web")
@@ -210,6 +247,72 @@ else:
         _SWAGGER_UI_DIR,
     )
 
+# Request pipeline stages, outermost first. Each may answer the request itself
+# (CSRF 403, rate-limit 429) or edit the response headers on the way out.
+_PIPELINE_STAGES = [
+    csrf_stage,  # CSRF protection (only in production by default)
+    redact_api_keys_stage,  # BYOK redaction
+    security_headers_stage,
+    rate_limit_stage,
+]
+
+
+def _histogram_counts(samples: Iterable[float]) -> List[int]:
+    counts = [0] * (len(_LATENCY_BINS) + 1)
+    for value in samples:
+        for idx, threshold in enumerate(_LATENCY_BINS):
+            if value <= threshold:
+                counts[idx] += 1
+                break
+        else:
+            counts[-1] += 1
+    return counts
+
+
+def _format_histogram(counts: List[int]) -> str:
+    labels = [f"<= {int(threshold)}" for threshold in _LATENCY_BINS]
+    labels.append(f"> {int(_LATENCY_BINS[-1])}")
+    parts = [f"{label}:{count}" for label, count in zip(labels, counts) if count]
+    return ", ".join(parts)
+
+
+async def _latency_stage(request, response_hooks: List[ResponseHook]):  # pragma: no cover - instrumentation
+    start = time.perf_counter()
+
+    def record(_headers) -> None:
+        duration_ms = (time.perf_counter() - start) * 1000.0
+
+        key = request.url.path
+        window = _LATENCY_WINDOW[key]
+        window.append(duration_ms)
+        if len(window) >= 10:
+            ordered = sorted(window)
+            p50 = ordered[int(0.5 * (len(ordered) - 1))]
+            p95 = ordered[int(0.95 * (len(ordered) - 1))]
+            log_extra = ""
+            if key == "/reader/analyze":
+                hist = _format_histogram(_histogram_counts(window))
+                if hist:
+                    log_extra = f" hist=[{hist}]"
+            _LOGGER.info(
+                "latency path=%s p50=%.1fms p95=%.1fms window=%d%s",
+                key,
+                p50,
+                p95,
+                len(window),
+                log_extra,
+            )
+
+    response_hooks.append(record)
+    return None
+
+
+if _ENABLE_LATENCY:
+    _PIPELINE_STAGES.insert(0, _latency_stage)
+
+app.add_middleware(RequestPipelineMiddleware, stages=_PIPELINE_STAGES)
+
+# CORS is added after the pipeline so it stays the outermost layer
 if settings.dev_cors_enabled:
     app.add_middleware(
         CORSMiddleware,
@@ -249,62 +352,7 @@ else:
         expose_headers=["X-CSRF-Token"],
         max_age=3600,
     )
-# Register the BYOK redaction middleware
-app.middleware("http")(redact_api_keys_middleware)
-
-# Register CSRF protection middleware (only in production by default)
-app.middleware("http")(csrf_middleware)
-
 
-def _histogram_counts(samples: Iterable[float]) -> List[int]:
-    counts = [0] * (len(_LATENCY_BINS) + 1)
-    for value in samples:
-        for idx, threshold in enumerate(_LATENCY_BINS):
-            if value <= threshold:
-                counts[idx] += 1
-                break
-        else:
-            counts[-1] += 1
-    return counts
-
-
-def _format_histogram(counts: List[int]) -> str:
-    labels = [f"<= {int(threshold)}" for threshold in _LATENCY_BINS]
-    labels.append(f"> {int(_LATENCY_BINS[-1])}")
-    parts = [f"{label}:{count}" for label, count in zip(labels, counts) if count]
-    return ", ".join(parts)
-
-
-async def _latency_middleware(request, call_next):  # pragma: no cover - simple instrumentation
-    start = time.perf_counter()
-    response = await call_next(request)
-    duration_ms = (time.perf_counter() - start) * 1000.0
-
-    key = request.url.path
-    window = _LATENCY_WINDOW[key]
-    window.append(duration_ms)
-    if len(window) >= 10:
-        ordered = sorted(window)
-        p50 = ordered[int(0.5 * (len(ordered) - 1))]
-        p95 = ordered[int(0.95 * (len(ordered) - 1))]
-        log_extra = ""
-        if key == "/reader/analyze":
-            hist = _format_histogram(_histogram_counts(window))
-            if hist:
-                log_extra = f" hist=[{hist}]"
-        _LOGGER.info(
-            "latency path=%s p50=%.1fms p95=%.1fms window=%d%s",
-            key,
-            p50,
-            p95,
-            len(window),
-            log_extra,
-        )
-    return response
-
-
-if _ENABLE_LATENCY:
-    app.middleware("http")(_latency_middleware)
 
 # Include the health router
 app.include_router(health_router, tags=["Health"])
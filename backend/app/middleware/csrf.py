@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import http.cookies
 import secrets
-from typing import Awaitable, Callable
 
 from app.core.config import settings
+from app.middleware.pipeline import ResponseHook
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
 
 # Methods that require CSRF protection (state-changing operations)
 PROTECTED_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
@@ -29,9 +31,21 @@ EXEMPT_PATHS = {
 }
 
 
-async def csrf_middleware(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+def _csrf_cookie(token: str) -> str:
+    cookie: http.cookies.SimpleCookie = http.cookies.SimpleCookie()
+    cookie["csrf_token"] = token
+    cookie["csrf_token"]["max-age"] = 86400  # 24 hours
+    cookie["csrf_token"]["path"] = "/"
+    if not settings.is_dev_environment:
+        cookie["csrf_token"]["secure"] = True
+    cookie["csrf_token"]["samesite"] = "strict"
+    # No httponly: the double-submit cookie must be readable by client JS
+    return cookie.output(header="").strip()
+
+
+async def csrf_stage(request: Request, response_hooks: list[ResponseHook]) -> Response | None:
     """
-    CSRF protection middleware using double-submit cookie pattern.
+    CSRF protection using the double-submit cookie pattern.
 
     For state-changing operations (POST, PUT, PATCH, DELETE), validates that:
     1. X-CSRF-Token header matches the csrf_token cookie
@@ -47,35 +61,31 @@ async def csrf_middleware(request: Request, call_next: Callable[[Request], Await
     """
     # Skip CSRF check in development if configured
     if settings.is_dev_environment and not getattr(settings, "CSRF_ENABLED_IN_DEV", False):
-        return await call_next(request)
+        return None
 
     # Skip CSRF for JWT Bearer token authentication
     # Bearer tokens are immune to CSRF because they must be explicitly added to requests
     # (unlike cookies which are automatically sent by browsers)
     auth_header = request.headers.get("Authorization", "")
     if auth_header.startswith("Bearer "):
-        return await call_next(request)
+        return None
 
     # Skip safe methods (GET, HEAD, OPTIONS, TRACE)
     if request.method not in PROTECTED_METHODS:
-        response = await call_next(request)
         # Set CSRF token cookie for future protected requests
         if "csrf_token" not in request.cookies:
             csrf_token = secrets.token_urlsafe(32)
-            response.set_cookie(
-                key="csrf_token",
-                value=csrf_token,
-                httponly=False,  # Double-submit cookie must be readable by client JS
-                secure=not settings.is_dev_environment,
-                samesite="strict",
-                max_age=86400,  # 24 hours
-            )
-            response.headers["X-CSRF-Token"] = csrf_token
-        return response
+
+            def issue_token(headers: MutableHeaders) -> None:
+                headers.append("set-cookie", _csrf_cookie(csrf_token))
+                headers["X-CSRF-Token"] = csrf_token
+
+            response_hooks.append(issue_token)
+        return None
 
     # Skip exempt paths
     if request.url.path in EXEMPT_PATHS:
-        return await call_next(request)
+        return None
 
     # Validate CSRF token for protected methods
     csrf_cookie = request.cookies.get("csrf_token")
@@ -94,4 +104,4 @@ async def csrf_middleware(request: Request, call_next: Callable[[Request], Await
         )
 
     # CSRF validation passed, process request
-    return await call_next(request)
+    return None
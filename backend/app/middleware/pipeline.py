@@ -0,0 +1,82 @@
+"""Single pure-ASGI middleware that runs the request pipeline as ordered stages.
+
+Each stage is an async function ``stage(request, response_hooks)`` that runs
+before the app. It may return a response to answer the request itself, which
+skips the remaining stages and the app, or register hooks that edit the
+response headers when ``http.response.start`` goes out. Hooks run innermost
+stage first, as they would with nested middleware, and apply to short-circuit
+responses from later stages too.
+
+Unlike stacked ``@app.middleware("http")`` layers, this adds no task or
+response wrapping per stage, and response bodies (including streams) pass
+through untouched.
+"""
+
+from __future__ import annotations
+
+from typing import Awaitable, Callable, Sequence
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ResponseHook = Callable[[MutableHeaders], None]
+Stage = Callable[[Request, list[ResponseHook]], Awaitable[Response | None]]
+
+
+def _replay_body(body: bytes, receive: Receive) -> Receive:
+    """Hand a body already read by a stage to the app, then defer to ``receive``."""
+    replayed = False
+
+    async def replay() -> Message:
+        nonlocal replayed
+        if not replayed:
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
+
+
+def _with_response_hooks(send: Send, hooks: list[ResponseHook]) -> Send:
+    async def send_with_hooks(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(scope=message)
+            for hook in reversed(hooks):
+                hook(headers)
+        await send(message)
+
+    return send_with_hooks
+
+
+class RequestPipelineMiddleware:
+    """Runs ``stages`` in order (outermost first) around the wrapped app."""
+
+    def __init__(self, app: ASGIApp, stages: Sequence[Stage]) -> None:
+        self.app = app
+        self.stages = tuple(stages)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+        hooks: list[ResponseHook] = []
+        response = None
+        for stage in self.stages:
+            response = await stage(request, hooks)
+            if response is not None:
+                break
+
+        if hooks:
+            send = _with_response_hooks(send, hooks)
+        if response is not None:
+            await response(scope, receive, send)
+            return
+
+        body = getattr(request, "_body", None)  # set when a stage awaited request.body()
+        if body is not None:
+            receive = _replay_body(body, receive)
+        await self.app(scope, receive, send)
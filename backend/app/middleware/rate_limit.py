@@ -1,80 +1,161 @@
-"""WORKING rate limiting using token bucket algorithm with Redis."""
+"""Sliding-window rate limiting backed by an atomic Redis Lua script."""
 
 import logging
+import math
 import time
-from typing import Awaitable, Callable
+import uuid
+from dataclasses import dataclass
 
 from app.core.config import settings
+from app.middleware.pipeline import ResponseHook
+from app.middleware.rate_limit_policy import policy_registry
+from app.utils.client_ip import get_client_ip
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
+from jose import JWTError, jwt
 from redis import asyncio as aioredis
 from redis.exceptions import RedisError
-
-
-class TokenBucketRateLimiter:
-    """Token bucket rate limiter - simple and reliable."""
+from starlette.datastructures import MutableHeaders
+
+# Sliding-window log: one sorted-set member per admitted request, scored by its timestamp.
+# Prunes entries older than the window, grants up to ARGV[4] slots that still fit under the
+# limit, and returns {granted, remaining, ms until the oldest entry leaves the window}.
+_SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+local want = tonumber(ARGV[4])
+local member = ARGV[5]
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local used = redis.call('ZCARD', key)
+local granted = math.min(want, limit - used)
+if granted > 0 then
+    local args = {}
+    for i = 1, granted do
+        args[#args + 1] = now
+        args[#args + 1] = member .. ':' .. i
+    end
+    redis.call('ZADD', key, unpack(args))
+    used = used + granted
+else
+    granted = 0
+end
+redis.call('PEXPIRE', key, window)
+
+local reset_ms = window
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+if oldest[2] then
+    reset_ms = tonumber(oldest[2]) + window - now
+end
+return {granted, limit - used, reset_ms}
+"""
+
+# Limits at or above this size are served from local leases of LEASE_FRACTION of the limit.
+_LEASE_MIN_LIMIT = 50
+_LEASE_FRACTION = 10
+# Leased slots are stamped when claimed, so they may only be spent for this long afterwards.
+_LEASE_MAX_SECONDS = 1.0
+
+
+@dataclass(slots=True)
+class RateLimitDecision:
+    allowed: bool
+    remaining: int
+    reset_after: float  # seconds until the oldest counted request leaves the window
+
+
+@dataclass(slots=True)
+class _Lease:
+    tokens: int
+    remaining: int
+    expires_at: float
+    reset_at: float
+
+
+class SlidingWindowRateLimiter:
+    """Atomic sliding-window limiter: one Redis round-trip per decision.
+
+    For generous limits (reads), a worker claims a small batch of slots in that
+    same round-trip and spends them locally, so most requests never reach Redis.
+    Leased slots are counted in Redis under the time they were claimed, not the
+    time they are spent, so a lease is only usable for a tenth of the window (at
+    most a second). A window that starts just after a claim can therefore admit
+    up to one lease per worker beyond the limit; within a lease's lifetime, other
+    workers only deny slightly earlier.
+    """
 
     def __init__(self, redis_url: str):
         self.redis = aioredis.from_url(redis_url, decode_responses=True)
+        self._script = self.redis.register_script(_SLIDING_WINDOW_LUA)
         self._logger = logging.getLogger("app.middleware.rate_limit")
         self._disabled_until = 0.0
         self._last_error_logged = 0.0
+        self._leases: dict[str, _Lease] = {}
+        self.local_hits = 0
+        self.redis_calls = 0
 
-    async def check_rate_limit(
-        self,
-        key: str,
-        max_requests: int,
-        window_seconds: int,
-    ) -> tuple[bool, int]:
-        """
-        Check rate limit using token bucket algorithm.
+    @staticmethod
+    def _lease_size(max_requests: int) -> int:
+        return max_requests // _LEASE_FRACTION if max_requests >= _LEASE_MIN_LIMIT else 1
 
-        Simple approach: Store count and reset time in Redis.
-        Returns: (allowed: bool, remaining: int)
-        """
-        now = int(time.time())
+    async def check(self, key: str, max_requests: int, window_seconds: int) -> RateLimitDecision:
+        now = time.time()
 
         if self._disabled_until and now < self._disabled_until:
-            return True, max_requests
-
-        # Get current count and reset time
+            return RateLimitDecision(True, max_requests, float(window_seconds))
+
+        lease = self._leases.get(key)
+        if lease is not None:
+            if lease.tokens > 0 and now < lease.expires_at:
+                lease.tokens -= 1
+                self.local_hits += 1
+                return RateLimitDecision(True, lease.remaining + lease.tokens, max(0.0, lease.reset_at - now))
+            del self._leases[key]
+
+        want = self._lease_size(max_requests)
+        window_ms = window_seconds * 1000
         try:
-            pipe = self.redis.pipeline()
-            pipe.get(f"{key}:count")
-            pipe.get(f"{key}:reset")
-            result = await pipe.execute()
+            self.redis_calls += 1
+            granted, remaining, reset_ms = await self._script(
+                keys=[key],
+                args=[int(now * 1000), window_ms, max_requests, want, uuid.uuid4().hex],
+            )
         except RedisError as exc:
             self._handle_redis_error(exc)
-            return True, max_requests
+            return RateLimitDecision(True, max_requests, float(window_seconds))
         else:
             if self._disabled_until:
                 self._disabled_until = 0.0
 
-        count = int(result[0]) if result[0] else 0
-        reset_time = int(result[1]) if result[1] else now
-
-        # If we've passed the reset time, reset the counter
-        if now >= reset_time:
-            count = 0
-            reset_time = now + window_seconds
-
-        # Check if we can allow this request
-        if count < max_requests:
-            # Increment counter
-            try:
-                pipe = self.redis.pipeline()
-                pipe.set(f"{key}:count", count + 1, ex=window_seconds + 10)
-                pipe.set(f"{key}:reset", reset_time, ex=window_seconds + 10)
-                await pipe.execute()
-            except RedisError as exc:
-                self._handle_redis_error(exc)
-                return True, max_requests
-
-            remaining = max_requests - count - 1
-            return True, remaining
-        else:
-            # Limit exceeded
-            return False, 0
+        granted, remaining, reset_after = int(granted), int(remaining), int(reset_ms) / 1000.0
+        if granted <= 0:
+            return RateLimitDecision(False, 0, reset_after)
+        if granted > 1:
+            if len(self._leases) >= 10_000:
+                self._leases.clear()
+            self._leases[key] = _Lease(
+                tokens=granted - 1,
+                remaining=remaining,
+                expires_at=now + min(window_seconds / _LEASE_FRACTION, _LEASE_MAX_SECONDS),
+                reset_at=now + reset_after,
+            )
+        return RateLimitDecision(True, remaining + granted - 1, reset_after)
+
+    async def check_rate_limit(
+        self,
+        key: str,
+        max_requests: int,
+        window_seconds: int,
+    ) -> tuple[bool, int]:
+        """
+        Check rate limit for ``key``.
+
+        Returns: (allowed: bool, remaining: int)
+        """
+        decision = await self.check(key, max_requests, window_seconds)
+        return decision.allowed, decision.remaining
 
     async def close(self):
         """Close Redis connection."""
@@ -95,119 +176,76 @@ class TokenBucketRateLimiter:
 _rate_limiter = None
 
 
-def get_rate_limiter() -> TokenBucketRateLimiter | None:
+def get_rate_limiter() -> SlidingWindowRateLimiter | None:
     """Get global rate limiter instance. Returns None if REDIS_URL not configured."""
     global _rate_limiter
     if _rate_limiter is None and settings.REDIS_URL:
-        _rate_limiter = TokenBucketRateLimiter(settings.REDIS_URL)
+        _rate_limiter = SlidingWindowRateLimiter(settings.REDIS_URL)
     return _rate_limiter
 
 
-async def rate_limit_middleware(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-) -> Response:
+def _rate_limit_identity(request: Request) -> str:
+    """Per-user key for requests with a valid access token, otherwise the client IP."""
+    authorization = request.headers.get("Authorization")
+    if authorization and authorization[:7].lower() == "bearer ":
+        try:
+            payload = jwt.decode(
+                authorization[7:].strip(), settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
+            )
+        except JWTError:
+            payload = None
+        if payload and payload.get("token_type") == "access" and payload.get("sub"):
+            return f"user:{payload['sub']}"
+    return f"ip:{get_client_ip(request)}"
+
+
+async def rate_limit_stage(request: Request, response_hooks: list[ResponseHook]) -> Response | None:
     """
-    Rate limiting middleware using token bucket algorithm.
+    Rate limiting using a sliding-window log per client and category.
 
-    Applies different limits based on path:
-    - Auth endpoints: 10 requests/minute (increased from 5 for usability)
-    - Chat endpoints: 20 requests/minute
-    - Other POST/PUT/PATCH/DELETE: 30 requests/minute
-    - GET requests: 100 requests/minute
+    The category, limit and window come from one lookup in the compiled policy
+    table (see ``app.middleware.rate_limit_policy``). Authenticated users are
+    limited per user, everyone else per client IP.
     """
-    # Skip rate limiting for health and docs endpoints
-    if request.url.path in {"/health", "/health/providers", "/docs", "/openapi.json", "/redoc", "/"}:
-        return await call_next(request)
-
-    # Determine rate limit based on path and method
-    path = request.url.path
-    method = request.method
-
-    # Ultra-sensitive endpoints: Very strict limits
-    if "/auth/password-reset" in path or "/auth/forgot-password" in path:
-        max_requests = 3  # Only 3 password reset attempts per hour
-        window_seconds = 3600
-        category = "password_reset"
-    elif "/users/me/api-keys" in path and method in {"POST", "PUT", "DELETE"}:
-        max_requests = 5  # Only 5 API key operations per hour
-        window_seconds = 3600
-        category = "api_keys"
-    elif "/lesson/" in path and method == "POST":
-        max_requests = 10  # Only 10 lesson generations per hour (expensive operation)
-        window_seconds = 3600
-        category = "lesson_generation"
-    # Sensitive endpoints: Strict limits
-    elif "/auth/register" in path:
-        max_requests = 5  # Only 5 registrations per hour (prevent spam)
-        window_seconds = 3600
-        category = "registration"
-    elif "/auth/login" in path:
-        max_requests = 10  # 10 login attempts per minute (prevent brute force)
-        window_seconds = 60
-        category = "login"
-    elif "/auth/" in path:
-        max_requests = 10
-        window_seconds = 60
-        category = "auth"
-    # Expensive operations: Moderate limits
-    elif "/chat/" in path:
-        max_requests = 20
-        window_seconds = 60
-        category = "chat"
-    elif "/tts/" in path and method == "POST":
-        max_requests = 15  # TTS generation is expensive
-        window_seconds = 60
-        category = "tts"
-    # Standard operations
-    elif method in {"POST", "PUT", "PATCH", "DELETE"}:
-        max_requests = 30
-        window_seconds = 60
-        category = "write"
-    elif method == "GET":
-        max_requests = 100
-        window_seconds = 60
-        category = "read"
-    else:
-        # OPTIONS, HEAD, etc - no limit
-        return await call_next(request)
-
-    # Get identifier (IP address)
-    client_ip = request.client.host if request.client else "unknown"
-    rate_limit_key = f"ratelimit:{category}:{client_ip}"
+    policy = policy_registry.current().match(request.url.path, request.method)
+    if policy is None:
+        # Exempt paths (health, docs) and OPTIONS/HEAD
+        return None
 
     # Check rate limit (skip if Redis not configured)
     limiter = get_rate_limiter()
     if limiter is None:
         # Redis not configured - allow all requests (no rate limiting)
-        response = await call_next(request)
-        return response
+        return None
 
-    allowed, remaining = await limiter.check_rate_limit(rate_limit_key, max_requests, window_seconds)
+    max_requests = policy.max_requests
+    rate_limit_key = f"ratelimit:{policy.category}:{_rate_limit_identity(request)}"
+    decision = await limiter.check(rate_limit_key, max_requests, policy.window_seconds)
+    reset_at = str(int(time.time() + decision.reset_after))
 
-    if not allowed:
-        # Return 429 response directly (don't raise exception in middleware)
+    if not decision.allowed:
+        # Answer with 429 directly; the app is not called
         return JSONResponse(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             content={
                 "detail": (
                     f"Rate limit exceeded. Maximum {max_requests} requests "
-                    f"per minute for {category} endpoints. Please try again later."
+                    f"per {policy.window_label} for {policy.category} endpoints. Please try again later."
                 )
             },
             headers={
                 "X-RateLimit-Limit": str(max_requests),
                 "X-RateLimit-Remaining": "0",
-                "X-RateLimit-Reset": str(int(time.time() + window_seconds)),
-                "Retry-After": str(window_seconds),
+                "X-RateLimit-Reset": reset_at,
+                "Retry-After": str(max(1, math.ceil(decision.reset_after))),
             },
         )
 
-    # Process request
-    response = await call_next(request)
-
-    # Add rate limit headers to response
-    response.headers["X-RateLimit-Limit"] = str(max_requests)
-    response.headers["X-RateLimit-Remaining"] = str(remaining)
-    response.headers["X-RateLimit-Reset"] = str(int(time.time() + window_seconds))
+    # Add rate limit headers to the app's response
+    def rate_limit_headers(headers: MutableHeaders) -> None:
+        headers["X-RateLimit-Limit"] = str(max_requests)
+        headers["X-RateLimit-Remaining"] = str(decision.remaining)
+        headers["X-RateLimit-Reset"] = reset_at
 
-    return response
+    response_hooks.append(rate_limit_headers)
+    return None
@@ -0,0 +1,202 @@
+"""Declarative rate-limit policies compiled into a path-segment trie.
+
+Each policy names a category, the path prefixes it covers (matched segment by
+segment, after stripping the ``/api/v1`` mount), optional HTTP methods, and its
+limit. :class:`PolicyMatcher` resolves a request to the most specific matching
+policy in one walk over the path segments; requests no policy covers fall back
+to the method defaults (``write`` for mutations, ``read`` for GET).
+
+Set ``RATE_LIMIT_POLICY_FILE`` to a YAML file with the same shape as
+``DEFAULT_POLICIES`` to override the table. The file is re-read when its mtime
+changes (checked at most every ``_RELOAD_CHECK_SECONDS``), so limits can be tuned
+without a restart.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+import yaml
+from app.core.config import settings
+
+_LOGGER = logging.getLogger("app.middleware.rate_limit_policy")
+
+_MOUNT_PREFIXES = (("api", "v1"),)
+_WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+_RELOAD_CHECK_SECONDS = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitPolicy:
+    category: str
+    max_requests: int
+    window_seconds: int
+    prefixes: tuple[str, ...] = ()
+    methods: frozenset[str] | None = None  # None: any method
+
+    @property
+    def window_label(self) -> str:
+        """Human-readable window for error messages ("minute", "hour", "30 seconds")."""
+        for seconds, unit in ((86400, "day"), (3600, "hour"), (60, "minute")):
+            if self.window_seconds % seconds == 0:
+                count = self.window_seconds // seconds
+                return unit if count == 1 else f"{count} {unit}s"
+        return "second" if self.window_seconds == 1 else f"{self.window_seconds} seconds"
+
+
+_EXEMPT_PATHS: tuple[str, ...] = ("/", "/health", "/health/providers", "/docs", "/openapi.json", "/redoc")
+
+DEFAULT_POLICIES: tuple[RateLimitPolicy, ...] = (
+    # Ultra-sensitive endpoints: very strict limits
+    RateLimitPolicy("password_reset", 3, 3600, ("/auth/password-reset", "/auth/forgot-password")),
+    RateLimitPolicy(
+        "api_keys", 5, 3600, ("/api-keys", "/users/me/api-keys"), frozenset({"POST", "PUT", "DELETE"})
+    ),
+    RateLimitPolicy("lesson_generation", 10, 3600, ("/lesson",), frozenset({"POST"})),
+    # Sensitive endpoints: strict limits
+    RateLimitPolicy("registration", 5, 3600, ("/auth/register",)),
+    RateLimitPolicy("login", 10, 60, ("/auth/login",)),
+    RateLimitPolicy("auth", 10, 60, ("/auth",)),
+    # Expensive operations: moderate limits
+    RateLimitPolicy("chat", 20, 60, ("/chat",)),
+    RateLimitPolicy("tts", 15, 60, ("/tts",), frozenset({"POST"})),
+)
+
+_WRITE_POLICY = RateLimitPolicy("write", 30, 60)
+_READ_POLICY = RateLimitPolicy("read", 100, 60)
+
+
+def _segments(path: str) -> list[str]:
+    parts = [part for part in path.split("/") if part]
+    for mount in _MOUNT_PREFIXES:
+        if tuple(parts[: len(mount)]) == mount:
+            return parts[len(mount) :]
+    return parts
+
+
+@dataclass(slots=True)
+class _Node:
+    children: dict[str, "_Node"] = field(default_factory=dict)
+    policies: list[RateLimitPolicy] = field(default_factory=list)
+
+
+class PolicyMatcher:
+    """Path-segment trie over policy prefixes; one lookup per request."""
+
+    def __init__(
+        self,
+        policies: Iterable[RateLimitPolicy],
+        *,
+        exempt_paths: Iterable[str] = _EXEMPT_PATHS,
+        write_policy: RateLimitPolicy = _WRITE_POLICY,
+        read_policy: RateLimitPolicy = _READ_POLICY,
+    ) -> None:
+        self.policies = tuple(policies)
+        self._exempt = frozenset(exempt_paths)
+        self._write = write_policy
+        self._read = read_policy
+        self._root = _Node()
+        for policy in self.policies:
+            for prefix in policy.prefixes:
+                node = self._root
+                for segment in _segments(prefix):
+                    node = node.children.setdefault(segment, _Node())
+                node.policies.append(policy)
+
+    def match(self, path: str, method: str) -> RateLimitPolicy | None:
+        """Return the policy for ``method path``, or None when the request is not limited."""
+        if path in self._exempt:
+            return None
+        best: RateLimitPolicy | None = None
+        node = self._root
+        for segment in _segments(path):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            for policy in node.policies:
+                if policy.methods is None or method in policy.methods:
+                    best = policy
+                    break
+        if best is not None:
+            return best
+        if method in _WRITE_METHODS:
+            return self._write
+        if method == "GET":
+            return self._read
+        return None  # OPTIONS, HEAD, etc - no limit
+
+
+def _policy_from_mapping(raw: dict[str, Any]) -> RateLimitPolicy:
+    methods = raw.get("methods")
+    return RateLimitPolicy(
+        category=str(raw["category"]),
+        max_requests=int(raw["max_requests"]),
+        window_seconds=int(raw["window_seconds"]),
+        prefixes=tuple(str(prefix) for prefix in raw.get("prefixes", ())),
+        methods=frozenset(str(method).upper() for method in methods) if methods else None,
+    )
+
+
+def load_policy_file(path: Path) -> PolicyMatcher:
+    """Build a matcher from a YAML policy file (``policies``, optional ``exempt``/``write``/``read``)."""
+    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    policies: Sequence[RateLimitPolicy] = [_policy_from_mapping(raw) for raw in data.get("policies", [])]
+    write_policy, read_policy = _WRITE_POLICY, _READ_POLICY
+    if "write" in data:
+        write_policy = _policy_from_mapping({"category": "write", **data["write"]})
+    if "read" in data:
+        read_policy = _policy_from_mapping({"category": "read", **data["read"]})
+    return PolicyMatcher(
+        policies,
+        exempt_paths=data.get("exempt", _EXEMPT_PATHS),
+        write_policy=write_policy,
+        read_policy=read_policy,
+    )
+
+
+class PolicyRegistry:
+    """Holds the active matcher and swaps it when the policy file changes."""
+
+    def __init__(self, policy_file: str | None) -> None:
+        self._path = Path(policy_file) if policy_file else None
+        self._mtime: float | None = None
+        self._next_check = 0.0
+        self.matcher = PolicyMatcher(DEFAULT_POLICIES)
+        if self._path is not None:
+            self.reload()
+
+    def reload(self) -> bool:
+        """Re-read the policy file; keeps the current table if it is missing or invalid."""
+        if self._path is None:
+            return False
+        try:
+            mtime = os.stat(self._path).st_mtime
+            matcher = load_policy_file(self._path)
+        except (OSError, ValueError, KeyError, TypeError, yaml.YAMLError) as exc:
+            _LOGGER.warning("Keeping current rate-limit policies; could not load %s: %s", self._path, exc)
+            return False
+        self.matcher = matcher
+        self._mtime = mtime
+        _LOGGER.info("Loaded %d rate-limit policies from %s", len(matcher.policies), self._path)
+        return True
+
+    def current(self) -> PolicyMatcher:
+        if self._path is not None:
+            now = time.monotonic()
+            if now >= self._next_check:
+                self._next_check = now + _RELOAD_CHECK_SECONDS
+                try:
+                    changed = os.stat(self._path).st_mtime != self._mtime
+                except OSError:
+                    changed = False
+                if changed:
+                    self.reload()
+        return self.matcher
+
+
+policy_registry = PolicyRegistry(settings.RATE_LIMIT_POLICY_FILE)
@@ -1,57 +1,19 @@
-"""Security headers middleware for production deployment."""
-
-from typing import Awaitable, Callable
+"""Security headers middleware stage for production deployment."""
 
 from app.core.config import settings
+from app.middleware.pipeline import ResponseHook
 from fastapi import Request, Response
+from starlette.datastructures import MutableHeaders
 
+# Swagger UI needs a permissive CSP, so API docs only get the basic headers
+_DOCS_PATHS = frozenset({"/docs", "/docs/oauth2-redirect", "/redoc", "/openapi.json"})
 
-async def security_headers_middleware(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-) -> Response:
-    """
-    Add security headers to all responses.
-
-    Headers added:
-    - X-Content-Type-Options: nosniff
-    - X-Frame-Options: DENY
-    - X-XSS-Protection: 1; mode=block
-    - Strict-Transport-Security (HSTS) - production only
-    - Content-Security-Policy (CSP)
-    - Referrer-Policy: strict-origin-when-cross-origin
-    """
-    # Skip strict CSP for API docs (Swagger UI needs permissive CSP)
-    if request.url.path in {"/docs", "/docs/oauth2-redirect", "/redoc", "/openapi.json"}:
-        response = await call_next(request)
-        # Still add basic security headers, but skip CSP
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        if not settings.is_dev_environment:
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        return response
-
-    response = await call_next(request)
-
-    # Prevent MIME type sniffing
-    response.headers["X-Content-Type-Options"] = "nosniff"
+_HSTS = "max-age=31536000; includeSubDomains"  # max-age=31536000 = 1 year
 
-    # Prevent clickjacking
-    response.headers["X-Frame-Options"] = "DENY"
-
-    # Enable XSS protection (legacy browsers)
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-
-    # Limit referrer information
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
-    # HSTS - Force HTTPS (only in production)
-    if not settings.is_dev_environment:
-        # max-age=31536000 = 1 year
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
-    # Content Security Policy
-    # Adjust based on your needs - this is a strict policy
-    csp_directives = [
+# Content Security Policy
+# Adjust based on your needs - this is a strict policy
+_CSP = "; ".join(
+    [
         "default-src 'self'",
         "script-src 'self' 'unsafe-inline' 'unsafe-eval'",  # Needed for Flutter web
         "style-src 'self' 'unsafe-inline'",  # Needed for inline styles
@@ -62,26 +24,71 @@ async def security_headers_middleware(
         "base-uri 'self'",
         "form-action 'self'",
     ]
+)
+
+# In development, be more permissive
+_DEV_CSP = "; ".join(
+    [
+        "default-src 'self' 'unsafe-inline' 'unsafe-eval'",
+        "img-src 'self' data: https: http:",
+        "connect-src 'self' http://localhost:* ws://localhost:*",  # Allow local dev servers
+    ]
+)
 
-    # In development, be more permissive
-    if settings.is_dev_environment:
-        csp_directives = [
-            "default-src 'self' 'unsafe-inline' 'unsafe-eval'",
-            "img-src 'self' data: https: http:",
-            "connect-src 'self' http://localhost:* ws://localhost:*",  # Allow local dev servers
-        ]
-
-    response.headers["Content-Security-Policy"] = "; ".join(csp_directives)
-
-    # Permissions Policy (formerly Feature-Policy)
-    # Restrict access to browser features
-    permissions_policy = [
+# Permissions Policy (formerly Feature-Policy)
+# Restrict access to browser features
+_PERMISSIONS_POLICY = ", ".join(
+    [
         "geolocation=()",  # Disable geolocation
         "microphone=()",  # Disable microphone
         "camera=()",  # Disable camera
         "payment=()",  # Disable payment APIs
         "usb=()",  # Disable USB
     ]
-    response.headers["Permissions-Policy"] = ", ".join(permissions_policy)
+)
+
 
-    return response
+def _docs_headers(headers: MutableHeaders) -> None:
+    headers["X-Content-Type-Options"] = "nosniff"
+    headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+    if not settings.is_dev_environment:
+        headers["Strict-Transport-Security"] = _HSTS
+
+
+def _security_headers(headers: MutableHeaders) -> None:
+    dev = settings.is_dev_environment
+
+    # Prevent MIME type sniffing
+    headers["X-Content-Type-Options"] = "nosniff"
+
+    # Prevent clickjacking
+    headers["X-Frame-Options"] = "DENY"
+
+    # Enable XSS protection (legacy browsers)
+    headers["X-XSS-Protection"] = "1; mode=block"
+
+    # Limit referrer information
+    headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+
+    # HSTS - Force HTTPS (only in production)
+    if not dev:
+        headers["Strict-Transport-Security"] = _HSTS
+
+    headers["Content-Security-Policy"] = _DEV_CSP if dev else _CSP
+    headers["Permissions-Policy"] = _PERMISSIONS_POLICY
+
+
+async def security_headers_stage(request: Request, response_hooks: list[ResponseHook]) -> Response | None:
+    """
+    Add security headers to all responses.
+
+    Headers added:
+    - X-Content-Type-Options: nosniff
+    - X-Frame-Options: DENY
+    - X-XSS-Protection: 1; mode=block
+    - Strict-Transport-Security (HSTS) - production only
+    - Content-Security-Policy (CSP)
+    - Referrer-Policy: strict-origin-when-cross-origin
+    """
+    response_hooks.append(_docs_headers if request.url.path in _DOCS_PATHS else _security_headers)
+    return None
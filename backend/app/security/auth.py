@@ -14,12 +14,12 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from pydantic import BaseModel, ValidationError
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.db.session import get_session
-from app.db.user_models import RevokedToken, User
+from app.db.user_models import User
+from app.security.auth_cache import revocations, user_principals
 
 # ---------------------------------------------------------------------
 # Configuration
@@ -166,12 +166,10 @@ async def decode_token(token: str, session: AsyncSession | None = None) -> Token
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         token_data = TokenPayload(**payload)
 
-        # Check if token has been revoked (if session provided)
+        # Check if token has been revoked (if session provided); the in-process
+        # revocation set only queries revoked_token when it is due for a sync
         if session is not None:
-            result = await session.execute(select(RevokedToken).where(RevokedToken.jti == token_data.jti))
-            revoked = result.scalar_one_or_none()
-
-            if revoked:
+            if await revocations.is_revoked(token_data.jti, session):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Token has been revoked",
@@ -222,9 +220,8 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Fetch user from database
-    result = await session.execute(select(User).where(User.id == token_data.user_id))
-    user = result.scalar_one_or_none()
+    # Fetch user (served from the short-TTL principal cache when possible)
+    user = await user_principals.get(session, token_data.user_id)
 
     if user is None:
         raise credentials_exception
@@ -269,9 +266,8 @@ async def get_current_user_optional(
         if token_data.token_type != "access":
             return None
 
-        # Fetch user from database
-        result = await session.execute(select(User).where(User.id == token_data.user_id))
-        user = result.scalar_one_or_none()
+        # Fetch user (served from the short-TTL principal cache when possible)
+        user = await user_principals.get(session, token_data.user_id)
 
         if user is None or not user.is_active:
             return None
@@ -329,8 +325,7 @@ async def get_optional_user(
         if token_data.token_type != "access":
             return None
 
-        result = await session.execute(select(User).where(User.id == token_data.user_id))
-        user = result.scalar_one_or_none()
+        user = await user_principals.get(session, token_data.user_id)
 
         if user and user.is_active:
             return user
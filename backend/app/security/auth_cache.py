@@ -0,0 +1,175 @@
+"""In-process caches that keep database queries out of request authentication.
+
+``revocations`` mirrors the unexpired ``revoked_token`` rows as a set of JTIs.
+Each worker polls at most every ``AUTH_REVOCATION_SYNC_SECONDS`` and records its
+own revocations right away, so a token revoked on another worker is rejected
+everywhere within one sync interval. Ids are assigned when a row is inserted,
+not when it commits, so a poll re-reads every row above the highest id seen by
+a sync at least a minute old, and every ten minutes all unexpired rows are read
+again; a revocation whose transaction commits after rows with higher ids is
+still picked up.
+
+``user_principals`` keeps the column values of recently authenticated users
+for ``AUTH_USER_CACHE_TTL_SECONDS``. A hit is attached to the request session
+with ``merge(load=False)``, which emits no SQL, so handlers still get a
+session-bound ``User`` they can modify and commit. Committing an ORM update or
+delete of a user drops its entry in this process; other workers see the change
+once their entry expires.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+
+from app.core.config import settings
+from app.db.user_models import RevokedToken, User
+
+_USER_CACHE_MAX_ENTRIES = 10_000
+_USER_COLUMNS = tuple(column.key for column in User.__mapper__.column_attrs)
+_CHANGED_USERS_INFO_KEY = "auth_cache_changed_users"
+# Longest a revocation's transaction may stay open and still be caught by the
+# incremental sync; the periodic full sync covers anything slower.
+_REVOCATION_OVERLAP_SECONDS = 60.0
+_REVOCATION_FULL_SYNC_SECONDS = 600.0
+
+
+class RevocationSet:
+    """Unexpired revoked JTIs, synced incrementally from ``revoked_token``."""
+
+    def __init__(self, sync_seconds: float) -> None:
+        self.sync_seconds = sync_seconds
+        self._expires: dict[str, datetime] = {}
+        self._last_id = 0
+        # (monotonic time of a sync, highest id seen by then), oldest first
+        self._seen: deque[tuple[float, int]] = deque()
+        self._next_sync = 0.0
+        self._next_full_sync = 0.0
+        self._lock = asyncio.Lock()
+        self.syncs = 0
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        """Record a revocation made by this process (already committed to the table)."""
+        self._expires[jti] = expires_at
+
+    async def is_revoked(self, jti: str, session: AsyncSession) -> bool:
+        if time.monotonic() >= self._next_sync:
+            await self.sync(session)
+        return jti in self._expires
+
+    def _watermark(self, monotonic_now: float) -> int:
+        """Highest id seen by a sync at least the overlap window ago; 0 if there is none."""
+        cutoff = monotonic_now - _REVOCATION_OVERLAP_SECONDS
+        while len(self._seen) > 1 and self._seen[1][0] <= cutoff:
+            self._seen.popleft()
+        if self._seen and self._seen[0][0] <= cutoff:
+            return self._seen[0][1]
+        return 0
+
+    async def sync(self, session: AsyncSession) -> None:
+        async with self._lock:
+            monotonic_now = time.monotonic()
+            if monotonic_now < self._next_sync:
+                return  # another request synced while we waited
+            if monotonic_now >= self._next_full_sync:
+                since = 0
+                self._next_full_sync = monotonic_now + _REVOCATION_FULL_SYNC_SECONDS
+            else:
+                since = self._watermark(monotonic_now)
+            now = datetime.now(timezone.utc)
+            result = await session.execute(
+                select(RevokedToken.id, RevokedToken.jti, RevokedToken.expires_at)
+                .where(RevokedToken.id > since, RevokedToken.expires_at > now)
+                .order_by(RevokedToken.id)
+            )
+            for row_id, jti, expires_at in result.all():
+                self._expires[jti] = expires_at
+                self._last_id = max(self._last_id, row_id)
+            self._expires = {jti: exp for jti, exp in self._expires.items() if exp > now}
+            self._seen.append((monotonic_now, self._last_id))
+            self._next_sync = time.monotonic() + self.sync_seconds
+            self.syncs += 1
+
+    def reset(self) -> None:
+        self._expires.clear()
+        self._last_id = 0
+        self._seen.clear()
+        self._next_sync = 0.0
+        self._next_full_sync = 0.0
+
+
+class UserPrincipalCache:
+    """Short-TTL snapshots of ``User`` columns keyed by user id."""
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[int, tuple[float, dict[str, Any]]] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, session: AsyncSession, user_id: int) -> User | None:
+        """Return the user bound to ``session``, querying only on a cache miss."""
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            snapshot = User(**entry[1])
+            make_transient_to_detached(snapshot)
+            return await session.merge(snapshot, load=False)
+
+        self.misses += 1
+        generation = self._generation
+        result = await session.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if user is not None and generation == self._generation:
+            self.put(user)  # skipped if a user changed while we were loading
+        return user
+
+    def put(self, user: User) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        if len(self._entries) >= _USER_CACHE_MAX_ENTRIES:
+            self._entries.clear()
+        values = {key: getattr(user, key) for key in _USER_COLUMNS}
+        self._entries[user.id] = (time.monotonic() + self.ttl_seconds, values)
+
+    def invalidate(self, user_id: int | None = None) -> None:
+        self._generation += 1
+        if user_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(user_id, None)
+
+
+revocations = RevocationSet(settings.AUTH_REVOCATION_SYNC_SECONDS)
+user_principals = UserPrincipalCache(settings.AUTH_USER_CACHE_TTL_SECONDS)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _collect_changed_user(mapper, connection, target: User) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_CHANGED_USERS_INFO_KEY, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session: Session) -> None:
+    # Only once committed: a request loading the user before this point must not cache it
+    for user_id in session.info.pop(_CHANGED_USERS_INFO_KEY, ()):
+        user_principals.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session: Session) -> None:
+    session.info.pop(_CHANGED_USERS_INFO_KEY, None)
+
+
+__all__ = ["RevocationSet", "UserPrincipalCache", "revocations", "user_principals"]
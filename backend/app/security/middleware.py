@@ -1,10 +1,11 @@
 import json
 
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
 from starlette.responses import Response
-from starlette.types import Message
 
 from app.core.config import settings
+from app.middleware.pipeline import ResponseHook
 
 SENSITIVE_KEYS = {
     "api_key",
@@ -16,18 +17,18 @@ SENSITIVE_KEYS = {
 SENSITIVE_HEADERS = {header.lower() for header in settings.BYOK_ALLOWED_HEADERS}
 
 
-async def _reset_body(request: Request, body: bytes):
-    async def receive() -> Message:
-        return {"type": "http.request", "body": body}
-
-    request._receive = receive
+def _redact_headers(headers) -> dict[str, str]:
+    return {
+        key: ("***" if key.lower() in SENSITIVE_HEADERS or key.lower() in SENSITIVE_KEYS else value)
+        for key, value in headers.items()
+    }
 
 
-async def redact_api_keys_middleware(request: Request, call_next):
+async def redact_api_keys_stage(request: Request, response_hooks: list[ResponseHook]) -> Response | None:
     ctype = request.headers.get("content-type", "")
     if ctype.startswith("application/json"):
+        # The pipeline replays the buffered body to the app
         body = await request.body()
-        await _reset_body(request, body)
         try:
             data = json.loads(body.decode("utf-8"))
 
@@ -51,17 +52,13 @@ async def redact_api_keys_middleware(request: Request, call_next):
     else:
         request.state.redacted_body = None
 
-    request.state.redacted_headers = {
-        key: ("***" if key.lower() in SENSITIVE_HEADERS or key.lower() in SENSITIVE_KEYS else value)
-        for key, value in request.headers.items()
-    }
+    request.state.redacted_headers = _redact_headers(request.headers)
+
+    def redact_response_headers(headers: MutableHeaders) -> None:
+        try:
+            request.state.redacted_response_headers = _redact_headers(headers)
+        except Exception:
+            request.state.redacted_response_headers = None
 
-    response: Response = await call_next(request)
-    try:
-        request.state.redacted_response_headers = {
-            key: ("***" if key.lower() in SENSITIVE_HEADERS or key.lower() in SENSITIVE_KEYS else value)
-            for key, value in response.headers.items()
-        }
-    except Exception:
-        request.state.redacted_response_headers = None
-    return response
+    response_hooks.append(redact_response_headers)
+    return None
@@ -0,0 +1,239 @@
+"""Achievement rarity: the share of active users holding each achievement.
+
+A snapshot (unlock counts per ``type:id`` plus the number of active users) is
+recomputed from Postgres by ``refresh_achievement_rarity`` on the scheduled task
+runner, and requests read it from memory. With REDIS_URL the snapshot is kept in
+Redis so workers share it: one worker per interval recomputes it and the others
+reload it at most every ACHIEVEMENT_RARITY_CACHE_TTL_SECONDS.
+
+Unlocks committed through the ORM are counted as they happen (HINCRBY in Redis
+and in this worker's copy), so rarity stays close to current between refreshes.
+The active user count only moves at refresh time, and increments that land while
+a refresh is being stored are lost until the next one.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.user_models import User, UserAchievement
+from app.services.commit_hooks import CommitHook
+from app.services.redis_backoff import RedisBackoff
+
+_LOGGER = logging.getLogger("app.services.achievement_rarity")
+
+_COUNTS_KEY = "achievement_rarity:counts"
+_ACTIVE_USERS_KEY = "achievement_rarity:active_users"
+_REFRESH_LOCK_KEY = "achievement_rarity:refresh_lock"
+
+
+@dataclass
+class RaritySnapshot:
+    counts: dict[str, int]
+    active_users: int
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    def percent(self, key: str) -> float | None:
+        """Percentage of active users holding ``key`` (``"type:id"``); None when there are none."""
+        if self.active_users <= 0:
+            return None
+        return self.counts.get(key, 0) / self.active_users * 100.0
+
+    def percentages(self) -> dict[str, float]:
+        """Percentages for every achievement somebody has unlocked."""
+        if self.active_users <= 0:
+            return {}
+        return {key: count / self.active_users * 100.0 for key, count in self.counts.items() if count > 0}
+
+
+async def compute_rarity_snapshot(session: AsyncSession) -> RaritySnapshot:
+    """Count active users and unlocks per achievement (the full scan the snapshot replaces)."""
+    active_users = await session.scalar(select(func.count(User.id)).where(User.is_active))
+    result = await session.execute(
+        select(
+            UserAchievement.achievement_type,
+            UserAchievement.achievement_id,
+            func.count(UserAchievement.id),
+        ).group_by(UserAchievement.achievement_type, UserAchievement.achievement_id)
+    )
+    return RaritySnapshot(
+        counts={
+            f"{achievement_type}:{achievement_id}": count
+            for achievement_type, achievement_id, count in result.all()
+        },
+        active_users=active_users or 0,
+    )
+
+
+class AchievementRarity(RedisBackoff):
+    """Serves the rarity snapshot from memory, shared through Redis when configured."""
+
+    _redis_outage_message = "Redis unavailable for achievement rarity; using local snapshot for 60s: %s"
+
+    def __init__(self, redis_url: str | None = None):
+        self.redis = aioredis.from_url(redis_url, decode_responses=True) if redis_url else None
+        self.snapshot: RaritySnapshot | None = None
+
+    async def get(self, session: AsyncSession) -> RaritySnapshot:
+        """The current snapshot; ``session`` is only used when no snapshot exists anywhere yet."""
+        snapshot = self.snapshot
+        if snapshot is not None and (
+            self.redis is None
+            or time.monotonic() - snapshot.loaded_at < settings.ACHIEVEMENT_RARITY_CACHE_TTL_SECONDS
+        ):
+            return snapshot
+        if self.redis_available:
+            try:
+                loaded = await self._load()
+            except RedisError as exc:
+                self._handle_redis_error(exc)
+                loaded = None
+            if loaded is not None:
+                self.snapshot = loaded
+                return loaded
+        if snapshot is not None:
+            return snapshot  # Redis is down; keep serving the last copy
+        return await self.refresh(session)
+
+    async def refresh(self, session: AsyncSession) -> RaritySnapshot:
+        """Recompute the snapshot from Postgres and publish it."""
+        snapshot = await compute_rarity_snapshot(session)
+        self.snapshot = snapshot
+        if self.redis_available:
+            try:
+                await self._store(snapshot)
+            except RedisError as exc:
+                self._handle_redis_error(exc)
+        return snapshot
+
+    async def _load(self) -> RaritySnapshot | None:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hgetall(_COUNTS_KEY)
+            pipe.get(_ACTIVE_USERS_KEY)
+            counts, active_users = await pipe.execute()
+        if active_users is None:
+            return None
+        return RaritySnapshot(
+            counts={key: int(value) for key, value in counts.items()}, active_users=int(active_users)
+        )
+
+    async def _store(self, snapshot: RaritySnapshot) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(_COUNTS_KEY)
+            if snapshot.counts:
+                pipe.hset(_COUNTS_KEY, mapping=snapshot.counts)
+            pipe.set(_ACTIVE_USERS_KEY, snapshot.active_users)
+            await pipe.execute()
+
+    def record_unlocks(self, unlocks: Counter[str]) -> None:
+        """Add committed unlocks to this worker's snapshot."""
+        if self.snapshot is None:
+            return
+        counts = self.snapshot.counts
+        for key, delta in unlocks.items():
+            counts[key] = max(0, counts.get(key, 0) + delta)
+
+    async def publish_unlocks(self, unlocks: Counter[str]) -> None:
+        """Add committed unlocks to the shared counters."""
+        if not self.redis_available:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, delta in unlocks.items():
+                    pipe.hincrby(_COUNTS_KEY, key, delta)
+                await pipe.execute()
+        except RedisError as exc:
+            self._handle_redis_error(exc)
+
+    async def acquire_refresh_lock(self, seconds: float) -> bool:
+        """Let one worker per interval recompute the snapshot; the lock simply expires."""
+        return bool(await self.redis.set(_REFRESH_LOCK_KEY, "1", nx=True, ex=max(1, int(seconds))))
+
+
+_rarity: AchievementRarity | None = None
+
+
+def get_achievement_rarity() -> AchievementRarity:
+    global _rarity
+    if _rarity is None:
+        _rarity = AchievementRarity(settings.REDIS_URL)
+    return _rarity
+
+
+async def rarity_snapshot(session: AsyncSession) -> RaritySnapshot:
+    """Rarity snapshot for a request; computed with ``session`` only on a cold start."""
+    return await get_achievement_rarity().get(session)
+
+
+async def refresh_achievement_rarity() -> None:
+    """Recompute the snapshot; run by the scheduled task runner.
+
+    With Redis, only the worker that takes the refresh lock recomputes; the others
+    pick up its snapshot when their copy expires.
+    """
+    rarity = get_achievement_rarity()
+    if rarity.redis_available:
+        try:
+            if not await rarity.acquire_refresh_lock(settings.ACHIEVEMENT_RARITY_REFRESH_SECONDS * 0.9):
+                return
+        except RedisError as exc:
+            rarity._handle_redis_error(exc)
+    from app.db.session import SessionLocal
+
+    started = time.perf_counter()
+    async with SessionLocal() as session:
+        snapshot = await rarity.refresh(session)
+    _LOGGER.info(
+        "Refreshed rarity of %d achievements in %.2fs", len(snapshot.counts), time.perf_counter() - started
+    )
+
+
+# ---------------------------------------------------------------------
+# Unlock counters from ORM flushes
+# ---------------------------------------------------------------------
+
+
+def _collect_unlocks(session: Session) -> Counter[str]:
+    unlocks: Counter[str] = Counter()
+    for obj in session.new:
+        if isinstance(obj, UserAchievement):
+            unlocks[f"{obj.achievement_type}:{obj.achievement_id}"] += 1
+    for obj in session.deleted:
+        if isinstance(obj, UserAchievement):
+            unlocks[f"{obj.achievement_type}:{obj.achievement_id}"] -= 1
+    return unlocks
+
+
+def _record_achievement_unlocks(session: Session, unlocks: Counter[str]) -> None:
+    rarity = get_achievement_rarity()
+    rarity.record_unlocks(unlocks)
+    if rarity.redis is not None:
+        _unlocks.spawn(rarity.publish_unlocks(unlocks))  # scripts are picked up by the next refresh
+
+
+_unlocks: CommitHook[Counter[str]] = CommitHook(
+    "achievement_unlocks",
+    collect=_collect_unlocks,
+    merge=Counter.update,
+    on_commit=_record_achievement_unlocks,
+)
+
+
+__all__ = [
+    "AchievementRarity",
+    "RaritySnapshot",
+    "compute_rarity_snapshot",
+    "get_achievement_rarity",
+    "rarity_snapshot",
+    "refresh_achievement_rarity",
+]
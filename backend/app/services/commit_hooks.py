@@ -0,0 +1,92 @@
+"""Acting on what a transaction changed once it has committed.
+
+Services that mirror database writes elsewhere (leaderboards, progress
+snapshots, achievement rarity) look at every ORM flush, keep what changed on
+``session.info`` until the transaction ends, act on it after the commit, and
+drop it on rollback, so nothing is published for a write that never happened.
+:class:`CommitHook` registers those listeners once per service.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, Coroutine, Generic, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+
+class CommitHook(Generic[T]):
+    """Collects ``T`` from each flush of a transaction and hands the total to ``on_commit``.
+
+    ``collect`` returns what one flush changed (falsy for nothing) and ``merge``
+    folds it into the transaction's pending value in place. ``on_commit`` runs
+    only when something was collected.
+    """
+
+    def __init__(
+        self,
+        info_key: str,
+        *,
+        collect: Callable[[Session], T | None],
+        merge: Callable[[T, T], None],
+        on_commit: Callable[[Session, T], None],
+    ):
+        self.info_key = info_key
+        self.tasks: set[asyncio.Task] = set()
+        self._collect = collect
+        self._merge = merge
+        self._on_commit = on_commit
+        event.listen(Session, "after_flush", self._after_flush)
+        event.listen(Session, "after_commit", self._after_commit)
+        event.listen(Session, "after_rollback", self._after_rollback)
+
+    def pending(self, session: Session) -> T | None:
+        """What the session's current transaction has collected so far."""
+        return session.info.get(self.info_key)
+
+    def add(self, session: Session, found: T | None) -> None:
+        """Add changes the flush can't see (e.g. events handed to the write-behind sink)."""
+        if not found:
+            return
+        pending = session.info.get(self.info_key)
+        if pending is None:
+            session.info[self.info_key] = found
+        else:
+            self._merge(pending, found)
+
+    def spawn(self, work: Coroutine) -> None:
+        """Run ``work`` on the event loop, tracked in :attr:`tasks`.
+
+        Synchronous sessions (scripts, migrations) have no loop; their changes
+        are left to the service's scheduled rebuild or to expiry.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            work.close()
+            return
+        task = loop.create_task(work)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def wait(self) -> None:
+        """Wait for the work spawned by commits so far."""
+        if self.tasks:
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    def _after_flush(self, session: Session, flush_context) -> None:
+        self.add(session, self._collect(session))
+
+    def _after_commit(self, session: Session) -> None:
+        pending = session.info.pop(self.info_key, None)
+        if pending:
+            self._on_commit(session, pending)
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(self.info_key, None)
+
+
+__all__ = ["CommitHook"]
@@ -0,0 +1,86 @@
+"""Daily XP rollup (``user_daily_xp``) for period leaderboards.
+
+Both lesson completion endpoints call :func:`record_daily_xp` in the same
+transaction that emits their ``LearningEvent``. The two endpoints log different
+event shapes, so :func:`lesson_xp` reads either one; :func:`lesson_xp_sql` is the
+same mapping in SQL for the backfill script and the event retention rollup.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import Integer, case, cast, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.user_models import UserDailyXP
+
+# event_type -> (XP key, language key) in LearningEvent.data
+LESSON_EVENTS: dict[str, tuple[str, str]] = {
+    "lesson_completed": ("xp_earned", "language_code"),  # gamification.complete_lesson
+    "lesson_complete": ("xp_gained", "language"),  # progress.update_user_progress
+}
+
+
+def lesson_xp(event_type: str, data: dict[str, Any] | None) -> tuple[int, str | None] | None:
+    """``(xp, language_code)`` awarded by a lesson event, or None for other events."""
+    keys = LESSON_EVENTS.get(event_type)
+    if keys is None:
+        return None
+    data = data or {}
+    return int(data.get(keys[0]) or 0), data.get(keys[1]) or None
+
+
+def lesson_xp_sql(events) -> tuple[Any, Any]:
+    """SQL counterparts of :func:`lesson_xp` over a ``learning_event``-shaped table.
+
+    Returns ``(xp, language_code)`` column expressions; xp is NULL and the
+    language ``""`` for events that aren't lesson completions.
+    """
+    xp = case(
+        {
+            event_type: cast(events.c.data[xp_key].astext, Integer)
+            for event_type, (xp_key, _) in LESSON_EVENTS.items()
+        },
+        value=events.c.event_type,
+    )
+    language = func.coalesce(
+        case(
+            {
+                event_type: events.c.data[language_key].astext
+                for event_type, (_, language_key) in LESSON_EVENTS.items()
+            },
+            value=events.c.event_type,
+        ),
+        "",
+    )
+    return xp, language
+
+
+async def record_daily_xp(
+    session: AsyncSession,
+    user_id: int,
+    xp: int,
+    language_code: str | None,
+    at: datetime | None = None,
+    lessons: int = 1,
+) -> None:
+    """Add ``lessons`` completed lessons worth ``xp`` in total to the user's row for the UTC day of ``at``."""
+    day = (at or datetime.now(timezone.utc)).astimezone(timezone.utc).date()
+    stmt = insert(UserDailyXP).values(
+        user_id=user_id, day=day, language_code=language_code or "", xp=xp, lessons=lessons
+    )
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[UserDailyXP.user_id, UserDailyXP.day, UserDailyXP.language_code],
+            set_={
+                "xp": UserDailyXP.xp + stmt.excluded.xp,
+                "lessons": UserDailyXP.lessons + stmt.excluded.lessons,
+            },
+        )
+    )
+
+
+__all__ = ["LESSON_EVENTS", "lesson_xp", "lesson_xp_sql", "record_daily_xp"]
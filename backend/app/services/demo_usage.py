@@ -8,22 +8,61 @@ Features:
 - Transparent rate limit headers
 - Per-user per-provider tracking
 - Future-proof configurable limits
+
+When ``REDIS_URL`` is configured, the live daily/weekly counters are Redis hashes
+that expire at the next daily/weekly reset, so a quota check is one round-trip
+and recording usage is one atomic MULTI. ``flush_demo_usage`` copies the
+counters into ``demo_api_usage`` periodically for reporting. If Redis is
+unavailable, both paths fall back to the ``demo_api_usage`` rows.
+
+The Redis counters are raised to at least the stored row the first time a quota
+check sees them, and again after any worker had to fall back to the database,
+so a Redis restart, a deploy mid-period or requests counted only in the
+database during an outage don't hand out a fresh quota.
 """
 
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import or_, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.db.user_models import DemoAPIUsage
+from app.services.redis_backoff import RedisBackoff
 
 _LOGGER = logging.getLogger("app.services.demo_usage")
 
+DEMO_PROVIDERS = ("openai", "anthropic", "google")
+_DIRTY_KEY = "demo_usage:dirty"
+# Bumped whenever a worker falls back to the database; counters synced under an
+# older value are reconciled with demo_api_usage again.
+_EPOCH_KEY = "demo_usage:epoch"
+_FLUSH_BATCH = 500
+
+# Raises the daily (KEYS[1]) and weekly (KEYS[2]) counters to at least the stored
+# row's values (ARGV: requests, tokens, reset timestamp per period) and marks both
+# synced with the current epoch (KEYS[3]).
+_SYNC_LUA = """
+local epoch = redis.call('GET', KEYS[3]) or '0'
+for i = 1, 2 do
+    local key = KEYS[i]
+    local base = (i - 1) * 3
+    local current = redis.call('HMGET', key, 'requests', 'tokens')
+    local requests = math.max(tonumber(current[1] or '0'), tonumber(ARGV[base + 1]))
+    local tokens = math.max(tonumber(current[2] or '0'), tonumber(ARGV[base + 2]))
+    redis.call('HSET', key, 'requests', requests, 'tokens', tokens, 'synced', epoch)
+    redis.call('EXPIREAT', key, ARGV[base + 3])
+end
+return epoch
+"""
+
 
 class DemoUsageExceeded(Exception):
     """Raised when user has exceeded demo API usage limits."""
@@ -53,6 +92,301 @@ def _get_next_weekly_reset() -> datetime:
     return next_monday.replace(hour=0, minute=0, second=0, microsecond=0)
 
 
+@dataclass(slots=True)
+class DemoUsageCounts:
+    """Live counters for one user/IP and provider, shaped like a ``DemoAPIUsage`` row."""
+
+    provider: str
+    requests_today: int
+    tokens_today: int
+    daily_reset_at: datetime
+    requests_this_week: int
+    tokens_this_week: int
+    weekly_reset_at: datetime
+    last_request_at: datetime | None = None
+    # False for Redis counters not yet reconciled with demo_api_usage
+    synced: bool = True
+
+
+def _usage_identity(user_id: int | None, ip_address: str | None) -> str:
+    if not user_id and not ip_address:
+        raise ValueError("Either user_id or ip_address must be provided")
+    return f"user:{user_id}" if user_id else f"ip:{ip_address}"
+
+
+def _int(value: str | None) -> int:
+    return int(value) if value else 0
+
+
+class RedisDemoUsageCounters(RedisBackoff):
+    """Daily and weekly demo counters kept in Redis hashes.
+
+    Keys carry the reset date of their period and expire at that reset, so old
+    periods disappear without a reset step. Every increment also adds the
+    ``identity|provider`` pair to a dirty set that :meth:`flush` drains.
+    """
+
+    _redis_outage_message = "Redis unavailable for demo usage; using database counters for 60s: %s"
+
+    def __init__(self, redis_url: str):
+        self.redis = aioredis.from_url(redis_url, decode_responses=True)
+        self._sync_script = self.redis.register_script(_SYNC_LUA)
+        self._fell_back = False
+
+    def _handle_redis_error(self, exc: Exception) -> None:
+        super()._handle_redis_error(exc)
+        self._fell_back = True
+
+    @staticmethod
+    def _keys(identity: str, provider: str, daily_reset: datetime, weekly_reset: datetime) -> tuple[str, str]:
+        base = f"demo_usage:{identity}:{provider}"
+        return f"{base}:day:{daily_reset:%Y%m%d}", f"{base}:week:{weekly_reset:%Y%m%d}"
+
+    async def read_many(self, pairs: list[tuple[str, str]]) -> list[DemoUsageCounts]:
+        """Counters for several ``(identity, provider)`` pairs in one round-trip."""
+        daily_reset, weekly_reset = _get_next_daily_reset(), _get_next_weekly_reset()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.get(_EPOCH_KEY)
+            for identity, provider in pairs:
+                daily_key, weekly_key = self._keys(identity, provider, daily_reset, weekly_reset)
+                pipe.hmget(daily_key, "requests", "tokens", "last", "synced")
+                pipe.hmget(weekly_key, "requests", "tokens", "synced")
+            epoch, *replies = await pipe.execute()
+
+        epoch = epoch or "0"
+        counts = []
+        for index, (_, provider) in enumerate(pairs):
+            (day_requests, day_tokens, last, day_synced), (week_requests, week_tokens, week_synced) = replies[
+                2 * index : 2 * index + 2
+            ]
+            counts.append(
+                DemoUsageCounts(
+                    provider=provider,
+                    requests_today=_int(day_requests),
+                    tokens_today=_int(day_tokens),
+                    daily_reset_at=daily_reset,
+                    requests_this_week=_int(week_requests),
+                    tokens_this_week=_int(week_tokens),
+                    weekly_reset_at=weekly_reset,
+                    last_request_at=datetime.fromtimestamp(float(last), timezone.utc) if last else None,
+                    synced=day_synced == epoch and week_synced == epoch,
+                )
+            )
+        return counts
+
+    async def read(self, identity: str, provider: str) -> DemoUsageCounts:
+        return (await self.read_many([(identity, provider)]))[0]
+
+    async def read_synced(self, session: AsyncSession, identity: str, provider: str) -> DemoUsageCounts:
+        """Like :meth:`read`, first reconciling counters Redis doesn't know to be current.
+
+        A missing key (Redis restart, new period, a deploy) or a fallback to the
+        database since the key was last synced raises the counters to at least
+        the stored ``demo_api_usage`` row.
+        """
+        if self._fell_back:
+            await self.redis.incr(_EPOCH_KEY)
+            self._fell_back = False
+        counts = await self.read(identity, provider)
+        if counts.synced:
+            return counts
+
+        try:
+            row = await _load_usage_row(session, identity, provider)
+        except SQLAlchemyError as exc:
+            _LOGGER.warning("Could not reconcile demo usage counters with the database: %s", exc)
+            return counts
+        stored = [0, 0, 0, 0]
+        if row is not None:
+            if row.daily_reset_at == counts.daily_reset_at:
+                stored[0:2] = row.requests_today, row.tokens_today
+            if row.weekly_reset_at == counts.weekly_reset_at:
+                stored[2:4] = row.requests_this_week, row.tokens_this_week
+        daily_key, weekly_key = self._keys(identity, provider, counts.daily_reset_at, counts.weekly_reset_at)
+        await self._sync_script(
+            keys=[daily_key, weekly_key, _EPOCH_KEY],
+            args=[
+                stored[0],
+                stored[1],
+                int(counts.daily_reset_at.timestamp()),
+                stored[2],
+                stored[3],
+                int(counts.weekly_reset_at.timestamp()),
+            ],
+        )
+        return await self.read(identity, provider)
+
+    async def increment(self, identity: str, provider: str, tokens_used: int = 0) -> DemoUsageCounts:
+        """Count one request atomically and return the updated counters."""
+        daily_reset, weekly_reset = _get_next_daily_reset(), _get_next_weekly_reset()
+        daily_key, weekly_key = self._keys(identity, provider, daily_reset, weekly_reset)
+        now = datetime.now(timezone.utc)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hincrby(daily_key, "requests", 1)
+            pipe.hincrby(daily_key, "tokens", tokens_used)
+            pipe.hset(daily_key, "last", repr(now.timestamp()))
+            pipe.expireat(daily_key, daily_reset)
+            pipe.hincrby(weekly_key, "requests", 1)
+            pipe.hincrby(weekly_key, "tokens", tokens_used)
+            pipe.expireat(weekly_key, weekly_reset)
+            pipe.sadd(_DIRTY_KEY, f"{identity}|{provider}")
+            day_requests, day_tokens, _, _, week_requests, week_tokens, _, _ = await pipe.execute()
+        return DemoUsageCounts(
+            provider=provider,
+            requests_today=day_requests,
+            tokens_today=day_tokens,
+            daily_reset_at=daily_reset,
+            requests_this_week=week_requests,
+            tokens_this_week=week_tokens,
+            weekly_reset_at=weekly_reset,
+            last_request_at=now,
+        )
+
+    async def flush(self, session: AsyncSession) -> int:
+        """Copy counters touched since the last flush into ``demo_api_usage``.
+
+        Within a period the stored counts only ever grow, so requests recorded
+        through the database fallback while Redis was down are not overwritten.
+        Returns the number of rows written.
+        """
+        flushed = 0
+        while True:
+            members = await self.redis.spop(_DIRTY_KEY, _FLUSH_BATCH)
+            if not members:
+                return flushed
+            try:
+                flushed += await self._flush_batch(session, members)
+            except Exception:
+                await session.rollback()
+                await self.redis.sadd(_DIRTY_KEY, *members)
+                raise
+
+    async def _flush_batch(self, session: AsyncSession, members: list[str]) -> int:
+        pairs = [tuple(member.rsplit("|", 1)) for member in members]
+        entries = [
+            (identity, provider, counts)
+            for (identity, provider), counts in zip(pairs, await self.read_many(pairs))
+        ]
+
+        user_ids = {int(identity[5:]) for identity, _, _ in entries if identity.startswith("user:")}
+        ips = {identity[3:] for identity, _, _ in entries if identity.startswith("ip:")}
+        result = await session.execute(
+            select(DemoAPIUsage).where(
+                or_(DemoAPIUsage.user_id.in_(user_ids), DemoAPIUsage.ip_address.in_(ips))
+            )
+        )
+        rows = {}
+        for row in result.scalars():
+            identity = f"user:{row.user_id}" if row.user_id else f"ip:{row.ip_address}"
+            rows[(identity, row.provider)] = row
+
+        for identity, provider, counts in entries:
+            row = rows.get((identity, provider))
+            if row is None:
+                row = DemoAPIUsage(
+                    user_id=int(identity[5:]) if identity.startswith("user:") else None,
+                    ip_address=identity[3:] if identity.startswith("ip:") else None,
+                    provider=provider,
+                    requests_today=0,
+                    tokens_today=0,
+                    requests_this_week=0,
+                    tokens_this_week=0,
+                    daily_reset_at=counts.daily_reset_at,
+                    weekly_reset_at=counts.weekly_reset_at,
+                )
+                session.add(row)
+            _merge_counts(row, counts)
+        await session.commit()
+        return len(entries)
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+async def _load_usage_row(session: AsyncSession, identity: str, provider: str) -> DemoAPIUsage | None:
+    if identity.startswith("user:"):
+        owner = DemoAPIUsage.user_id == int(identity[5:])
+    else:
+        owner = DemoAPIUsage.ip_address == identity[3:]
+    result = await session.execute(select(DemoAPIUsage).where(owner, DemoAPIUsage.provider == provider))
+    return result.scalar_one_or_none()
+
+
+def _merge_counts(row: DemoAPIUsage | DemoUsageCounts, counts: DemoUsageCounts) -> None:
+    if row.daily_reset_at == counts.daily_reset_at:
+        row.requests_today = max(row.requests_today, counts.requests_today)
+        row.tokens_today = max(row.tokens_today, counts.tokens_today)
+    else:
+        row.requests_today, row.tokens_today = counts.requests_today, counts.tokens_today
+        row.daily_reset_at = counts.daily_reset_at
+    if row.weekly_reset_at == counts.weekly_reset_at:
+        row.requests_this_week = max(row.requests_this_week, counts.requests_this_week)
+        row.tokens_this_week = max(row.tokens_this_week, counts.tokens_this_week)
+    else:
+        row.requests_this_week, row.tokens_this_week = counts.requests_this_week, counts.tokens_this_week
+        row.weekly_reset_at = counts.weekly_reset_at
+    if counts.last_request_at and (
+        row.last_request_at is None or counts.last_request_at > row.last_request_at
+    ):
+        row.last_request_at = counts.last_request_at
+
+
+def _merge_live_counts(
+    rows: list[DemoAPIUsage | DemoUsageCounts], live: list[DemoUsageCounts]
+) -> list[DemoAPIUsage | DemoUsageCounts]:
+    """Overlay live counters on copies of the stored rows (the ORM rows are left untouched)."""
+    merged: dict[str, DemoUsageCounts] = {
+        row.provider: DemoUsageCounts(
+            provider=row.provider,
+            requests_today=row.requests_today,
+            tokens_today=row.tokens_today,
+            daily_reset_at=row.daily_reset_at,
+            requests_this_week=row.requests_this_week,
+            tokens_this_week=row.tokens_this_week,
+            weekly_reset_at=row.weekly_reset_at,
+            last_request_at=row.last_request_at,
+        )
+        for row in rows
+    }
+    for counts in live:
+        if counts.provider in merged:
+            _merge_counts(merged[counts.provider], counts)
+        elif counts.requests_this_week:
+            merged[counts.provider] = counts
+    return list(merged.values())
+
+
+_demo_counters: RedisDemoUsageCounters | None = None
+
+
+def get_demo_usage_counters() -> RedisDemoUsageCounters | None:
+    """Redis counter backend, or None when Redis is not configured or currently failing."""
+    global _demo_counters
+    if _demo_counters is None and settings.REDIS_URL:
+        _demo_counters = RedisDemoUsageCounters(settings.REDIS_URL)
+    if _demo_counters is not None and _demo_counters.redis_available:
+        return _demo_counters
+    return None
+
+
+async def flush_demo_usage() -> int:
+    """Persist Redis demo counters to ``demo_api_usage``; run by the scheduled task runner."""
+    counters = get_demo_usage_counters()
+    if counters is None:
+        return 0
+    from app.db.session import SessionLocal
+
+    async with SessionLocal() as session:
+        try:
+            flushed = await counters.flush(session)
+        except RedisError as exc:
+            counters._handle_redis_error(exc)
+            return 0
+    if flushed:
+        _LOGGER.info("Flushed %d demo usage counters to the database", flushed)
+    return flushed
+
+
 async def get_or_create_usage_record(
     session: AsyncSession,
     provider: str,
@@ -166,15 +500,50 @@ async def reset_counters_if_needed(
     return usage
 
 
+def _enforce_limits(
+    usage: DemoAPIUsage | DemoUsageCounts,
+    provider: str,
+    user_id: int | None,
+    ip_address: str | None,
+) -> None:
+    daily_limit = settings.DEMO_DAILY_REQUEST_LIMIT
+    weekly_limit = settings.DEMO_WEEKLY_REQUEST_LIMIT
+
+    identifier = f"user_id={user_id}" if user_id else f"IP {ip_address}"
+
+    if usage.requests_today >= daily_limit:
+        raise DemoUsageExceeded(
+            f"Daily demo API limit exceeded for {provider} ({identifier}). "
+            f"Limit: {daily_limit} requests/day. "
+            f"Resets at {usage.daily_reset_at.isoformat()}. "
+            f"Sign up or add your own API key for unlimited usage!",
+            daily_limit=daily_limit,
+            weekly_limit=weekly_limit,
+            reset_at=usage.daily_reset_at,
+        )
+
+    if usage.requests_this_week >= weekly_limit:
+        raise DemoUsageExceeded(
+            f"Weekly demo API limit exceeded for {provider} ({identifier}). "
+            f"Limit: {weekly_limit} requests/week. "
+            f"Resets at {usage.weekly_reset_at.isoformat()}. "
+            f"Sign up or add your own API key for unlimited usage!",
+            daily_limit=daily_limit,
+            weekly_limit=weekly_limit,
+            reset_at=usage.weekly_reset_at,
+        )
+
+
 async def check_rate_limit(
     session: AsyncSession,
     provider: str,
     user_id: int | None = None,
     ip_address: str | None = None,
-) -> tuple[bool, DemoAPIUsage | None]:
+) -> tuple[bool, DemoAPIUsage | DemoUsageCounts | None]:
     """Check if user/IP can make a demo API request.
 
     Supports both authenticated users (by user_id) and guest users (by IP address).
+    Reads the Redis counters when available, otherwise the ``demo_api_usage`` row.
 
     Args:
         session: Database session
@@ -183,12 +552,23 @@ async def check_rate_limit(
         ip_address: IP address (for guest users)
 
     Returns:
-        Tuple of (allowed: bool, usage: DemoAPIUsage)
+        Tuple of (allowed: bool, usage: DemoAPIUsage or DemoUsageCounts)
 
     Raises:
         DemoUsageExceeded: If user/IP has exceeded limits
         ValueError: If neither user_id nor ip_address is provided
     """
+    identity = _usage_identity(user_id, ip_address)
+    counters = get_demo_usage_counters()
+    if counters is not None:
+        try:
+            counts = await counters.read_synced(session, identity, provider)
+        except RedisError as exc:
+            counters._handle_redis_error(exc)
+        else:
+            _enforce_limits(counts, provider, user_id, ip_address)
+            return (True, counts)
+
     # Get or create usage record
     try:
         usage = await get_or_create_usage_record(session, provider, user_id=user_id, ip_address=ip_address)
@@ -210,34 +590,7 @@ async def check_rate_limit(
         )
         return True, None
 
-    # Check limits
-    daily_limit = settings.DEMO_DAILY_REQUEST_LIMIT
-    weekly_limit = settings.DEMO_WEEKLY_REQUEST_LIMIT
-
-    identifier = f"user_id={user_id}" if user_id else f"IP {ip_address}"
-
-    if usage.requests_today >= daily_limit:
-        raise DemoUsageExceeded(
-            f"Daily demo API limit exceeded for {provider} ({identifier}). "
-            f"Limit: {daily_limit} requests/day. "
-            f"Resets at {usage.daily_reset_at.isoformat()}. "
-            f"Sign up or add your own API key for unlimited usage!",
-            daily_limit=daily_limit,
-            weekly_limit=weekly_limit,
-            reset_at=usage.daily_reset_at,
-        )
-
-    if usage.requests_this_week >= weekly_limit:
-        raise DemoUsageExceeded(
-            f"Weekly demo API limit exceeded for {provider} ({identifier}). "
-            f"Limit: {weekly_limit} requests/week. "
-            f"Resets at {usage.weekly_reset_at.isoformat()}. "
-            f"Sign up or add your own API key for unlimited usage!",
-            daily_limit=daily_limit,
-            weekly_limit=weekly_limit,
-            reset_at=usage.weekly_reset_at,
-        )
-
+    _enforce_limits(usage, provider, user_id, ip_address)
     return (True, usage)
 
 
@@ -247,10 +600,12 @@ async def record_usage(
     user_id: int | None = None,
     ip_address: str | None = None,
     tokens_used: int = 0,
-) -> DemoAPIUsage | None:
+) -> DemoAPIUsage | DemoUsageCounts | None:
     """Record a demo API usage event.
 
     Supports both authenticated users (by user_id) and guest users (by IP address).
+    With Redis available this is a single atomic increment; the database row is
+    updated by the next :func:`flush_demo_usage`.
 
     Args:
         session: Database session
@@ -260,11 +615,22 @@ async def record_usage(
         tokens_used: Number of tokens used (optional)
 
     Returns:
-        Updated DemoAPIUsage record
+        Updated DemoAPIUsage record, or the live counters when Redis is used
 
     Raises:
         ValueError: If neither user_id nor ip_address is provided
     """
+    identity = _usage_identity(user_id, ip_address)
+    counters = get_demo_usage_counters()
+    if counters is not None:
+        try:
+            usage = await counters.increment(identity, provider, tokens_used)
+        except RedisError as exc:
+            counters._handle_redis_error(exc)
+        else:
+            _log_recorded_usage(identity, usage)
+            return usage
+
     try:
         usage = await get_or_create_usage_record(session, provider, user_id=user_id, ip_address=ip_address)
         usage = await reset_counters_if_needed(session, usage)
@@ -295,19 +661,21 @@ async def record_usage(
     await session.commit()
     await session.refresh(usage)
 
-    identifier = f"user_id={user_id}" if user_id else f"ip={ip_address}"
+    _log_recorded_usage(identity, usage)
+    return usage
+
+
+def _log_recorded_usage(identity: str, usage: DemoAPIUsage | DemoUsageCounts) -> None:
     _LOGGER.info(
         "Recorded demo usage: %s provider=%s requests_today=%d/%d requests_week=%d/%d",
-        identifier,
-        provider,
+        identity,
+        usage.provider,
         usage.requests_today,
         settings.DEMO_DAILY_REQUEST_LIMIT,
         usage.requests_this_week,
         settings.DEMO_WEEKLY_REQUEST_LIMIT,
     )
 
-    return usage
-
 
 async def get_usage_stats(
     session: AsyncSession,
@@ -330,7 +698,18 @@ async def get_usage_stats(
         query = query.where(DemoAPIUsage.provider == provider)
 
     result = await session.execute(query)
-    usage_records = result.scalars().all()
+    usage_records: list[DemoAPIUsage | DemoUsageCounts] = list(result.scalars().all())
+
+    counters = get_demo_usage_counters()
+    if counters is not None:
+        # Rows lag the Redis counters by up to one flush interval
+        providers = (provider,) if provider else DEMO_PROVIDERS
+        try:
+            live = await counters.read_many([(f"user:{user_id}", name) for name in providers])
+        except RedisError as exc:
+            counters._handle_redis_error(exc)
+        else:
+            usage_records = _merge_live_counts(usage_records, live)
 
     stats = []
     for usage in usage_records:
@@ -0,0 +1,226 @@
+"""Monthly partitions and retention for ``learning_event``.
+
+The table is range-partitioned on ``event_timestamp`` with one partition per UTC
+month (``learning_event_pYYYYMM``) and ``learning_event_default`` for anything
+outside them (migration 20261018_partition_learning_event). Queries bounded on
+``event_timestamp`` only scan the months their window overlaps.
+
+:func:`maintain_learning_event_partitions` runs daily on the scheduled task runner:
+
+* it creates the current month and the next LEARNING_EVENT_PARTITIONS_AHEAD
+  months, each in its own transaction, so new events never land in the default
+  partition. If some did (the task didn't run for months), they are moved into
+  the new partition, which Postgres would otherwise refuse to create;
+* with LEARNING_EVENT_RETENTION_MONTHS set, each month older than that is summed
+  into ``learning_event_monthly`` and its partition detached and dropped, one
+  transaction per month.
+
+Databases where ``learning_event`` is a plain table (``create_all`` in tests and
+scripts) are left alone.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from datetime import date, datetime, timezone
+from typing import Iterable
+
+from sqlalchemy import Column, Date, Integer, MetaData, String, Table, func, literal, select, text
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.user_models import LearningEventMonthly
+from app.services.daily_xp import lesson_xp_sql
+
+_LOGGER = logging.getLogger("app.services.event_partitions")
+
+_PARTITION_NAME = re.compile(r"^learning_event_p(\d{4})(\d{2})$")
+_DEFAULT_PARTITION = "learning_event_default"
+_COLUMNS = "id, user_id, event_type, event_timestamp, data, lesson_id, work_id"
+
+
+def month_start(value: date | datetime) -> date:
+    """First day of the month of ``value`` (datetimes are taken in UTC)."""
+    if isinstance(value, datetime):
+        value = value.astimezone(timezone.utc)
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"learning_event_p{month:%Y%m}"
+
+
+def expired_months(months: Iterable[date], now: datetime, retention_months: int | None) -> list[date]:
+    """Partitions to retire: those starting more than ``retention_months`` before the current month."""
+    if not retention_months:
+        return []
+    cutoff = add_months(month_start(now), -retention_months)
+    return sorted(month for month in months if month < cutoff)
+
+
+async def _claim(session: AsyncSession) -> bool:
+    """Whether learning_event is partitioned and this worker holds the maintenance lock."""
+    return bool(
+        await session.scalar(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table"
+                " WHERE partrelid = to_regclass('learning_event'))"
+                " AND pg_try_advisory_xact_lock(hashtext('learning_event_partitions'))"
+            )
+        )
+    )
+
+
+async def partition_months(session: AsyncSession) -> list[date]:
+    """Months that currently have a partition."""
+    result = await session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits"
+            " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+            " WHERE pg_inherits.inhparent = 'learning_event'::regclass"
+        )
+    )
+    months = []
+    for (name,) in result.all():
+        match = _PARTITION_NAME.match(name)
+        if match:
+            months.append(date(int(match[1]), int(match[2]), 1))
+    return sorted(months)
+
+
+async def create_partition(session: AsyncSession, month: date) -> int:
+    """Create the partition for ``month``; returns how many rows it took over from the default partition.
+
+    Postgres refuses to create a partition while the default partition holds rows
+    in its range, so those rows are moved: the default partition is detached, the
+    month created, the rows moved over and the default attached again.
+    """
+    name = partition_name(month)
+    end = add_months(month, 1)
+    bounds = f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{end.isoformat()} 00:00:00+00')"
+    in_range = "event_timestamp >= :start AND event_timestamp < :end"
+    params = {
+        "start": datetime(month.year, month.month, 1, tzinfo=timezone.utc),
+        "end": datetime(end.year, end.month, 1, tzinfo=timezone.utc),
+    }
+    stray = await session.scalar(text(f"SELECT count(*) FROM {_DEFAULT_PARTITION} WHERE {in_range}"), params)
+    if not stray:
+        await session.execute(text(f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF learning_event {bounds}"))
+        return 0
+    await session.execute(text(f"ALTER TABLE learning_event DETACH PARTITION {_DEFAULT_PARTITION}"))
+    await session.execute(text(f"CREATE TABLE {name} PARTITION OF learning_event {bounds}"))
+    await session.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {_DEFAULT_PARTITION} WHERE {in_range} RETURNING {_COLUMNS})"
+            f" INSERT INTO {name} ({_COLUMNS}) SELECT {_COLUMNS} FROM moved"
+        ),
+        params,
+    )
+    await session.execute(text(f"ALTER TABLE learning_event ATTACH PARTITION {_DEFAULT_PARTITION} DEFAULT"))
+    return stray
+
+
+async def retire_partition(session: AsyncSession, month: date) -> None:
+    """Sum one month into ``learning_event_monthly``, then detach and drop its partition."""
+    name = partition_name(month)
+    events = Table(
+        name,
+        MetaData(),
+        Column("user_id", Integer),
+        Column("event_type", String(50)),
+        Column("data", JSONB),
+    )
+    xp, language = lesson_xp_sql(events)
+    rows = select(
+        events.c.user_id,
+        literal(month, Date),
+        events.c.event_type,
+        language,
+        func.count(),
+        func.coalesce(func.sum(xp), 0),
+    ).group_by(events.c.user_id, events.c.event_type, language)
+    stmt = insert(LearningEventMonthly).from_select(
+        ["user_id", "month", "event_type", "language_code", "events", "xp"], rows
+    )
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[
+                LearningEventMonthly.user_id,
+                LearningEventMonthly.month,
+                LearningEventMonthly.event_type,
+                LearningEventMonthly.language_code,
+            ],
+            set_={
+                "events": LearningEventMonthly.events + stmt.excluded.events,
+                "xp": LearningEventMonthly.xp + stmt.excluded.xp,
+            },
+        )
+    )
+    await session.execute(text(f"ALTER TABLE learning_event DETACH PARTITION {name}"))
+    await session.execute(text(f"DROP TABLE {name}"))
+
+
+async def maintain_learning_event_partitions() -> None:
+    """Create upcoming partitions and retire expired ones; run by the scheduled task runner."""
+    from app.db.session import SessionLocal
+
+    now = datetime.now(timezone.utc)
+    current = month_start(now)
+    for offset in range(settings.LEARNING_EVENT_PARTITIONS_AHEAD + 1):
+        month = add_months(current, offset)
+        try:
+            async with SessionLocal() as session:
+                if not await _claim(session):
+                    return  # not partitioned, or another worker is on it
+                if month in await partition_months(session):
+                    continue
+                moved = await create_partition(session, month)
+                await session.commit()
+        except SQLAlchemyError as exc:
+            # Later months don't depend on this one
+            _LOGGER.error("Could not create learning_event partition %s: %s", partition_name(month), exc)
+            continue
+        if moved:
+            _LOGGER.error(
+                "%d learning events had landed in %s; moved them to %s",
+                moved,
+                _DEFAULT_PARTITION,
+                partition_name(month),
+            )
+        _LOGGER.info("Created learning_event partition %s", partition_name(month))
+
+    async with SessionLocal() as session:
+        months = await partition_months(session)
+    for month in expired_months(months, now, settings.LEARNING_EVENT_RETENTION_MONTHS):
+        async with SessionLocal() as session:
+            if not await _claim(session) or month not in await partition_months(session):
+                continue
+            await retire_partition(session, month)
+            await session.commit()
+        _LOGGER.info("Rolled up and dropped %s", partition_name(month))
+
+
+async def ensure_learning_event_partitions() -> None:
+    """Run the maintenance once at startup so a lapsed scheduler can't leave the month uncovered."""
+    try:
+        await maintain_learning_event_partitions()
+    except SQLAlchemyError as exc:
+        _LOGGER.warning("learning_event partition maintenance failed at startup: %s", exc)
+
+
+__all__ = [
+    "add_months",
+    "ensure_learning_event_partitions",
+    "expired_months",
+    "maintain_learning_event_partitions",
+    "month_start",
+    "partition_name",
+]
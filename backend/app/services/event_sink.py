@@ -0,0 +1,433 @@
+"""Write-behind sink for ``learning_event`` rows.
+
+Handlers log events with :func:`emit_learning_event` rather than adding a
+``LearningEvent`` to their session. The event waits on the session until the
+transaction commits (a rollback drops it) and then goes onto an in-process
+bounded queue. A background flusher writes the queue with asyncpg
+``copy_records_to_table`` every EVENT_SINK_FLUSH_INTERVAL_MS, or as soon as
+EVENT_SINK_BATCH_SIZE rows are waiting, so request transactions skip the insert
+and the table gets one COPY per batch instead of a row per lesson.
+
+A batch leaves the buffer only after its COPY has committed, failed batches are
+retried, and the lifespan drains the queue on shutdown. With REDIS_URL each
+worker also journals its committed events to its own Redis stream until their
+batch is written, and keeps a heartbeat key alive while it runs (even while
+Postgres is down and it is still retrying). ``recover_learning_events`` replays
+only the journals of workers whose heartbeat has lapsed, so a crashed worker's
+events are written at least once without duplicating batches a live worker is
+still retrying.
+
+The journal entry is added right after the commit, from the commit hook, so a
+worker that dies in the few milliseconds in between, or while Redis is
+unavailable, loses the events it was holding. Events that reached the journal
+are delivered at least once.
+
+When the sink isn't running (tests, scripts, TESTING=1) or its queue is full,
+:func:`emit_learning_event` adds the row to the session as before. Events reach
+the table up to one flush interval after the commit that logged them;
+listeners registered with :func:`on_learning_events_written` hear about each
+batch once it is written.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+from asyncpg.exceptions import DataError, IntegrityConstraintViolationError, PostgresError
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.user_models import LearningEvent
+from app.services.redis_backoff import RedisBackoff
+
+_LOGGER = logging.getLogger("app.services.event_sink")
+
+# (user_id, event_type, event_timestamp, data as JSON text)
+EventRecord = tuple[int, str, datetime, str]
+WrittenListener = Callable[[list[EventRecord]], Awaitable[None]]
+
+_COLUMNS = ["user_id", "event_type", "event_timestamp", "data"]
+_PENDING_INFO_KEY = "pending_learning_events"
+_JOURNAL_PREFIX = "learning_event:journal:"  # + worker id: that worker's stream
+_ALIVE_SUFFIX = ":alive"  # journal key + suffix: the worker's heartbeat
+_WORKERS_KEY = "learning_event:journal_workers"
+_RECOVERY_LOCK_KEY = "learning_event:recovery_lock"
+_FIRST_RETRY_DELAY = 1.0
+_MAX_RETRY_DELAY = 30.0
+_SHUTDOWN_ATTEMPTS = 3
+
+
+def _record(event: LearningEvent) -> EventRecord:
+    return (event.user_id, event.event_type, event.event_timestamp, json.dumps(event.data, default=str))
+
+
+def _dump(record: EventRecord) -> str:
+    user_id, event_type, timestamp, data = record
+    return json.dumps([user_id, event_type, timestamp.isoformat(), data])
+
+
+def _load(value: str) -> EventRecord:
+    user_id, event_type, timestamp, data = json.loads(value)
+    return user_id, event_type, datetime.fromisoformat(timestamp), data
+
+
+def _rejects_rows(exc: Exception) -> bool:
+    """True for errors caused by the rows themselves (e.g. a deleted user), which retrying won't fix."""
+    cause = exc.orig if isinstance(exc, DBAPIError) else exc
+    cause = getattr(cause, "__cause__", None) or cause
+    return isinstance(cause, (DataError, IntegrityConstraintViolationError))
+
+
+class LearningEventSink(RedisBackoff):
+    """Buffers committed learning events and writes them to Postgres in COPY batches."""
+
+    _redis_outage_message = "Redis unavailable for the learning event journal; buffering in memory: %s"
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        *,
+        batch_size: int = 500,
+        flush_interval: float = 0.25,
+        max_queue: int = 10_000,
+        dead_after: float = 300.0,
+    ):
+        self.redis = aioredis.from_url(redis_url, decode_responses=True) if redis_url else None
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dead_after = dead_after
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._journal_key = _JOURNAL_PREFIX + self.worker_id
+        self._queue: asyncio.Queue[tuple[EventRecord, str | None]] = asyncio.Queue(maxsize=max_queue)
+        self._task: asyncio.Task | None = None
+        self._heartbeat_task: asyncio.Task | None = None
+        self._submits: set[asyncio.Task] = set()
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done() and not self._stopping
+
+    def has_room(self) -> bool:
+        return self.running and not self._queue.full()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+        if self.redis is not None and (self._heartbeat_task is None or self._heartbeat_task.done()):
+            self._heartbeat_task = asyncio.create_task(self._heartbeat())
+
+    def _beat(self, pipe) -> None:
+        pipe.set(self._journal_key + _ALIVE_SUFFIX, "1", ex=max(1, int(self.dead_after)))
+        pipe.sadd(_WORKERS_KEY, self.worker_id)
+
+    async def _heartbeat(self) -> None:
+        """Keep this worker's journal from being recovered while it runs."""
+        while True:
+            if self.redis_available:
+                try:
+                    async with self.redis.pipeline(transaction=False) as pipe:
+                        self._beat(pipe)
+                        await pipe.execute()
+                except RedisError as exc:
+                    self._handle_redis_error(exc)
+            await asyncio.sleep(self.dead_after / 3)
+
+    async def stop(self, timeout: float) -> None:
+        """Stop accepting events and write everything already committed, waiting up to ``timeout``."""
+        if self._task is None:
+            return
+        if self._submits:
+            await asyncio.gather(*self._submits, return_exceptions=True)
+        self._stopping = True
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            # The heartbeat stops with the process, after which another worker recovers the journal
+            _LOGGER.error(
+                "Learning event sink did not drain within %.0fs; %d queued events %s",
+                timeout,
+                self._queue.qsize(),
+                "remain in the Redis journal" if self.redis is not None else "were dropped",
+            )
+        else:
+            await self._retire_journal()
+        self._task = None
+
+    async def _retire_journal(self) -> None:
+        """Drop this worker's journal and heartbeat once everything has been written."""
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        if not self.redis_available:
+            return
+        try:
+            if await self.redis.xlen(self._journal_key):
+                return  # a batch was given up on; leave it for recovery
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.delete(self._journal_key, self._journal_key + _ALIVE_SUFFIX)
+                pipe.srem(_WORKERS_KEY, self.worker_id)
+                await pipe.execute()
+        except RedisError as exc:
+            self._handle_redis_error(exc)
+
+    def submit_soon(self, records: list[EventRecord]) -> None:
+        """Hand over events from a committed transaction (called from a sync commit hook)."""
+        task = asyncio.get_running_loop().create_task(self.submit(records))
+        self._submits.add(task)
+        task.add_done_callback(self._submits.discard)
+
+    async def submit(self, records: list[EventRecord]) -> None:
+        """Journal ``records`` (with Redis) and queue them for the flusher."""
+        journal_ids: list[str | None] = [None] * len(records)
+        if self.redis_available:
+            try:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for record in records:
+                        pipe.xadd(self._journal_key, {"event": _dump(record)})
+                    self._beat(pipe)
+                    journal_ids = (await pipe.execute())[: len(records)]
+            except RedisError as exc:
+                self._handle_redis_error(exc)
+
+        overflow = []
+        for item in zip(records, journal_ids):
+            if self._stopping:
+                overflow.append(item)
+                continue
+            try:
+                self._queue.put_nowait(item)
+            except asyncio.QueueFull:
+                overflow.append(item)
+        if overflow:
+            await self._flush(overflow)  # write them now rather than drop them
+
+    async def _run(self) -> None:
+        while not (self._stopping and self._queue.empty()):
+            batch = await self._next_batch()
+            if batch:
+                await self._flush(batch)
+
+    async def _next_batch(self) -> list[tuple[EventRecord, str | None]]:
+        loop = asyncio.get_running_loop()
+        try:
+            batch = [await asyncio.wait_for(self._queue.get(), self.flush_interval)]
+        except asyncio.TimeoutError:
+            return []
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if self._stopping or remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _flush(
+        self, batch: list[tuple[EventRecord, str | None]], journal_key: str | None = None
+    ) -> None:
+        """Write ``batch``, then delete its entries from ``journal_key`` (default: this worker's)."""
+        records = [record for record, _ in batch]
+        delay = _FIRST_RETRY_DELAY
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                await self._write(records)
+                break
+            except (SQLAlchemyError, PostgresError, OSError) as exc:
+                if _rejects_rows(exc):
+                    await self._write_each(records)
+                    break
+                if self._stopping and attempts >= _SHUTDOWN_ATTEMPTS:
+                    _LOGGER.error("Giving up on %d learning events at shutdown: %s", len(records), exc)
+                    return  # journaled events stay in Redis for recovery
+                _LOGGER.warning(
+                    "Writing %d learning events failed; retrying in %.0fs: %s", len(records), delay, exc
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _MAX_RETRY_DELAY)
+
+        for listener in _written_listeners:
+            try:
+                await listener(records)
+            except Exception:
+                _LOGGER.exception("Learning event listener %r failed", listener)
+
+        journal_ids = [journal_id for _, journal_id in batch if journal_id]
+        if journal_ids and self.redis_available:
+            try:
+                await self.redis.xdel(journal_key or self._journal_key, *journal_ids)
+            except RedisError as exc:
+                self._handle_redis_error(exc)
+
+    async def _write_each(self, records: list[EventRecord]) -> None:
+        """Write rows one by one, dropping the ones Postgres rejects."""
+        for record in records:
+            try:
+                await self._write([record])
+            except (SQLAlchemyError, PostgresError) as exc:
+                if not _rejects_rows(exc):
+                    raise
+                _LOGGER.warning("Dropping learning event %s for user %s: %s", record[1], record[0], exc)
+
+    async def _write(self, records: list[EventRecord]) -> None:
+        from app.db.session import engine
+
+        async with engine.connect() as conn:
+            driver = (await conn.get_raw_connection()).driver_connection
+            async with driver.transaction():
+                await driver.copy_records_to_table("learning_event", records=records, columns=_COLUMNS)
+
+    async def recover(self) -> int:
+        """Write the journals of workers whose heartbeat has lapsed, then drop those journals."""
+        if not self.redis_available:
+            return 0
+        recovered = 0
+        for worker_id in sorted(await self.redis.smembers(_WORKERS_KEY)):
+            journal_key = _JOURNAL_PREFIX + worker_id
+            if worker_id == self.worker_id or await self.redis.exists(journal_key + _ALIVE_SUFFIX):
+                continue
+            start = "-"
+            while entries := await self.redis.xrange(journal_key, min=start, count=self.batch_size):
+                if self._stopping:
+                    return recovered
+                await self._flush(
+                    [(_load(fields["event"]), entry_id) for entry_id, fields in entries], journal_key
+                )
+                recovered += len(entries)
+                start = "(" + entries[-1][0]
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.delete(journal_key)
+                pipe.srem(_WORKERS_KEY, worker_id)
+                await pipe.execute()
+        return recovered
+
+    async def acquire_recovery_lock(self, seconds: float) -> bool:
+        """Let one worker per interval replay the journal; the lock simply expires."""
+        return bool(await self.redis.set(_RECOVERY_LOCK_KEY, "1", nx=True, ex=max(1, int(seconds))))
+
+
+_sink: LearningEventSink | None = None
+_written_listeners: list[WrittenListener] = []
+
+
+def on_learning_events_written(listener: WrittenListener) -> WrittenListener:
+    """Call ``listener`` with each batch of records once its COPY has committed."""
+    _written_listeners.append(listener)
+    return listener
+
+
+def get_event_sink() -> LearningEventSink | None:
+    """The running sink, or None when events are written inline."""
+    return _sink if _sink is not None and _sink.running else None
+
+
+def start_event_sink() -> LearningEventSink | None:
+    """Start the flusher; called from the application lifespan."""
+    global _sink
+    if not settings.EVENT_SINK_ENABLED:
+        return None
+    if _sink is None:
+        _sink = LearningEventSink(
+            settings.REDIS_URL,
+            batch_size=settings.EVENT_SINK_BATCH_SIZE,
+            flush_interval=settings.EVENT_SINK_FLUSH_INTERVAL_MS / 1000,
+            max_queue=settings.EVENT_SINK_MAX_QUEUE,
+            dead_after=settings.EVENT_SINK_RECOVERY_AGE_SECONDS,
+        )
+    _sink.start()
+    return _sink
+
+
+async def stop_event_sink() -> None:
+    """Drain queued events to Postgres; called from the application lifespan at shutdown."""
+    if _sink is not None:
+        await _sink.stop(settings.EVENT_SINK_DRAIN_TIMEOUT_SECONDS)
+
+
+async def recover_learning_events() -> int:
+    """Replay the journals of crashed workers; run by the scheduled task runner."""
+    sink = get_event_sink()
+    if sink is None or not sink.redis_available:
+        return 0
+    try:
+        if not await sink.acquire_recovery_lock(settings.EVENT_SINK_RECOVERY_INTERVAL_SECONDS * 0.9):
+            return 0
+        recovered = await sink.recover()
+    except RedisError as exc:
+        sink._handle_redis_error(exc)
+        return 0
+    if recovered:
+        _LOGGER.warning("Recovered %d learning events from the Redis journal", recovered)
+    return recovered
+
+
+# ---------------------------------------------------------------------
+# Hand-off from request transactions
+# ---------------------------------------------------------------------
+
+
+def emit_learning_event(session: AsyncSession | Session, event: LearningEvent) -> None:
+    """Log ``event`` when ``session`` commits; written inline if the sink isn't available."""
+    sink = get_event_sink()
+    if sink is None or not sink.has_room():
+        session.add(event)
+        return
+    if event.event_timestamp is None:
+        event.event_timestamp = datetime.now(timezone.utc)
+    session.info.setdefault(_PENDING_INFO_KEY, []).append(event)
+
+
+def pending_learning_events(session: Session) -> list[LearningEvent]:
+    """Events emitted in the session's current transaction; other ``after_commit`` hooks may read them."""
+    return session.info.get(_PENDING_INFO_KEY, [])
+
+
+@event.listens_for(Session, "after_commit")
+def _submit_learning_events(session: Session) -> None:
+    events = pending_learning_events(session)
+    if not events:
+        return
+    sink = _sink
+    if sink is None:
+        _LOGGER.error("Dropping %d learning events: no event sink", len(events))
+        return
+    sink.submit_soon([_record(event) for event in events])
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_learning_events(session: Session, transaction) -> None:
+    # after_commit listeners have run by now; a rollback simply discards the events
+    if transaction.parent is None:
+        session.info.pop(_PENDING_INFO_KEY, None)
+
+
+__all__ = [
+    "LearningEventSink",
+    "emit_learning_event",
+    "get_event_sink",
+    "on_learning_events_written",
+    "pending_learning_events",
+    "recover_learning_events",
+    "start_event_sink",
+    "stop_event_sink",
+]
@@ -0,0 +1,720 @@
+"""Leaderboards kept as Redis sorted sets.
+
+Each board is a ZSET of ``user_id -> score``:
+
+* ``leaderboard:xp:all_time`` - ``UserProgress.xp_total`` of active users
+* ``leaderboard:xp:{daily|weekly|monthly}:{start}`` - lesson XP (``user_daily_xp``)
+  in the current UTC day, ISO week or month; keys expire after their period
+* ``...:lang:{code}`` - the same boards, and an all-time board, for one lesson language
+* ``leaderboard:xp:all_time:region:{region}`` - the all-time board per profile region
+* ``leaderboard:challenges`` - challenge streaks, scored so the current streak
+  ranks first and completed challenges break ties
+
+A page is one pipelined ZREVRANGE + ZREVRANK + ZCARD. Friends boards look up the
+friends' scores on the shared board with ZMSCORE rather than keeping a ZSET per
+user, so awarding XP never has to fan out to every follower.
+
+Writes are collected from every ORM flush (new lesson events, ``xp_total``
+changes, region changes, challenge progress, deactivations), plus the lesson
+events the transaction handed to the write-behind event sink, and applied once the
+transaction commits, so each code path that awards XP keeps the boards current.
+``rebuild_leaderboards`` recomputes everything from Postgres on a schedule and
+repairs whatever was missed while Redis was down. Until the first rebuild has
+finished, and while Redis is failing, readers get None and fall back to SQL.
+
+A rebuild reads one Postgres snapshot and renames the new boards over the live
+ones, which would drop updates applied in between. Each update carries the id
+of the transaction that committed it (``txid_current()``) and the rebuild
+records its ``pg_current_snapshot()``. While it runs every update is also
+logged, and once the boards are swapped in only the logged updates its snapshot
+did not see are replayed; an update applied after the swap is skipped when the
+live boards' snapshot already has it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+from typing import Any
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import event, func, inspect, select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.social_models import ChallengeStreak, DailyChallenge
+from app.db.user_models import LearningEvent, User, UserDailyXP, UserProfile, UserProgress
+from app.services.commit_hooks import CommitHook
+from app.services.daily_xp import lesson_xp
+from app.services.event_sink import pending_learning_events
+from app.services.redis_backoff import RedisBackoff
+
+_LOGGER = logging.getLogger("app.services.leaderboards")
+
+PERIODS = ("daily", "weekly", "monthly")
+CHALLENGE_BOARD = "leaderboard:challenges"
+_CHALLENGE_ENTRIES_KEY = "leaderboard:challenges:entries"
+_REGIONS_KEY = "leaderboard:regions"
+_BOARDS_KEY = "leaderboard:boards"
+_READY_KEY = "leaderboard:ready"  # pg_current_snapshot() the live boards were built from
+_REBUILD_LOCK_KEY = "leaderboard:rebuild_lock"
+_REBUILDING_KEY = "leaderboard:rebuilding"
+_REPLAY_KEY_PREFIX = "leaderboard:replay:"
+_REBUILD_MARK_SECONDS = 900
+_STREAK_WEIGHT = 1_000_000  # challenges completed never reach this, so streak always ranks first
+_PERIOD_GRACE = timedelta(days=1)
+_WRITE_CHUNK = 1000
+# Snapshot of a swap that did not come from Postgres: it has seen no transaction
+_EMPTY_SNAPSHOT = "1:1:"
+
+
+def period_start(period: str, now: datetime | None = None) -> datetime:
+    """Start (UTC) of the calendar day, ISO week or month containing ``now``."""
+    now = now or datetime.now(timezone.utc)
+    day = now.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == "daily":
+        return day
+    if period == "weekly":
+        return day - timedelta(days=day.weekday())
+    if period == "monthly":
+        return day.replace(day=1)
+    raise ValueError(f"Unknown leaderboard period: {period}")
+
+
+def _period_end(period: str, start: datetime) -> datetime:
+    if period == "daily":
+        return start + timedelta(days=1)
+    if period == "weekly":
+        return start + timedelta(days=7)
+    return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def xp_board(
+    period: str,
+    language_code: str | None = None,
+    region: str | None = None,
+    now: datetime | None = None,
+) -> str:
+    """Key of the XP board for ``period`` (``all_time`` or one of ``PERIODS``)."""
+    if period == "all_time":
+        key = "leaderboard:xp:all_time"
+    else:
+        key = f"leaderboard:xp:{period}:{period_start(period, now):%Y%m%d}"
+    if language_code:
+        key += f":lang:{language_code}"
+    if region:
+        key += f":region:{region}"
+    return key
+
+
+def _board_expiry(key: str) -> datetime | None:
+    """Expiry of a period board key, None for all-time boards."""
+    parts = key.split(":")
+    if len(parts) < 4 or parts[2] not in PERIODS:
+        return None
+    start = datetime.strptime(parts[3], "%Y%m%d").replace(tzinfo=timezone.utc)
+    return _period_end(parts[2], start) + _PERIOD_GRACE
+
+
+def _normalize_region(region: str | None) -> str | None:
+    return (region or "").strip() or None
+
+
+def _challenge_score(current_streak: int, challenges_completed: int) -> int:
+    return current_streak * _STREAK_WEIGHT + challenges_completed
+
+
+@dataclass(slots=True)
+class BoardPage:
+    """Top of a board plus one user's position on it."""
+
+    entries: list[tuple[int, int]]  # (user_id, score), best first
+    rank: int  # 1-based; users not on the board rank after everyone on it
+    total: int
+    details: list[dict[str, int]] = field(default_factory=list)  # challenge board only, per entry
+
+
+@dataclass(slots=True)
+class LeaderboardUpdates:
+    """Board changes collected from one transaction."""
+
+    lessons: list[tuple[int, int, str | None, datetime]] = field(default_factory=list)
+    xp_totals: dict[int, int] = field(default_factory=dict)
+    regions: dict[int, str | None] = field(default_factory=dict)
+    deactivated: set[int] = field(default_factory=set)
+    challenge_users: set[int] = field(default_factory=set)
+    xid: int | None = None  # txid_current() of the transaction; None when it wasn't read
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.lessons or self.xp_totals or self.regions or self.deactivated or self.challenge_users
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class _Rebuild:
+    """A rebuild in progress: its staging suffix and the Postgres snapshot it reads."""
+
+    token: str
+    snapshot: str = _EMPTY_SNAPSHOT
+
+    @property
+    def replay_key(self) -> str:
+        return _REPLAY_KEY_PREFIX + self.token
+
+
+def _dump_updates(updates: LeaderboardUpdates, challenges: dict[int, dict[str, int]]) -> str:
+    return json.dumps(
+        {
+            "lessons": [
+                (user_id, xp, language_code, awarded_at.isoformat())
+                for user_id, xp, language_code, awarded_at in updates.lessons
+            ],
+            "xp_totals": list(updates.xp_totals.items()),
+            "regions": list(updates.regions.items()),
+            "deactivated": sorted(updates.deactivated),
+            "challenge_users": sorted(updates.challenge_users),
+            "xid": updates.xid,
+            "challenges": list(challenges.items()),
+        }
+    )
+
+
+def _load_updates(raw: str) -> tuple[LeaderboardUpdates, dict[int, dict[str, int]]]:
+    data = json.loads(raw)
+    updates = LeaderboardUpdates(
+        lessons=[
+            (user_id, xp, language_code, datetime.fromisoformat(awarded_at))
+            for user_id, xp, language_code, awarded_at in data["lessons"]
+        ],
+        xp_totals=dict(data["xp_totals"]),
+        regions=dict(data["regions"]),
+        deactivated=set(data["deactivated"]),
+        challenge_users=set(data["challenge_users"]),
+        xid=data["xid"],
+    )
+    return updates, dict(data["challenges"])
+
+
+def _visible_in_snapshot(xid: int, snapshot: str | None) -> bool:
+    """``pg_visible_in_snapshot(xid, snapshot)`` for a committed ``xid``; False for unreadable snapshots."""
+    try:
+        xmin, xmax, xip = (snapshot or "").split(":")
+        if xid < int(xmin):
+            return True
+        return xid < int(xmax) and str(xid) not in xip.split(",")
+    except ValueError:
+        return False  # written by an older release
+
+
+def _challenge_rows_query(user_ids: list[int] | None = None):
+    completed = (
+        select(
+            DailyChallenge.user_id,
+            func.count().label("challenges_completed"),
+            func.sum(DailyChallenge.coin_reward).label("total_rewards"),
+        )
+        .where(DailyChallenge.is_completed == True)  # noqa: E712
+        .group_by(DailyChallenge.user_id)
+    )
+    if user_ids is not None:
+        completed = completed.where(DailyChallenge.user_id.in_(user_ids))
+    completed = completed.subquery()
+    stmt = (
+        select(
+            ChallengeStreak.user_id,
+            ChallengeStreak.current_streak,
+            ChallengeStreak.longest_streak,
+            func.coalesce(completed.c.challenges_completed, 0),
+            func.coalesce(completed.c.total_rewards, 0),
+        )
+        .join(User, User.id == ChallengeStreak.user_id)
+        .outerjoin(completed, completed.c.user_id == ChallengeStreak.user_id)
+        .where(User.is_active == True)  # noqa: E712
+    )
+    if user_ids is not None:
+        stmt = stmt.where(ChallengeStreak.user_id.in_(user_ids))
+    return stmt
+
+
+def _challenge_entry(current_streak, longest_streak, challenges_completed, total_rewards) -> dict[str, int]:
+    return {
+        "current_streak": current_streak or 0,
+        "longest_streak": longest_streak or 0,
+        "challenges_completed": int(challenges_completed or 0),
+        "total_rewards": int(total_rewards or 0),
+    }
+
+
+async def load_board_users(session: AsyncSession, user_ids: list[int]) -> dict[int, tuple[str, int | None]]:
+    """``user_id -> (username, level)`` for the users on a page, in one query."""
+    if not user_ids:
+        return {}
+    result = await session.execute(
+        select(User.id, User.username, UserProgress.level)
+        .outerjoin(UserProgress, UserProgress.user_id == User.id)
+        .where(User.id.in_(user_ids))
+    )
+    return {user_id: (username, level) for user_id, username, level in result.all()}
+
+
+class LeaderboardService(RedisBackoff):
+    """Reads and maintains the Redis leaderboards."""
+
+    _redis_outage_message = "Redis unavailable for leaderboards; using SQL rankings for 60s: %s"
+
+    def __init__(self, redis_url: str):
+        self.redis = aioredis.from_url(redis_url, decode_responses=True)
+        self._apply_lock = asyncio.Lock()
+
+    async def page(self, board: str, user_id: int, limit: int) -> BoardPage | None:
+        """Top ``limit`` entries of ``board`` and ``user_id``'s rank, or None if boards aren't built."""
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.exists(_READY_KEY)
+                pipe.zrevrange(board, 0, limit - 1, withscores=True)
+                pipe.zrevrank(board, user_id)
+                pipe.zcard(board)
+                ready, top, rank, total = await pipe.execute()
+        except RedisError as exc:
+            self._handle_redis_error(exc)
+            return None
+        if not ready:
+            return None
+        return BoardPage(
+            entries=[(int(member), int(score)) for member, score in top],
+            rank=rank + 1 if rank is not None else total + 1,
+            total=total,
+        )
+
+    async def members_page(
+        self, board: str, member_ids: list[int], user_id: int, limit: int
+    ) -> BoardPage | None:
+        """Like :meth:`page`, restricted to ``member_ids`` (a friends board)."""
+        member_ids = list(dict.fromkeys(member_ids))
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.exists(_READY_KEY)
+                pipe.zmscore(board, member_ids)
+                ready, scores = await pipe.execute()
+        except RedisError as exc:
+            self._handle_redis_error(exc)
+            return None
+        if not ready:
+            return None
+        ranked = sorted(
+            ((member, int(score)) for member, score in zip(member_ids, scores) if score is not None),
+            key=lambda entry: (-entry[1], entry[0]),
+        )
+        position = next((index for index, (member, _) in enumerate(ranked) if member == user_id), None)
+        return BoardPage(
+            entries=ranked[:limit],
+            rank=position + 1 if position is not None else len(ranked) + 1,
+            total=len(ranked),
+        )
+
+    async def challenge_page(self, user_id: int, limit: int) -> BoardPage | None:
+        page = await self.page(CHALLENGE_BOARD, user_id, limit)
+        if page is None or not page.entries:
+            return page
+        try:
+            raw = await self.redis.hmget(_CHALLENGE_ENTRIES_KEY, [member for member, _ in page.entries])
+        except RedisError as exc:
+            self._handle_redis_error(exc)
+            return None
+        if any(value is None for value in raw):
+            return None  # entries hash out of step with the board; let SQL answer
+        page.details = [json.loads(value) for value in raw]
+        return page
+
+    async def apply(self, updates: LeaderboardUpdates) -> None:
+        """Apply the board changes of one committed transaction."""
+        async with self._apply_lock:  # keep absolute scores from different commits in commit order
+            try:
+                challenges = await self._load_challenges(updates.challenge_users)
+                await self._apply(updates, challenges)
+            except RedisError as exc:
+                self._handle_redis_error(exc)
+            except SQLAlchemyError as exc:
+                _LOGGER.warning("Could not load challenge standings for leaderboard update: %s", exc)
+
+    @staticmethod
+    async def _load_challenges(user_ids: set[int]) -> dict[int, dict[str, int]]:
+        if not user_ids:
+            return {}
+        from app.db.session import SessionLocal
+
+        async with SessionLocal() as session:
+            result = await session.execute(_challenge_rows_query(sorted(user_ids)))
+            return {row[0]: _challenge_entry(*row[1:]) for row in result.all()}
+
+    async def _apply(self, updates: LeaderboardUpdates, challenges: dict[int, dict[str, int]]) -> None:
+        region_users = sorted(set(updates.xp_totals) | set(updates.regions) | updates.deactivated)
+        moved = [user_id for user_id in updates.regions if user_id not in updates.xp_totals]
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.get(_READY_KEY)
+            pipe.get(_REBUILDING_KEY)
+            if region_users:
+                pipe.hmget(_REGIONS_KEY, region_users)
+            if moved:
+                pipe.zmscore(xp_board("all_time"), moved)
+            ready, rebuilding, *replies = await pipe.execute()
+        if updates.xid is not None and _visible_in_snapshot(updates.xid, ready):
+            return  # the live boards were rebuilt from a snapshot that already has this commit
+        known_regions: dict[int, str | None] = dict(zip(region_users, replies.pop(0))) if region_users else {}
+        moved_scores: dict[int, float | None] = dict(zip(moved, replies.pop(0))) if moved else {}
+        rebuild = _Rebuild(token=json.loads(rebuilding)["token"]) if rebuilding else None
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if rebuild is not None:
+                # The writes below may be renamed away; the swap replays what its snapshot missed
+                pipe.rpush(rebuild.replay_key, _dump_updates(updates, challenges))
+                pipe.expire(rebuild.replay_key, _REBUILD_MARK_SECONDS)
+            for user_id, xp, language_code, awarded_at in updates.lessons:
+                for period in PERIODS:
+                    boards = [xp_board(period, now=awarded_at)]
+                    if language_code:
+                        boards.append(xp_board(period, language_code, now=awarded_at))
+                    for board in boards:
+                        pipe.zincrby(board, xp, user_id)
+                        pipe.expireat(board, _board_expiry(board))
+                        pipe.sadd(_BOARDS_KEY, board)
+                if language_code:
+                    board = xp_board("all_time", language_code)
+                    pipe.zincrby(board, xp, user_id)
+                    pipe.sadd(_BOARDS_KEY, board)
+
+            for user_id, xp_total in updates.xp_totals.items():
+                pipe.zadd(xp_board("all_time"), {user_id: xp_total})
+                region = updates.regions.get(user_id, known_regions.get(user_id))
+                if region:
+                    pipe.zadd(xp_board("all_time", region=region), {user_id: xp_total})
+
+            for user_id, region in updates.regions.items():
+                previous = known_regions.get(user_id)
+                if previous and previous != region:
+                    pipe.zrem(xp_board("all_time", region=previous), user_id)
+                if region:
+                    pipe.hset(_REGIONS_KEY, user_id, region)
+                    score = moved_scores.get(user_id)
+                    if score is not None:
+                        pipe.zadd(xp_board("all_time", region=region), {user_id: score})
+                    pipe.sadd(_BOARDS_KEY, xp_board("all_time", region=region))
+                else:
+                    pipe.hdel(_REGIONS_KEY, user_id)
+
+            for user_id in updates.challenge_users:
+                entry = challenges.get(user_id)
+                if entry is None:
+                    pipe.zrem(CHALLENGE_BOARD, user_id)
+                    pipe.hdel(_CHALLENGE_ENTRIES_KEY, user_id)
+                    continue
+                score = _challenge_score(entry["current_streak"], entry["challenges_completed"])
+                pipe.zadd(CHALLENGE_BOARD, {user_id: score})
+                pipe.hset(_CHALLENGE_ENTRIES_KEY, user_id, json.dumps(entry))
+
+            # Period and language boards of deactivated users are cleaned up by the next rebuild
+            for user_id in updates.deactivated:
+                pipe.zrem(xp_board("all_time"), user_id)
+                if known_regions.get(user_id):
+                    pipe.zrem(xp_board("all_time", region=known_regions[user_id]), user_id)
+                for period in PERIODS:
+                    pipe.zrem(xp_board(period), user_id)
+                pipe.zrem(CHALLENGE_BOARD, user_id)
+                pipe.hdel(_CHALLENGE_ENTRIES_KEY, user_id)
+            await pipe.execute()
+
+    async def is_ready(self) -> bool:
+        return bool(await self.redis.exists(_READY_KEY))
+
+    async def _begin_rebuild(self) -> _Rebuild:
+        """Announce a rebuild so updates applied from now on are logged for replay."""
+        rebuild = _Rebuild(token=uuid.uuid4().hex)
+        await self.redis.set(_REBUILDING_KEY, json.dumps({"token": rebuild.token}), ex=_REBUILD_MARK_SECONDS)
+        return rebuild
+
+    async def rebuild(self, session: AsyncSession) -> int:
+        """Recompute every board from Postgres and swap them in atomically; returns the board count."""
+        rebuild = await self._begin_rebuild()
+        # One snapshot for every query below, taken by this first one after the rebuild was announced
+        await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        rebuild = replace(rebuild, snapshot=await session.scalar(text("SELECT pg_current_snapshot()::text")))
+        now = datetime.now(timezone.utc)
+        boards: dict[str, dict[int, int]] = defaultdict(dict)
+        regions: dict[int, str] = {}
+
+        result = await session.execute(
+            select(UserProgress.user_id, UserProgress.xp_total, UserProfile.region)
+            .join(User, User.id == UserProgress.user_id)
+            .outerjoin(UserProfile, UserProfile.user_id == UserProgress.user_id)
+            .where(User.is_active == True)  # noqa: E712
+        )
+        for user_id, xp_total, region in result.all():
+            boards[xp_board("all_time")][user_id] = xp_total
+            region = _normalize_region(region)
+            if region:
+                regions[user_id] = region
+                boards[xp_board("all_time", region=region)][user_id] = xp_total
+
+        for period in (*PERIODS, "all_time"):
+            stmt = (
+                select(UserDailyXP.user_id, UserDailyXP.language_code, func.sum(UserDailyXP.xp))
+                .join(User, User.id == UserDailyXP.user_id)
+                .where(User.is_active == True)  # noqa: E712
+                .group_by(UserDailyXP.user_id, UserDailyXP.language_code)
+            )
+            if period != "all_time":
+                stmt = stmt.where(UserDailyXP.day >= period_start(period, now).date())
+            result = await session.execute(stmt)
+            period_board = boards[xp_board(period, now=now)] if period != "all_time" else None
+            for user_id, language_code, xp in result.all():
+                if period_board is not None:
+                    period_board[user_id] = period_board.get(user_id, 0) + xp
+                if language_code:
+                    boards[xp_board(period, language_code, now=now)][user_id] = xp
+
+        result = await session.execute(_challenge_rows_query())
+        challenges = {row[0]: _challenge_entry(*row[1:]) for row in result.all()}
+        boards[CHALLENGE_BOARD] = {
+            user_id: _challenge_score(entry["current_streak"], entry["challenges_completed"])
+            for user_id, entry in challenges.items()
+        }
+
+        await self._swap_in(boards, regions, challenges, rebuild)
+        return len(boards)
+
+    async def _swap_in(
+        self,
+        boards: dict[str, dict[int, int]],
+        regions: dict[int, str],
+        challenges: dict[int, dict[str, int]],
+        rebuild: _Rebuild | None = None,
+    ) -> None:
+        rebuild = rebuild or _Rebuild(token=uuid.uuid4().hex)
+        suffix = f":rebuild:{rebuild.token}"
+        hashes = {
+            _REGIONS_KEY: regions,
+            _CHALLENGE_ENTRIES_KEY: {user_id: json.dumps(entry) for user_id, entry in challenges.items()},
+        }
+        staged = [key for key, values in chain(boards.items(), hashes.items()) if values]
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in staged:
+                items = list((hashes[key] if key in hashes else boards[key]).items())
+                for offset in range(0, len(items), _WRITE_CHUNK):
+                    chunk = dict(items[offset : offset + _WRITE_CHUNK])
+                    if key in hashes:
+                        pipe.hset(key + suffix, mapping=chunk)
+                    else:
+                        pipe.zadd(key + suffix, chunk)
+            await pipe.execute()
+
+        previous = await self.redis.smembers(_BOARDS_KEY)
+        xp_boards = [key for key in staged if key.startswith("leaderboard:xp:")]
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.lrange(rebuild.replay_key, 0, -1)
+            pipe.delete(rebuild.replay_key, _REBUILDING_KEY)
+            for key in staged:
+                pipe.rename(key + suffix, key)
+                expiry = _board_expiry(key)
+                if expiry is not None:
+                    pipe.expireat(key, expiry)
+            stale = (previous | {CHALLENGE_BOARD, *hashes}) - set(staged)
+            if stale:
+                pipe.delete(*stale)
+            pipe.delete(_BOARDS_KEY)
+            if xp_boards:
+                pipe.sadd(_BOARDS_KEY, *xp_boards)
+            pipe.set(_READY_KEY, rebuild.snapshot)
+            replay, *_ = await pipe.execute()
+
+        async with self._apply_lock:
+            for raw in replay:  # _apply skips the ones the new snapshot already has
+                await self._apply(*_load_updates(raw))
+
+    async def acquire_rebuild_lock(self, seconds: float) -> bool:
+        """Let one worker per interval rebuild; the lock simply expires."""
+        return bool(await self.redis.set(_REBUILD_LOCK_KEY, "1", nx=True, ex=max(1, int(seconds))))
+
+
+_leaderboards: LeaderboardService | None = None
+
+
+def get_leaderboard_service() -> LeaderboardService | None:
+    """Redis leaderboards, or None when Redis is not configured or currently failing."""
+    global _leaderboards
+    if _leaderboards is None and settings.REDIS_URL:
+        _leaderboards = LeaderboardService(settings.REDIS_URL)
+    if _leaderboards is not None and _leaderboards.redis_available:
+        return _leaderboards
+    return None
+
+
+async def rebuild_leaderboards(force: bool = False) -> int:
+    """Rebuild the boards from Postgres; run by the scheduled task runner.
+
+    Without ``force`` the rebuild is skipped when boards already exist and another
+    worker rebuilt them less than one interval ago.
+    """
+    service = get_leaderboard_service()
+    if service is None:
+        return 0
+    from app.db.session import SessionLocal
+
+    interval = settings.LEADERBOARD_REBUILD_INTERVAL_SECONDS
+    try:
+        if not force and not await service.acquire_rebuild_lock(interval * 0.9):
+            return 0
+        started = time.perf_counter()
+        async with SessionLocal() as session:
+            count = await service.rebuild(session)
+    except RedisError as exc:
+        service._handle_redis_error(exc)
+        return 0
+    _LOGGER.info("Rebuilt %d leaderboards in %.2fs", count, time.perf_counter() - started)
+    return count
+
+
+async def ensure_leaderboards() -> None:
+    """Build the boards at startup if Redis has none yet (e.g. after a flush or restart)."""
+    service = get_leaderboard_service()
+    if service is None:
+        return
+    try:
+        if await service.is_ready():
+            return
+    except RedisError as exc:
+        service._handle_redis_error(exc)
+        return
+    try:
+        await rebuild_leaderboards()
+    except SQLAlchemyError as exc:
+        _LOGGER.warning("Initial leaderboard build failed: %s", exc)
+
+
+# ---------------------------------------------------------------------
+# Incremental updates from ORM flushes
+# ---------------------------------------------------------------------
+
+
+def _changed(obj: Any, attribute: str) -> bool:
+    return inspect(obj).attrs[attribute].history.has_changes()
+
+
+def _lesson_updates(events) -> list[tuple[int, int, str | None, datetime]]:
+    lessons = []
+    for obj in events:
+        if isinstance(obj, LearningEvent) and (awarded := lesson_xp(obj.event_type, obj.data)):
+            xp, language_code = awarded
+            if xp:
+                # event_timestamp may be a server default that isn't loaded yet; don't refresh it
+                awarded_at = inspect(obj).dict.get("event_timestamp") or datetime.now(timezone.utc)
+                lessons.append((obj.user_id, xp, language_code, awarded_at))
+    return lessons
+
+
+def _collect(session: Session) -> LeaderboardUpdates:
+    updates = LeaderboardUpdates(lessons=_lesson_updates(session.new))
+    for obj in session.new:
+        if isinstance(obj, UserProgress):
+            updates.xp_totals[obj.user_id] = obj.xp_total or 0
+        elif isinstance(obj, UserProfile) and _normalize_region(obj.region):
+            updates.regions[obj.user_id] = _normalize_region(obj.region)
+        elif isinstance(obj, ChallengeStreak) or (isinstance(obj, DailyChallenge) and obj.is_completed):
+            updates.challenge_users.add(obj.user_id)
+
+    for obj in session.dirty:
+        if isinstance(obj, UserProgress) and _changed(obj, "xp_total"):
+            updates.xp_totals[obj.user_id] = obj.xp_total
+        elif isinstance(obj, UserProfile) and _changed(obj, "region"):
+            updates.regions[obj.user_id] = _normalize_region(obj.region)
+        elif isinstance(obj, ChallengeStreak) or (
+            isinstance(obj, DailyChallenge) and _changed(obj, "is_completed")
+        ):
+            updates.challenge_users.add(obj.user_id)
+        elif isinstance(obj, User) and _changed(obj, "is_active") and not obj.is_active:
+            updates.deactivated.add(obj.id)
+
+    for obj in session.deleted:
+        if isinstance(obj, User):
+            updates.deactivated.add(obj.id)
+    return updates
+
+
+def _transaction_xid(session: Session) -> int | None:
+    """txid_current(), so a racing rebuild can tell whether its snapshot has this commit."""
+    pending = _updates.pending(session)
+    if pending is not None and pending.xid is not None:
+        return pending.xid
+    if get_leaderboard_service() is None:
+        return None
+    try:
+        return session.connection().scalar(text("SELECT txid_current()"))
+    except SQLAlchemyError as exc:
+        # Without it the update counts as unseen by every snapshot and a racing rebuild may replay it
+        _LOGGER.debug("Could not read the transaction id for leaderboard updates: %s", exc)
+        return None
+
+
+def _collect_leaderboard_updates(session: Session) -> LeaderboardUpdates | None:
+    if not settings.REDIS_URL:
+        return None
+    updates = _collect(session)
+    if updates:
+        updates.xid = _transaction_xid(session)
+    return updates
+
+
+def _merge_updates(pending: LeaderboardUpdates, updates: LeaderboardUpdates) -> None:
+    pending.lessons.extend(updates.lessons)
+    pending.xp_totals.update(updates.xp_totals)
+    pending.regions.update(updates.regions)
+    pending.deactivated |= updates.deactivated
+    pending.challenge_users |= updates.challenge_users
+    if pending.xid is None:
+        pending.xid = updates.xid
+
+
+def _apply_leaderboard_updates(session: Session, updates: LeaderboardUpdates) -> None:
+    service = get_leaderboard_service()
+    if service is not None:
+        _updates.spawn(service.apply(updates))  # scripts and migrations are picked up by the next rebuild
+
+
+_updates: CommitHook[LeaderboardUpdates] = CommitHook(
+    "leaderboard_updates",
+    collect=_collect_leaderboard_updates,
+    merge=_merge_updates,
+    on_commit=_apply_leaderboard_updates,
+)
+
+
+@event.listens_for(Session, "before_commit")
+def _collect_sink_lessons(session: Session) -> None:
+    # Sink events never reach session.new; their XP reaches user_daily_xp through a plain statement
+    if settings.REDIS_URL and (lessons := _lesson_updates(pending_learning_events(session))):
+        _updates.add(session, LeaderboardUpdates(lessons=lessons, xid=_transaction_xid(session)))
+
+
+__all__ = [
+    "BoardPage",
+    "CHALLENGE_BOARD",
+    "LeaderboardService",
+    "LeaderboardUpdates",
+    "PERIODS",
+    "ensure_leaderboards",
+    "get_leaderboard_service",
+    "load_board_users",
+    "period_start",
+    "rebuild_leaderboards",
+    "xp_board",
+]
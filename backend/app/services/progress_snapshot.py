@@ -0,0 +1,231 @@
+"""Per-user progress snapshots for the home screen.
+
+``GET /gamification/users/{id}/progress`` and ``GET /progress/me`` load the
+progress row, the user's achievements and a week of learning events. Their
+response bodies are cached per user and view with an ETag, so a repeat open is
+one cache read and a client sending If-None-Match gets a 304.
+
+Snapshots live in Redis when REDIS_URL is set (shared by workers) and in this
+process otherwise. Committing a change to a user's UserProgress, UserAchievement
+or learning events bumps that user's version; bodies built for an older version
+are ignored, so a snapshot that was being built while the write committed is
+never served. Events logged through the write-behind event sink reach
+learning_event a flush interval after that commit, so the users of each written
+batch are bumped again once its COPY commits. Snapshots also lapse at the end
+of the UTC day (the weekly window moves) and after PROGRESS_SNAPSHOT_TTL_SECONDS,
+which also bounds how long a version bump lost to a Redis outage can leave a
+stale body. While Redis is unreachable nothing is cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Iterable
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.user_models import LearningEvent, UserAchievement, UserProgress
+from app.services.commit_hooks import CommitHook
+from app.services.event_sink import EventRecord, on_learning_events_written, pending_learning_events
+from app.services.redis_backoff import RedisBackoff
+
+_KEY_PREFIX = "progress_snapshot:"
+_VERSION_FIELD = "v"
+
+
+@dataclass(slots=True, frozen=True)
+class ProgressSnapshot:
+    body: dict[str, Any]
+    etag: str
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """Whether an If-None-Match header already names this snapshot."""
+        return bool(if_none_match) and (if_none_match.strip() == "*" or self.etag in if_none_match)
+
+
+def snapshot_etag(body: dict[str, Any]) -> str:
+    payload = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+    return '"' + hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def _today() -> str:
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+class ProgressSnapshotCache(RedisBackoff):
+    """Snapshot bodies keyed by user and view, in Redis when configured or in this process."""
+
+    _redis_outage_message = "Redis unavailable for progress snapshots; serving uncached for 60s: %s"
+
+    def __init__(self, redis_url: str | None = None):
+        self.redis = aioredis.from_url(redis_url, decode_responses=True) if redis_url else None
+        # user_id -> {"v": version, view: entry}; used only without Redis
+        self._local: OrderedDict[int, dict[str, Any]] = OrderedDict()
+
+    async def get(self, user_id: int, view: str) -> tuple[ProgressSnapshot | None, int | None]:
+        """The current snapshot (or None) and the version to store a rebuilt one under.
+
+        The version is None when nothing may be cached right now (Redis is down).
+        """
+        if self.redis is None:
+            record = self._local.get(user_id) or {}
+            version, entry = record.get(_VERSION_FIELD, 0), record.get(view)
+            if user_id in self._local:
+                self._local.move_to_end(user_id)
+        elif not self.redis_available:
+            return None, None
+        else:
+            try:
+                raw_version, raw_entry = await self.redis.hmget(
+                    _KEY_PREFIX + str(user_id), _VERSION_FIELD, view
+                )
+            except RedisError as exc:
+                self._handle_redis_error(exc)
+                return None, None
+            version, entry = int(raw_version or 0), json.loads(raw_entry) if raw_entry else None
+        if (
+            entry is None
+            or entry["v"] != version
+            or entry["day"] != _today()
+            or entry["expires_at"] <= time.time()
+        ):
+            return None, version
+        return ProgressSnapshot(body=entry["body"], etag=entry["etag"]), version
+
+    async def put(self, user_id: int, view: str, version: int, body: dict[str, Any]) -> ProgressSnapshot:
+        snapshot = ProgressSnapshot(body=body, etag=snapshot_etag(body))
+        ttl = settings.PROGRESS_SNAPSHOT_TTL_SECONDS
+        entry = {
+            "v": version,
+            "day": _today(),
+            "expires_at": time.time() + ttl,
+            "etag": snapshot.etag,
+            "body": body,
+        }
+        if self.redis is None:
+            self._local.setdefault(user_id, {_VERSION_FIELD: 0})[view] = entry
+            self._local.move_to_end(user_id)
+            while len(self._local) > settings.PROGRESS_SNAPSHOT_LOCAL_MAX_USERS:
+                self._local.popitem(last=False)
+            return snapshot
+        if not self.redis_available:
+            return snapshot
+        key = _KEY_PREFIX + str(user_id)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, view, json.dumps(entry, default=str))
+                pipe.expire(key, ttl)
+                await pipe.execute()
+        except RedisError as exc:
+            self._handle_redis_error(exc)
+        return snapshot
+
+    def invalidate_local(self, user_ids: Iterable[int]) -> None:
+        for user_id in user_ids:
+            record = self._local.get(user_id)
+            # Keep the bumped version so a body built from the old data is rejected
+            version = record[_VERSION_FIELD] + 1 if record else 1
+            self._local[user_id] = {_VERSION_FIELD: version}
+            self._local.move_to_end(user_id)
+
+    async def invalidate(self, user_ids: Iterable[int]) -> None:
+        """Bump the shared versions of ``user_ids``."""
+        if self.redis is None:
+            self.invalidate_local(user_ids)
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for user_id in user_ids:
+                    key = _KEY_PREFIX + str(user_id)
+                    pipe.hincrby(key, _VERSION_FIELD, 1)
+                    pipe.expire(key, settings.PROGRESS_SNAPSHOT_TTL_SECONDS)
+                await pipe.execute()
+        except RedisError as exc:
+            self._handle_redis_error(exc)
+
+
+_cache: ProgressSnapshotCache | None = None
+
+
+def get_progress_snapshot_cache() -> ProgressSnapshotCache:
+    global _cache
+    if _cache is None:
+        _cache = ProgressSnapshotCache(settings.REDIS_URL)
+    return _cache
+
+
+async def progress_snapshot(
+    user_id: int, view: str, build: Callable[[], Awaitable[dict[str, Any]]]
+) -> ProgressSnapshot:
+    """The cached ``view`` snapshot for ``user_id``, calling ``build`` for the body on a miss."""
+    # Let this worker's own commits land first so it never serves what it just changed
+    await _snapshot_users.wait()
+    cache = get_progress_snapshot_cache()
+    snapshot, version = await cache.get(user_id, view)
+    if snapshot is not None:
+        return snapshot
+    body = await build()
+    if version is None:
+        return ProgressSnapshot(body=body, etag=snapshot_etag(body))
+    return await cache.put(user_id, view, version, body)
+
+
+# ---------------------------------------------------------------------
+# Invalidation from ORM flushes
+# ---------------------------------------------------------------------
+
+
+_TRACKED = (UserProgress, UserAchievement, LearningEvent)
+
+
+def _collect_users(session: Session) -> set[int]:
+    return {
+        obj.user_id
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(obj, _TRACKED) and obj.user_id is not None
+    }
+
+
+def _invalidate_snapshots(session: Session, users: set[int]) -> None:
+    cache = get_progress_snapshot_cache()
+    if cache.redis is None:
+        cache.invalidate_local(users)
+    else:
+        _snapshot_users.spawn(cache.invalidate(users))
+
+
+_snapshot_users: CommitHook[set[int]] = CommitHook(
+    "progress_snapshot_users", collect=_collect_users, merge=set.update, on_commit=_invalidate_snapshots
+)
+
+
+@event.listens_for(Session, "before_commit")
+def _collect_sink_event_users(session: Session) -> None:
+    # Events handed to the write-behind sink never reach session.new
+    _snapshot_users.add(
+        session, {learning_event.user_id for learning_event in pending_learning_events(session)}
+    )
+
+
+@on_learning_events_written
+async def _invalidate_written_events(records: list[EventRecord]) -> None:
+    # A snapshot read between the commit and the flush was built without these events
+    await get_progress_snapshot_cache().invalidate({record[0] for record in records})
+
+
+__all__ = [
+    "ProgressSnapshot",
+    "ProgressSnapshotCache",
+    "get_progress_snapshot_cache",
+    "progress_snapshot",
+    "snapshot_etag",
+]
@@ -0,0 +1,42 @@
+"""Outage handling shared by the services that keep state in an optional Redis.
+
+After a Redis error a service stops calling Redis for REDIS_RETRY_SECONDS and
+uses its fallback (SQL, a local copy, the database counters), so an outage costs
+one failed call per worker and minute instead of one per request. One warning is
+logged per window, from the service's own module logger.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+REDIS_RETRY_SECONDS = 60.0
+
+
+class RedisBackoff:
+    """Mixin for a service with an optional ``redis`` client.
+
+    Subclasses set ``_redis_outage_message``, a %-format for the warning that
+    receives the error.
+    """
+
+    redis: Any = None
+    _redis_outage_message = "Redis unavailable; retrying in 60s: %s"
+    _disabled_until = 0.0
+    _last_error_logged = 0.0
+
+    @property
+    def redis_available(self) -> bool:
+        return self.redis is not None and time.monotonic() >= self._disabled_until
+
+    def _handle_redis_error(self, exc: Exception) -> None:
+        now = time.monotonic()
+        self._disabled_until = now + REDIS_RETRY_SECONDS
+        if now - self._last_error_logged >= REDIS_RETRY_SECONDS:
+            logging.getLogger(type(self).__module__).warning(self._redis_outage_message, exc)
+            self._last_error_logged = now
+
+
+__all__ = ["REDIS_RETRY_SECONDS", "RedisBackoff"]
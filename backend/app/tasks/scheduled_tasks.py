@@ -3,6 +3,12 @@
 This module handles:
 - Daily streak shield auto-use for users who miss challenges
 - Weekly challenge expiry and regeneration
+- Lesson audio cache eviction
+- Demo usage counter flush from Redis to the database
+- Leaderboard rebuilds from the database into Redis
+- Achievement rarity snapshot refresh
+- Replay of learning events left in the Redis journal by crashed workers
+- Monthly learning_event partition creation and retention
 """
 
 import asyncio
@@ -11,9 +17,19 @@ from datetime import datetime, timedelta
 
 from sqlalchemy import select
 
+from app.core.config import settings
 from app.db.session import SessionLocal
 from app.db.social_models import DailyChallenge, WeeklyChallenge
 from app.db.user_models import User
+from app.lesson.audio_cache import audio_renderer
+from app.services.achievement_rarity import refresh_achievement_rarity
+from app.services.demo_usage import flush_demo_usage
+from app.services.event_partitions import (
+    ensure_learning_event_partitions,
+    maintain_learning_event_partitions,
+)
+from app.services.event_sink import recover_learning_events
+from app.services.leaderboards import ensure_leaderboards, rebuild_leaderboards
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +60,59 @@ class ScheduledTaskRunner:
             asyncio.create_task(self._run_weekly_task(self.cleanup_expired_challenges, weekday=0, hour=0))
         )
 
+        # Start audio cache eviction (runs every AUDIO_CACHE_EVICT_INTERVAL_SECONDS)
+        self._tasks.append(
+            asyncio.create_task(
+                self._run_interval_task(
+                    audio_renderer.run_maintenance, seconds=settings.AUDIO_CACHE_EVICT_INTERVAL_SECONDS
+                )
+            )
+        )
+
+        # Create upcoming learning_event partitions now and daily, retiring expired months
+        self._tasks.append(asyncio.create_task(ensure_learning_event_partitions()))
+        self._tasks.append(
+            asyncio.create_task(self._run_daily_task(maintain_learning_event_partitions, hour=1, minute=0))
+        )
+
+        # Recompute achievement rarity (unlocks between refreshes are counted as they commit)
+        self._tasks.append(
+            asyncio.create_task(
+                self._run_interval_task(
+                    refresh_achievement_rarity, seconds=settings.ACHIEVEMENT_RARITY_REFRESH_SECONDS
+                )
+            )
+        )
+
+        # Copy Redis demo usage counters into demo_api_usage for reporting
+        if settings.REDIS_URL:
+            self._tasks.append(
+                asyncio.create_task(
+                    self._run_interval_task(
+                        flush_demo_usage, seconds=settings.DEMO_USAGE_FLUSH_INTERVAL_SECONDS
+                    )
+                )
+            )
+
+            # Build the Redis leaderboards if missing, then repair them from Postgres periodically
+            self._tasks.append(asyncio.create_task(ensure_leaderboards()))
+            self._tasks.append(
+                asyncio.create_task(
+                    self._run_interval_task(
+                        rebuild_leaderboards, seconds=settings.LEADERBOARD_REBUILD_INTERVAL_SECONDS
+                    )
+                )
+            )
+
+            # Write learning events that a crashed worker journaled but never flushed
+            self._tasks.append(
+                asyncio.create_task(
+                    self._run_interval_task(
+                        recover_learning_events, seconds=settings.EVENT_SINK_RECOVERY_INTERVAL_SECONDS
+                    )
+                )
+            )
+
         logger.info(f"Started {len(self._tasks)} scheduled tasks")
 
     async def stop(self):
@@ -108,6 +177,18 @@ class ScheduledTaskRunner:
                 logger.error(f"Error in weekly task {task_func.__name__}: {e}", exc_info=True)
                 await asyncio.sleep(3600)  # Wait 1 hour before retry
 
+    async def _run_interval_task(self, task_func, seconds: float):
+        """Run a task every ``seconds``, starting one interval after startup."""
+        while self._running:
+            try:
+                await asyncio.sleep(seconds)
+                await task_func()
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in interval task {task_func.__name__}: {e}", exc_info=True)
+
     async def check_streak_freezes(self):
         """Check for broken streaks and auto-use streak shields if available.
 
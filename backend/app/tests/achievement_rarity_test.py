@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.user_models import UserAchievement
+from app.services import achievement_rarity
+from app.services.achievement_rarity import AchievementRarity, RaritySnapshot
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+def _counting_session(active_users: int, rows: list[tuple]) -> tuple[AsyncSession, list]:
+    session = AsyncSession()
+    scans = []
+
+    async def scalar(statement, *args, **kwargs):
+        scans.append(statement)
+        return active_users
+
+    async def execute(statement, *args, **kwargs):
+        return _Result(rows)
+
+    session.scalar = scalar
+    session.execute = execute
+    return session, scans
+
+
+@pytest.fixture
+def rarity():
+    service = AchievementRarity("redis://localhost:6379/0")
+    service.redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    return service
+
+
+def test_snapshot_percentages_skip_unearned_achievements():
+    snapshot = RaritySnapshot(counts={"milestone:xp_100": 5, "milestone:xp_500": 0}, active_users=20)
+
+    assert snapshot.percentages() == {"milestone:xp_100": 25.0}
+    assert snapshot.percent("milestone:xp_500") == 0.0
+    assert RaritySnapshot(counts={}, active_users=0).percent("milestone:xp_100") is None
+
+
+@pytest.mark.asyncio
+async def test_requests_scan_once_and_workers_share_the_snapshot(rarity):
+    session, scans = _counting_session(10, [("milestone", "xp_100", 4)])
+
+    assert (await rarity.get(session)).percent("milestone:xp_100") == 40.0
+    assert (await rarity.get(session)).percent("milestone:xp_100") == 40.0
+    assert len(scans) == 1
+
+    other_worker = AchievementRarity("redis://localhost:6379/0")
+    other_worker.redis = rarity.redis
+    assert (await other_worker.get(session)).counts == {"milestone:xp_100": 4}
+    assert len(scans) == 1
+
+
+@pytest.mark.asyncio
+async def test_committed_unlocks_increment_local_and_shared_counts(rarity):
+    await rarity.refresh(_counting_session(10, [("milestone", "xp_100", 4)])[0])
+
+    session = Session()
+    session.add_all(
+        [
+            UserAchievement(user_id=1, achievement_type="milestone", achievement_id="xp_100"),
+            UserAchievement(user_id=2, achievement_type="milestone", achievement_id="xp_500"),
+        ]
+    )
+    unlocks = achievement_rarity._collect_unlocks(session)
+    rarity.record_unlocks(unlocks)
+    await rarity.publish_unlocks(unlocks)
+
+    assert rarity.snapshot.counts == {"milestone:xp_100": 5, "milestone:xp_500": 1}
+    assert await rarity.redis.hgetall("achievement_rarity:counts") == {
+        "milestone:xp_100": "5",
+        "milestone:xp_500": "1",
+    }
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.seed_achievements import (
+    CRITERIA_INDEX,
+    LANGUAGE_LESSONS_STAT,
+    check_and_unlock_achievements,
+    record_language_lesson,
+)
+from app.db.user_models import UserProgress
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+def _recording_session(rows_per_call: list[list]) -> tuple[AsyncSession, list]:
+    session = AsyncSession()
+    statements = []
+
+    async def execute(statement, *args, **kwargs):
+        statements.append(statement)
+        return _Result(rows_per_call[len(statements) - 1])
+
+    session.execute = execute
+    return session, statements
+
+
+def _ids(achievements) -> list[str]:
+    return [achievement.achievement_id for achievement in achievements]
+
+
+def test_index_returns_only_thresholds_the_value_reaches():
+    assert _ids(CRITERIA_INDEX["xp_total"].reachable(600)) == ["xp_100", "xp_500"]
+    assert _ids(CRITERIA_INDEX["completion_time_seconds"].reachable(90)) == ["speed_demon"]
+    assert _ids(CRITERIA_INDEX["language_lessons:grc-cls"].reachable(9)) == []
+
+
+@pytest.mark.asyncio
+async def test_only_reachable_achievements_are_checked_and_unlocked():
+    session, statements = _recording_session([[("milestone", "xp_100")]])
+    session.add = lambda obj: None
+    progress_data = {
+        "total_lessons": 0,
+        "xp_total": 600,
+        "language": "grc-cls",
+        "language_lessons": {"grc-cls": 10, "lat": 2},
+        "completion_time_seconds": 300,
+        "lesson_timestamp": datetime(2026, 10, 14, 12, 0, tzinfo=timezone.utc),  # a Wednesday noon
+    }
+
+    unlocked = await check_and_unlock_achievements(session, 7, progress_data)
+
+    assert len(statements) == 1  # no learning event scan when counters are supplied
+    queried = statements[0].compile().params["achievement_id_1"]
+    assert sorted(queried) == ["greek_beginner", "polyglot_2", "xp_100", "xp_500"]
+    assert sorted(achievement.achievement_id for achievement in unlocked) == [
+        "greek_beginner",
+        "polyglot_2",
+        "xp_500",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_mixed_language_batch_checks_every_language_and_lesson_time():
+    session, statements = _recording_session([[]])
+    session.add = lambda obj: None
+    progress_data = {
+        "total_lessons": 11,
+        "language": "lat",  # the batch's last lesson
+        "language_lessons": {"grc-cls": 10, "lat": 1},
+        "lesson_timestamp": datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc),  # a Monday noon
+        "lesson_timestamps": [
+            datetime(2026, 10, 17, 6, 30, tzinfo=timezone.utc),  # a Saturday morning
+            datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc),
+        ],
+    }
+
+    unlocked = await check_and_unlock_achievements(session, 7, progress_data)
+
+    assert {"greek_beginner", "early_bird", "weekend_warrior"} <= set(_ids(unlocked))
+    assert "night_owl" not in _ids(unlocked)
+
+
+@pytest.mark.asyncio
+async def test_language_counters_are_seeded_once_then_incremented():
+    progress = UserProgress(user_id=7, stats={})
+    session, statements = _recording_session([[("lat", 4)]])
+
+    assert await record_language_lesson(session, progress, "grc-cls") == {"lat": 4, "grc-cls": 1}
+    assert await record_language_lesson(session, progress, "lat") == {"lat": 5, "grc-cls": 1}
+    assert len(statements) == 1
+    assert progress.stats[LANGUAGE_LESSONS_STAT] == {"lat": 5, "grc-cls": 1}
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from app.lesson.audio_cache import AudioRenderService
+from app.tts.providers.base import TTSAudioResult
+
+
+@pytest.fixture
+def synth_calls(monkeypatch):
+    calls: list[str] = []
+
+    async def fake_synthesize(request, token):
+        calls.append(request.text)
+        await asyncio.sleep(0.01)
+        return (
+            TTSAudioResult(
+                audio=b"RIFF" + request.text.encode(), mime="audio/wav", model="echo", sample_rate=22050
+            ),
+            "echo",
+            None,
+        )
+
+    monkeypatch.setattr("app.tts.service.synthesize", fake_synthesize)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_render_once(tmp_path, synth_calls):
+    service = AudioRenderService(cache_dir=tmp_path, max_concurrency=2)
+
+    urls = await asyncio.gather(*(service.get_url(text="χαῖρε", language="grc-cls") for _ in range(5)))
+
+    assert synth_calls == ["χαῖρε"]
+    assert len(set(urls)) == 1 and urls[0].endswith(".wav")
+    assert (tmp_path / urls[0].removeprefix("/audio/")).read_bytes() == "RIFFχαῖρε".encode()
+    assert service.stats()["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_render_many_aligns_results_and_reuses_existing_files(tmp_path, synth_calls):
+    first = AudioRenderService(cache_dir=tmp_path, max_concurrency=1)
+    urls = await first.render_many(["a", "b", "a"], language="lat")
+    assert urls[0] == urls[2] and urls[0] != urls[1]
+    assert sorted(synth_calls) == ["a", "b"]
+
+    # A fresh service (e.g. another worker) finds the files via its directory index.
+    second = AudioRenderService(cache_dir=tmp_path, max_concurrency=1)
+    assert await second.render_many(["b", "a"], language="lat") == [urls[1], urls[0]]
+    assert sorted(synth_calls) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_maintenance_shards_legacy_files_and_evicts_least_recently_used(tmp_path, synth_calls):
+    (tmp_path / "0123456789abcdef.wav").write_bytes(b"x" * 40)
+    service = AudioRenderService(cache_dir=tmp_path, max_concurrency=1, max_bytes=100, max_age_seconds=3600)
+
+    old, recent = await service.render_many(["old phrase", "recent phrase"], language="lat")
+    await service.get_url(text="recent phrase", language="lat")
+    assert (tmp_path / "01" / "0123456789abcdef.wav").exists()
+    assert old.count("/") == 3  # /audio/<shard>/<key>.wav
+
+    service._index["0123456789abcdef"].last_access = 0  # expired legacy file
+    service._index[old.rsplit("/", 1)[1].split(".")[0]].last_access -= 60
+    (tmp_path / "zz").mkdir()
+    (tmp_path / "zz" / "zz00000000000000.wav").write_bytes(b"y" * 60)  # written by another worker
+
+    stats = await service.run_maintenance()
+
+    assert not (tmp_path / "01" / "0123456789abcdef.wav").exists()
+    assert not (tmp_path / old.removeprefix("/audio/")).exists()
+    assert (tmp_path / recent.removeprefix("/audio/")).exists()
+    assert stats["total_bytes"] <= 90 and stats["evicted"] == 2
+    assert stats["hits"] == 1 and stats["misses"] == 2
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    assert set(manifest["entries"]) == set(service._index)
+
+
+@pytest.mark.asyncio
+async def test_files_removed_by_another_worker_are_rendered_again(tmp_path, synth_calls):
+    service = AudioRenderService(cache_dir=tmp_path, max_concurrency=1)
+    url = await service.get_url(text="salve", language="lat")
+
+    (tmp_path / url.removeprefix("/audio/")).unlink()  # evicted elsewhere
+
+    assert await service.get_url(text="salve", language="lat") == url
+    assert synth_calls == ["salve", "salve"]
+    assert (tmp_path / url.removeprefix("/audio/")).exists()
+
+
+@pytest.mark.asyncio
+async def test_an_unreadable_cache_directory_yields_no_audio(tmp_path, synth_calls):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_bytes(b"")
+    service = AudioRenderService(cache_dir=blocker, max_concurrency=1)
+
+    assert await service.get_url(text="salve", language="lat") is None
+    assert synth_calls == []
+
+
+def test_scan_skips_files_another_worker_moves_first(tmp_path, monkeypatch):
+    from app.lesson import audio_cache
+
+    (tmp_path / "0123456789abcdef.wav").write_bytes(b"x")
+    (tmp_path / "fedcba9876543210.wav").write_bytes(b"y")
+    replace = audio_cache.os.replace
+
+    def racing_replace(source, target):
+        if "0123" in str(source):
+            replace(source, target)  # the other worker wins
+        replace(source, target)
+
+    monkeypatch.setattr(audio_cache.os, "replace", racing_replace)
+
+    assert set(audio_cache._scan_cache_dir(tmp_path)) == {"fedcba9876543210"}
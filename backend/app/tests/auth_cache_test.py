@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.user_models import User
+from app.security.auth_cache import RevocationSet, UserPrincipalCache
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+    def scalar_one_or_none(self):
+        return self._rows[0] if self._rows else None
+
+
+def _recording_session(rows_per_call: list[list]) -> tuple[AsyncSession, list]:
+    session = AsyncSession()
+    statements = []
+
+    async def execute(statement, *args, **kwargs):
+        statements.append(statement)
+        return _Result(rows_per_call[len(statements) - 1])
+
+    session.execute = execute
+    return session, statements
+
+
+@pytest.mark.asyncio
+async def test_revocations_sync_incrementally_and_drop_expired_tokens():
+    now = datetime.now(timezone.utc)
+    session, statements = _recording_session(
+        [
+            [(1, "jti-old", now + timedelta(hours=1)), (2, "jti-expired", now - timedelta(seconds=1))],
+            [(3, "jti-new", now + timedelta(hours=1))],
+        ]
+    )
+    revoked = RevocationSet(sync_seconds=3600)
+
+    assert await revoked.is_revoked("jti-old", session)
+    assert not await revoked.is_revoked("jti-new", session)
+    assert not await revoked.is_revoked("jti-expired", session)  # expired entries are pruned
+    assert len(statements) == 1  # further checks are answered in-process
+
+    revoked.add("jti-local", now + timedelta(hours=1))
+    assert await revoked.is_revoked("jti-local", session)
+
+    revoked._next_sync = 0.0  # sync interval elapsed
+    revoked._seen[0] = (revoked._seen[0][0] - 120, 2)  # the first sync is older than the overlap window
+    assert await revoked.is_revoked("jti-new", session)
+    assert len(statements) == 2
+    assert statements[1].compile().params["id_1"] == 2  # only rows above what that sync had seen
+
+
+@pytest.mark.asyncio
+async def test_revocations_committed_out_of_id_order_are_not_skipped(monkeypatch):
+    from app.security import auth_cache
+
+    clock = [1000.0]
+    monkeypatch.setattr(auth_cache.time, "monotonic", lambda: clock[0])
+    expires = datetime.now(timezone.utc) + timedelta(hours=1)
+    session, statements = _recording_session(
+        [
+            [(2, "jti-b", expires)],  # row 1 is inserted but not committed yet
+            [(1, "jti-a", expires), (2, "jti-b", expires)],
+            [(3, "jti-c", expires)],
+            [(1, "jti-a", expires), (2, "jti-b", expires), (3, "jti-c", expires)],
+        ]
+    )
+    revoked = RevocationSet(sync_seconds=5)
+
+    assert not await revoked.is_revoked("jti-a", session)
+    clock[0] += 10
+    assert await revoked.is_revoked("jti-a", session)  # re-read although id 1 < the highest seen id
+    clock[0] += 90
+    assert await revoked.is_revoked("jti-c", session)
+    clock[0] += 600
+    await revoked.sync(session)
+
+    since = [statement.compile().params["id_1"] for statement in statements]
+    assert since == [0, 0, 2, 0]  # the last is the periodic full sync
+
+
+@pytest.mark.asyncio
+async def test_user_cache_hit_attaches_user_without_querying():
+    cache = UserPrincipalCache(ttl_seconds=60)
+    stored = User(id=5, username="reader", email="r@example.com", hashed_password="x", is_active=True)
+    session, statements = _recording_session([[stored]])
+
+    assert (await cache.get(session, 5)) is stored
+    request_session, request_statements = _recording_session([])
+    cached = await cache.get(request_session, 5)
+
+    assert request_statements == [] and len(statements) == 1
+    assert cached is not stored and cached in request_session
+    assert (cached.id, cached.username, cached.is_active) == (5, "reader", True)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.invalidate(5)
+    assert 5 not in cache._entries
+
+
+def test_user_updates_invalidate_the_cache_when_they_commit(monkeypatch):
+    from sqlalchemy.orm import Session
+
+    from app.security import auth_cache
+
+    cache = UserPrincipalCache(ttl_seconds=60)
+    monkeypatch.setattr(auth_cache, "user_principals", cache)
+    user = User(id=5, username="reader", email="r@example.com", hashed_password="x", is_active=True)
+    cache.put(user)
+    session = Session()
+    session.add(user)
+
+    auth_cache._collect_changed_user(None, None, user)  # flushed, not committed
+    assert 5 in cache._entries
+    auth_cache._invalidate_changed_users(session)
+    assert 5 not in cache._entries and cache._generation == 1
@@ -6,12 +6,13 @@ from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 
 from app.core.config import settings
-from app.middleware.csrf import csrf_middleware
+from app.middleware.csrf import csrf_stage
+from app.middleware.pipeline import RequestPipelineMiddleware
 
 
 def _build_app() -> FastAPI:
     app = FastAPI()
-    app.middleware("http")(csrf_middleware)
+    app.add_middleware(RequestPipelineMiddleware, stages=[csrf_stage])
 
     @app.get("/bootstrap")
     def bootstrap():
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.exc import OperationalError
+
+from app.core.config import settings
+from app.db.user_models import DemoAPIUsage
+from app.services import demo_usage
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis needs lupa to run Lua scripts
+
+
+@pytest.fixture
+def counters(monkeypatch):
+    backend = demo_usage.RedisDemoUsageCounters("redis://localhost:6379/0")
+    backend.redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    backend._sync_script = backend.redis.register_script(demo_usage._SYNC_LUA)
+    monkeypatch.setattr(demo_usage, "_demo_counters", backend)
+    monkeypatch.setattr(settings, "DEMO_DAILY_REQUEST_LIMIT", 3)
+    return backend
+
+
+class _UnavailableSession:
+    async def execute(self, *args, **kwargs):
+        raise OperationalError("SELECT", {}, Exception("database down"))
+
+
+class _StoredRowSession:
+    """Answers the usage-row lookup with ``row``."""
+
+    def __init__(self, row=None):
+        self.row = row
+
+    async def execute(self, *args, **kwargs):
+        return self
+
+    def scalar_one_or_none(self):
+        return self.row
+
+
+def _stored_row(requests_today: int, requests_this_week: int) -> DemoAPIUsage:
+    return DemoAPIUsage(
+        user_id=7,
+        provider="openai",
+        requests_today=requests_today,
+        tokens_today=0,
+        daily_reset_at=demo_usage._get_next_daily_reset(),
+        requests_this_week=requests_this_week,
+        tokens_this_week=0,
+        weekly_reset_at=demo_usage._get_next_weekly_reset(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_redis_counters_enforce_the_daily_limit(counters):
+    session = _StoredRowSession()
+    for _ in range(3):
+        allowed, _ = await demo_usage.check_rate_limit(session, "openai", user_id=7)
+        assert allowed
+        await demo_usage.record_usage(None, "openai", user_id=7, tokens_used=10)
+
+    with pytest.raises(demo_usage.DemoUsageExceeded) as exc_info:
+        await demo_usage.check_rate_limit(session, "openai", user_id=7)
+    assert exc_info.value.reset_at == demo_usage._get_next_daily_reset()
+
+    counts = await counters.read("user:7", "openai")
+    assert (counts.requests_today, counts.tokens_today, counts.requests_this_week) == (3, 30, 3)
+    assert await demo_usage.check_rate_limit(session, "openai", ip_address="203.0.113.7") == (
+        True,
+        await counters.read("ip:203.0.113.7", "openai"),
+    )
+    assert await counters.redis.smembers(demo_usage._DIRTY_KEY) == {"user:7|openai"}
+
+    daily_key, weekly_key = counters._keys(
+        "user:7", "openai", demo_usage._get_next_daily_reset(), demo_usage._get_next_weekly_reset()
+    )
+    assert await counters.redis.expiretime(daily_key) == int(demo_usage._get_next_daily_reset().timestamp())
+    assert await counters.redis.expiretime(weekly_key) == int(demo_usage._get_next_weekly_reset().timestamp())
+
+
+@pytest.mark.asyncio
+async def test_redis_outage_falls_back_to_database_path(counters, monkeypatch):
+    async def unavailable(*args, **kwargs):
+        raise RedisConnectionError("redis down")
+
+    monkeypatch.setattr(counters, "read_many", unavailable)
+
+    assert await demo_usage.check_rate_limit(_UnavailableSession(), "openai", user_id=7) == (True, None)
+    assert not counters.redis_available
+    assert demo_usage.get_demo_usage_counters() is None
+
+
+@pytest.mark.asyncio
+async def test_redis_counters_start_from_the_stored_row(counters):
+    # Redis lost the counters (restart, deploy) but the row already used up today's quota
+    with pytest.raises(demo_usage.DemoUsageExceeded):
+        await demo_usage.check_rate_limit(_StoredRowSession(_stored_row(3, 3)), "openai", user_id=7)
+
+    counts = await counters.read("user:7", "openai")
+    assert (counts.requests_today, counts.requests_this_week, counts.synced) == (3, 3, True)
+
+
+@pytest.mark.asyncio
+async def test_requests_counted_in_the_database_during_an_outage_still_count(counters, monkeypatch):
+    session = _StoredRowSession(_stored_row(0, 0))
+    await demo_usage.check_rate_limit(session, "openai", user_id=7)
+    await demo_usage.record_usage(session, "openai", user_id=7)
+
+    # Redis fails, two more requests are counted in the row, then Redis comes back
+    counters._handle_redis_error(RedisConnectionError("redis down"))
+    session.row = _stored_row(3, 3)
+    monkeypatch.setattr(counters, "_disabled_until", 0.0)
+
+    with pytest.raises(demo_usage.DemoUsageExceeded):
+        await demo_usage.check_rate_limit(session, "openai", user_id=7)
+    assert (await counters.read("user:7", "openai")).requests_today == 3
+
+
+def test_flush_merge_never_lowers_counts_within_a_period():
+    daily, weekly = demo_usage._get_next_daily_reset(), demo_usage._get_next_weekly_reset()
+    stored = demo_usage.DemoUsageCounts("openai", 5, 50, daily, 9, 90, weekly)
+
+    demo_usage._merge_counts(stored, demo_usage.DemoUsageCounts("openai", 2, 20, daily, 12, 120, weekly))
+
+    assert (stored.requests_today, stored.requests_this_week, stored.tokens_this_week) == (5, 12, 120)
+
+    stale = demo_usage.DemoUsageCounts("openai", 5, 50, daily.replace(year=2000), 9, 90, weekly)
+    demo_usage._merge_counts(stale, demo_usage.DemoUsageCounts("openai", 1, 10, daily, 10, 100, weekly))
+    assert (stale.requests_today, stale.daily_reset_at) == (1, daily)
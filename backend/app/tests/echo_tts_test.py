@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import pytest
+
+from app.tts.models import TTSSpeakRequest
+from app.tts.providers import echo
+
+
+@pytest.mark.skipif(not echo.NUMPY_AVAILABLE, reason="NumPy not installed")
+@pytest.mark.parametrize("base_freq", [220, 331, 439])
+def test_numpy_renderer_matches_reference_loop(base_freq):
+    assert echo._tone_frames_numpy(base_freq, 22050, 13230) == echo._tone_frames_python(
+        base_freq, 22050, 13230
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_and_uncached_speak_are_identical():
+    request = TTSSpeakRequest(text="χαῖρε", provider="echo")
+    cached = await echo.EchoTTSProvider().speak(request=request, token=None)
+    uncached = await echo.EchoTTSProvider(cache_waveforms=False).speak(request=request, token=None)
+    assert cached.audio == uncached.audio
+    assert cached.audio[:4] == b"RIFF" and len(cached.audio) == 44 + 2 * 13230
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+from app.services.event_partitions import add_months, expired_months, month_start, partition_name
+
+
+def test_month_math_and_partition_names():
+    assert month_start(datetime(2026, 10, 31, 23, 30, tzinfo=timezone.utc)) == date(2026, 10, 1)
+    assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert partition_name(date(2027, 1, 1)) == "learning_event_p202701"
+
+
+def test_retention_keeps_the_configured_months_before_the_current_one():
+    now = datetime(2026, 10, 18, tzinfo=timezone.utc)
+    months = [add_months(date(2026, 10, 1), -offset) for offset in range(15)]
+
+    assert expired_months(months, now, None) == []
+    assert expired_months(months, now, 12) == [date(2025, 8, 1), date(2025, 9, 1)]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.db.user_models import LearningEvent
+from app.services import event_sink
+from app.services.event_sink import LearningEventSink, emit_learning_event
+
+fakeredis = pytest.importorskip("fakeredis")
+
+NOW = datetime(2026, 10, 18, 9, 0, tzinfo=timezone.utc)
+
+
+def _event(user_id: int) -> LearningEvent:
+    return LearningEvent(
+        user_id=user_id, event_type="lesson_complete", event_timestamp=NOW, data={"xp_gained": 10}
+    )
+
+
+@pytest.fixture
+def sink(monkeypatch):
+    backend = LearningEventSink(batch_size=2, flush_interval=0.01)
+    backend.written = []
+
+    async def write(records):
+        backend.written.append([record[0] for record in records])
+
+    backend._write = write
+    monkeypatch.setattr(event_sink, "_sink", backend)
+    return backend
+
+
+def test_events_are_added_to_the_session_when_no_sink_runs(monkeypatch):
+    monkeypatch.setattr(event_sink, "_sink", None)
+    session = Session()
+
+    emit_learning_event(session, _event(1))
+
+    assert len(session.new) == 1
+
+
+@pytest.mark.asyncio
+async def test_committed_events_are_copied_in_batches_and_rolled_back_ones_dropped(sink):
+    sink.start()
+    committed, rolled_back = Session(), Session()
+    for user_id in (1, 2, 3):
+        emit_learning_event(committed, _event(user_id))
+    emit_learning_event(rolled_back, _event(4))
+
+    assert not committed.new  # nothing is inserted in the request transaction
+    committed.commit()
+    rolled_back.rollback()
+    await sink.stop(timeout=1)
+
+    assert sink.written == [[1, 2], [3]]
+    assert not committed.info.get("pending_learning_events")
+
+
+@pytest.mark.asyncio
+async def test_failed_batches_are_retried_and_journal_entries_cleared(sink, monkeypatch):
+    monkeypatch.setattr(event_sink, "_FIRST_RETRY_DELAY", 0)
+    sink.redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    write = sink._write
+    failures = [OSError("connection reset")]
+
+    async def flaky_write(records):
+        if failures:
+            raise failures.pop()
+        await write(records)
+
+    sink._write = flaky_write
+    sink.start()
+    await sink.submit([event_sink._record(_event(5))])
+    assert await sink.redis.xlen(sink._journal_key) == 1
+    assert await sink.redis.exists(sink._journal_key + ":alive")
+    await sink.stop(timeout=1)
+
+    assert sink.written == [[5]]
+    assert not await sink.redis.exists(sink._journal_key, sink._journal_key + ":alive")
+    assert not await sink.redis.smembers("learning_event:journal_workers")
+
+
+@pytest.mark.asyncio
+async def test_only_journals_of_dead_workers_are_recovered(sink):
+    sink.redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    dead, retrying = LearningEventSink(batch_size=2), LearningEventSink(batch_size=2)
+    for worker, user_ids in ((dead, (6, 7, 8)), (retrying, (9,))):
+        worker.redis = sink.redis
+        await worker.submit([event_sink._record(_event(user_id)) for user_id in user_ids])
+        worker._queue = asyncio.Queue()  # never flushed: one crashed, one is waiting on Postgres
+    await sink.redis.delete(dead._journal_key + ":alive")  # its heartbeat lapsed
+
+    assert await sink.recover() == 3
+    assert sink.written == [[6, 7], [8]]
+    assert not await sink.redis.exists(dead._journal_key)
+    assert await sink.redis.xlen(retrying._journal_key) == 1
+    assert await sink.redis.smembers("learning_event:journal_workers") == {retrying.worker_id}
+    record = event_sink._record(_event(6))
+    assert event_sink._load(event_sink._dump(record)) == record
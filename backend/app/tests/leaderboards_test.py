@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.db.user_models import LearningEvent, UserProfile, UserProgress
+from app.services import leaderboards
+from app.services.leaderboards import LeaderboardService, LeaderboardUpdates, xp_board
+
+fakeredis = pytest.importorskip("fakeredis")
+
+NOW = datetime(2026, 10, 14, 9, 30, tzinfo=timezone.utc)  # a Wednesday
+
+
+@pytest.fixture
+def service():
+    backend = LeaderboardService("redis://localhost:6379/0")
+    backend.redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    return backend
+
+
+def test_period_boards_follow_calendar_periods():
+    assert xp_board("daily", now=NOW) == "leaderboard:xp:daily:20261014"
+    assert xp_board("weekly", "grc", now=NOW) == "leaderboard:xp:weekly:20261012:lang:grc"
+    assert xp_board("monthly", now=NOW) == "leaderboard:xp:monthly:20261001"
+    assert xp_board("all_time", region="Athens") == "leaderboard:xp:all_time:region:Athens"
+    assert leaderboards._board_expiry("leaderboard:xp:monthly:20261201") == datetime(
+        2027, 1, 2, tzinfo=timezone.utc
+    )
+
+
+@pytest.mark.asyncio
+async def test_pages_are_empty_until_a_rebuild_marks_boards_ready(service):
+    assert await service.page(xp_board("all_time"), 1, 10) is None
+
+    await service._swap_in({xp_board("all_time"): {1: 50, 2: 80, 3: 20}}, {2: "Athens"}, {})
+    page = await service.page(xp_board("all_time"), 3, 2)
+
+    assert (page.entries, page.rank, page.total) == ([(2, 80), (1, 50)], 3, 3)
+    assert (await service.page(xp_board("all_time"), 99, 2)).rank == 4  # not on the board
+    assert await service.redis.hget("leaderboard:regions", "2") == "Athens"
+
+
+@pytest.mark.asyncio
+async def test_updates_increment_period_boards_and_move_regions(service):
+    now = datetime.now(timezone.utc)
+    await service._swap_in({xp_board("all_time"): {1: 50, 2: 80}}, {1: "Athens"}, {})
+    await service.apply(
+        LeaderboardUpdates(
+            lessons=[(1, 40, "grc", now), (1, 5, None, now)],
+            xp_totals={1: 95},
+            regions={1: "Sparta", 2: "Sparta"},
+        )
+    )
+
+    daily = await service.page(xp_board("daily"), 1, 10)
+    assert daily.entries == [(1, 45)]
+    assert await service.redis.ttl(xp_board("daily")) > 86400  # expires a day after the period ends
+    assert (await service.page(xp_board("all_time", "grc"), 1, 10)).entries == [(1, 40)]
+    assert (await service.page(xp_board("all_time"), 1, 10)).entries == [(1, 95), (2, 80)]
+    assert (await service.page(xp_board("all_time", region="Sparta"), 2, 10)).entries == [(1, 95), (2, 80)]
+    assert await service.redis.zcard(xp_board("all_time", region="Athens")) == 0
+
+    friends = await service.members_page(xp_board("all_time"), [2, 1, 7], 2, 1)
+    assert (friends.entries, friends.rank, friends.total) == ([(1, 95)], 2, 2)
+
+
+@pytest.mark.asyncio
+async def test_rebuild_replaces_boards_and_drops_stale_ones(service):
+    stale = xp_board("all_time", region="Atlantis")
+    await service._swap_in({xp_board("all_time"): {1: 10}, stale: {1: 10}}, {1: "Atlantis"}, {})
+    await service._swap_in(
+        {xp_board("all_time"): {2: 30}, leaderboards.CHALLENGE_BOARD: {2: 3_000_004}},
+        {},
+        {2: {"current_streak": 3, "longest_streak": 5, "challenges_completed": 4, "total_rewards": 60}},
+    )
+
+    assert not await service.redis.exists(stale, "leaderboard:regions")
+    assert (await service.page(xp_board("all_time"), 1, 10)).entries == [(2, 30)]
+    challenges = await service.challenge_page(2, 10)
+    assert (challenges.rank, challenges.details[0]["challenges_completed"]) == (1, 4)
+
+
+@pytest.mark.asyncio
+async def test_updates_racing_a_rebuild_are_counted_exactly_once(service):
+    now = datetime.now(timezone.utc)
+    daily = xp_board("daily")
+    await service._swap_in({daily: {1: 10}}, {}, {})
+
+    rebuild = await service._begin_rebuild()
+    # Transactions 102 and 99 committed before the rebuild's snapshot, 101 and 105 after it
+    for user_id, xid in ((2, 101), (3, 102)):
+        await service.apply(LeaderboardUpdates(lessons=[(user_id, 40, None, now)], xid=xid))
+    await service._swap_in({daily: {1: 15, 3: 40}}, {}, {}, replace(rebuild, snapshot="100:104:101"))
+    for user_id, xid in ((1, 99), (4, 105)):  # commit hooks that ran after the swap
+        await service.apply(LeaderboardUpdates(lessons=[(user_id, 5, None, now)], xid=xid))
+
+    assert (await service.page(daily, 1, 10)).entries == [(3, 40), (2, 40), (1, 15), (4, 5)]
+    assert not await service.redis.exists(rebuild.replay_key, "leaderboard:rebuilding")
+
+
+def test_snapshot_visibility_matches_postgres():
+    snapshot = "100:104:101,103"
+    assert [xid for xid in range(98, 106) if leaderboards._visible_in_snapshot(xid, snapshot)] == [
+        98,
+        99,
+        100,
+        102,
+    ]
+    assert not leaderboards._visible_in_snapshot(5, "1717000000.5")  # marker from an older release
+
+
+def test_flush_collects_lessons_from_both_completion_endpoints():
+    session = Session()
+    session.add_all(
+        [
+            LearningEvent(
+                user_id=4,
+                event_type="lesson_completed",
+                event_timestamp=NOW,
+                data={"xp_earned": 25, "language_code": "lat"},
+            ),
+            LearningEvent(
+                user_id=4, event_type="lesson_complete", event_timestamp=NOW, data={"xp_gained": 10}
+            ),
+            LearningEvent(user_id=4, event_type="lesson_start", data={}),
+            UserProgress(user_id=4, xp_total=125),
+            UserProfile(user_id=4, region=" Rome "),
+        ]
+    )
+
+    updates = leaderboards._collect(session)
+
+    assert sorted(updates.lessons) == [(4, 10, None, NOW), (4, 25, "lat", NOW)]
+    assert (updates.xp_totals, updates.regions) == ({4: 125}, {4: "Rome"})
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+
+from app.lesson.context_cache import LessonContextCache
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_memoizes_until_invalidated():
+    cache = LessonContextCache(ttl_seconds=60, max_size=8)
+    calls: list[str] = []
+
+    async def load():
+        calls.append("load")
+        return ("line",)
+
+    assert await cache.get_or_load(("canon", "grc-cls"), load) == ("line",)
+    assert await cache.get_or_load(("canon", "grc-cls"), load) == ("line",)
+    assert calls == ["load"]
+
+    cache.invalidate("lat")
+    await cache.get_or_load(("canon", "grc-cls"), load)
+    assert calls == ["load"]
+
+    cache.invalidate("grc-cls")
+    await cache.get_or_load(("canon", "grc-cls"), load)
+    assert calls == ["load", "load"]
+
+
+@pytest.mark.asyncio
+async def test_empty_results_are_cached_for_the_shorter_ttl():
+    calls: list[str] = []
+
+    async def load_empty():
+        calls.append("empty")
+        return tuple()
+
+    cache = LessonContextCache(ttl_seconds=60, max_size=8, empty_ttl_seconds=30)
+    await cache.get_or_load(("canon", "lat"), load_empty)
+    assert await cache.get_or_load(("canon", "lat"), load_empty) == tuple()
+    assert calls == ["empty"]  # no canonical query on a warm cache
+
+    expired = LessonContextCache(ttl_seconds=60, max_size=8, empty_ttl_seconds=0)
+    await expired.get_or_load(("canon", "lat"), load_empty)
+    await expired.get_or_load(("canon", "lat"), load_empty)
+    assert calls == ["empty", "empty", "empty"]
+
+
+@pytest.mark.asyncio
+async def test_load_racing_with_invalidation_is_not_cached():
+    cache = LessonContextCache(ttl_seconds=60, max_size=8)
+
+    async def load_during_ingest():
+        cache.invalidate("grc-cls")
+        return ("stale",)
+
+    assert await cache.get_or_load(("canon", "grc-cls"), load_during_ingest) == ("stale",)
+    assert cache.get(("canon", "grc-cls")) is None
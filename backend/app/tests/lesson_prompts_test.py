@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from app.lesson import prompts
+from app.lesson.models import LessonGenerateRequest
+from app.lesson.providers.anthropic import AnthropicLessonProvider
+from app.lesson.providers.base import DailyLine, LessonContext
+
+
+def test_bound_templates_render_like_full_format():
+    daily = [DailyLine(text="χαῖρε {φίλε}", en="hello")]
+    expected = prompts.MATCH_PROMPT.format(
+        profile="beginner",
+        context="ctx",
+        seed_examples=prompts.format_daily_examples(daily, language="lat"),
+        language="lat",
+    )
+    assert prompts.build_match_prompt("beginner", "ctx", daily, language="lat") == expected
+    assert prompts.build_cloze_prompt("intermediate", "canon", "1.1", "μῆνιν") == prompts.CLOZE_PROMPT.format(
+        profile="intermediate", source_kind="canon", ref="1.1", canonical_text="μῆνιν"
+    )
+
+
+def test_warm_prompt_cache_populates_system_prompts():
+    prompts.get_system_prompt.cache_clear()
+    assert prompts.warm_prompt_cache(["grc-cls", "lat"]) == 2
+    assert prompts.get_system_prompt.cache_info().currsize == 2
+
+
+def test_anthropic_system_prompt_is_cacheable_prefix():
+    request = LessonGenerateRequest(language="lat", exercise_types=["match"], provider="anthropic")
+    context = LessonContext(daily_lines=tuple(), canonical_lines=tuple(), seed=1)
+    payload = AnthropicLessonProvider()._build_payload(
+        request=request, context=context, model_name="claude-sonnet-4-5"
+    )
+    (block,) = payload["system"]
+    assert block["cache_control"] == {"type": "ephemeral"}
+    assert "Latin" in block["text"]
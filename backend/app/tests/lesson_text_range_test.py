@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.lesson.service import _extract_text_range_data, _normalize
+from app.tests.conftest import DB_SKIP_REASON, RUN_DB_TESTS
+
+pytestmark = pytest.mark.skipif(not RUN_DB_TESTS, reason=DB_SKIP_REASON)
+
+# (segment ref, lemma, surface, msd); whitespace variants must group like str.strip() does
+TOKENS = [
+    ("1.1", "μῆνις", "μῆνιν", {"case": "accusative", "pos": "noun"}),
+    ("1.1", "ἀείδω", "ἄειδε", None),
+    ("1.1", "θεά", "θεὰ", None),
+    ("1.2", "μῆνις", "μῆνις\t", None),
+    ("1.2", "\nμῆνις", "μήνιδος", {"case": "genitive", "pos": "noun"}),
+    ("1.2", "Ἀχιλλεύς", "Ἀχιλῆος ", {"case": "genitive", "pos": "noun"}),
+    ("1.3", "Ἀχιλλεύς\r\n", "Ἀχιλλεύς", None),
+    ("1.3", "πέμπω", "προΐαψεν", {"tense": "aorist", "voice": "passive", "mood": "subjunctive"}),
+    ("1.3", "τίθημι", "ἐτέθη", {"tense": "aorist", "voice": "passive"}),
+    ("1.3", "εἰμί", "ᾖ", {"mood": "subjunctive"}),
+    ("1.4", " ", "κενόν", None),
+    ("1.4", "ἀείδω", " ἄειδε", None),
+]
+
+
+def _reference(tokens):
+    """The per-token Python aggregation the SQL query replaced."""
+    lemma_forms: dict[str, list[str]] = {}
+    pattern_forms: dict[str, list[str]] = {}
+    for _, raw_lemma, raw_surface, msd in tokens:
+        lemma, surface = _normalize(raw_lemma), _normalize(raw_surface)
+        if not lemma or not surface:
+            continue
+        forms = lemma_forms.setdefault(lemma, [])
+        if surface not in forms:
+            forms.append(surface)
+        msd = msd or {}
+        if msd.get("tense") == "aorist" and msd.get("voice") == "passive":
+            pattern = "aorist_passive"
+        elif msd.get("case") == "genitive" and msd.get("pos") == "noun":
+            pattern = "genitive_noun"
+        elif msd.get("mood") == "subjunctive":
+            pattern = "subjunctive"
+        else:
+            continue
+        examples = pattern_forms.setdefault(pattern, [])
+        if surface not in examples:
+            examples.append(surface)
+    vocabulary = [
+        (lemma, tuple(forms[:5]), len(forms))
+        for lemma, forms in sorted(lemma_forms.items(), key=lambda item: len(item[1]), reverse=True)[:30]
+    ]
+    patterns = [
+        (pattern, tuple(examples[:5])) for pattern, examples in pattern_forms.items() if len(examples) >= 2
+    ]
+    return vocabulary, patterns
+
+
+@pytest.mark.asyncio
+async def test_sql_aggregation_matches_the_python_reference():
+    engine = create_async_engine(os.environ["DATABASE_URL"], poolclass=NullPool)
+    try:
+        async with engine.connect() as conn:
+            # Temporary tables shadow the real ones for this connection only
+            for ddl in (
+                "CREATE TEMP TABLE language (id int PRIMARY KEY, code text)",
+                "CREATE TEMP TABLE text_work (id int PRIMARY KEY, language_id int)",
+                "CREATE TEMP TABLE text_segment ("
+                "id serial PRIMARY KEY, work_id int, ref text, text_nfc text)",
+                "CREATE TEMP TABLE token (segment_id int, idx int, lemma text, surface_nfc text, msd jsonb)",
+                "INSERT INTO language VALUES (1, 'grc-test')",
+                "INSERT INTO text_work VALUES (1, 1)",
+            ):
+                await conn.execute(text(ddl))
+            segments = {}
+            for ref in sorted({row[0] for row in TOKENS}):
+                segments[ref] = await conn.scalar(
+                    text(
+                        "INSERT INTO text_segment (work_id, ref, text_nfc)"
+                        " VALUES (1, :ref, :ref) RETURNING id"
+                    ),
+                    {"ref": ref},
+                )
+            for idx, (ref, lemma, surface, msd) in enumerate(TOKENS):
+                await conn.execute(
+                    text("INSERT INTO token VALUES (:segment, :idx, :lemma, :surface, CAST(:msd AS jsonb))"),
+                    {
+                        "segment": segments[ref],
+                        "idx": idx,
+                        "lemma": lemma,
+                        "surface": surface,
+                        "msd": json.dumps(msd) if msd else None,
+                    },
+                )
+
+            session = AsyncSession(bind=conn)
+            data = await _extract_text_range_data(
+                session=session, language="grc-test", ref_start="1.1", ref_end="1.4"
+            )
+    finally:
+        await engine.dispose()
+
+    vocabulary, patterns = _reference(TOKENS)
+    assert [(item.lemma, item.surface_forms, item.frequency) for item in data.vocabulary] == vocabulary
+    assert [(item.pattern, item.examples) for item in data.grammar_patterns] == patterns
+    assert vocabulary[0] == ("μῆνις", ("μῆνιν", "μῆνις", "μήνιδος"), 3)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from app.api.routers.progress import _apply_lesson, _lesson_time
+from app.api.schemas.user_schemas import ProgressBatchEvent
+from app.db.user_models import UserProgress
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+def _progress(**overrides) -> UserProgress:
+    values = dict(
+        xp_total=0,
+        coins=0,
+        streak_days=0,
+        max_streak=0,
+        streak_freezes=0,
+        streak_freeze_used_today=False,
+        total_lessons=0,
+        perfect_lessons=0,
+        total_time_minutes=0,
+    )
+    return UserProgress(user_id=1, **{**values, **overrides})
+
+
+def test_lesson_times_stay_ordered_and_never_pass_now():
+    previous = NOW - timedelta(days=1)
+
+    assert _lesson_time(NOW - timedelta(days=3), previous, NOW) == previous
+    assert _lesson_time(NOW + timedelta(hours=2), previous, NOW) == NOW
+    assert _lesson_time(None, None, NOW) == NOW
+    assert _lesson_time(datetime(2026, 10, 18, 9, 0), previous, NOW) == datetime(
+        2026, 10, 18, 9, 0, tzinfo=timezone.utc
+    )
+
+
+def test_queued_lessons_replay_streak_and_level_transitions_in_order():
+    progress = _progress(streak_freezes=1)
+    lessons = [
+        (ProgressBatchEvent(xp_gained=60), NOW - timedelta(days=4)),
+        (ProgressBatchEvent(xp_gained=60, is_perfect=True), NOW - timedelta(days=3)),
+        # two-day gap, covered by the streak shield
+        (ProgressBatchEvent(xp_gained=10, time_spent_minutes=5), NOW - timedelta(days=1)),
+    ]
+
+    levels = [_apply_lesson(progress, update, at) for update, at in lessons]
+
+    assert levels == [(0, 0), (0, 1), (1, 1)]
+    assert (progress.streak_days, progress.max_streak, progress.streak_freezes) == (2, 2, 0)
+    assert (progress.xp_total, progress.coins, progress.perfect_lessons) == (130, 13, 1)
+    assert (progress.total_lessons, progress.total_time_minutes) == (3, 5)
+    assert progress.last_lesson_at == NOW - timedelta(days=1)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.api.routers import progress
+from app.db.user_models import LearningEvent, User, UserAchievement
+from app.services import event_sink
+from app.services import progress_snapshot as snapshots
+from app.services.event_sink import LearningEventSink
+from app.services.progress_snapshot import ProgressSnapshotCache
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture(params=["local", "redis"])
+def cache(request, monkeypatch):
+    backend = ProgressSnapshotCache()
+    if request.param == "redis":
+        backend.redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(snapshots, "_cache", backend)
+    return backend
+
+
+def _builder(bodies: list[dict]):
+    calls = []
+
+    async def build():
+        calls.append(len(calls))
+        return bodies[len(calls) - 1]
+
+    return build, calls
+
+
+@pytest.mark.asyncio
+async def test_snapshots_are_built_once_until_a_commit_touches_the_user(cache):
+    build, calls = _builder([{"xp_total": 10}, {"xp_total": 25}])
+
+    first = await snapshots.progress_snapshot(7, "progress", build)
+    assert (await snapshots.progress_snapshot(7, "progress", build)).etag == first.etag
+    assert len(calls) == 1
+
+    session = Session()
+    session.add(UserAchievement(user_id=7, achievement_type="milestone", achievement_id="xp_100"))
+    snapshots._snapshot_users._after_flush(session, None)
+    snapshots._snapshot_users._after_commit(session)
+
+    second = await snapshots.progress_snapshot(7, "progress", build)
+    assert (second.body, len(calls)) == ({"xp_total": 25}, 2)
+    assert second.etag != first.etag
+
+
+@pytest.mark.asyncio
+async def test_a_read_between_commit_and_sink_flush_is_rebuilt_after_the_flush(cache, monkeypatch):
+    table: list = []
+    sink = LearningEventSink()
+
+    async def write(records):
+        table.extend(records)
+
+    sink._write = write
+    monkeypatch.setattr(event_sink, "_sink", sink)
+    monkeypatch.setattr(sink, "_task", asyncio.Future())  # running, flushed by hand below
+
+    async def build():
+        return {"lessons": len(table)}
+
+    await snapshots.progress_snapshot(7, "progress", build)
+    session = Session()
+    event_sink.emit_learning_event(session, LearningEvent(user_id=7, event_type="lesson_complete", data={}))
+    batch = [(event_sink._record(event), None) for event in event_sink.pending_learning_events(session)]
+    session.commit()  # the event is handed to the sink, not written yet
+    assert (await snapshots.progress_snapshot(7, "progress", build)).body == {"lessons": 0}
+
+    await sink._flush(batch)
+
+    assert (await snapshots.progress_snapshot(7, "progress", build)).body == {"lessons": 1}
+
+
+@pytest.mark.asyncio
+async def test_a_body_built_before_a_write_committed_is_not_served(cache):
+    snapshot, version = await cache.get(7, "progress")
+    await cache.invalidate({7})  # a lesson commits while the stale body is being built
+    await cache.put(7, "progress", version, {"xp_total": 10})
+
+    assert (await cache.get(7, "progress"))[0] is None
+
+
+@pytest.mark.asyncio
+async def test_matching_if_none_match_returns_304_without_touching_the_database(cache):
+    build, _ = _builder([{"xp_total": 10}])
+    etag = (await snapshots.progress_snapshot(7, "progress", build)).etag
+
+    response = await progress.get_user_progress(
+        current_user=User(id=7), session=AsyncSession(), if_none_match=etag
+    )
+
+    assert (response.status_code, response.headers["etag"]) == (304, etag)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from app.middleware import rate_limit_policy
+from app.middleware.rate_limit import SlidingWindowRateLimiter
+
+
+def test_policy_table_resolves_most_specific_prefix():
+    matcher = rate_limit_policy.PolicyMatcher(rate_limit_policy.DEFAULT_POLICIES)
+
+    def category(path: str, method: str) -> str | None:
+        policy = matcher.match(path, method)
+        return policy.category if policy else None
+
+    assert category("/api/v1/auth/password-reset/request", "POST") == "password_reset"
+    assert category("/api/v1/auth/login", "POST") == "login"
+    assert category("/api/v1/auth/email/verify", "POST") == "auth"
+    assert category("/api/v1/api-keys/openai", "DELETE") == "api_keys"
+    assert category("/lesson/generate", "POST") == "lesson_generation"
+    assert category("/lesson/generate", "GET") == "read"
+    assert category("/coach/chat", "POST") == "write"
+    assert category("/health", "GET") is None
+    assert category("/health/db", "GET") == "read"
+    assert category("/search", "OPTIONS") is None
+    assert matcher.match("/api/v1/auth/register", "POST").window_label == "hour"
+
+
+def test_policy_file_is_reloaded_when_it_changes(tmp_path):
+    policy_file = tmp_path / "policies.yaml"
+    policy_file.write_text(
+        "policies:\n  - {category: chat, prefixes: [/chat], max_requests: 5, window_seconds: 30}\n"
+    )
+    registry = rate_limit_policy.PolicyRegistry(str(policy_file))
+    assert registry.current().match("/chat/converse", "POST").max_requests == 5
+    assert registry.current().match("/chat/converse", "POST").window_label == "30 seconds"
+
+    policy_file.write_text(
+        "policies: [{category: chat, prefixes: [/chat], max_requests: 7, window_seconds: 60}]\n"
+    )
+    assert registry.reload()
+    assert registry.current().match("/chat/converse", "POST").max_requests == 7
+
+    policy_file.write_text("policies: [{category: chat}]\n")
+    assert not registry.reload()  # invalid file keeps the previous table
+    assert registry.current().match("/chat/converse", "POST").max_requests == 7
+
+
+def test_identity_is_per_user_for_access_tokens():
+    from starlette.requests import Request
+
+    from app.middleware.rate_limit import _rate_limit_identity
+    from app.security.auth import create_access_token, create_refresh_token
+
+    def request(headers: dict[str, str]) -> Request:
+        raw = [(name.lower().encode(), value.encode()) for name, value in headers.items()]
+        return Request({"type": "http", "headers": raw, "client": ("10.0.0.9", 1234)})
+
+    assert _rate_limit_identity(request({"Authorization": f"Bearer {create_access_token(42)}"})) == "user:42"
+    forwarded = {"X-Forwarded-For": "203.0.113.7", "Authorization": f"Bearer {create_refresh_token(42)}"}
+    assert _rate_limit_identity(request(forwarded)) == "ip:203.0.113.7"
+    assert _rate_limit_identity(request({"Authorization": "Bearer not-a-jwt"})) == "ip:10.0.0.9"
+
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis needs lupa to run Lua scripts
+
+
+def _limiter() -> SlidingWindowRateLimiter:
+    limiter = SlidingWindowRateLimiter("redis://localhost:6379/0")
+    limiter.redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    limiter._script = limiter.redis.register_script(limiter._script.script)
+    return limiter
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_never_overshoot_the_limit():
+    limiter = _limiter()
+
+    decisions = await asyncio.gather(*(limiter.check("ratelimit:write:1.2.3.4", 20, 60) for _ in range(50)))
+
+    assert sum(decision.allowed for decision in decisions) == 20
+    assert sorted(d.remaining for d in decisions if d.allowed) == list(range(20))
+    denied = next(d for d in decisions if not d.allowed)
+    assert 0 < denied.reset_after <= 60
+    assert limiter.redis_calls == 50
+
+
+@pytest.mark.asyncio
+async def test_generous_limits_are_served_from_local_leases():
+    limiter = _limiter()
+
+    decisions = [await limiter.check("ratelimit:read:1.2.3.4", 100, 60) for _ in range(101)]
+
+    assert all(decision.allowed for decision in decisions[:100])
+    assert not decisions[100].allowed
+    assert [d.remaining for d in decisions[:3]] == [99, 98, 97]
+    assert limiter.redis_calls == 11 and limiter.local_hits == 90
+
+
+@pytest.mark.asyncio
+async def test_leases_are_not_spent_into_the_next_window(monkeypatch):
+    from types import SimpleNamespace
+
+    from app.middleware import rate_limit
+
+    start = time.time()
+    clock = [start]
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(time=lambda: clock[0]))
+    first, second = _limiter(), _limiter()
+    second.redis = first.redis
+    second._script = second.redis.register_script(second._script.script)
+    key = "ratelimit:read:1.2.3.4"
+
+    assert (await first.check(key, 100, 60)).allowed  # claims 10 slots stamped at `start`
+    for _ in range(90):
+        assert (await second.check(key, 100, 60)).allowed
+    assert (await first.check(key, 100, 60)).allowed  # leased slot, spent locally
+
+    # Spending the rest of the lease just before the window ends would let them
+    # count only until `start + 60`, while the other worker refills the window.
+    clock[0] = start + 59
+    assert not (await first.check(key, 100, 60)).allowed
+    clock[0] = start + 60.5
+    decisions = [await second.check(key, 100, 60) for _ in range(101)]
+    assert sum(decision.allowed for decision in decisions) == 100
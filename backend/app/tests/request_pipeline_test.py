@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.pipeline import RequestPipelineMiddleware
+from app.middleware.security_headers import security_headers_stage
+from app.security.middleware import redact_api_keys_stage
+
+
+def _build_app(calls: list[str]) -> FastAPI:
+    async def tagging_stage(request, response_hooks):
+        calls.append("tag")
+        response_hooks.append(lambda headers: headers.__setitem__("X-Stage-Order", "tag"))
+        return None
+
+    async def blocking_stage(request, response_hooks):
+        calls.append("block")
+        response_hooks.append(lambda headers: headers.__setitem__("X-Stage-Order", "block"))
+        if request.url.path == "/blocked":
+            return PlainTextResponse("blocked", status_code=429)
+        return None
+
+    app = FastAPI()
+    app.add_middleware(
+        RequestPipelineMiddleware,
+        stages=[tagging_stage, security_headers_stage, redact_api_keys_stage, blocking_stage],
+    )
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"one,", b"two,", b"three"]), media_type="text/plain")
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        payload = await request.json()
+        return JSONResponse({"payload": payload, "redacted": request.state.redacted_body})
+
+    @app.get("/blocked")
+    def blocked():  # pragma: no cover - short-circuited by blocking_stage
+        calls.append("endpoint")
+        return {}
+
+    return app
+
+
+def test_stages_wrap_streaming_responses_innermost_hook_first():
+    calls: list[str] = []
+    with TestClient(_build_app(calls)) as pipeline_client:
+        response = pipeline_client.get("/stream")
+
+    assert response.text == "one,two,three"
+    assert response.headers["X-Stage-Order"] == "tag"  # outer stage edits the response last
+    assert response.headers["X-Frame-Options"] == "DENY"
+    assert calls == ["tag", "block"]
+
+
+def test_short_circuit_skips_inner_stages_and_keeps_outer_hooks():
+    calls: list[str] = []
+    with TestClient(_build_app(calls)) as pipeline_client:
+        response = pipeline_client.get("/blocked")
+
+    assert (response.status_code, response.text) == (429, "blocked")
+    assert response.headers["X-Stage-Order"] == "tag"
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+    assert calls == ["tag", "block"]
+
+
+def test_body_read_by_a_stage_is_replayed_to_the_endpoint():
+    with TestClient(_build_app([])) as pipeline_client:
+        response = pipeline_client.post("/echo", json={"api_key": "sk-secret", "text": "λόγος"})
+
+    assert response.json() == {
+        "payload": {"api_key": "sk-secret", "text": "λόγος"},
+        "redacted": {"api_key": "***", "text": "λόγος"},
+    }
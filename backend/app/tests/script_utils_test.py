@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from app.lesson.script_utils import (
+    apply_script_preferences,
+    apply_script_transform,
+    compile_script_transform,
+)
+
+
+def test_compiled_transform_is_cached_per_language():
+    assert compile_script_transform("grc-cls") is compile_script_transform("grc-cls")
+    assert compile_script_transform("zzz") is compile_script_transform("zzz")
+
+
+def test_greek_and_latin_rules():
+    assert apply_script_transform("μῆνιν ἄειδε θεὰ", "grc-cls") == "ΜΗΝΙΝΑΕΙΔΕΘΕΑ"
+    assert apply_script_transform("Ἄ Έ ὦ", "grc-cls") == "ΑΕΩ"
+    assert apply_script_transform("Julius Cæsar", "lat") == "IVLIVSCAESAR"
+    assert apply_script_transform("ἄειδε", "zzz") == "ἄειδε"
+
+
+def test_accent_strip_handles_decomposed_input():
+    assert apply_script_transform("α\u0313\u0301νθρωπος", "grc-cls") == "ΑΝΘΡΩΠΟΣ"
+    assert apply_script_transform("ᾠδή", "grc-cls") == "ΩΔΗ"
+
+
+def test_preferences_share_compiled_transform():
+    assert apply_script_preferences("χαῖρε ὦ φίλε", "grc-cls", authentic_mode=True) == "ΧΑΙΡΕΩΦΙΛΕ"
+    assert apply_script_preferences("τῷ λόγῳ", "grc", use_iota_adscript=True) == "τωι λόγωι"
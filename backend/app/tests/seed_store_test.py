@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pytest
+
+from app.lesson import seed_store
+
+_DAILY_YAML = """\
+daily_grc:
+  - text: "χαῖρε"
+    en: hello
+    variants: ["χαῖρε", "χαίρετε"]
+  - text: "ναί"
+    en: yes
+  - text: "χαῖρε"
+    en: duplicate
+"""
+
+_CANONICAL_YAML = """\
+canonical_grc-cls:
+  - ref: "Il.1.1"
+  - ref: "Il.1.2"
+"""
+
+
+@pytest.fixture
+def compiled_store(tmp_path, monkeypatch):
+    seed_dir = tmp_path / "seed"
+    seed_dir.mkdir()
+    (seed_dir / "daily_grc-cls.yaml").write_text(_DAILY_YAML, encoding="utf-8")
+    (seed_dir / "canonical_grc-cls.yaml").write_text(_CANONICAL_YAML, encoding="utf-8")
+    output = seed_dir / "seed_store.bin"
+    seed_store.build_seed_store(seed_dir, output)
+
+    monkeypatch.setattr(seed_store, "SEED_DIR", seed_dir)
+    monkeypatch.setattr(seed_store, "SEED_STORE_PATH", output)
+    monkeypatch.setattr(seed_store, "seed_fingerprint", lambda: seed_store.SeedStore(output).fingerprint)
+    seed_store.get_seed_store.cache_clear()
+    seed_store._yaml_daily_lines.cache_clear()
+    yield seed_dir
+    seed_store.get_seed_store.cache_clear()
+    seed_store._yaml_daily_lines.cache_clear()
+
+
+def test_compiled_store_matches_yaml(compiled_store):
+    lines = seed_store.load_daily_lines("grc-cls")
+    assert isinstance(lines, seed_store.SeedLines)
+    assert len(lines) == 2
+    assert lines[0].text == "χαῖρε"
+    assert lines[0].variants == ("χαῖρε", "χαίρετε")
+    assert lines[-1].en == "yes"
+    assert lines[1].variants == ("ναί",)
+
+    yaml_lines = seed_store._yaml_daily_lines("daily_grc-cls", "grc-cls")
+    assert tuple(lines) == yaml_lines
+    assert seed_store.load_canonical_refs("grc-cls") == ["Il.1.1", "Il.1.2"]
+
+
+def test_stale_store_falls_back_to_yaml(compiled_store, monkeypatch):
+    monkeypatch.setattr(seed_store, "seed_fingerprint", lambda: "changed")
+    seed_store.get_seed_store.cache_clear()
+    assert seed_store.get_seed_store() is None
+    lines = seed_store.load_daily_lines("grc-cls")
+    assert isinstance(lines, tuple)
+    assert [line.text for line in lines] == ["χαῖρε", "ναί"]
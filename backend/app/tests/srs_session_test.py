@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.api.routers import srs
+from app.api.routers.srs import SRSReviewBatchRequest, _review_card
+from app.db.session import get_session
+from app.db.user_models import Base, User, UserProgress, UserSRSCard
+from app.security.auth import get_current_user
+from app.tests.conftest import DB_SKIP_REASON, RUN_DB_TESTS
+
+NOW = datetime(2026, 10, 18, 9, 0, tzinfo=timezone.utc)
+
+
+def _state(**overrides) -> dict:
+    state = {
+        "id": 3,
+        "stability": 4.0,
+        "difficulty": 5.0,
+        "state": "review",
+        "reps": 2,
+        "lapses": 0,
+        "last_review_at": NOW - timedelta(days=6),
+    }
+    return {**state, **overrides}
+
+
+def test_review_values_count_reps_lapses_and_schedule_from_now():
+    lapse = _review_card(_state(), 1, NOW)
+
+    assert (lapse["state"], lapse["reps"], lapse["lapses"], lapse["elapsed_days"]) == ("relearning", 3, 1, 6)
+    assert lapse["due_at"] == NOW + timedelta(days=lapse["scheduled_days"])
+
+    # A second answer in the same batch starts from the first one's result
+    again = _review_card({**_state(), **lapse}, 3, NOW)
+    assert (again["state"], again["reps"], again["elapsed_days"]) == ("review", 4, 0)
+
+
+def test_review_batches_are_bounded():
+    with pytest.raises(ValidationError):
+        SRSReviewBatchRequest(reviews=[])
+    with pytest.raises(ValidationError):
+        SRSReviewBatchRequest(reviews=[{"card_id": 1, "quality": 3}] * 201)
+
+
+needs_db = pytest.mark.skipif(not RUN_DB_TESTS, reason=DB_SKIP_REASON)
+
+
+@pytest.fixture
+async def srs_api():
+    """The SRS router on one connection whose transaction is rolled back afterwards."""
+    engine = create_async_engine(os.environ["DATABASE_URL"], poolclass=NullPool)
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        tables = [User.__table__, UserProgress.__table__, UserSRSCard.__table__]
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=tables))
+        session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+        users = [
+            User(username=f"srs-{name}", email=f"srs-{name}@example.com", hashed_password="x")
+            for name in ("reader", "other")
+        ]
+        session.add_all(users)
+        await session.flush()
+        session.add(UserProgress(user_id=users[0].id, xp_total=100))
+        now = datetime.now(timezone.utc)
+        for user, content_id, state, due_in in (
+            (users[0], "λόγος", "review", timedelta(days=-2)),
+            (users[0], "ἄνθρωπος", "new", timedelta(hours=-1)),
+            (users[0], "θεός", "learning", timedelta(days=-1)),
+            (users[0], "πόλις", "review", timedelta(days=3)),  # not due yet
+            (users[1], "οἶκος", "new", timedelta(days=-1)),
+        ):
+            session.add(
+                UserSRSCard(
+                    user_id=user.id,
+                    card_type="lemma",
+                    content_id=content_id,
+                    state=state,
+                    due_at=now + due_in,
+                )
+            )
+        await session.commit()
+
+        app = FastAPI()
+        app.include_router(srs.router)
+        app.dependency_overrides[get_session] = lambda: session
+        app.dependency_overrides[get_current_user] = lambda: users[0]
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            yield client, session, users
+        await session.close()
+        await transaction.rollback()
+    await engine.dispose()
+
+
+async def _card_ids(session: AsyncSession, user: User) -> dict[str, int]:
+    result = await session.execute(
+        select(UserSRSCard.content_id, UserSRSCard.id).where(UserSRSCard.user_id == user.id)
+    )
+    return dict(result.all())
+
+
+@needs_db
+async def test_session_returns_a_due_batch_and_the_due_total(srs_api):
+    client, _, _ = srs_api
+
+    first = (await client.get("/srs/session", params={"size": 2})).json()
+    assert [card["content_id"] for card in first["cards"]] == ["ἄνθρωπος", "θεός"]  # new, then learning
+    assert first["due_total"] == 3  # beyond the batch; the card due later and other users' are not
+
+    assert (await client.get("/srs/session", params={"card_type": "grammar"})).json() == {
+        "cards": [],
+        "due_total": 0,
+    }
+
+
+@needs_db
+async def test_review_batch_updates_every_card_and_grants_xp_once(srs_api):
+    client, session, users = srs_api
+    ids = await _card_ids(session, users[0])
+
+    response = await client.post(
+        "/srs/session/reviews",
+        json={
+            "reviews": [
+                {"card_id": ids["λόγος"], "quality": 1},
+                {"card_id": ids["θεός"], "quality": 3},
+                {"card_id": ids["λόγος"], "quality": 3},  # answered again later in the session
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["xp_earned"] == 5 + 12 + 12
+    assert [result["card_id"] for result in body["results"]] == [ids["λόγος"], ids["θεός"], ids["λόγος"]]
+    result = await session.execute(
+        select(UserSRSCard.content_id, UserSRSCard.reps, UserSRSCard.lapses, UserSRSCard.state)
+    )
+    cards = {content_id: (reps, lapses, state) for content_id, reps, lapses, state in result.all()}
+    assert cards["λόγος"] == (2, 1, "review")
+    assert cards["θεός"] == (1, 0, body["results"][1]["new_state"])
+    assert cards["ἄνθρωπος"][0] == 0
+    xp_total = select(UserProgress.xp_total).where(UserProgress.user_id == users[0].id)
+    assert await session.scalar(xp_total) == 100 + 29
+
+
+@needs_db
+async def test_review_batch_with_a_missing_or_foreign_card_changes_nothing(srs_api):
+    client, session, users = srs_api
+    own = await _card_ids(session, users[0])
+    foreign = await _card_ids(session, users[1])
+    xp_total = select(UserProgress.xp_total).where(UserProgress.user_id == users[0].id)
+
+    response = await client.post(
+        "/srs/session/reviews",
+        json={
+            "reviews": [
+                {"card_id": own["λόγος"], "quality": 3},
+                {"card_id": foreign["οἶκος"], "quality": 3},
+                {"card_id": 999_999_999, "quality": 3},
+            ]
+        },
+    )
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == f"Cards not found: {sorted([foreign['οἶκος'], 999_999_999])}"
+    await session.rollback()  # what get_session does when the request raises
+    assert await session.scalar(select(UserSRSCard.reps).where(UserSRSCard.id == own["λόγος"])) == 0
+    assert await session.scalar(xp_total) == 100
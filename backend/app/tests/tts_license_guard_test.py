@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import pytest
+
+from app.tts import license_guard
+
+
+@pytest.mark.asyncio
+async def test_batch_checks_use_cached_map_until_invalidated(monkeypatch):
+    loads: list[int] = []
+
+    async def fake_load():
+        loads.append(1)
+        return {
+            "il": (license_guard._WorkLicense({"license": "CC BY-SA 3.0"}, "Perseus", False),),
+            "od": (license_guard._WorkLicense({"license": "CC BY-NC 4.0"}, "NC Press", True),),
+        }
+
+    monkeypatch.setattr(license_guard, "_load_license_labels", fake_load)
+    monkeypatch.setattr(license_guard, "license_map", license_guard.LicenseMap(ttl_seconds=3600))
+
+    results = await license_guard.evaluate_tts_requests(["Il.1.1", "χαῖρε", "Od.2.3 ἄνδρα"])
+    assert results[:2] == [None, None]
+    assert results[2]["ref"] == "Od.2.3" and results[2]["license"] == "CC BY-NC 4.0"
+
+    assert await license_guard.evaluate_tts_request("Od.1.1") is not None
+    assert await license_guard.evaluate_tts_requests(["no reference here"]) == [None]
+    assert loads == [1]
+
+    license_guard.invalidate_license_map()
+    await license_guard.evaluate_tts_request("Il.1.2")
+    assert loads == [1, 1]
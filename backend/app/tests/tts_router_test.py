@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import base64
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.tts.router import router
+
+
+@pytest.fixture
+def tts_client(monkeypatch):
+    monkeypatch.setattr(settings, "TTS_ENABLED", True)
+    monkeypatch.setattr(settings, "TTS_LICENSE_GUARD", False)
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_json_remains_default_and_binary_is_negotiated(tts_client):
+    body = {"text": "χαῖρε", "provider": "echo"}
+    as_json = tts_client.post("/tts/speak", json=body)
+    assert as_json.headers["content-type"] == "application/json"
+    audio = base64.b64decode(as_json.json()["audio"]["b64"])
+
+    raw = tts_client.post("/tts/speak", json=body, headers={"Accept": "audio/wav, application/json;q=0.5"})
+    assert raw.status_code == 200
+    assert raw.headers["content-type"] == "audio/wav"
+    assert raw.headers["x-tts-provider"] == "echo"
+    assert raw.content == audio
+
+    etag = raw.headers["etag"]
+    cached = tts_client.post("/tts/speak", json=body, headers={"Accept": "audio/*", "If-None-Match": etag})
+    assert cached.status_code == 304
+
+
+def test_range_and_streaming(tts_client):
+    body = {"text": "salve", "provider": "echo"}
+    full = tts_client.post("/tts/speak", json=body, headers={"Accept": "audio/wav"}).content
+
+    partial = tts_client.post("/tts/speak", json=body, headers={"Accept": "audio/wav", "Range": "bytes=0-43"})
+    assert partial.status_code == 206
+    assert partial.headers["content-range"] == f"bytes 0-43/{len(full)}"
+    assert partial.content == full[:44]
+
+    suffix = tts_client.post("/tts/speak", json=body, headers={"Accept": "audio/wav", "Range": "bytes=-10"})
+    assert suffix.content == full[-10:]
+
+    beyond = tts_client.post(
+        "/tts/speak", json=body, headers={"Accept": "audio/wav", "Range": f"bytes={len(full)}-"}
+    )
+    assert beyond.status_code == 416
+
+    streamed = tts_client.post("/tts/speak?stream=true", json=body)
+    assert streamed.headers["content-type"] == "audio/wav"
+    assert streamed.content == full
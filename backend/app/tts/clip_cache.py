@@ -0,0 +1,78 @@
+"""Byte-bounded LRU of recently synthesized clips for ``/tts/speak``.
+
+Browsers fetch audio with Range requests and revalidate with If-None-Match, so the
+same clip is usually requested several times in a row. Keeping the rendered bytes
+(and their ETag) here lets those follow-up requests be answered with 206/304
+without calling the TTS provider again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.tts.models import TTSSpeakRequest
+from app.tts.providers.base import TTSAudioResult
+
+
+@dataclass(slots=True, frozen=True)
+class CachedClip:
+    result: TTSAudioResult
+    provider: str
+    note: str | None
+    etag: str
+
+
+def clip_key(request: TTSSpeakRequest, token: str | None) -> str:
+    """Fingerprint of everything that determines the synthesized audio.
+
+    Paid providers are keyed per BYOK token so one user's clips are never served on another's key.
+    """
+    scope = "" if request.provider == "echo" else hashlib.sha256((token or "").encode("utf-8")).hexdigest()
+    parts = (request.provider, request.model or "", request.voice or "", request.format, request.text, scope)
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def audio_etag(audio: bytes) -> str:
+    return '"' + hashlib.sha256(audio).hexdigest()[:32] + '"'
+
+
+class ClipCache:
+    def __init__(self, *, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, CachedClip] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> CachedClip | None:
+        clip = self._entries.get(key)
+        if clip is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return clip
+
+    def put(self, key: str, result: TTSAudioResult, provider: str, note: str | None) -> CachedClip:
+        """Store and return the clip; echo fallbacks (``note`` set) are returned but not stored."""
+        clip = CachedClip(result=result, provider=provider, note=note, etag=audio_etag(result.audio))
+        if note is not None or len(result.audio) > self._max_bytes:
+            return clip
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous.result.audio)
+        self._entries[key] = clip
+        self._bytes += len(result.audio)
+        while self._bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted.result.audio)
+        return clip
+
+    def stats(self) -> dict[str, int]:
+        return {"entries": len(self._entries), "bytes": self._bytes, "hits": self.hits, "misses": self.misses}
+
+
+clip_cache = ClipCache(max_bytes=settings.TTS_CLIP_CACHE_MAX_BYTES)
@@ -2,45 +2,119 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
-from typing import Any
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Dict, Sequence
 
 from sqlalchemy import text
 
+from app.core.config import settings
 from app.db.session import SessionLocal
 
 _LOGGER = logging.getLogger("app.tts.license_guard")
 _REF_PATTERN = re.compile(r"(?P<label>[A-Za-z]{1,4})\.(?P<ref>\d+(?:[.:-]\d+)*)")
 
 
+@dataclass(frozen=True, slots=True)
+class _WorkLicense:
+    license: Any
+    source_title: str | None
+    restricted: bool
+
+
+class LicenseMap:
+    """In-memory label -> work licenses map built from ``text_work`` and ``source_doc``.
+
+    Labels are the two-letter abbreviations of each work's title and author (the same
+    rule :func:`_abbreviate` applies to request text). The map is rebuilt lazily when
+    :meth:`invalidate` bumps the generation after ingestion, or after ``ttl_seconds``
+    so other workers eventually see new sources too.
+    """
+
+    def __init__(self, *, ttl_seconds: float) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._labels: Dict[str, tuple[_WorkLicense, ...]] | None = None
+        self._generation = 0
+        self._loaded_generation = -1
+        self._loaded_at = 0.0
+        self._lock: asyncio.Lock | None = None
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._labels is not None
+            and self._loaded_generation == self._generation
+            and monotonic() - self._loaded_at <= self._ttl_seconds
+        )
+
+    async def labels(self) -> Dict[str, tuple[_WorkLicense, ...]]:
+        if self._is_fresh():
+            return self._labels  # type: ignore[return-value]
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not self._is_fresh():
+                generation = self._generation
+                self._labels = await _load_license_labels()
+                self._loaded_generation = generation
+                self._loaded_at = monotonic()
+                _LOGGER.info("Loaded TTS license map: %d labels", len(self._labels))
+        return self._labels  # type: ignore[return-value]
+
+    def invalidate(self) -> None:
+        self._generation += 1
+
+
+license_map = LicenseMap(ttl_seconds=settings.TTS_LICENSE_MAP_TTL_SECONDS)
+
+
+def invalidate_license_map() -> None:
+    """Force the next TTS license check to rebuild the label map (call after ingestion)."""
+    license_map.invalidate()
+
+
 async def evaluate_tts_request(text_value: str) -> dict[str, str] | None:
     """
     Inspect the request text and return a violation detail payload when TTS should be blocked.
     Returns None when no guard applies.
     """
-    label_ref = _extract_reference(text_value)
-    if not label_ref:
-        return None
+    return (await evaluate_tts_requests([text_value]))[0]
 
-    label, ref = label_ref
-    try:
-        license_meta, source_title = await _fetch_license(label, ref)
-    except Exception as exc:  # pragma: no cover - defensive guard
-        _LOGGER.warning("license lookup failed label=%s ref=%s: %s", label, ref, exc)
-        return None
 
-    if not license_meta:
-        return None
+async def evaluate_tts_requests(texts: Sequence[str]) -> list[dict[str, str] | None]:
+    """Batch variant of :func:`evaluate_tts_request`; one result per text, in order.
 
-    if _is_restricted(license_meta):
-        return {
-            "reason": "TTS disabled for non-commercial source",
-            "ref": f"{label}.{ref}",
-            "license": _summarize_license(license_meta),
-            "source": source_title or label,
-        }
+    Uses the cached label map, so a whole lesson is checked without database round-trips.
+    """
+    results: list[dict[str, str] | None] = [None] * len(texts)
+    references = [(position, _extract_reference(value)) for position, value in enumerate(texts)]
+    if not any(label_ref for _, label_ref in references):
+        return results
+
+    try:
+        labels = await license_map.labels()
+    except Exception as exc:  # pragma: no cover - defensive guard
+        _LOGGER.warning("license map load failed: %s", exc)
+        return results
+
+    for position, label_ref in references:
+        if label_ref:
+            results[position] = _violation(labels, *label_ref)
+    return results
+
+
+def _violation(labels: Dict[str, tuple[_WorkLicense, ...]], label: str, ref: str) -> dict[str, str] | None:
+    for work in labels.get(label.strip().lower(), ()):
+        if work.restricted:
+            return {
+                "reason": "TTS disabled for non-commercial source",
+                "ref": f"{label}.{ref}",
+                "license": _summarize_license(work.license),
+                "source": work.source_title or label,
+            }
     return None
 
 
@@ -59,35 +133,36 @@ def _extract_reference(text_value: str) -> tuple[str, str] | None:
     return label, ref
 
 
-async def _fetch_license(label: str, ref: str) -> tuple[Any | None, str | None]:
+async def _load_license_labels() -> Dict[str, tuple[_WorkLicense, ...]]:
     async with SessionLocal() as session:
         result = await session.execute(
             text(
                 """
                 SELECT sd.license, sd.title AS source_title, tw.title AS work_title, tw.author AS work_author
-                FROM text_segment AS ts
-                JOIN text_work AS tw ON tw.id = ts.work_id
+                FROM text_work AS tw
                 JOIN source_doc AS sd ON sd.id = tw.source_id
-                WHERE ts.ref = :ref
+                WHERE sd.license IS NOT NULL
+                ORDER BY tw.id
                 """
-            ),
-            {"ref": ref},
+            )
         )
-        for row in result.mappings():
-            if _matches_label(label, row.get("work_title"), row.get("work_author")):
-                return row.get("license"), row.get("source_title") or row.get("work_title")
-    return None, None
-
-
-def _matches_label(label: str, title: str | None, author: str | None) -> bool:
-    normalized = (label or "").strip().lower()
-    if not normalized:
-        return False
-    for candidate in (title, author):
-        abbrev = _abbreviate(candidate)
-        if abbrev and abbrev.lower() == normalized:
-            return True
-    return False
+        rows = result.mappings().all()
+
+    labels: Dict[str, list[_WorkLicense]] = {}
+    for row in rows:
+        work = _WorkLicense(
+            license=row["license"],
+            source_title=row["source_title"] or row["work_title"],
+            restricted=_is_restricted(row["license"]),
+        )
+        keys = {
+            abbrev.lower()
+            for abbrev in (_abbreviate(row["work_title"]), _abbreviate(row["work_author"]))
+            if abbrev
+        }
+        for key in keys:
+            labels.setdefault(key, []).append(work)
+    return {key: tuple(works) for key, works in labels.items()}
 
 
 def _abbreviate(value: str | None) -> str | None:
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from app.tts.providers.base import TTSAudioResult, TTSProvider, TTSProviderError
+from app.tts.providers.base import TTSAudioResult, TTSAudioStream, TTSProvider, TTSProviderError
 from app.tts.providers.echo import EchoTTSProvider
 from app.tts.providers.google import GoogleTTSProvider
 from app.tts.providers.openai import OpenAITTSProvider
 
 __all__ = [
     "TTSAudioResult",
+    "TTSAudioStream",
     "TTSProvider",
     "TTSProviderError",
     "PROVIDERS",
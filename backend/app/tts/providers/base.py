@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol
+from typing import AsyncIterator, Protocol
 
 from app.tts.models import TTSSpeakRequest
 
@@ -14,6 +14,28 @@ class TTSAudioResult:
     sample_rate: int
 
 
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(slots=True)
+class TTSAudioStream:
+    """Provider audio delivered incrementally; ``chunks`` must be consumed or closed once."""
+
+    chunks: AsyncIterator[bytes]
+    mime: str
+    model: str
+    sample_rate: int
+
+    @classmethod
+    def from_result(cls, result: TTSAudioResult, chunk_size: int = STREAM_CHUNK_SIZE) -> "TTSAudioStream":
+        async def _chunks() -> AsyncIterator[bytes]:
+            audio = memoryview(result.audio)
+            for start in range(0, len(audio), chunk_size):
+                yield bytes(audio[start : start + chunk_size])
+
+        return cls(chunks=_chunks(), mime=result.mime, model=result.model, sample_rate=result.sample_rate)
+
+
 class TTSProvider(Protocol):
     name: str
 
@@ -6,47 +6,82 @@ import math
 import struct
 import wave
 from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional; falls back to the per-sample loop
+    np = None
+    NUMPY_AVAILABLE = False
 
 from app.tts.models import TTSSpeakRequest
 from app.tts.providers.base import TTSAudioResult, TTSProviderError
 
+_AMPLITUDE = 0.35
+_ATTACK_FRAMES = 200.0
+# The tone depends only on digest[0] % 220, so this bounds the waveform cache per sample rate/duration.
+_WAVEFORM_CACHE_SIZE = 512
+
+
+def _tone_frames_python(base_freq: int, sample_rate: int, total_frames: int) -> bytes:
+    """Per-sample reference renderer, used when NumPy is unavailable."""
+    overtone = base_freq * 2
+    frames = bytearray()
+    for idx in range(total_frames):
+        t = idx / sample_rate
+        envelope = min(1.0, idx / _ATTACK_FRAMES) * (1.0 - min(1.0, idx / total_frames))
+        sample = math.sin(2 * math.pi * base_freq * t) + 0.5 * math.sin(2 * math.pi * overtone * t)
+        value = int(max(-1.0, min(1.0, _AMPLITUDE * envelope * sample)) * 32767)
+        frames.extend(struct.pack("<h", value))
+    return bytes(frames)
+
+
+def _tone_frames_numpy(base_freq: int, sample_rate: int, total_frames: int) -> bytes:
+    """Vectorized renderer producing the same little-endian int16 frames."""
+    idx = np.arange(total_frames, dtype=np.float64)
+    t = idx / sample_rate
+    envelope = np.minimum(1.0, idx / _ATTACK_FRAMES) * (1.0 - np.minimum(1.0, idx / total_frames))
+    sample = np.sin(2 * math.pi * base_freq * t) + 0.5 * np.sin(2 * math.pi * (base_freq * 2) * t)
+    values = np.clip(_AMPLITUDE * envelope * sample, -1.0, 1.0) * 32767
+    # astype truncates toward zero, matching int() in the reference renderer
+    return values.astype("<i2").tobytes()
+
+
+def _render_wav(base_freq: int, sample_rate: int, total_frames: int) -> bytes:
+    render = _tone_frames_numpy if NUMPY_AVAILABLE else _tone_frames_python
+    buffer = io.BytesIO()
+    try:
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(render(base_freq, sample_rate, total_frames))
+    except wave.Error as exc:  # pragma: no cover - extremely unlikely
+        raise TTSProviderError(f"Failed to synthesize echo audio: {exc}") from exc
+    return buffer.getvalue()
+
+
+_cached_wav = lru_cache(maxsize=_WAVEFORM_CACHE_SIZE)(_render_wav)
+
 
 @dataclass(slots=True)
 class EchoTTSProvider:
     name: str = "echo"
     sample_rate: int = 22050
     duration_seconds: float = 0.6
+    cache_waveforms: bool = True
 
     async def speak(self, *, request: TTSSpeakRequest, token: str | None) -> TTSAudioResult:
         # Deterministic tone derived from text hash; ignores BYOK token
         digest = hashlib.sha256(request.text.encode("utf-8")).digest()
         base_freq = 220 + digest[0] % 220  # 220–439 Hz
-        overtone = base_freq * 2
-        amplitude = 0.35
         total_frames = max(int(self.sample_rate * self.duration_seconds), 1)
 
-        buffer = io.BytesIO()
-        try:
-            with wave.open(buffer, "wb") as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(self.sample_rate)
-
-                frames = bytearray()
-                for idx in range(total_frames):
-                    t = idx / self.sample_rate
-                    envelope = min(1.0, idx / 200.0) * (1.0 - min(1.0, idx / total_frames))
-                    sample = math.sin(2 * math.pi * base_freq * t) + 0.5 * math.sin(
-                        2 * math.pi * overtone * t
-                    )
-                    value = int(max(-1.0, min(1.0, amplitude * envelope * sample)) * 32767)
-                    frames.extend(struct.pack("<h", value))
-                wav_file.writeframes(frames)
-        except wave.Error as exc:  # pragma: no cover - extremely unlikely
-            raise TTSProviderError(f"Failed to synthesize echo audio: {exc}") from exc
-
+        render = _cached_wav if self.cache_waveforms else _render_wav
         return TTSAudioResult(
-            audio=buffer.getvalue(),
+            audio=render(base_freq, self.sample_rate, total_frames),
             mime="audio/wav",
             model="echo:v0",
             sample_rate=self.sample_rate,
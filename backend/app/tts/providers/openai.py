@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from typing import AsyncIterator
 
 import httpx
 
 from app.core.config import settings
 from app.tts.models import TTSSpeakRequest
-from app.tts.providers.base import TTSAudioResult, TTSProviderError
+from app.tts.providers.base import TTSAudioResult, TTSAudioStream, TTSProviderError
 
 _LOGGER = logging.getLogger("app.tts.openai")
+_TIMEOUT = httpx.Timeout(connect=5.0, read=15.0, write=5.0, pool=5.0)
 
 
 @dataclass(slots=True)
@@ -23,24 +25,33 @@ class OpenAITTSProvider:
     def default_model(self) -> str:
         return settings.TTS_DEFAULT_MODEL
 
-    async def speak(self, *, request: TTSSpeakRequest, token: str | None) -> TTSAudioResult:
-        if not token:
-            raise TTSProviderError("Authorization header required for OpenAI TTS")
-
-        payload = {
+    def _payload(self, request: TTSSpeakRequest) -> dict[str, str]:
+        return {
             "model": request.model or self.default_model,
             "voice": request.voice or self.default_voice,
             "input": request.text,
             "format": request.format,
         }
+
+    def _sample_rate(self, response: httpx.Response) -> int:
+        sample_rate_header = response.headers.get("x-openai-sampling-rate")
+        try:
+            return int(sample_rate_header) if sample_rate_header else self.default_sample_rate
+        except ValueError:
+            return self.default_sample_rate
+
+    async def speak(self, *, request: TTSSpeakRequest, token: str | None) -> TTSAudioResult:
+        if not token:
+            raise TTSProviderError("Authorization header required for OpenAI TTS")
+
+        payload = self._payload(request)
         headers = {
             "Authorization": token,
             "Content-Type": "application/json",
         }
-        timeout = httpx.Timeout(connect=5.0, read=15.0, write=5.0, pool=5.0)
 
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
                 response = await client.post(self.endpoint, json=payload, headers=headers)
         except httpx.HTTPError as exc:  # pragma: no cover - network failure depends on environment
             raise TTSProviderError(f"OpenAI TTS request failed: {exc}") from exc
@@ -51,15 +62,53 @@ class OpenAITTSProvider:
             raise TTSProviderError(f"OpenAI TTS returned {response.status_code}")
 
         mime = response.headers.get("content-type", "audio/wav").split(";")[0]
-        sample_rate_header = response.headers.get("x-openai-sampling-rate")
-        try:
-            sample_rate = int(sample_rate_header) if sample_rate_header else self.default_sample_rate
-        except ValueError:
-            sample_rate = self.default_sample_rate
-
         return TTSAudioResult(
             audio=response.content,
             mime=mime,
             model=payload["model"],
-            sample_rate=sample_rate,
+            sample_rate=self._sample_rate(response),
+        )
+
+    async def stream(self, *, request: TTSSpeakRequest, token: str | None) -> TTSAudioStream:
+        """Open the speech request and forward audio chunks as OpenAI sends them.
+
+        Errors before the first byte (auth, status) raise here so callers can fall back.
+        """
+        if not token:
+            raise TTSProviderError("Authorization header required for OpenAI TTS")
+
+        payload = self._payload(request)
+        headers = {
+            "Authorization": token,
+            "Content-Type": "application/json",
+        }
+        client = httpx.AsyncClient(timeout=_TIMEOUT)
+        try:
+            response = await client.send(
+                client.build_request("POST", self.endpoint, json=payload, headers=headers), stream=True
+            )
+        except httpx.HTTPError as exc:  # pragma: no cover - network failure depends on environment
+            await client.aclose()
+            raise TTSProviderError(f"OpenAI TTS request failed: {exc}") from exc
+
+        if response.status_code != 200:
+            body = (await response.aread())[:200].decode("utf-8", "replace")
+            await response.aclose()
+            await client.aclose()
+            _LOGGER.warning("OpenAI TTS error status=%s body=%s", response.status_code, body)
+            raise TTSProviderError(f"OpenAI TTS returned {response.status_code}")
+
+        async def _chunks() -> AsyncIterator[bytes]:
+            try:
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+            finally:
+                await response.aclose()
+                await client.aclose()
+
+        return TTSAudioStream(
+            chunks=_chunks(),
+            mime=response.headers.get("content-type", "audio/wav").split(";")[0],
+            model=payload["model"],
+            sample_rate=self._sample_rate(response),
         )
@@ -2,24 +2,134 @@ from __future__ import annotations
 
 import base64
 import logging
+import re
 
-from fastapi import APIRouter, Header, HTTPException, status
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from fastapi.responses import Response, StreamingResponse
 
 from app.core.config import settings
+from app.tts.clip_cache import CachedClip, clip_cache, clip_key
 from app.tts.license_guard import evaluate_tts_request
 from app.tts.models import TTSAudioMeta, TTSAudioPayload, TTSSpeakRequest, TTSSpeakResponse
 from app.tts.providers.base import TTSProviderError
-from app.tts.service import synthesize
+from app.tts.service import synthesize, synthesize_stream
 
 _LOGGER = logging.getLogger("app.tts.router")
 router = APIRouter(prefix="/tts", tags=["TTS"])
 
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+_AUDIO_RESPONSES = {
+    200: {"content": {"audio/wav": {}, "audio/mpeg": {}}},
+    206: {"description": "Partial audio content (Range request)"},
+    304: {"description": "Audio unchanged (If-None-Match)"},
+}
 
-@router.post("/speak", response_model=TTSSpeakResponse)
+
+def _wants_audio(accept: str | None) -> bool:
+    """True when ``Accept`` ranks an ``audio/*`` type above JSON; bare ``*/*`` keeps the JSON default."""
+    if not accept:
+        return False
+    audio_q = json_q = 0.0
+    for part in accept.split(","):
+        media, *params = (item.strip().lower() for item in part.split(";"))
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if media.startswith("audio/"):
+            audio_q = max(audio_q, quality)
+        elif media in ("application/json", "application/*"):
+            json_q = max(json_q, quality)
+    return audio_q > json_q
+
+
+def _meta_headers(provider: str, model: str, sample_rate: int, note: str | None) -> dict[str, str]:
+    headers = {
+        "X-TTS-Provider": provider,
+        "X-TTS-Model": model,
+        "X-TTS-Sample-Rate": str(sample_rate),
+    }
+    if note:
+        headers["X-TTS-Note"] = note
+    return headers
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Return an inclusive (start, end) for a single-range header; None means serve the full body.
+
+    Raises 416 when the range cannot be satisfied.
+    """
+    match = _RANGE_RE.match(header.strip())
+    if match is None:
+        return None  # multi-range or malformed: RFC 9110 allows ignoring it
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        length = int(last)
+        if length == 0:
+            raise HTTPException(
+                status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": f"bytes */{size}"},
+            )
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise HTTPException(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
+def _binary_response(
+    clip: CachedClip, *, range_header: str | None, if_none_match: str | None, if_range: str | None
+) -> Response:
+    result = clip.result
+    headers = _meta_headers(clip.provider, result.model, result.sample_rate, clip.note)
+    headers.update({"ETag": clip.etag, "Accept-Ranges": "bytes", "Cache-Control": "private, max-age=3600"})
+
+    if if_none_match and (if_none_match.strip() == "*" or clip.etag in if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    size = len(result.audio)
+    byte_range = None
+    if range_header and (not if_range or if_range.strip() == clip.etag):
+        byte_range = _parse_range(range_header, size)
+    if byte_range is None:
+        return Response(content=result.audio, media_type=result.mime, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return Response(
+        content=memoryview(result.audio)[start : end + 1].tobytes(),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=result.mime,
+        headers=headers,
+    )
+
+
+@router.post("/speak", response_model=TTSSpeakResponse, responses=_AUDIO_RESPONSES)
 async def speak(
     request: TTSSpeakRequest,
     authorization: str | None = Header(default=None),
-) -> TTSSpeakResponse:
+    accept: str | None = Header(default=None),
+    range_header: str | None = Header(default=None, alias="Range"),
+    if_none_match: str | None = Header(default=None),
+    if_range: str | None = Header(default=None),
+    stream: bool = Query(default=False, description="Forward provider audio as chunks while it arrives"),
+) -> TTSSpeakResponse | Response:
+    """Synthesize speech.
+
+    Returns JSON with base64 audio by default. Clients that prefer ``audio/*`` in
+    ``Accept`` get the raw bytes with metadata in ``X-TTS-*`` headers, plus ETag and
+    single-range support; ``?stream=true`` sends chunked audio as the provider
+    produces it.
+    """
     if not settings.TTS_ENABLED:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="TTS is disabled")
 
@@ -29,19 +139,46 @@ async def speak(
         violation = await evaluate_tts_request(request.text)
         if violation:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=violation)
-    try:
-        result, provider_name, note = await synthesize(request, token)
-    except TTSProviderError as exc:
-        _LOGGER.error("TTS synthesis failed: %s", exc)
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="TTS provider failed") from exc
 
+    if stream:
+        try:
+            audio_stream, provider_name, note = await synthesize_stream(request, token)
+        except TTSProviderError as exc:
+            _LOGGER.error("TTS synthesis failed: %s", exc)
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY, detail="TTS provider failed"
+            ) from exc
+        return StreamingResponse(
+            audio_stream.chunks,
+            media_type=audio_stream.mime,
+            headers=_meta_headers(provider_name, audio_stream.model, audio_stream.sample_rate, note),
+        )
+
+    key = clip_key(request, token)
+    clip = clip_cache.get(key)
+    if clip is None:
+        try:
+            result, provider_name, note = await synthesize(request, token)
+        except TTSProviderError as exc:
+            _LOGGER.error("TTS synthesis failed: %s", exc)
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY, detail="TTS provider failed"
+            ) from exc
+        clip = clip_cache.put(key, result, provider_name, note)
+
+    if _wants_audio(accept):
+        return _binary_response(
+            clip, range_header=range_header, if_none_match=if_none_match, if_range=if_range
+        )
+
+    result = clip.result
     audio_b64 = base64.b64encode(result.audio).decode("ascii")
     return TTSSpeakResponse(
         audio=TTSAudioPayload(mime=result.mime, b64=audio_b64),
         meta=TTSAudioMeta(
-            provider=provider_name,
+            provider=clip.provider,
             model=result.model,
             sample_rate=result.sample_rate,
-            note=note,
+            note=clip.note,
         ),
     )
@@ -4,7 +4,7 @@ import logging
 
 from app.tts.models import TTSSpeakRequest
 from app.tts.providers import TTSProviderError, get_provider
-from app.tts.providers.base import TTSAudioResult
+from app.tts.providers.base import TTSAudioResult, TTSAudioStream
 
 _LOGGER = logging.getLogger("app.tts.service")
 
@@ -21,3 +21,25 @@ async def synthesize(request: TTSSpeakRequest, token: str | None) -> tuple[TTSAu
             fallback = await echo.speak(request=request.model_copy(update={"provider": "echo"}), token=None)
             return fallback, "echo", "tts_failed_fell_back_to_echo"
         raise
+
+
+async def synthesize_stream(
+    request: TTSSpeakRequest, token: str | None
+) -> tuple[TTSAudioStream, str, str | None]:
+    """Like :func:`synthesize`, but forwards audio as the provider produces it.
+
+    Providers without a ``stream`` method are synthesized in full and chunked.
+    Fallback to echo only applies to failures before the first chunk.
+    """
+    provider = get_provider(request.provider)
+    stream = getattr(provider, "stream", None)
+    if stream is None:
+        result, provider_name, note = await synthesize(request, token)
+        return TTSAudioStream.from_result(result), provider_name, note
+    try:
+        return await stream(request=request, token=token), provider.name, None
+    except TTSProviderError as exc:
+        _LOGGER.warning("TTS provider %s failed: %s; falling back to echo", provider.name, exc)
+        echo = get_provider("echo")
+        fallback = await echo.speak(request=request.model_copy(update={"provider": "echo"}), token=None)
+        return TTSAudioStream.from_result(fallback), "echo", "tts_failed_fell_back_to_echo"
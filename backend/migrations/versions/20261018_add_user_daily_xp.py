@@ -0,0 +1,42 @@
+"""Add user_daily_xp rollup for period leaderboards
+
+Revision ID: 20261018_user_daily_xp
+Revises: 20251030_add_hnsw_vector_indexes
+Create Date: 2026-10-18 09:00:00.000000
+
+Existing lesson events are copied in by backend/scripts/backfill_user_daily_xp.py.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_user_daily_xp"
+down_revision: Union[str, Sequence[str], None] = "20251030_add_hnsw_vector_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create user_daily_xp keyed by (user_id, day, language_code)."""
+    op.create_table(
+        "user_daily_xp",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("language_code", sa.String(length=20), nullable=False, server_default=""),
+        sa.Column("xp", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("lessons", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "day", "language_code"),
+    )
+    # Period leaderboards scan one date range across all users
+    op.create_index("ix_user_daily_xp_day", "user_daily_xp", ["day", "user_id"])
+
+
+def downgrade() -> None:
+    """Drop user_daily_xp."""
+    op.drop_index("ix_user_daily_xp_day", table_name="user_daily_xp")
+    op.drop_table("user_daily_xp")
@@ -0,0 +1,126 @@
+"""Partition learning_event by month and add learning_event_monthly
+
+Revision ID: 20261018_partition_learning_event
+Revises: 20261018_user_daily_xp
+Create Date: 2026-10-18 15:00:00.000000
+
+Postgres cannot partition an existing table in place, so the table is renamed, a
+range-partitioned learning_event is created with one partition per UTC month from
+the oldest event through PARTITIONS_AHEAD months from now (plus a default
+partition), the rows are copied over and the old table is dropped. The copy
+rewrites the whole table; run it in a maintenance window on large databases.
+Later months are created by app.services.event_partitions.
+
+Downgrading copies the remaining events back into a plain table; events already
+folded into learning_event_monthly by retention are not restored.
+"""
+
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy import text
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_partition_learning_event"
+down_revision: Union[str, Sequence[str], None] = "20261018_user_daily_xp"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONS_AHEAD = 3
+
+COLUMNS = "id, user_id, event_type, event_timestamp, data, lesson_id, work_id"
+
+INDEXES = (
+    ("ix_learning_event_user_id", ["user_id"]),
+    ("ix_learning_event_event_type", ["event_type"]),
+    ("ix_learning_event_event_timestamp", ["event_timestamp"]),
+    ("ix_learning_event_user_type", ["user_id", "event_type"]),
+    ("ix_learning_event_user_time", ["user_id", "event_timestamp"]),
+)
+
+
+def _add_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _create_table(sequence: str, primary_key: str, partitioned: bool) -> None:
+    op.execute(
+        f"""
+        CREATE TABLE learning_event (
+            id integer NOT NULL DEFAULT nextval('{sequence}'::regclass),
+            user_id integer NOT NULL REFERENCES "user" (id),
+            event_type varchar(50) NOT NULL,
+            event_timestamp timestamptz NOT NULL DEFAULT now(),
+            data jsonb NOT NULL,
+            lesson_id varchar(100),
+            work_id integer REFERENCES text_work (id),
+            CONSTRAINT learning_event_pkey PRIMARY KEY ({primary_key})
+        ){" PARTITION BY RANGE (event_timestamp)" if partitioned else ""}
+        """
+    )
+    op.execute(f"ALTER SEQUENCE {sequence} OWNED BY learning_event.id")
+
+
+def _replace_table(old_name: str, primary_key: str, partitioned: bool) -> str:
+    """Rename learning_event to ``old_name`` and create the new learning_event in its place."""
+    bind = op.get_bind()
+    sequence = bind.execute(text("SELECT pg_get_serial_sequence('learning_event', 'id')")).scalar()
+    for name, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.rename_table("learning_event", old_name)
+    op.execute(f"ALTER INDEX IF EXISTS learning_event_pkey RENAME TO {old_name}_pkey")
+    _create_table(sequence, primary_key, partitioned)
+    return sequence
+
+
+def _copy_rows(old_name: str) -> None:
+    op.execute(f"INSERT INTO learning_event ({COLUMNS}) SELECT {COLUMNS} FROM {old_name}")
+    op.execute(f"DROP TABLE {old_name}")
+    for name, columns in INDEXES:
+        op.create_index(name, "learning_event", columns)
+
+
+def upgrade() -> None:
+    """Rebuild learning_event partitioned by month and create learning_event_monthly."""
+    bind = op.get_bind()
+    _replace_table("learning_event_legacy", "id, event_timestamp", partitioned=True)
+
+    oldest = bind.execute(text("SELECT min(event_timestamp) FROM learning_event_legacy")).scalar()
+    now = datetime.now(timezone.utc)
+    first = (oldest or now).astimezone(timezone.utc)
+    month = date(first.year, first.month, 1)
+    last = date(now.year, now.month, 1)
+    for _ in range(PARTITIONS_AHEAD):
+        last = _add_month(last)
+    while month <= last:
+        end = _add_month(month)
+        op.execute(
+            f"CREATE TABLE learning_event_p{month:%Y%m} PARTITION OF learning_event "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{end.isoformat()} 00:00:00+00')"
+        )
+        month = end
+    op.execute("CREATE TABLE learning_event_default PARTITION OF learning_event DEFAULT")
+
+    _copy_rows("learning_event_legacy")
+
+    op.create_table(
+        "learning_event_monthly",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("event_type", sa.String(length=50), nullable=False),
+        sa.Column("language_code", sa.String(length=20), nullable=False, server_default=""),
+        sa.Column("events", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("xp", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "month", "event_type", "language_code"),
+    )
+
+
+def downgrade() -> None:
+    """Copy learning_event back into an unpartitioned table and drop learning_event_monthly."""
+    op.drop_table("learning_event_monthly")
+    _replace_table("learning_event_partitioned", "id", partitioned=False)
+    _copy_rows("learning_event_partitioned")
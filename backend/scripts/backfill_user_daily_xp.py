@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Backfill the user_daily_xp rollup from learning_event.
+
+Recomputes every (user, UTC day, language) row from the lesson events, so the
+script can be rerun safely. Run it once after the migration and the new write
+path are deployed. Lessons completed while a batch is running can be
+overwritten by that batch's snapshot; rerunning the affected users fixes them.
+
+Usage:
+    python backend/scripts/backfill_user_daily_xp.py
+    python backend/scripts/backfill_user_daily_xp.py --batch-size 500 --start-user-id 10000
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(backend_dir))
+
+from app.db.session import SessionLocal  # noqa: E402
+from app.db.user_models import LearningEvent, UserDailyXP  # noqa: E402
+from app.services.daily_xp import LESSON_EVENTS, lesson_xp_sql  # noqa: E402
+from sqlalchemy import Date, cast, func, select  # noqa: E402
+from sqlalchemy.dialects.postgresql import insert  # noqa: E402
+
+
+def _rollup_select(start_user_id: int, end_user_id: int):
+    """Per (user, day, language) lesson XP for users in ``[start_user_id, end_user_id)``."""
+    xp, language = lesson_xp_sql(LearningEvent.__table__)
+    day = cast(func.timezone("UTC", LearningEvent.event_timestamp), Date)
+    return (
+        select(
+            LearningEvent.user_id,
+            day,
+            language,
+            func.coalesce(func.sum(xp), 0),
+            func.count(),
+        )
+        .where(
+            LearningEvent.event_type.in_(list(LESSON_EVENTS)),
+            LearningEvent.user_id >= start_user_id,
+            LearningEvent.user_id < end_user_id,
+        )
+        .group_by(LearningEvent.user_id, day, language)
+    )
+
+
+async def backfill(batch_size: int, start_user_id: int) -> int:
+    async with SessionLocal() as session:
+        max_user_id = await session.scalar(
+            select(func.max(LearningEvent.user_id)).where(LearningEvent.event_type.in_(list(LESSON_EVENTS)))
+        )
+    if max_user_id is None:
+        return 0
+
+    total = 0
+    for batch_start in range(start_user_id, max_user_id + 1, batch_size):
+        stmt = insert(UserDailyXP).from_select(
+            ["user_id", "day", "language_code", "xp", "lessons"],
+            _rollup_select(batch_start, batch_start + batch_size),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserDailyXP.user_id, UserDailyXP.day, UserDailyXP.language_code],
+            set_={"xp": stmt.excluded.xp, "lessons": stmt.excluded.lessons},
+        )
+        async with SessionLocal() as session:
+            result = await session.execute(stmt)
+            await session.commit()
+        total += result.rowcount or 0
+        print(f"  users {batch_start}-{batch_start + batch_size - 1}: {result.rowcount} rows")
+    return total
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--batch-size", type=int, default=1000, help="Users per transaction")
+    parser.add_argument("--start-user-id", type=int, default=0, help="Resume from this user id")
+    args = parser.parse_args()
+
+    print("Backfilling user_daily_xp from learning_event...")
+    total = await backfill(args.batch_size, args.start_user_id)
+    print(f"SUCCESS: wrote {total} user_daily_xp rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,135 @@
+"""Benchmark text-range lesson context extraction against a live database.
+
+Compares the SQL-side aggregation used by ``app.lesson.service._extract_text_range_data``
+with an in-memory aggregator (sets + Counter) that pulls every token row into Python.
+
+Usage:
+    python scripts/dev/bench_text_range.py --start 1.1 --end 1.500 --runs 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Awaitable, Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "backend"))
+
+from app.db.session import SessionLocal  # noqa: E402
+from app.lesson.service import (  # noqa: E402
+    _TEXT_RANGE_MAX_SEGMENTS,
+    _extract_text_range_data,
+    _normalize,
+)
+from sqlalchemy import text  # noqa: E402
+
+_TOKENS_SQL = text(
+    """
+    SELECT t.lemma, t.surface_nfc, t.msd
+    FROM token AS t
+    JOIN (
+        SELECT ts.id
+        FROM text_segment AS ts
+        JOIN text_work AS tw ON tw.id = ts.work_id
+        JOIN language AS lang ON lang.id = tw.language_id
+        WHERE lang.code = :language AND ts.ref >= :start_ref AND ts.ref <= :end_ref
+        ORDER BY ts.ref
+        LIMIT :max_segments
+    ) AS seg ON seg.id = t.segment_id
+    WHERE t.lemma IS NOT NULL
+    ORDER BY t.segment_id, t.idx
+    """
+)
+
+
+def _classify(msd: object) -> str | None:
+    if not isinstance(msd, dict):
+        return None
+    if msd.get("tense") == "aorist" and msd.get("voice") == "passive":
+        return "aorist_passive"
+    if msd.get("case") == "genitive" and msd.get("pos") == "noun":
+        return "genitive_noun"
+    if msd.get("mood") == "subjunctive":
+        return "subjunctive"
+    return None
+
+
+async def _in_memory(language: str, start_ref: str, end_ref: str) -> int:
+    async with SessionLocal() as session:
+        rows = (
+            await session.execute(
+                _TOKENS_SQL,
+                {
+                    "language": language,
+                    "start_ref": start_ref,
+                    "end_ref": end_ref,
+                    "max_segments": _TEXT_RANGE_MAX_SEGMENTS,
+                },
+            )
+        ).all()
+    seen_forms: set[tuple[str, str]] = set()
+    frequency: Counter[str] = Counter()
+    pattern_forms: dict[str, dict[str, None]] = {}
+    for row in rows:
+        lemma = _normalize(row.lemma or "")
+        surface = _normalize(row.surface_nfc or "")
+        if not lemma or not surface:
+            continue
+        if (lemma, surface) not in seen_forms:
+            seen_forms.add((lemma, surface))
+            frequency[lemma] += 1
+        pattern = _classify(row.msd)
+        if pattern:
+            pattern_forms.setdefault(pattern, {})[surface] = None
+    return len(frequency.most_common(30)) + len(pattern_forms)
+
+
+async def _sql(language: str, start_ref: str, end_ref: str) -> int:
+    async with SessionLocal() as session:
+        data = await _extract_text_range_data(
+            session=session, language=language, ref_start=start_ref, ref_end=end_ref
+        )
+    return len(data.vocabulary) + len(data.grammar_patterns)
+
+
+async def _time(fn: Callable[[], Awaitable[int]], runs: int, warmup: int) -> List[float]:
+    for _ in range(warmup):
+        await fn()
+    durations: List[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await fn()
+        durations.append((time.perf_counter() - start) * 1000.0)
+    return durations
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark text-range aggregation strategies")
+    parser.add_argument("--language", default="grc-cls")
+    parser.add_argument("--start", default="1.1", help="First ref of the range (default: 1.1)")
+    parser.add_argument("--end", default="1.500", help="Last ref of the range (default: 1.500)")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=3)
+    args = parser.parse_args()
+
+    strategies = {
+        "sql_aggregate": lambda: _sql(args.language, args.start, args.end),
+        "in_memory_counter": lambda: _in_memory(args.language, args.start, args.end),
+    }
+
+    print("| Strategy | p50 (ms) | mean (ms) |")
+    print("| --- | --- | --- |")
+    for name, fn in strategies.items():
+        durations = await _time(fn, args.runs, args.warmup)
+        p50 = statistics.median(durations)
+        mean = statistics.fmean(durations)
+        print(f"| {name} | {p50:.1f} | {mean:.1f} |")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    asyncio.run(main())